@@ -1,7 +1,7 @@
 'use server'
 
 import type { EntityKey } from '@/lib/schema'
-import { pickEntityColumns } from '@/lib/schema'
+import { pickEntityColumns } from '@/lib/schema/eager'
 
 const DEFAULT_DENY_COLUMNS = new Set(['id', 'created_at', 'updated_at'])
 
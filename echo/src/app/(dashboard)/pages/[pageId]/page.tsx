@@ -8,7 +8,7 @@ import { ApexEmptyState } from '@/components/apex/apex-empty-state'
 import { EntityTable } from '@/components/table/entity-table'
 import type { TableColumn, TableSort } from '@/components/table/types'
 import { createClient } from '@/lib/supabase/client'
-import { getEntityColumns, getEntitySchema, type EntityKey } from '@/lib/schema'
+import { getEntityColumns, getEntitySchema, type EntityKey } from '@/lib/schema/eager'
 import { getCustomPage, updateCustomPage, type CustomPageRow } from '@/actions/custom-pages'
 import { useEntityData } from '@/hooks/use-entity-data'
 import { asText } from '@/lib/fields'
@@ -164,7 +164,7 @@ function normalizeLimit(definition: Record<string, unknown>): number {
 function applyDefinitionFilters<T extends FilterQueryLike>(
   query: T,
   definition: Record<string, unknown>,
-  allowedColumnIds: Set<string>
+  allowedColumnIds: ReadonlySet<string>
 ): T {
   let next: FilterQueryLike = query
 
@@ -234,7 +234,7 @@ function isSortDirection(value: unknown): value is 'asc' | 'desc' {
   return value === 'asc' || value === 'desc'
 }
 
-function normalizeSortPreference(value: unknown, allowed: Set<string>): TableSort | null {
+function normalizeSortPreference(value: unknown, allowed: ReadonlySet<string>): TableSort | null {
   if (!value) return null
   let raw: unknown = value
   if (typeof raw === 'string') {
@@ -259,20 +259,20 @@ function normalizeSortPreference(value: unknown, allowed: Set<string>): TableSor
   return { id, direction }
 }
 
-function normalizeGroupPreference(value: unknown, allowed: Set<string>): string | null {
+function normalizeGroupPreference(value: unknown, allowed: ReadonlySet<string>): string | null {
   const next = asText(value).trim()
   if (!next) return null
   return allowed.has(next) ? next : null
 }
 
-function normalizeVisibilityList(value: unknown, allowed: Set<string>, fallback: string[]): string[] {
+function normalizeVisibilityList(value: unknown, allowed: ReadonlySet<string>, fallback: string[]): string[] {
   if (!Array.isArray(value)) return fallback.filter((c) => allowed.has(c))
   const normalized = uniqueStrings(value.map((e) => asText(e)))
   const filtered = normalized.filter((c) => allowed.has(c))
   return filtered.length > 0 ? filtered : fallback.filter((c) => allowed.has(c))
 }
 
-function normalizeColumnOrder(value: unknown, allowed: Set<string>, fallback: string[]): string[] {
+function normalizeColumnOrder(value: unknown, allowed: ReadonlySet<string>, fallback: string[]): string[] {
   const preferred = Array.isArray(value)
     ? uniqueStrings(value.map((e) => asText(e))).filter((c) => allowed.has(c))
     : []
@@ -286,7 +286,7 @@ function normalizeColumnOrder(value: unknown, allowed: Set<string>, fallback: st
 
 function buildStorageSeedPayload(
   page: CustomPageRow,
-  allowedColumnIds: Set<string>,
+  allowedColumnIds: ReadonlySet<string>,
   baseColumnIds: string[]
 ) {
   const defaultState = asRecord(page.default_state)
@@ -1,7 +1,7 @@
 'use client'
 
 import { useEffect, useMemo, useState } from 'react'
-import { SCHEMA, type EntityKey, type SchemaField } from '@/lib/schema'
+import { SCHEMA, type EntityKey, type SchemaField } from '@/lib/schema/eager'
 import { createClient } from '@/lib/supabase/client'
 import { Input } from '@/components/ui/input'
 import { Label } from '@/components/ui/label'
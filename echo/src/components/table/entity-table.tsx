@@ -7,7 +7,7 @@ import { ChevronDown, ChevronRight, Download, Pencil, Trash2, Upload } from 'luc
 import { TableToolbar } from './table-toolbar'
 import type { TableColumn, TableSort } from './types'
 import { createClient } from '@/lib/supabase/client'
-import { getEntitySchema, type EntityKey, type SchemaField } from '@/lib/schema'
+import { getEntitySchema, type EntityKey, type SchemaField } from '@/lib/schema/eager'
 import {
   DropdownMenu,
   DropdownMenuCheckboxItem,
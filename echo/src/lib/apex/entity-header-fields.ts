@@ -1,4 +1,4 @@
-import { SCHEMA, type EntityKey, type SchemaField } from '@/lib/schema'
+import { SCHEMA, type EntityKey, type SchemaField } from '@/lib/schema/eager'
 
 export type HeaderFieldType =
   | 'text'
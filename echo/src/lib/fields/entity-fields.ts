@@ -5,7 +5,7 @@
  * into unified FieldBehavior[] for any entity.
  */
 
-import { getEntitySchema, type EntityKey, type SchemaField } from '@/lib/schema'
+import { getEntitySchema, type EntityKey, type SchemaField } from '@/lib/schema/eager'
 import type { FieldBehavior, FieldDataType, ExtendedEntityKey } from './types'
 import { getComputedFormulas } from './computed-fields'
 import { FIELD_ENTITY_MAP } from './field-entity-map'
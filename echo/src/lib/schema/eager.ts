@@ -0,0 +1,58 @@
+// Eager entry point: imports the whole registry (every entity module). Keep it out of
+// client bundles that only need one entity; use loadEntitySchema()/loadEntityLookups()
+// from '@/lib/schema' or './entities/<entity>.generated' there instead.
+import { LOOKUPS, SCHEMA, type EntityKey, type EntityLookups, type SchemaField } from './schema.generated'
+
+export { LOOKUPS, SCHEMA }
+export type { EntityKey, EntityLookups, SchemaField }
+
+export function getEntitySchema(entity: EntityKey) {
+  return SCHEMA[entity]
+}
+
+export function getEntityLookups(entity: EntityKey): EntityLookups {
+  return LOOKUPS[entity]
+}
+
+// Shared precomputed set; do not mutate.
+export function getEntityColumns(entity: EntityKey): ReadonlySet<string> {
+  return LOOKUPS[entity].columns
+}
+
+// text[] columns backed by a GIN index. Filter them in Postgres with
+// `.contains(column, values)` (@>) or `.overlaps(column, values)` (&&)
+// instead of fetching rows and filtering client-side.
+export function getContainmentColumns(entity: EntityKey): readonly string[] {
+  return SCHEMA[entity].containmentColumns
+}
+
+export function supportsContainmentFilter(entity: EntityKey, column: string): boolean {
+  return SCHEMA[entity].containmentColumns.includes(column)
+}
+
+// Allowed values of a status_list/list/color column, from schema.values.json (see
+// --list-values in the generator). Empty when the column has no recorded values.
+export function getListValues(entity: EntityKey, column: string): readonly string[] {
+  return SCHEMA[entity].listValues?.[column] ?? []
+}
+
+export function pickEntityColumns(
+  entity: EntityKey,
+  input: Record<string, unknown>,
+  options?: { deny?: ReadonlySet<string> }
+) {
+  // writableColumns already excludes id / created_at / updated_at, which are never
+  // accepted from clients in generic pickers (TS_READONLY_COLUMNS in the generator),
+  // and the trigger-maintained summary counters (SUMMARY_COUNTERS).
+  const writable = LOOKUPS[entity].writableColumns
+  const deny = options?.deny
+
+  const out: Record<string, unknown> = {}
+  for (const [key, value] of Object.entries(input)) {
+    if (value === undefined) continue
+    if (!writable.has(key)) continue
+    if (deny?.has(key)) continue
+    out[key] = value
+  }
+  return out
+}
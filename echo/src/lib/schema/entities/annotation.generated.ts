@@ -0,0 +1,43 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Source: echo/src/lib/schema/schema.manual.json (hand-maintained; edit that file)
+// Schema hash: 22e730845ad485e3
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "annotation",
+  table: "annotations",
+  csv: "",
+  containmentColumns: [],
+  fields: [
+    ["Id","number","permanent","id","id","integer",null],
+    ["Post Media","entity","permanent","post_media_id","post_media_id","integer",null],
+    ["Version","entity","permanent","version_id","version_id","integer",null],
+    ["Author","entity","permanent","author_id","author_id","uuid",null],
+    ["Frame Number","number","permanent","frame_number","frame_number","integer","1"],
+    ["Timecode","text","permanent","timecode","timecode","text",null],
+    ["Annotation Data","serializable","permanent","annotation_data","annotation_data","jsonb","'{}'"],
+    ["Annotation Text","text","permanent","annotation_text","annotation_text","text",null],
+    ["Status","status_list","permanent","status","status","text","'active'"],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["id", "post_media_id", "version_id", "author_id", "frame_number", "timecode", "annotation_data", "annotation_text", "status", "created_at", "updated_at"],
+  writableColumns: ["post_media_id", "version_id", "author_id", "frame_number", "timecode", "annotation_data", "annotation_text", "status"],
+  codeToColumn: {"id": "id", "post_media_id": "post_media_id", "version_id": "version_id", "author_id": "author_id", "frame_number": "frame_number", "timecode": "timecode", "annotation_data": "annotation_data", "annotation_text": "annotation_text", "status": "status", "date_created": "created_at", "date_updated": "updated_at"},
+  fieldIndexByColumn: {"id": 0, "post_media_id": 1, "version_id": 2, "author_id": 3, "frame_number": 4, "timecode": 5, "annotation_data": 6, "annotation_text": 7, "status": 8, "created_at": 9, "updated_at": 10},
+  columnsByPgType: {"integer": ["id", "post_media_id", "version_id", "frame_number"], "jsonb": ["annotation_data"], "text": ["timecode", "annotation_text", "status"], "timestamptz": ["created_at", "updated_at"], "uuid": ["author_id"]},
+})
+
+export default schema
@@ -0,0 +1,76 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Schema hash: e9d388809d80ab25
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "asset",
+  table: "assets",
+  csv: "asset.csv",
+  containmentColumns: ["tags", "sequences", "shots", "vendor_groups"],
+  fields: [
+    ["Asset Name","text","permanent","asset_name","name","text",null],
+    ["Asset <-> Sequence","multi_entity","dynamic","asset_sequence","asset_sequence","text[]","'{}'::text[]"],
+    ["Asset <-> Shot","multi_entity","dynamic","asset_shot","asset_shot","text[]","'{}'::text[]"],
+    ["Cached Display Name","text","permanent","cached_display_name","cached_display_name","text",null],
+    ["Cc","multi_entity","permanent","cc","cc","text[]","'{}'::text[]"],
+    ["Client Name","text","dynamic","client_name","client_name","text",null],
+    ["Created by","entity","permanent","created_by","created_by","uuid",null],
+    ["Creative Brief","url","dynamic","creative_brief","creative_brief","text",null],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+    ["DD Client Name","text","dynamic","dd_client_name","dd_client_name","text",null],
+    ["Description","text","permanent","description","description","text",null],
+    ["Episodes","multi_entity","permanent","episodes","episodes","text[]","'{}'::text[]"],
+    ["Filmstrip Thumbnail","image","permanent","filmstrip_thumbnail","filmstrip_thumbnail_url","text",null],
+    ["Id","number","permanent","id","id","integer",null],
+    ["Image Source Entity","entity","system_owned","image_source_entity","image_source_entity","text",null],
+    ["Keep","checkbox","dynamic","keep","keep","boolean","false"],
+    ["Levels","multi_entity","permanent","levels","levels","text[]","'{}'::text[]"],
+    ["Linked Projects","multi_entity","system_owned","linked_projects","linked_projects","text[]","'{}'::text[]"],
+    ["Mocap Takes","multi_entity","permanent","mocap_takes","mocap_takes","text[]","'{}'::text[]"],
+    ["Notes","multi_entity","permanent","notes","notes","text[]","'{}'::text[]"],
+    ["Open Notes","multi_entity","permanent","open_notes","open_notes","text[]","'{}'::text[]"],
+    ["Open Notes Count","summary","permanent","open_notes_count","open_notes_count","integer","0"],
+    ["Outsource","checkbox","dynamic","outsource","outsource","boolean","false"],
+    ["Parent Assets","multi_entity","permanent","parent_assets","parent_assets","text[]","'{}'::text[]"],
+    ["Project","entity","permanent","project","project_id","integer",null],
+    ["Published File <-> Link","multi_entity","dynamic","published_file_link","published_file_links","text[]","'{}'::text[]"],
+    ["Review Versions <-> Link","multi_entity","dynamic","review_versions_link","review_versions_link","text[]","'{}'::text[]"],
+    ["Sequence","entity","dynamic","sequence","sequence_id","integer",null],
+    ["Sequences","multi_entity","permanent","sequences","sequences","text[]","'{}'::text[]"],
+    ["Sequences <-> Assets","multi_entity","dynamic","sequences_assets","sequences_assets","text[]","'{}'::text[]"],
+    ["Shot","entity","dynamic","shot","shot_id","integer",null],
+    ["Shots","multi_entity","permanent","shots","shots","text[]","'{}'::text[]"],
+    ["Shots <-> Assets","multi_entity","dynamic","shots_assets","shots_assets","text[]","'{}'::text[]"],
+    ["Status","status_list","permanent","status","status","text",null],
+    ["Sub Assets","multi_entity","permanent","sub_assets","sub_assets","text[]","'{}'::text[]"],
+    ["Tags","multi_entity","permanent","tags","tags","text[]","'{}'::text[]"],
+    ["Tasks","multi_entity","permanent","tasks","tasks","text[]","'{}'::text[]"],
+    ["Task Template","entity","permanent","task_template","task_template","text",null],
+    ["Thumbnail","image","permanent","thumbnail","thumbnail_url","text",null],
+    ["Thumbnail Blur Hash","text","system_owned","thumbnail_blur_hash","thumbnail_blur_hash","text",null],
+    ["Type","list","permanent","type","asset_type","text",null],
+    ["Updated by","entity","permanent","updated_by","updated_by","uuid",null],
+    ["Vendor Groups","multi_entity","dynamic","vendor_groups","vendor_groups","text[]","'{}'::text[]"],
+    ["Version <-> Link","multi_entity","dynamic","version_link","version_link","text[]","'{}'::text[]"],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["name", "asset_sequence", "asset_shot", "cached_display_name", "cc", "client_name", "created_by", "creative_brief", "created_at", "updated_at", "dd_client_name", "description", "episodes", "filmstrip_thumbnail_url", "id", "image_source_entity", "keep", "levels", "linked_projects", "mocap_takes", "notes", "open_notes", "open_notes_count", "outsource", "parent_assets", "project_id", "published_file_links", "review_versions_link", "sequence_id", "sequences", "sequences_assets", "shot_id", "shots", "shots_assets", "status", "sub_assets", "tags", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "asset_type", "updated_by", "vendor_groups", "version_link"],
+  writableColumns: ["name", "asset_sequence", "asset_shot", "cached_display_name", "cc", "client_name", "created_by", "creative_brief", "dd_client_name", "description", "episodes", "filmstrip_thumbnail_url", "image_source_entity", "keep", "levels", "linked_projects", "mocap_takes", "notes", "open_notes", "outsource", "parent_assets", "project_id", "published_file_links", "review_versions_link", "sequence_id", "sequences", "sequences_assets", "shot_id", "shots", "shots_assets", "status", "sub_assets", "tags", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "asset_type", "updated_by", "vendor_groups", "version_link"],
+  codeToColumn: {"asset_name": "name", "asset_sequence": "asset_sequence", "asset_shot": "asset_shot", "cached_display_name": "cached_display_name", "cc": "cc", "client_name": "client_name", "created_by": "created_by", "creative_brief": "creative_brief", "date_created": "created_at", "date_updated": "updated_at", "dd_client_name": "dd_client_name", "description": "description", "episodes": "episodes", "filmstrip_thumbnail": "filmstrip_thumbnail_url", "id": "id", "image_source_entity": "image_source_entity", "keep": "keep", "levels": "levels", "linked_projects": "linked_projects", "mocap_takes": "mocap_takes", "notes": "notes", "open_notes": "open_notes", "open_notes_count": "open_notes_count", "outsource": "outsource", "parent_assets": "parent_assets", "project": "project_id", "published_file_link": "published_file_links", "review_versions_link": "review_versions_link", "sequence": "sequence_id", "sequences": "sequences", "sequences_assets": "sequences_assets", "shot": "shot_id", "shots": "shots", "shots_assets": "shots_assets", "status": "status", "sub_assets": "sub_assets", "tags": "tags", "tasks": "tasks", "task_template": "task_template", "thumbnail": "thumbnail_url", "thumbnail_blur_hash": "thumbnail_blur_hash", "type": "asset_type", "updated_by": "updated_by", "vendor_groups": "vendor_groups", "version_link": "version_link"},
+  fieldIndexByColumn: {"name": 0, "asset_sequence": 1, "asset_shot": 2, "cached_display_name": 3, "cc": 4, "client_name": 5, "created_by": 6, "creative_brief": 7, "created_at": 8, "updated_at": 9, "dd_client_name": 10, "description": 11, "episodes": 12, "filmstrip_thumbnail_url": 13, "id": 14, "image_source_entity": 15, "keep": 16, "levels": 17, "linked_projects": 18, "mocap_takes": 19, "notes": 20, "open_notes": 21, "open_notes_count": 22, "outsource": 23, "parent_assets": 24, "project_id": 25, "published_file_links": 26, "review_versions_link": 27, "sequence_id": 28, "sequences": 29, "sequences_assets": 30, "shot_id": 31, "shots": 32, "shots_assets": 33, "status": 34, "sub_assets": 35, "tags": 36, "tasks": 37, "task_template": 38, "thumbnail_url": 39, "thumbnail_blur_hash": 40, "asset_type": 41, "updated_by": 42, "vendor_groups": 43, "version_link": 44},
+  columnsByPgType: {"boolean": ["keep", "outsource"], "integer": ["id", "open_notes_count", "project_id", "sequence_id", "shot_id"], "text": ["name", "cached_display_name", "client_name", "creative_brief", "dd_client_name", "description", "filmstrip_thumbnail_url", "image_source_entity", "status", "task_template", "thumbnail_url", "thumbnail_blur_hash", "asset_type"], "text[]": ["asset_sequence", "asset_shot", "cc", "episodes", "levels", "linked_projects", "mocap_takes", "notes", "open_notes", "parent_assets", "published_file_links", "review_versions_link", "sequences", "sequences_assets", "shots", "shots_assets", "sub_assets", "tags", "tasks", "vendor_groups", "version_link"], "timestamptz": ["created_at", "updated_at"], "uuid": ["created_by", "updated_by"]},
+})
+
+export default schema
@@ -0,0 +1,67 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Schema hash: 81a92b3c15f01869
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "note",
+  table: "notes",
+  csv: "note.csv",
+  containmentColumns: ["tags", "links"],
+  fields: [
+    ["Attachments","multi_entity","permanent","attachments","attachments","text[]","'{}'::text[]"],
+    ["Author","entity","permanent","author","author_id","uuid",null],
+    ["Ayon ID","text","dynamic","ayon_id","ayon_id","text",null],
+    ["Ayon Sync Status","list","dynamic","ayon_sync_status","ayon_sync_status","text",null],
+    ["Body","text","permanent","body","content","text",null],
+    ["Cached Display Name","text","permanent","cached_display_name","cached_display_name","text",null],
+    ["Cc","multi_entity","permanent","cc","cc","text[]","'{}'::text[]"],
+    ["Client Approved","checkbox","permanent","client_approved","client_approved","boolean","false"],
+    ["Client Note","checkbox","permanent","client_note","client_note","boolean","false"],
+    ["Client Note ID","number","dynamic","client_note_id","client_note_id","integer",null],
+    ["Composition","entity","system_owned","composition","composition","text",null],
+    ["Created by","entity","permanent","created_by","created_by","uuid",null],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+    ["Filmstrip Thumbnail","image","permanent","filmstrip_thumbnail","filmstrip_thumbnail_url","text",null],
+    ["Id","number","permanent","id","id","integer",null],
+    ["Image Source Entity","entity","system_owned","image_source_entity","image_source_entity","text",null],
+    ["Links","multi_entity","permanent","links","links","text[]","'{}'::text[]"],
+    ["Notes App Context Entity","entity","permanent","notes_app_context_entity","notes_app_context_entity","text",null],
+    ["OTIO Playable","text","system_owned","otio_playable","otio_playable","text",null],
+    ["Playlist","entity","permanent","playlist","playlist","text",null],
+    ["Project","entity","permanent","project","project_id","integer",null],
+    ["Publish Status","text","permanent","publish_status","publish_status","text",null],
+    ["Read/Unread","list","permanent","read_unread","read_unread","text",null],
+    ["Replies","multi_entity","permanent","replies","replies","text[]","'{}'::text[]"],
+    ["Reply Content","text","permanent","reply_content","reply_content","text",null],
+    ["Status","status_list","permanent","status","status","text",null],
+    ["Subject","text","permanent","subject","subject","text",null],
+    ["Suppress Email Notification","checkbox","permanent","suppress_email_notification","suppress_email_notification","boolean","false"],
+    ["Tags","multi_entity","permanent","tags","tags","text[]","'{}'::text[]"],
+    ["Tasks","multi_entity","permanent","tasks","tasks","text[]","'{}'::text[]"],
+    ["Thumbnail","image","permanent","thumbnail","thumbnail_url","text",null],
+    ["Thumbnail Blur Hash","text","system_owned","thumbnail_blur_hash","thumbnail_blur_hash","text",null],
+    ["To","multi_entity","permanent","f_to","f_to","text[]","'{}'::text[]"],
+    ["Type","list","permanent","type","note_type","text",null],
+    ["Updated by","entity","permanent","updated_by","updated_by","uuid",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["attachments", "author_id", "ayon_id", "ayon_sync_status", "content", "cached_display_name", "cc", "client_approved", "client_note", "client_note_id", "composition", "created_by", "created_at", "updated_at", "filmstrip_thumbnail_url", "id", "image_source_entity", "links", "notes_app_context_entity", "otio_playable", "playlist", "project_id", "publish_status", "read_unread", "replies", "reply_content", "status", "subject", "suppress_email_notification", "tags", "tasks", "thumbnail_url", "thumbnail_blur_hash", "f_to", "note_type", "updated_by"],
+  writableColumns: ["attachments", "author_id", "ayon_id", "ayon_sync_status", "content", "cached_display_name", "cc", "client_approved", "client_note", "client_note_id", "composition", "created_by", "filmstrip_thumbnail_url", "image_source_entity", "links", "notes_app_context_entity", "otio_playable", "playlist", "project_id", "publish_status", "read_unread", "replies", "reply_content", "status", "subject", "suppress_email_notification", "tags", "tasks", "thumbnail_url", "thumbnail_blur_hash", "f_to", "note_type", "updated_by"],
+  codeToColumn: {"attachments": "attachments", "author": "author_id", "ayon_id": "ayon_id", "ayon_sync_status": "ayon_sync_status", "body": "content", "cached_display_name": "cached_display_name", "cc": "cc", "client_approved": "client_approved", "client_note": "client_note", "client_note_id": "client_note_id", "composition": "composition", "created_by": "created_by", "date_created": "created_at", "date_updated": "updated_at", "filmstrip_thumbnail": "filmstrip_thumbnail_url", "id": "id", "image_source_entity": "image_source_entity", "links": "links", "notes_app_context_entity": "notes_app_context_entity", "otio_playable": "otio_playable", "playlist": "playlist", "project": "project_id", "publish_status": "publish_status", "read_unread": "read_unread", "replies": "replies", "reply_content": "reply_content", "status": "status", "subject": "subject", "suppress_email_notification": "suppress_email_notification", "tags": "tags", "tasks": "tasks", "thumbnail": "thumbnail_url", "thumbnail_blur_hash": "thumbnail_blur_hash", "f_to": "f_to", "type": "note_type", "updated_by": "updated_by"},
+  fieldIndexByColumn: {"attachments": 0, "author_id": 1, "ayon_id": 2, "ayon_sync_status": 3, "content": 4, "cached_display_name": 5, "cc": 6, "client_approved": 7, "client_note": 8, "client_note_id": 9, "composition": 10, "created_by": 11, "created_at": 12, "updated_at": 13, "filmstrip_thumbnail_url": 14, "id": 15, "image_source_entity": 16, "links": 17, "notes_app_context_entity": 18, "otio_playable": 19, "playlist": 20, "project_id": 21, "publish_status": 22, "read_unread": 23, "replies": 24, "reply_content": 25, "status": 26, "subject": 27, "suppress_email_notification": 28, "tags": 29, "tasks": 30, "thumbnail_url": 31, "thumbnail_blur_hash": 32, "f_to": 33, "note_type": 34, "updated_by": 35},
+  columnsByPgType: {"boolean": ["client_approved", "client_note", "suppress_email_notification"], "integer": ["client_note_id", "id", "project_id"], "text": ["ayon_id", "ayon_sync_status", "content", "cached_display_name", "composition", "filmstrip_thumbnail_url", "image_source_entity", "notes_app_context_entity", "otio_playable", "playlist", "publish_status", "read_unread", "reply_content", "status", "subject", "thumbnail_url", "thumbnail_blur_hash", "note_type"], "text[]": ["attachments", "cc", "links", "replies", "tags", "tasks", "f_to"], "timestamptz": ["created_at", "updated_at"], "uuid": ["author_id", "created_by", "updated_by"]},
+})
+
+export default schema
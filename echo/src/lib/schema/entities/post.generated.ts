@@ -0,0 +1,43 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Source: echo/src/lib/schema/schema.manual.json (hand-maintained; edit that file)
+// Schema hash: 66f627f1fcf10b3e
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "post",
+  table: "posts",
+  csv: "",
+  containmentColumns: [],
+  fields: [
+    ["Id","number","permanent","id","id","integer",null],
+    ["Author","entity","permanent","author_id","author_id","uuid",null],
+    ["Project","entity","permanent","project","project_id","integer",null],
+    ["Content","text","permanent","content","content","text","''"],
+    ["Content HTML","text","permanent","content_html","content_html","text",null],
+    ["Media Count","number","permanent","media_count","media_count","integer","0"],
+    ["Comment Count","number","permanent","comment_count","comment_count","integer","0"],
+    ["Reaction Count","number","permanent","reaction_count","reaction_count","integer","0"],
+    ["Visibility","list","permanent","visibility","visibility","text","'global'"],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["id", "author_id", "project_id", "content", "content_html", "media_count", "comment_count", "reaction_count", "visibility", "created_at", "updated_at"],
+  writableColumns: ["author_id", "project_id", "content", "content_html", "media_count", "comment_count", "reaction_count", "visibility"],
+  codeToColumn: {"id": "id", "author_id": "author_id", "project": "project_id", "content": "content", "content_html": "content_html", "media_count": "media_count", "comment_count": "comment_count", "reaction_count": "reaction_count", "visibility": "visibility", "date_created": "created_at", "date_updated": "updated_at"},
+  fieldIndexByColumn: {"id": 0, "author_id": 1, "project_id": 2, "content": 3, "content_html": 4, "media_count": 5, "comment_count": 6, "reaction_count": 7, "visibility": 8, "created_at": 9, "updated_at": 10},
+  columnsByPgType: {"integer": ["id", "project_id", "media_count", "comment_count", "reaction_count"], "text": ["content", "content_html", "visibility"], "timestamptz": ["created_at", "updated_at"], "uuid": ["author_id"]},
+})
+
+export default schema
@@ -0,0 +1,47 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Source: echo/src/lib/schema/schema.manual.json (hand-maintained; edit that file)
+// Schema hash: 1ec94aa3b3462549
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "post_media",
+  table: "post_media",
+  csv: "",
+  containmentColumns: [],
+  fields: [
+    ["Id","number","permanent","id","id","integer",null],
+    ["Post","entity","permanent","post_id","post_id","integer",null],
+    ["Storage Path","text","permanent","storage_path","storage_path","text",null],
+    ["File Name","text","permanent","file_name","file_name","text","''"],
+    ["File Size","number","permanent","file_size","file_size","bigint","0"],
+    ["MIME Type","text","permanent","mime_type","mime_type","text","''"],
+    ["Media Type","list","permanent","media_type","media_type","text","'image'"],
+    ["Thumbnail","image","permanent","thumbnail","thumbnail_url","text",null],
+    ["Width","number","permanent","width","width","integer",null],
+    ["Height","number","permanent","height","height","integer",null],
+    ["Duration","float","permanent","duration_seconds","duration_seconds","decimal",null],
+    ["Frame Count","number","permanent","frame_count","frame_count","integer",null],
+    ["FPS","float","permanent","fps","fps","numeric",null],
+    ["Sort Order","number","permanent","sort_order","sort_order","integer","0"],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["id", "post_id", "storage_path", "file_name", "file_size", "mime_type", "media_type", "thumbnail_url", "width", "height", "duration_seconds", "frame_count", "fps", "sort_order", "created_at"],
+  writableColumns: ["post_id", "storage_path", "file_name", "file_size", "mime_type", "media_type", "thumbnail_url", "width", "height", "duration_seconds", "frame_count", "fps", "sort_order"],
+  codeToColumn: {"id": "id", "post_id": "post_id", "storage_path": "storage_path", "file_name": "file_name", "file_size": "file_size", "mime_type": "mime_type", "media_type": "media_type", "thumbnail": "thumbnail_url", "width": "width", "height": "height", "duration_seconds": "duration_seconds", "frame_count": "frame_count", "fps": "fps", "sort_order": "sort_order", "date_created": "created_at"},
+  fieldIndexByColumn: {"id": 0, "post_id": 1, "storage_path": 2, "file_name": 3, "file_size": 4, "mime_type": 5, "media_type": 6, "thumbnail_url": 7, "width": 8, "height": 9, "duration_seconds": 10, "frame_count": 11, "fps": 12, "sort_order": 13, "created_at": 14},
+  columnsByPgType: {"bigint": ["file_size"], "decimal": ["duration_seconds"], "integer": ["id", "post_id", "width", "height", "frame_count", "sort_order"], "numeric": ["fps"], "text": ["storage_path", "file_name", "mime_type", "media_type", "thumbnail_url"], "timestamptz": ["created_at"]},
+})
+
+export default schema
@@ -0,0 +1,38 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Source: echo/src/lib/schema/schema.manual.json (hand-maintained; edit that file)
+// Schema hash: a70037edac921093
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "post_reaction",
+  table: "post_reactions",
+  csv: "",
+  containmentColumns: [],
+  fields: [
+    ["Id","number","permanent","id","id","integer",null],
+    ["User","entity","permanent","user_id","user_id","uuid",null],
+    ["Post","entity","permanent","post_id","post_id","integer",null],
+    ["Comment","entity","permanent","comment_id","comment_id","integer",null],
+    ["Reaction Type","list","permanent","reaction_type","reaction_type","text","'like'"],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["id", "user_id", "post_id", "comment_id", "reaction_type", "created_at"],
+  writableColumns: ["user_id", "post_id", "comment_id", "reaction_type"],
+  codeToColumn: {"id": "id", "user_id": "user_id", "post_id": "post_id", "comment_id": "comment_id", "reaction_type": "reaction_type", "date_created": "created_at"},
+  fieldIndexByColumn: {"id": 0, "user_id": 1, "post_id": 2, "comment_id": 3, "reaction_type": 4, "created_at": 5},
+  columnsByPgType: {"integer": ["id", "post_id", "comment_id"], "text": ["reaction_type"], "timestamptz": ["created_at"], "uuid": ["user_id"]},
+})
+
+export default schema
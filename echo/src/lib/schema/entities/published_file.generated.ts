@@ -0,0 +1,66 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Schema hash: 99eed3b26ffa3b39
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "published_file",
+  table: "published_files",
+  csv: "publishfile.csv",
+  containmentColumns: ["tags"],
+  fields: [
+    ["ayon_representation_id","text","dynamic","ayon_representation_id","ayon_representation_id","text",null],
+    ["Cached Display Name","text","permanent","cached_display_name","cached_display_name","text",null],
+    ["Client Version","number","dynamic","client_version","client_version","integer",null],
+    ["Created by","entity","permanent","created_by","published_by","uuid",null],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+    ["Description","text","permanent","description","description","text",null],
+    ["Downstream Published Files","multi_entity","permanent","downstream_published_files","downstream_published_files","text[]","'{}'::text[]"],
+    ["Element","text","dynamic","element","element","text",null],
+    ["Filmstrip Thumbnail","image","permanent","filmstrip_thumbnail","filmstrip_thumbnail_url","text",null],
+    ["Id","number","permanent","id","id","integer",null],
+    ["Image Source Entity","entity","system_owned","image_source_entity","image_source_entity","text",null],
+    ["Link","entity","permanent","link",null,null,null],
+    ["Name","text","permanent","name","name","text",null],
+    ["Output","text","dynamic","output","output","text",null],
+    ["Path","url","permanent","path","file_path","text",null],
+    ["Path Cache","text","permanent","path_cache","path_cache","text",null],
+    ["Path Cache Storage","entity","permanent","path_cache_storage","path_cache_storage","text",null],
+    ["Path to Source","text","dynamic","path_to_source","path_to_source","text",null],
+    ["Project","entity","permanent","project","project_id","integer",null],
+    ["Published File Name","text","permanent","published_file_name","code","text",null],
+    ["Published File Type","entity","permanent","published_file_type","file_type","text",null],
+    ["Snapshot ID","number","dynamic","snapshot_id","snapshot_id","integer",null],
+    ["Snapshot Type","text","dynamic","snapshot_type","snapshot_type","text",null],
+    ["Status","status_list","permanent","status","status","text",null],
+    ["Submission Notes","text","dynamic","submission_notes","submission_notes","text",null],
+    ["Tags","multi_entity","permanent","tags","tags","text[]","'{}'::text[]"],
+    ["Target Name","entity","dynamic","target_name","target_name","text",null],
+    ["Task","entity","permanent","task","task_id","integer",null],
+    ["Thumbnail","image","permanent","thumbnail","thumbnail_url","text",null],
+    ["Thumbnail Blur Hash","text","system_owned","thumbnail_blur_hash","thumbnail_blur_hash","text",null],
+    ["Updated by","entity","permanent","updated_by","updated_by","uuid",null],
+    ["Upstream Published Files","multi_entity","permanent","upstream_published_files","upstream_published_files","text[]","'{}'::text[]"],
+    ["Version","entity","permanent","version","version_id","integer",null],
+    ["Version Number","number","permanent","version_number","version_number","integer",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["ayon_representation_id", "cached_display_name", "client_version", "published_by", "created_at", "updated_at", "description", "downstream_published_files", "element", "filmstrip_thumbnail_url", "id", "image_source_entity", "name", "output", "file_path", "path_cache", "path_cache_storage", "path_to_source", "project_id", "code", "file_type", "snapshot_id", "snapshot_type", "status", "submission_notes", "tags", "target_name", "task_id", "thumbnail_url", "thumbnail_blur_hash", "updated_by", "upstream_published_files", "version_id", "version_number"],
+  writableColumns: ["ayon_representation_id", "cached_display_name", "client_version", "published_by", "description", "downstream_published_files", "element", "filmstrip_thumbnail_url", "image_source_entity", "name", "output", "file_path", "path_cache", "path_cache_storage", "path_to_source", "project_id", "code", "file_type", "snapshot_id", "snapshot_type", "status", "submission_notes", "tags", "target_name", "task_id", "thumbnail_url", "thumbnail_blur_hash", "updated_by", "upstream_published_files", "version_id", "version_number"],
+  codeToColumn: {"ayon_representation_id": "ayon_representation_id", "cached_display_name": "cached_display_name", "client_version": "client_version", "created_by": "published_by", "date_created": "created_at", "date_updated": "updated_at", "description": "description", "downstream_published_files": "downstream_published_files", "element": "element", "filmstrip_thumbnail": "filmstrip_thumbnail_url", "id": "id", "image_source_entity": "image_source_entity", "name": "name", "output": "output", "path": "file_path", "path_cache": "path_cache", "path_cache_storage": "path_cache_storage", "path_to_source": "path_to_source", "project": "project_id", "published_file_name": "code", "published_file_type": "file_type", "snapshot_id": "snapshot_id", "snapshot_type": "snapshot_type", "status": "status", "submission_notes": "submission_notes", "tags": "tags", "target_name": "target_name", "task": "task_id", "thumbnail": "thumbnail_url", "thumbnail_blur_hash": "thumbnail_blur_hash", "updated_by": "updated_by", "upstream_published_files": "upstream_published_files", "version": "version_id", "version_number": "version_number"},
+  fieldIndexByColumn: {"ayon_representation_id": 0, "cached_display_name": 1, "client_version": 2, "published_by": 3, "created_at": 4, "updated_at": 5, "description": 6, "downstream_published_files": 7, "element": 8, "filmstrip_thumbnail_url": 9, "id": 10, "image_source_entity": 11, "name": 13, "output": 14, "file_path": 15, "path_cache": 16, "path_cache_storage": 17, "path_to_source": 18, "project_id": 19, "code": 20, "file_type": 21, "snapshot_id": 22, "snapshot_type": 23, "status": 24, "submission_notes": 25, "tags": 26, "target_name": 27, "task_id": 28, "thumbnail_url": 29, "thumbnail_blur_hash": 30, "updated_by": 31, "upstream_published_files": 32, "version_id": 33, "version_number": 34},
+  columnsByPgType: {"integer": ["client_version", "id", "project_id", "snapshot_id", "task_id", "version_id", "version_number"], "text": ["ayon_representation_id", "cached_display_name", "description", "element", "filmstrip_thumbnail_url", "image_source_entity", "name", "output", "file_path", "path_cache", "path_cache_storage", "path_to_source", "code", "file_type", "snapshot_type", "status", "submission_notes", "target_name", "thumbnail_url", "thumbnail_blur_hash"], "text[]": ["downstream_published_files", "tags", "upstream_published_files"], "timestamptz": ["created_at", "updated_at"], "uuid": ["published_by", "updated_by"]},
+})
+
+export default schema
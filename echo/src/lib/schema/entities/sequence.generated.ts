@@ -0,0 +1,66 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Schema hash: 80b06ebe21f890c8
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "sequence",
+  table: "sequences",
+  csv: "sequence.csv",
+  containmentColumns: ["tags", "shots", "assets"],
+  fields: [
+    ["Assets","multi_entity","permanent","assets","assets","text[]","'{}'::text[]"],
+    ["Ayon ID","text","dynamic","ayon_id","ayon_id","text",null],
+    ["Ayon Sync Status","list","dynamic","ayon_sync_status","ayon_sync_status","text",null],
+    ["Cached Display Name","text","permanent","cached_display_name","cached_display_name","text",null],
+    ["Cc","multi_entity","permanent","cc","cc","text[]","'{}'::text[]"],
+    ["Client Name","text","dynamic","client_name","client_name","text",null],
+    ["Created by","entity","permanent","created_by","created_by","uuid",null],
+    ["Cuts","multi_entity","permanent","cuts","cuts","text[]","'{}'::text[]"],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+    ["DD Client Name","text","dynamic","dd_client_name","dd_client_name","text",null],
+    ["Description","text","permanent","description","description","text",null],
+    ["Episode","entity","permanent","episode","episode","text",null],
+    ["Filmstrip Thumbnail","image","permanent","filmstrip_thumbnail","filmstrip_thumbnail_url","text",null],
+    ["Id","number","permanent","id","id","integer",null],
+    ["Image Source Entity","entity","system_owned","image_source_entity","image_source_entity","text",null],
+    ["Notes","multi_entity","permanent","notes","notes","text[]","'{}'::text[]"],
+    ["Open Notes","multi_entity","permanent","open_notes","open_notes","text[]","'{}'::text[]"],
+    ["Open Notes Count","summary","permanent","open_notes_count","open_notes_count","integer","0"],
+    ["Plates","multi_entity","dynamic","plates","plates","text[]","'{}'::text[]"],
+    ["Project","entity","permanent","project","project_id","integer",null],
+    ["Published File <-> Link","multi_entity","dynamic","published_file_link","published_file_links","text[]","'{}'::text[]"],
+    ["Scenes","multi_entity","dynamic","scenes","scenes","text[]","'{}'::text[]"],
+    ["Sequence Name","text","permanent","sequence_name","name","text",null],
+    ["Shots","multi_entity","permanent","shots","shots","text[]","'{}'::text[]"],
+    ["Status","status_list","permanent","status","status","text",null],
+    ["Tags","multi_entity","permanent","tags","tags","text[]","'{}'::text[]"],
+    ["Tasks","multi_entity","permanent","tasks","tasks","text[]","'{}'::text[]"],
+    ["Task Template","entity","permanent","task_template","task_template","text",null],
+    ["Thumbnail","image","permanent","thumbnail","thumbnail_url","text",null],
+    ["Thumbnail Blur Hash","text","system_owned","thumbnail_blur_hash","thumbnail_blur_hash","text",null],
+    ["Type","list","permanent","type","sequence_type","text",null],
+    ["Updated by","entity","permanent","updated_by","updated_by","uuid",null],
+    ["Vendor Groups","multi_entity","dynamic","vendor_groups","vendor_groups","text[]","'{}'::text[]"],
+    ["Version <-> Link","multi_entity","dynamic","version_link","version_link","text[]","'{}'::text[]"],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["assets", "ayon_id", "ayon_sync_status", "cached_display_name", "cc", "client_name", "created_by", "cuts", "created_at", "updated_at", "dd_client_name", "description", "episode", "filmstrip_thumbnail_url", "id", "image_source_entity", "notes", "open_notes", "open_notes_count", "plates", "project_id", "published_file_links", "scenes", "name", "shots", "status", "tags", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "sequence_type", "updated_by", "vendor_groups", "version_link"],
+  writableColumns: ["assets", "ayon_id", "ayon_sync_status", "cached_display_name", "cc", "client_name", "created_by", "cuts", "dd_client_name", "description", "episode", "filmstrip_thumbnail_url", "image_source_entity", "notes", "open_notes", "plates", "project_id", "published_file_links", "scenes", "name", "shots", "status", "tags", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "sequence_type", "updated_by", "vendor_groups", "version_link"],
+  codeToColumn: {"assets": "assets", "ayon_id": "ayon_id", "ayon_sync_status": "ayon_sync_status", "cached_display_name": "cached_display_name", "cc": "cc", "client_name": "client_name", "created_by": "created_by", "cuts": "cuts", "date_created": "created_at", "date_updated": "updated_at", "dd_client_name": "dd_client_name", "description": "description", "episode": "episode", "filmstrip_thumbnail": "filmstrip_thumbnail_url", "id": "id", "image_source_entity": "image_source_entity", "notes": "notes", "open_notes": "open_notes", "open_notes_count": "open_notes_count", "plates": "plates", "project": "project_id", "published_file_link": "published_file_links", "scenes": "scenes", "sequence_name": "name", "shots": "shots", "status": "status", "tags": "tags", "tasks": "tasks", "task_template": "task_template", "thumbnail": "thumbnail_url", "thumbnail_blur_hash": "thumbnail_blur_hash", "type": "sequence_type", "updated_by": "updated_by", "vendor_groups": "vendor_groups", "version_link": "version_link"},
+  fieldIndexByColumn: {"assets": 0, "ayon_id": 1, "ayon_sync_status": 2, "cached_display_name": 3, "cc": 4, "client_name": 5, "created_by": 6, "cuts": 7, "created_at": 8, "updated_at": 9, "dd_client_name": 10, "description": 11, "episode": 12, "filmstrip_thumbnail_url": 13, "id": 14, "image_source_entity": 15, "notes": 16, "open_notes": 17, "open_notes_count": 18, "plates": 19, "project_id": 20, "published_file_links": 21, "scenes": 22, "name": 23, "shots": 24, "status": 25, "tags": 26, "tasks": 27, "task_template": 28, "thumbnail_url": 29, "thumbnail_blur_hash": 30, "sequence_type": 31, "updated_by": 32, "vendor_groups": 33, "version_link": 34},
+  columnsByPgType: {"integer": ["id", "open_notes_count", "project_id"], "text": ["ayon_id", "ayon_sync_status", "cached_display_name", "client_name", "dd_client_name", "description", "episode", "filmstrip_thumbnail_url", "image_source_entity", "name", "status", "task_template", "thumbnail_url", "thumbnail_blur_hash", "sequence_type"], "text[]": ["assets", "cc", "cuts", "notes", "open_notes", "plates", "published_file_links", "scenes", "shots", "tags", "tasks", "vendor_groups", "version_link"], "timestamptz": ["created_at", "updated_at"], "uuid": ["created_by", "updated_by"]},
+})
+
+export default schema
@@ -0,0 +1,96 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Schema hash: 2d8f9f72f1faace5
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "shot",
+  table: "shots",
+  csv: "shots.csv",
+  containmentColumns: ["tags", "assets", "vendor_groups"],
+  fields: [
+    ["Assets","multi_entity","permanent","assets","assets","text[]","'{}'::text[]"],
+    ["Ayon ID","text","dynamic","ayon_id","ayon_id","text",null],
+    ["Ayon Sync Status","list","dynamic","ayon_sync_status","ayon_sync_status","text",null],
+    ["Cached Display Name","text","permanent","cached_display_name","cached_display_name","text",null],
+    ["Cc","multi_entity","permanent","cc","cc","text[]","'{}'::text[]"],
+    ["Client Name","text","dynamic","client_name","client_name","text",null],
+    ["Comp Note","text","dynamic","comp_note","comp_note","text",null],
+    ["Created by","entity","permanent","created_by","created_by","uuid",null],
+    ["Cut Duration","number","permanent","cut_duration","cut_duration","integer",null],
+    ["Cut In","number","permanent","cut_in","cut_in","integer",null],
+    ["Cut Order","number","system_owned","cut_order","cut_order","integer",null],
+    ["Cut Out","number","system_owned","cut_out","cut_out","integer",null],
+    ["Cut Summary","text","permanent","cut_summary","cut_summary","text",null],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+    ["DD Client Name","text","dynamic","dd_client_name","dd_client_name","text",null],
+    ["DD Location","list","dynamic","dd_location","dd_location","text",null],
+    ["Delivery Date","date","dynamic","delivery_date","delivery_date","date",null],
+    ["Description","text","permanent","description","description","text",null],
+    ["Duration Summary","text","permanent","duration_summary","duration_summary","text",null],
+    ["Filmstrip Thumbnail","image","permanent","filmstrip_thumbnail","filmstrip_thumbnail_url","text",null],
+    ["Head Duration","number","permanent","head_duration","head_duration","integer",null],
+    ["Head In","number","permanent","head_in","head_in","integer",null],
+    ["Head Out","number","permanent","head_out","head_out","integer",null],
+    ["Id","number","permanent","id","id","integer",null],
+    ["Image Source Entity","entity","system_owned","image_source_entity","image_source_entity","text",null],
+    ["Next Review","date","dynamic","next_review","next_review","date",null],
+    ["Notes","multi_entity","permanent","notes","notes","text[]","'{}'::text[]"],
+    ["Open Notes","multi_entity","permanent","open_notes","open_notes","text[]","'{}'::text[]"],
+    ["Open Notes Count","summary","permanent","open_notes_count","open_notes_count","integer","0"],
+    ["Parent Shots","multi_entity","permanent","parent_shots","parent_shots","text[]","'{}'::text[]"],
+    ["Plates","multi_entity","dynamic","plates","plates","text[]","'{}'::text[]"],
+    ["Project","entity","permanent","project","project_id","integer",null],
+    ["Published File <-> Link","multi_entity","dynamic","published_file_link","published_file_links","text[]","'{}'::text[]"],
+    ["Raw Cut Duration","number","permanent","raw_cut_duration","raw_cut_duration","integer",null],
+    ["Raw Cut In","number","permanent","raw_cut_in","raw_cut_in","integer",null],
+    ["Raw Cut Out","number","permanent","raw_cut_out","raw_cut_out","integer",null],
+    ["Raw Head Duration","number","permanent","raw_head_duration","raw_head_duration","integer",null],
+    ["Raw Head In","number","permanent","raw_head_in","raw_head_in","integer",null],
+    ["Raw Head Out","number","permanent","raw_head_out","raw_head_out","integer",null],
+    ["Raw Tail Duration","number","permanent","raw_tail_duration","raw_tail_duration","integer",null],
+    ["Raw Tail In","number","permanent","raw_tail_in","raw_tail_in","integer",null],
+    ["Raw Tail Out","number","permanent","raw_tail_out","raw_tail_out","integer",null],
+    ["Seq Shot","text","dynamic","seq_shot","seq_shot","text",null],
+    ["Sequence","entity","system_owned","sequence","sequence_id","integer",null],
+    ["Shot Name","text","permanent","shot_name","name","text",null],
+    ["Shot Code","text","permanent","shot_code","code","text",null],
+    ["Shot Notes","text","dynamic","shot_notes","shot_notes","text",null],
+    ["Status","status_list","permanent","status","status","text",null],
+    ["Sub Shots","multi_entity","permanent","sub_shots","sub_shots","text[]","'{}'::text[]"],
+    ["Tags","multi_entity","permanent","tags","tags","text[]","'{}'::text[]"],
+    ["Tail Duration","number","permanent","tail_duration","tail_duration","integer",null],
+    ["Tail In","number","permanent","tail_in","tail_in","integer",null],
+    ["Tail Out","number","permanent","tail_out","tail_out","integer",null],
+    ["Target Date","date","dynamic","target_date","target_date","date",null],
+    ["Tasks","multi_entity","permanent","tasks","tasks","text[]","'{}'::text[]"],
+    ["Task Template","entity","permanent","task_template","task_template","text",null],
+    ["Thumbnail","image","permanent","thumbnail","thumbnail_url","text",null],
+    ["Thumbnail Blur Hash","text","system_owned","thumbnail_blur_hash","thumbnail_blur_hash","text",null],
+    ["Turnover #","number","dynamic","turnover","turnover","integer",null],
+    ["Type","list","permanent","type","shot_type","text",null],
+    ["Updated by","entity","permanent","updated_by","updated_by","uuid",null],
+    ["Vendor Groups","multi_entity","dynamic","vendor_groups","vendor_groups","text[]","'{}'::text[]"],
+    ["Version <-> Link","multi_entity","dynamic","version_link","version_link","text[]","'{}'::text[]"],
+    ["Working Duration","number","permanent","working_duration","working_duration","integer",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["assets", "ayon_id", "ayon_sync_status", "cached_display_name", "cc", "client_name", "comp_note", "created_by", "cut_duration", "cut_in", "cut_order", "cut_out", "cut_summary", "created_at", "updated_at", "dd_client_name", "dd_location", "delivery_date", "description", "duration_summary", "filmstrip_thumbnail_url", "head_duration", "head_in", "head_out", "id", "image_source_entity", "next_review", "notes", "open_notes", "open_notes_count", "parent_shots", "plates", "project_id", "published_file_links", "raw_cut_duration", "raw_cut_in", "raw_cut_out", "raw_head_duration", "raw_head_in", "raw_head_out", "raw_tail_duration", "raw_tail_in", "raw_tail_out", "seq_shot", "sequence_id", "name", "code", "shot_notes", "status", "sub_shots", "tags", "tail_duration", "tail_in", "tail_out", "target_date", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "turnover", "shot_type", "updated_by", "vendor_groups", "version_link", "working_duration"],
+  writableColumns: ["assets", "ayon_id", "ayon_sync_status", "cached_display_name", "cc", "client_name", "comp_note", "created_by", "cut_duration", "cut_in", "cut_order", "cut_out", "cut_summary", "dd_client_name", "dd_location", "delivery_date", "description", "duration_summary", "filmstrip_thumbnail_url", "head_duration", "head_in", "head_out", "image_source_entity", "next_review", "notes", "open_notes", "parent_shots", "plates", "project_id", "published_file_links", "raw_cut_duration", "raw_cut_in", "raw_cut_out", "raw_head_duration", "raw_head_in", "raw_head_out", "raw_tail_duration", "raw_tail_in", "raw_tail_out", "seq_shot", "sequence_id", "name", "code", "shot_notes", "status", "sub_shots", "tags", "tail_duration", "tail_in", "tail_out", "target_date", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "turnover", "shot_type", "updated_by", "vendor_groups", "version_link", "working_duration"],
+  codeToColumn: {"assets": "assets", "ayon_id": "ayon_id", "ayon_sync_status": "ayon_sync_status", "cached_display_name": "cached_display_name", "cc": "cc", "client_name": "client_name", "comp_note": "comp_note", "created_by": "created_by", "cut_duration": "cut_duration", "cut_in": "cut_in", "cut_order": "cut_order", "cut_out": "cut_out", "cut_summary": "cut_summary", "date_created": "created_at", "date_updated": "updated_at", "dd_client_name": "dd_client_name", "dd_location": "dd_location", "delivery_date": "delivery_date", "description": "description", "duration_summary": "duration_summary", "filmstrip_thumbnail": "filmstrip_thumbnail_url", "head_duration": "head_duration", "head_in": "head_in", "head_out": "head_out", "id": "id", "image_source_entity": "image_source_entity", "next_review": "next_review", "notes": "notes", "open_notes": "open_notes", "open_notes_count": "open_notes_count", "parent_shots": "parent_shots", "plates": "plates", "project": "project_id", "published_file_link": "published_file_links", "raw_cut_duration": "raw_cut_duration", "raw_cut_in": "raw_cut_in", "raw_cut_out": "raw_cut_out", "raw_head_duration": "raw_head_duration", "raw_head_in": "raw_head_in", "raw_head_out": "raw_head_out", "raw_tail_duration": "raw_tail_duration", "raw_tail_in": "raw_tail_in", "raw_tail_out": "raw_tail_out", "seq_shot": "seq_shot", "sequence": "sequence_id", "shot_name": "name", "shot_code": "code", "shot_notes": "shot_notes", "status": "status", "sub_shots": "sub_shots", "tags": "tags", "tail_duration": "tail_duration", "tail_in": "tail_in", "tail_out": "tail_out", "target_date": "target_date", "tasks": "tasks", "task_template": "task_template", "thumbnail": "thumbnail_url", "thumbnail_blur_hash": "thumbnail_blur_hash", "turnover": "turnover", "type": "shot_type", "updated_by": "updated_by", "vendor_groups": "vendor_groups", "version_link": "version_link", "working_duration": "working_duration"},
+  fieldIndexByColumn: {"assets": 0, "ayon_id": 1, "ayon_sync_status": 2, "cached_display_name": 3, "cc": 4, "client_name": 5, "comp_note": 6, "created_by": 7, "cut_duration": 8, "cut_in": 9, "cut_order": 10, "cut_out": 11, "cut_summary": 12, "created_at": 13, "updated_at": 14, "dd_client_name": 15, "dd_location": 16, "delivery_date": 17, "description": 18, "duration_summary": 19, "filmstrip_thumbnail_url": 20, "head_duration": 21, "head_in": 22, "head_out": 23, "id": 24, "image_source_entity": 25, "next_review": 26, "notes": 27, "open_notes": 28, "open_notes_count": 29, "parent_shots": 30, "plates": 31, "project_id": 32, "published_file_links": 33, "raw_cut_duration": 34, "raw_cut_in": 35, "raw_cut_out": 36, "raw_head_duration": 37, "raw_head_in": 38, "raw_head_out": 39, "raw_tail_duration": 40, "raw_tail_in": 41, "raw_tail_out": 42, "seq_shot": 43, "sequence_id": 44, "name": 45, "code": 46, "shot_notes": 47, "status": 48, "sub_shots": 49, "tags": 50, "tail_duration": 51, "tail_in": 52, "tail_out": 53, "target_date": 54, "tasks": 55, "task_template": 56, "thumbnail_url": 57, "thumbnail_blur_hash": 58, "turnover": 59, "shot_type": 60, "updated_by": 61, "vendor_groups": 62, "version_link": 63, "working_duration": 64},
+  columnsByPgType: {"date": ["delivery_date", "next_review", "target_date"], "integer": ["cut_duration", "cut_in", "cut_order", "cut_out", "head_duration", "head_in", "head_out", "id", "open_notes_count", "project_id", "raw_cut_duration", "raw_cut_in", "raw_cut_out", "raw_head_duration", "raw_head_in", "raw_head_out", "raw_tail_duration", "raw_tail_in", "raw_tail_out", "sequence_id", "tail_duration", "tail_in", "tail_out", "turnover", "working_duration"], "text": ["ayon_id", "ayon_sync_status", "cached_display_name", "client_name", "comp_note", "cut_summary", "dd_client_name", "dd_location", "description", "duration_summary", "filmstrip_thumbnail_url", "image_source_entity", "seq_shot", "name", "code", "shot_notes", "status", "task_template", "thumbnail_url", "thumbnail_blur_hash", "shot_type"], "text[]": ["assets", "cc", "notes", "open_notes", "parent_shots", "plates", "published_file_links", "sub_shots", "tags", "tasks", "vendor_groups", "version_link"], "timestamptz": ["created_at", "updated_at"], "uuid": ["created_by", "updated_by"]},
+})
+
+export default schema
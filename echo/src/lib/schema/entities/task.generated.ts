@@ -0,0 +1,94 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Schema hash: c507c3d342668f2e
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "task",
+  table: "tasks",
+  csv: "task.csv",
+  containmentColumns: ["tags", "reviewer", "versions"],
+  fields: [
+    ["Assigned To","multi_entity","permanent","assigned_to","assigned_to","uuid",null],
+    ["ayon_assignees","list","dynamic","ayon_assignees","ayon_assignees","text",null],
+    ["Ayon ID","text","dynamic","ayon_id","ayon_id","text",null],
+    ["Ayon Sync Status","list","dynamic","ayon_sync_status","ayon_sync_status","text",null],
+    ["Bid","duration","permanent","bid","bid","numeric",null],
+    ["Bid Breakdown","text","dynamic","bid_breakdown","bid_breakdown","text",null],
+    ["Cached Display Name","text","permanent","cached_display_name","cached_display_name","text",null],
+    ["Casting","text","dynamic","casting","casting","text",null],
+    ["Cc","multi_entity","permanent","cc","cc","text[]","'{}'::text[]"],
+    ["Created by","entity","permanent","created_by","created_by","uuid",null],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+    ["DDNA Bid","duration","dynamic","ddna_bid","ddna_bid","numeric",null],
+    ["DDNA ID#","number","dynamic","ddna_id","ddna_id","integer",null],
+    ["DDNA TO#","text","dynamic","ddna_to","ddna_to","text",null],
+    ["Dependency Violation","checkbox","permanent","dependency_violation","dependency_violation","boolean","false"],
+    ["Description","text","dynamic","description","description","text",null],
+    ["Downstream Dependency","multi_entity","permanent","downstream_dependency","downstream_dependency","text[]","'{}'::text[]"],
+    ["Due Date","date","dynamic","due_date","due_date","date",null],
+    ["Duration","duration","permanent","duration","duration","numeric",null],
+    ["End Date","date","permanent","end_date","end_date","date",null],
+    ["Filmstrip Thumbnail","image","permanent","filmstrip_thumbnail","filmstrip_thumbnail_url","text",null],
+    ["Gantt Bar Color","color","permanent","gantt_bar_color","gantt_bar_color","text",null],
+    ["Id","number","permanent","id","id","integer",null],
+    ["Image Source Entity","entity","system_owned","image_source_entity","image_source_entity","text",null],
+    ["Implicit","checkbox","permanent","implicit","implicit","boolean","false"],
+    ["Inventory Date","date","permanent","inventory_date","inventory_date","date",null],
+    ["Link","entity","permanent","link",null,null,null],
+    ["Milestone","checkbox","permanent","milestone","milestone","boolean","false"],
+    ["Notes","multi_entity","permanent","notes","notes_links","text[]","'{}'::text[]"],
+    ["Notes","text","dynamic","notes_text","notes","text",null],
+    ["Open Notes","multi_entity","permanent","open_notes","open_notes","text[]","'{}'::text[]"],
+    ["Open Notes Count","summary","permanent","open_notes_count","open_notes_count","integer","0"],
+    ["Pinned","checkbox","permanent","pinned","pinned","boolean","false"],
+    ["Pipeline Step","entity","permanent","pipeline_step","step_id","integer",null],
+    ["Priority","list","dynamic","priority","priority","text",null],
+    ["Prod Comments","text","dynamic","prod_comments","prod_comments","text",null],
+    ["Project","entity","permanent","project","project_id","integer",null],
+    ["Proposed Start Date","date","system_owned","proposed_start_date","proposed_start_date","date",null],
+    ["Publish Version Number","summary","dynamic","publish_version_number","publish_version_number","integer","0"],
+    ["Reviewer","multi_entity","system_owned","reviewer","reviewer","text[]","'{}'::text[]"],
+    ["Review Versions <-> Task","multi_entity","dynamic","review_versions_task","review_versions_task","text[]","'{}'::text[]"],
+    ["Schedule change comments","text","dynamic","schedule_change_comments","schedule_change_comments","text",null],
+    ["Sibling Tasks","multi_entity","permanent","sibling_tasks","sibling_tasks","text[]","'{}'::text[]"],
+    ["Sort Order","number","dynamic","sort_order","sort_order","integer",null],
+    ["Split Durations","serializable","permanent","split_durations","split_durations","jsonb",null],
+    ["Splits","serializable","permanent","splits","splits","jsonb",null],
+    ["Start Date","date","permanent","start_date","start_date","date",null],
+    ["Status","status_list","permanent","status","status","text",null],
+    ["Tags","multi_entity","permanent","tags","tags","text[]","'{}'::text[]"],
+    ["Task Complexity","list","dynamic","task_complexity","task_complexity","text",null],
+    ["Task Name","text","permanent","task_name","name","text",null],
+    ["Task Template","entity","permanent","task_template","task_template","text",null],
+    ["Template Task","entity","permanent","template_task","template_task","text",null],
+    ["Thumbnail","image","permanent","thumbnail","thumbnail_url","text",null],
+    ["Thumbnail Blur Hash","text","system_owned","thumbnail_blur_hash","thumbnail_blur_hash","text",null],
+    ["Time Logged","duration","permanent","time_logged","time_logged","numeric",null],
+    ["Time Logged - % of Bid","percent","permanent","time_logged_of_bid","time_logged_of_bid","numeric",null],
+    ["Time Logged - Over/Under Bid","duration","permanent","time_logged_over_under_bid","time_logged_over_under_bid","numeric",null],
+    ["Updated by","entity","permanent","updated_by","updated_by","uuid",null],
+    ["Upstream Dependency","multi_entity","permanent","upstream_dependency","upstream_dependency","text[]","'{}'::text[]"],
+    ["Versions","multi_entity","system_owned","versions","versions","text[]","'{}'::text[]"],
+    ["Workload Assignee Count","number","permanent","workload_assignee_count","workload_assignee_count","integer",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["assigned_to", "ayon_assignees", "ayon_id", "ayon_sync_status", "bid", "bid_breakdown", "cached_display_name", "casting", "cc", "created_by", "created_at", "updated_at", "ddna_bid", "ddna_id", "ddna_to", "dependency_violation", "description", "downstream_dependency", "due_date", "duration", "end_date", "filmstrip_thumbnail_url", "gantt_bar_color", "id", "image_source_entity", "implicit", "inventory_date", "milestone", "notes_links", "notes", "open_notes", "open_notes_count", "pinned", "step_id", "priority", "prod_comments", "project_id", "proposed_start_date", "publish_version_number", "reviewer", "review_versions_task", "schedule_change_comments", "sibling_tasks", "sort_order", "split_durations", "splits", "start_date", "status", "tags", "task_complexity", "name", "task_template", "template_task", "thumbnail_url", "thumbnail_blur_hash", "time_logged", "time_logged_of_bid", "time_logged_over_under_bid", "updated_by", "upstream_dependency", "versions", "workload_assignee_count"],
+  writableColumns: ["assigned_to", "ayon_assignees", "ayon_id", "ayon_sync_status", "bid", "bid_breakdown", "cached_display_name", "casting", "cc", "created_by", "ddna_bid", "ddna_id", "ddna_to", "dependency_violation", "description", "downstream_dependency", "due_date", "duration", "end_date", "filmstrip_thumbnail_url", "gantt_bar_color", "image_source_entity", "implicit", "inventory_date", "milestone", "notes_links", "notes", "open_notes", "pinned", "step_id", "priority", "prod_comments", "project_id", "proposed_start_date", "publish_version_number", "reviewer", "review_versions_task", "schedule_change_comments", "sibling_tasks", "sort_order", "split_durations", "splits", "start_date", "status", "tags", "task_complexity", "name", "task_template", "template_task", "thumbnail_url", "thumbnail_blur_hash", "time_logged", "time_logged_of_bid", "time_logged_over_under_bid", "updated_by", "upstream_dependency", "versions"],
+  codeToColumn: {"assigned_to": "assigned_to", "ayon_assignees": "ayon_assignees", "ayon_id": "ayon_id", "ayon_sync_status": "ayon_sync_status", "bid": "bid", "bid_breakdown": "bid_breakdown", "cached_display_name": "cached_display_name", "casting": "casting", "cc": "cc", "created_by": "created_by", "date_created": "created_at", "date_updated": "updated_at", "ddna_bid": "ddna_bid", "ddna_id": "ddna_id", "ddna_to": "ddna_to", "dependency_violation": "dependency_violation", "description": "description", "downstream_dependency": "downstream_dependency", "due_date": "due_date", "duration": "duration", "end_date": "end_date", "filmstrip_thumbnail": "filmstrip_thumbnail_url", "gantt_bar_color": "gantt_bar_color", "id": "id", "image_source_entity": "image_source_entity", "implicit": "implicit", "inventory_date": "inventory_date", "milestone": "milestone", "notes": "notes_links", "notes_text": "notes", "open_notes": "open_notes", "open_notes_count": "open_notes_count", "pinned": "pinned", "pipeline_step": "step_id", "priority": "priority", "prod_comments": "prod_comments", "project": "project_id", "proposed_start_date": "proposed_start_date", "publish_version_number": "publish_version_number", "reviewer": "reviewer", "review_versions_task": "review_versions_task", "schedule_change_comments": "schedule_change_comments", "sibling_tasks": "sibling_tasks", "sort_order": "sort_order", "split_durations": "split_durations", "splits": "splits", "start_date": "start_date", "status": "status", "tags": "tags", "task_complexity": "task_complexity", "task_name": "name", "task_template": "task_template", "template_task": "template_task", "thumbnail": "thumbnail_url", "thumbnail_blur_hash": "thumbnail_blur_hash", "time_logged": "time_logged", "time_logged_of_bid": "time_logged_of_bid", "time_logged_over_under_bid": "time_logged_over_under_bid", "updated_by": "updated_by", "upstream_dependency": "upstream_dependency", "versions": "versions", "workload_assignee_count": "workload_assignee_count"},
+  fieldIndexByColumn: {"assigned_to": 0, "ayon_assignees": 1, "ayon_id": 2, "ayon_sync_status": 3, "bid": 4, "bid_breakdown": 5, "cached_display_name": 6, "casting": 7, "cc": 8, "created_by": 9, "created_at": 10, "updated_at": 11, "ddna_bid": 12, "ddna_id": 13, "ddna_to": 14, "dependency_violation": 15, "description": 16, "downstream_dependency": 17, "due_date": 18, "duration": 19, "end_date": 20, "filmstrip_thumbnail_url": 21, "gantt_bar_color": 22, "id": 23, "image_source_entity": 24, "implicit": 25, "inventory_date": 26, "milestone": 28, "notes_links": 29, "notes": 30, "open_notes": 31, "open_notes_count": 32, "pinned": 33, "step_id": 34, "priority": 35, "prod_comments": 36, "project_id": 37, "proposed_start_date": 38, "publish_version_number": 39, "reviewer": 40, "review_versions_task": 41, "schedule_change_comments": 42, "sibling_tasks": 43, "sort_order": 44, "split_durations": 45, "splits": 46, "start_date": 47, "status": 48, "tags": 49, "task_complexity": 50, "name": 51, "task_template": 52, "template_task": 53, "thumbnail_url": 54, "thumbnail_blur_hash": 55, "time_logged": 56, "time_logged_of_bid": 57, "time_logged_over_under_bid": 58, "updated_by": 59, "upstream_dependency": 60, "versions": 61, "workload_assignee_count": 62},
+  columnsByPgType: {"boolean": ["dependency_violation", "implicit", "milestone", "pinned"], "date": ["due_date", "end_date", "inventory_date", "proposed_start_date", "start_date"], "integer": ["ddna_id", "id", "open_notes_count", "step_id", "project_id", "publish_version_number", "sort_order", "workload_assignee_count"], "jsonb": ["split_durations", "splits"], "numeric": ["bid", "ddna_bid", "duration", "time_logged", "time_logged_of_bid", "time_logged_over_under_bid"], "text": ["ayon_assignees", "ayon_id", "ayon_sync_status", "bid_breakdown", "cached_display_name", "casting", "ddna_to", "description", "filmstrip_thumbnail_url", "gantt_bar_color", "image_source_entity", "notes", "priority", "prod_comments", "schedule_change_comments", "status", "task_complexity", "name", "task_template", "template_task", "thumbnail_url", "thumbnail_blur_hash"], "text[]": ["cc", "downstream_dependency", "notes_links", "open_notes", "reviewer", "review_versions_task", "sibling_tasks", "tags", "upstream_dependency", "versions"], "timestamptz": ["created_at", "updated_at"], "uuid": ["assigned_to", "created_by", "updated_by"]},
+})
+
+export default schema
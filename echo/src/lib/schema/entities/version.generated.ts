@@ -0,0 +1,97 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+// Schema hash: 5f71eed1e7601a7f
+
+import {
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({
+  entity: "version",
+  table: "versions",
+  csv: "version.csv",
+  containmentColumns: ["tags", "playlists", "published_files"],
+  fields: [
+    ["Artist","entity","permanent","artist","artist_id","uuid",null],
+    ["Ayon ID","text","dynamic","ayon_id","ayon_id","text",null],
+    ["ayon_product_id","text","dynamic","ayon_product_id","ayon_product_id","text",null],
+    ["Ayon Sync Status","list","dynamic","ayon_sync_status","ayon_sync_status","text",null],
+    ["ayon_version_id","text","dynamic","ayon_version_id","ayon_version_id","text",null],
+    ["Cached Display Name","text","permanent","cached_display_name","cached_display_name","text",null],
+    ["Client Approved","checkbox","permanent","client_approved","client_approved","boolean","false"],
+    ["Client Approved At","date_time","permanent","client_approved_at","client_approved_at","timestamptz",null],
+    ["Client Approved by","entity","permanent","client_approved_by","client_approved_by","text",null],
+    ["Client Version Name","text","permanent","client_version_name","client_version_name","text",null],
+    ["Created by","entity","permanent","created_by","created_by","uuid",null],
+    ["Cuts","multi_entity","system_owned","cuts","cuts","text[]","'{}'::text[]"],
+    ["Date Created","date_time","permanent","date_created","created_at","timestamptz",null],
+    ["Date Updated","date_time","permanent","date_updated","updated_at","timestamptz",null],
+    ["Date Viewed","date_time","permanent","date_viewed","date_viewed","timestamptz",null],
+    ["Deliveries","multi_entity","dynamic","deliveries","deliveries","text[]","'{}'::text[]"],
+    ["Department","text","dynamic","department","department","text",null],
+    ["Description","text","permanent","description","description","text",null],
+    ["Editorial QC","status_list","dynamic","editorial_qc","editorial_qc","text",null],
+    ["Filmstrip Thumbnail","image","permanent","filmstrip_thumbnail","filmstrip_thumbnail_url","text",null],
+    ["First Frame","number","system_owned","first_frame","first_frame","integer",null],
+    ["Flagged","checkbox","permanent","flagged","flagged","boolean","false"],
+    ["Frame Count","number","permanent","frame_count","frame_count","integer",null],
+    ["Frame Range","text","permanent","frame_range","frame_range","text",null],
+    ["Frame Rate","float","system_owned","frame_rate","frame_rate","double precision",null],
+    ["Frames Aspect Ratio","float","system_owned","frames_aspect_ratio","frames_aspect_ratio","double precision",null],
+    ["Frames Have Slate","checkbox","system_owned","frames_have_slate","frames_have_slate","boolean","false"],
+    ["Id","number","permanent","id","id","integer",null],
+    ["Image Source Entity","entity","system_owned","image_source_entity","image_source_entity","text",null],
+    ["Last Frame","number","system_owned","last_frame","last_frame","integer",null],
+    ["Link","entity","permanent","link","link","text",null],
+    ["Media Center Import Time","date_time","permanent","media_center_import_time","media_center_import_time","timestamptz",null],
+    ["Movie Aspect Ratio","float","system_owned","movie_aspect_ratio","movie_aspect_ratio","double precision",null],
+    ["Movie Has Slate","checkbox","system_owned","movie_has_slate","movie_has_slate","boolean","false"],
+    ["Notes","multi_entity","permanent","notes","notes","text[]","'{}'::text[]"],
+    ["Nuke script","text","dynamic","nuke_script","nuke_script","text",null],
+    ["Open Notes","multi_entity","permanent","open_notes","open_notes","text[]","'{}'::text[]"],
+    ["Open Notes Count","summary","permanent","open_notes_count","open_notes_count","integer","0"],
+    ["OTIO Playable","text","system_owned","otio_playable","otio_playable","text",null],
+    ["Path to Frames","text","system_owned","path_to_frames","frames_path","text",null],
+    ["Path to Geometry","text","system_owned","path_to_geometry","path_to_geometry","text",null],
+    ["Path to Movie","text","system_owned","path_to_movie","movie_url","text",null],
+    ["Playlists","multi_entity","permanent","playlists","playlists","text[]","'{}'::text[]"],
+    ["Project","entity","permanent","project","project_id","integer",null],
+    ["Published Files","multi_entity","permanent","published_files","published_files","text[]","'{}'::text[]"],
+    ["Send EXRs","checkbox","dynamic","send_exrs","send_exrs","boolean","false"],
+    ["Source Clip","entity","system_owned","source_clip","source_clip","text",null],
+    ["Status","status_list","permanent","status","status","text",null],
+    ["Tags","multi_entity","permanent","tags","tags","text[]","'{}'::text[]"],
+    ["Task","entity","system_owned","task","task_id","integer",null],
+    ["Tasks","multi_entity","permanent","tasks","tasks","text[]","'{}'::text[]"],
+    ["Task Template","entity","permanent","task_template","task_template","text",null],
+    ["Thumbnail","image","permanent","thumbnail","thumbnail_url","text",null],
+    ["Thumbnail Blur Hash","text","system_owned","thumbnail_blur_hash","thumbnail_blur_hash","text",null],
+    ["Translation Type","text","dynamic","translation_type","translation_type","text",null],
+    ["Type","list","permanent","type","version_type","text",null],
+    ["Updated by","entity","permanent","updated_by","updated_by","uuid",null],
+    ["Uploaded Movie","url","system_owned","uploaded_movie","uploaded_movie","text",null],
+    ["Uploaded Movie Audio Offset","float","system_owned","uploaded_movie_audio_offset","uploaded_movie_audio_offset","double precision",null],
+    ["Uploaded Movie Duration","float","system_owned","uploaded_movie_duration","uploaded_movie_duration","double precision",null],
+    ["Uploaded Movie Image","url","system_owned","uploaded_movie_image","uploaded_movie_image","text",null],
+    ["Uploaded Movie MP4","url","system_owned","uploaded_movie_mp4","uploaded_movie_mp4","text",null],
+    ["Uploaded Movie Transcoding Status","number","system_owned","uploaded_movie_transcoding_status","uploaded_movie_transcoding_status","integer",null],
+    ["Uploaded Movie WebM","url","system_owned","uploaded_movie_webm","uploaded_movie_webm","text",null],
+    ["Version Name","text","permanent","version_name","code","text",null],
+    ["Viewed/Unviewed","list","permanent","viewed_unviewed","viewed_status","text",null],
+  ],
+})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {
+  columns: ["artist_id", "ayon_id", "ayon_product_id", "ayon_sync_status", "ayon_version_id", "cached_display_name", "client_approved", "client_approved_at", "client_approved_by", "client_version_name", "created_by", "cuts", "created_at", "updated_at", "date_viewed", "deliveries", "department", "description", "editorial_qc", "filmstrip_thumbnail_url", "first_frame", "flagged", "frame_count", "frame_range", "frame_rate", "frames_aspect_ratio", "frames_have_slate", "id", "image_source_entity", "last_frame", "link", "media_center_import_time", "movie_aspect_ratio", "movie_has_slate", "notes", "nuke_script", "open_notes", "open_notes_count", "otio_playable", "frames_path", "path_to_geometry", "movie_url", "playlists", "project_id", "published_files", "send_exrs", "source_clip", "status", "tags", "task_id", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "translation_type", "version_type", "updated_by", "uploaded_movie", "uploaded_movie_audio_offset", "uploaded_movie_duration", "uploaded_movie_image", "uploaded_movie_mp4", "uploaded_movie_transcoding_status", "uploaded_movie_webm", "code", "viewed_status"],
+  writableColumns: ["artist_id", "ayon_id", "ayon_product_id", "ayon_sync_status", "ayon_version_id", "cached_display_name", "client_approved", "client_approved_at", "client_approved_by", "client_version_name", "created_by", "cuts", "date_viewed", "deliveries", "department", "description", "editorial_qc", "filmstrip_thumbnail_url", "first_frame", "flagged", "frame_count", "frame_range", "frame_rate", "frames_aspect_ratio", "frames_have_slate", "image_source_entity", "last_frame", "link", "media_center_import_time", "movie_aspect_ratio", "movie_has_slate", "notes", "nuke_script", "open_notes", "otio_playable", "frames_path", "path_to_geometry", "movie_url", "playlists", "project_id", "published_files", "send_exrs", "source_clip", "status", "tags", "task_id", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "translation_type", "version_type", "updated_by", "uploaded_movie", "uploaded_movie_audio_offset", "uploaded_movie_duration", "uploaded_movie_image", "uploaded_movie_mp4", "uploaded_movie_transcoding_status", "uploaded_movie_webm", "code", "viewed_status"],
+  codeToColumn: {"artist": "artist_id", "ayon_id": "ayon_id", "ayon_product_id": "ayon_product_id", "ayon_sync_status": "ayon_sync_status", "ayon_version_id": "ayon_version_id", "cached_display_name": "cached_display_name", "client_approved": "client_approved", "client_approved_at": "client_approved_at", "client_approved_by": "client_approved_by", "client_version_name": "client_version_name", "created_by": "created_by", "cuts": "cuts", "date_created": "created_at", "date_updated": "updated_at", "date_viewed": "date_viewed", "deliveries": "deliveries", "department": "department", "description": "description", "editorial_qc": "editorial_qc", "filmstrip_thumbnail": "filmstrip_thumbnail_url", "first_frame": "first_frame", "flagged": "flagged", "frame_count": "frame_count", "frame_range": "frame_range", "frame_rate": "frame_rate", "frames_aspect_ratio": "frames_aspect_ratio", "frames_have_slate": "frames_have_slate", "id": "id", "image_source_entity": "image_source_entity", "last_frame": "last_frame", "link": "link", "media_center_import_time": "media_center_import_time", "movie_aspect_ratio": "movie_aspect_ratio", "movie_has_slate": "movie_has_slate", "notes": "notes", "nuke_script": "nuke_script", "open_notes": "open_notes", "open_notes_count": "open_notes_count", "otio_playable": "otio_playable", "path_to_frames": "frames_path", "path_to_geometry": "path_to_geometry", "path_to_movie": "movie_url", "playlists": "playlists", "project": "project_id", "published_files": "published_files", "send_exrs": "send_exrs", "source_clip": "source_clip", "status": "status", "tags": "tags", "task": "task_id", "tasks": "tasks", "task_template": "task_template", "thumbnail": "thumbnail_url", "thumbnail_blur_hash": "thumbnail_blur_hash", "translation_type": "translation_type", "type": "version_type", "updated_by": "updated_by", "uploaded_movie": "uploaded_movie", "uploaded_movie_audio_offset": "uploaded_movie_audio_offset", "uploaded_movie_duration": "uploaded_movie_duration", "uploaded_movie_image": "uploaded_movie_image", "uploaded_movie_mp4": "uploaded_movie_mp4", "uploaded_movie_transcoding_status": "uploaded_movie_transcoding_status", "uploaded_movie_webm": "uploaded_movie_webm", "version_name": "code", "viewed_unviewed": "viewed_status"},
+  fieldIndexByColumn: {"artist_id": 0, "ayon_id": 1, "ayon_product_id": 2, "ayon_sync_status": 3, "ayon_version_id": 4, "cached_display_name": 5, "client_approved": 6, "client_approved_at": 7, "client_approved_by": 8, "client_version_name": 9, "created_by": 10, "cuts": 11, "created_at": 12, "updated_at": 13, "date_viewed": 14, "deliveries": 15, "department": 16, "description": 17, "editorial_qc": 18, "filmstrip_thumbnail_url": 19, "first_frame": 20, "flagged": 21, "frame_count": 22, "frame_range": 23, "frame_rate": 24, "frames_aspect_ratio": 25, "frames_have_slate": 26, "id": 27, "image_source_entity": 28, "last_frame": 29, "link": 30, "media_center_import_time": 31, "movie_aspect_ratio": 32, "movie_has_slate": 33, "notes": 34, "nuke_script": 35, "open_notes": 36, "open_notes_count": 37, "otio_playable": 38, "frames_path": 39, "path_to_geometry": 40, "movie_url": 41, "playlists": 42, "project_id": 43, "published_files": 44, "send_exrs": 45, "source_clip": 46, "status": 47, "tags": 48, "task_id": 49, "tasks": 50, "task_template": 51, "thumbnail_url": 52, "thumbnail_blur_hash": 53, "translation_type": 54, "version_type": 55, "updated_by": 56, "uploaded_movie": 57, "uploaded_movie_audio_offset": 58, "uploaded_movie_duration": 59, "uploaded_movie_image": 60, "uploaded_movie_mp4": 61, "uploaded_movie_transcoding_status": 62, "uploaded_movie_webm": 63, "code": 64, "viewed_status": 65},
+  columnsByPgType: {"boolean": ["client_approved", "flagged", "frames_have_slate", "movie_has_slate", "send_exrs"], "double precision": ["frame_rate", "frames_aspect_ratio", "movie_aspect_ratio", "uploaded_movie_audio_offset", "uploaded_movie_duration"], "integer": ["first_frame", "frame_count", "id", "last_frame", "open_notes_count", "project_id", "task_id", "uploaded_movie_transcoding_status"], "text": ["ayon_id", "ayon_product_id", "ayon_sync_status", "ayon_version_id", "cached_display_name", "client_approved_by", "client_version_name", "department", "description", "editorial_qc", "filmstrip_thumbnail_url", "frame_range", "image_source_entity", "link", "nuke_script", "otio_playable", "frames_path", "path_to_geometry", "movie_url", "source_clip", "status", "task_template", "thumbnail_url", "thumbnail_blur_hash", "translation_type", "version_type", "uploaded_movie", "uploaded_movie_image", "uploaded_movie_mp4", "uploaded_movie_webm", "code", "viewed_status"], "text[]": ["cuts", "deliveries", "notes", "open_notes", "playlists", "published_files", "tags", "tasks"], "timestamptz": ["client_approved_at", "created_at", "updated_at", "date_viewed", "media_center_import_time"], "uuid": ["artist_id", "created_by", "updated_by"]},
+})
+
+export default schema
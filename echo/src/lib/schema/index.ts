@@ -1,44 +1,27 @@
-import { SCHEMA, type EntityKey, type SchemaField } from './schema.generated'
+// Light barrel: types, per-entity lazy loading, RPC and keyset helpers. The eager
+// SCHEMA/LOOKUPS registry and its accessors live in '@/lib/schema/eager'.
+export type { EntityKey, EntityLookups, SchemaField } from './schema.types.generated'
+// Per-entity dynamic import; prefer this (or './entities/<entity>.generated') in code
+// that only needs one entity, so the full registry stays out of that bundle.
+export { ENTITY_KEYS, loadEntityLookups, loadEntitySchema } from './schema.lazy.generated'
+// One RPC round trip per batch of rows (bulk_upsert_<table>), instead of one write per row.
+export {
+  BULK_UPSERT_MAX_ROWS,
+  bulkUpsert,
+  toBulkUpsertRows,
+  type BulkUpsertEntity,
+  type BulkUpsertOptions,
+  type BulkUpsertRow,
+} from './schema.rpc.generated'
+// Cursor pagination for list pages: constant cost per page instead of growing with the offset.
+export {
+  KEYSET_INDEXED_SORT_COLUMNS,
+  KEYSET_SORT_COLUMNS,
+  applyKeysetPage,
+  decodeKeysetCursor,
+  encodeKeysetCursor,
+  keysetPageResult,
+  type KeysetEntity,
+  type KeysetPageRequest,
+} from './schema.keyset.generated'
 
-export { SCHEMA }
-export type { EntityKey, SchemaField }
-
-const DEFAULT_DENY_COLUMNS = new Set([
-  // Never accept client-provided values for these in generic pickers.
-  'id',
-  'created_at',
-  'updated_at',
-])
-
-export function getEntitySchema(entity: EntityKey) {
-  return SCHEMA[entity]
-}
-
-export function getEntityColumns(entity: EntityKey): Set<string> {
-  const columns = new Set<string>()
-  for (const field of SCHEMA[entity].fields) {
-    if (field.virtual) continue
-    if (!field.column) continue
-    columns.add(field.column)
-  }
-  return columns
-}
-
-export function pickEntityColumns(
-  entity: EntityKey,
-  input: Record<string, unknown>,
-  options?: { deny?: Set<string> }
-) {
-  const allowed = getEntityColumns(entity)
-  const deny = new Set<string>(DEFAULT_DENY_COLUMNS)
-  for (const col of options?.deny ?? []) deny.add(col)
-
-  const out: Record<string, unknown> = {}
-  for (const [key, value] of Object.entries(input)) {
-    if (value === undefined) continue
-    if (!allowed.has(key)) continue
-    if (deny.has(key)) continue
-    out[key] = value
-  }
-  return out
-}
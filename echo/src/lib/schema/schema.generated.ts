@@ -1,3598 +1,56 @@
 /* eslint-disable */
 // AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
 // Generated by tools/schema/generate_from_csv.py
-// Generated: 2026-02-19T09:33:48Z
+//
+// Eager registry of every entity. Code that needs a single entity should import
+// './entities/<entity>.generated' or use loadEntitySchema() from './schema.lazy.generated'.
 
-export type EntityKey = 'asset' | 'sequence' | 'shot' | 'task' | 'version' | 'note' | 'published_file' | 'post' | 'post_media' | 'post_reaction' | 'annotation'
+import type { EntityKey, EntityLookups, EntitySchema } from './schema.types.generated'
+import { lookups as asset_lookups, schema as asset } from './entities/asset.generated'
+import { lookups as sequence_lookups, schema as sequence } from './entities/sequence.generated'
+import { lookups as shot_lookups, schema as shot } from './entities/shot.generated'
+import { lookups as task_lookups, schema as task } from './entities/task.generated'
+import { lookups as version_lookups, schema as version } from './entities/version.generated'
+import { lookups as note_lookups, schema as note } from './entities/note.generated'
+import { lookups as published_file_lookups, schema as published_file } from './entities/published_file.generated'
+import { lookups as post_lookups, schema as post } from './entities/post.generated'
+import { lookups as post_media_lookups, schema as post_media } from './entities/post_media.generated'
+import { lookups as post_reaction_lookups, schema as post_reaction } from './entities/post_reaction.generated'
+import { lookups as annotation_lookups, schema as annotation } from './entities/annotation.generated'
 
-export interface SchemaField {
-  name: string
-  dataType: string
-  fieldType: string
-  code: string
-  // When virtual=true, column/pgType/defaultSql will be null.
-  column: string | null
-  pgType: string | null
-  defaultSql: string | null
-  virtual: boolean
-}
+export type {
+  EncodedEntitySchema,
+  EntityKey,
+  EntityLookups,
+  EntitySchema,
+  FieldTuple,
+  SchemaField,
+} from './schema.types.generated'
 
-export interface EntitySchema {
-  entity: EntityKey
-  table: string
-  csv: string
-  fields: SchemaField[]
+export const SCHEMA: Record<EntityKey, EntitySchema> = {
+  asset,
+  sequence,
+  shot,
+  task,
+  version,
+  note,
+  published_file,
+  post,
+  post_media,
+  post_reaction,
+  annotation,
 }
 
-export const SCHEMA: Record<EntityKey, EntitySchema> = {
-  "asset": {
-    "csv": "asset.csv",
-    "entity": "asset",
-    "fields": [
-      {
-        "code": "asset_name",
-        "column": "name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Asset Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "asset_sequence",
-        "column": "asset_sequence",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Asset <-> Sequence",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "asset_shot",
-        "column": "asset_shot",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Asset <-> Shot",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "cached_display_name",
-        "column": "cached_display_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cached Display Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cc",
-        "column": "cc",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Cc",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "client_name",
-        "column": "client_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Client Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "created_by",
-        "column": "created_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Created by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "creative_brief",
-        "column": "creative_brief",
-        "dataType": "url",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Creative Brief",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "date_created",
-        "column": "created_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Created",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "date_updated",
-        "column": "updated_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Updated",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "dd_client_name",
-        "column": "dd_client_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "DD Client Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "description",
-        "column": "description",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Description",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "episodes",
-        "column": "episodes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Episodes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "filmstrip_thumbnail",
-        "column": "filmstrip_thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Filmstrip Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "id",
-        "column": "id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Id",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "image_source_entity",
-        "column": "image_source_entity",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Image Source Entity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "keep",
-        "column": "keep",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "dynamic",
-        "name": "Keep",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "levels",
-        "column": "levels",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Levels",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "linked_projects",
-        "column": "linked_projects",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "system_owned",
-        "name": "Linked Projects",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "mocap_takes",
-        "column": "mocap_takes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Mocap Takes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "notes",
-        "column": "notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "open_notes",
-        "column": "open_notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Open Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "open_notes_count",
-        "column": "open_notes_count",
-        "dataType": "summary",
-        "defaultSql": "0",
-        "fieldType": "permanent",
-        "name": "Open Notes Count",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "outsource",
-        "column": "outsource",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "dynamic",
-        "name": "Outsource",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "parent_assets",
-        "column": "parent_assets",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Parent Assets",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "project",
-        "column": "project_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Project",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "published_file_link",
-        "column": "published_file_links",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Published File <-> Link",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "review_versions_link",
-        "column": "review_versions_link",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Review Versions <-> Link",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "sequence",
-        "column": "sequence_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Sequence",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "sequences",
-        "column": "sequences",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Sequences",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "sequences_assets",
-        "column": "sequences_assets",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Sequences <-> Assets",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "shot",
-        "column": "shot_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Shot",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "shots",
-        "column": "shots",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Shots",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "shots_assets",
-        "column": "shots_assets",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Shots <-> Assets",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "status",
-        "column": "status",
-        "dataType": "status_list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "sub_assets",
-        "column": "sub_assets",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Sub Assets",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "tags",
-        "column": "tags",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tags",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "tasks",
-        "column": "tasks",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tasks",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "task_template",
-        "column": "task_template",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Task Template",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail",
-        "column": "thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail_blur_hash",
-        "column": "thumbnail_blur_hash",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Thumbnail Blur Hash",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "type",
-        "column": "asset_type",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Type",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "updated_by",
-        "column": "updated_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Updated by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "vendor_groups",
-        "column": "vendor_groups",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Vendor Groups",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "version_link",
-        "column": "version_link",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Version <-> Link",
-        "pgType": "text[]",
-        "virtual": false
-      }
-    ],
-    "table": "assets"
-  },
-  "note": {
-    "csv": "note.csv",
-    "entity": "note",
-    "fields": [
-      {
-        "code": "attachments",
-        "column": "attachments",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Attachments",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "author",
-        "column": "author_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Author",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "ayon_id",
-        "column": "ayon_id",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon ID",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "ayon_sync_status",
-        "column": "ayon_sync_status",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon Sync Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "body",
-        "column": "content",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Body",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cached_display_name",
-        "column": "cached_display_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cached Display Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cc",
-        "column": "cc",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Cc",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "client_approved",
-        "column": "client_approved",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Client Approved",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "client_note",
-        "column": "client_note",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Client Note",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "client_note_id",
-        "column": "client_note_id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Client Note ID",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "composition",
-        "column": "composition",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Composition",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "created_by",
-        "column": "created_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Created by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "date_created",
-        "column": "created_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Created",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "date_updated",
-        "column": "updated_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Updated",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "filmstrip_thumbnail",
-        "column": "filmstrip_thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Filmstrip Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "id",
-        "column": "id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Id",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "image_source_entity",
-        "column": "image_source_entity",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Image Source Entity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "links",
-        "column": "links",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Links",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "notes_app_context_entity",
-        "column": "notes_app_context_entity",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Notes App Context Entity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "otio_playable",
-        "column": "otio_playable",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "OTIO Playable",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "playlist",
-        "column": "playlist",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Playlist",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "project",
-        "column": "project_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Project",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "publish_status",
-        "column": "publish_status",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Publish Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "read_unread",
-        "column": "read_unread",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Read/Unread",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "replies",
-        "column": "replies",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Replies",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "reply_content",
-        "column": "reply_content",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Reply Content",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "status",
-        "column": "status",
-        "dataType": "status_list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "subject",
-        "column": "subject",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Subject",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "suppress_email_notification",
-        "column": "suppress_email_notification",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Suppress Email Notification",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "tags",
-        "column": "tags",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tags",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "tasks",
-        "column": "tasks",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tasks",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail",
-        "column": "thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail_blur_hash",
-        "column": "thumbnail_blur_hash",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Thumbnail Blur Hash",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "f_to",
-        "column": "f_to",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "To",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "type",
-        "column": "note_type",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Type",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "updated_by",
-        "column": "updated_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Updated by",
-        "pgType": "uuid",
-        "virtual": false
-      }
-    ],
-    "table": "notes"
-  },
-  "published_file": {
-    "csv": "publishfile.csv",
-    "entity": "published_file",
-    "fields": [
-      {
-        "code": "ayon_representation_id",
-        "column": "ayon_representation_id",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "ayon_representation_id",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cached_display_name",
-        "column": "cached_display_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cached Display Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "client_version",
-        "column": "client_version",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Client Version",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "created_by",
-        "column": "published_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Created by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "date_created",
-        "column": "created_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Created",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "date_updated",
-        "column": "updated_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Updated",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "description",
-        "column": "description",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Description",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "downstream_published_files",
-        "column": "downstream_published_files",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Downstream Published Files",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "element",
-        "column": "element",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Element",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "filmstrip_thumbnail",
-        "column": "filmstrip_thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Filmstrip Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "id",
-        "column": "id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Id",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "image_source_entity",
-        "column": "image_source_entity",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Image Source Entity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "link",
-        "column": null,
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Link",
-        "pgType": null,
-        "virtual": true
-      },
-      {
-        "code": "name",
-        "column": "name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "output",
-        "column": "output",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Output",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "path",
-        "column": "file_path",
-        "dataType": "url",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Path",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "path_cache",
-        "column": "path_cache",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Path Cache",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "path_cache_storage",
-        "column": "path_cache_storage",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Path Cache Storage",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "path_to_source",
-        "column": "path_to_source",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Path to Source",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "project",
-        "column": "project_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Project",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "published_file_name",
-        "column": "code",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Published File Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "published_file_type",
-        "column": "file_type",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Published File Type",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "snapshot_id",
-        "column": "snapshot_id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Snapshot ID",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "snapshot_type",
-        "column": "snapshot_type",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Snapshot Type",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "status",
-        "column": "status",
-        "dataType": "status_list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "submission_notes",
-        "column": "submission_notes",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Submission Notes",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "tags",
-        "column": "tags",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tags",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "target_name",
-        "column": "target_name",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Target Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "task",
-        "column": "task_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Task",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail",
-        "column": "thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail_blur_hash",
-        "column": "thumbnail_blur_hash",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Thumbnail Blur Hash",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "updated_by",
-        "column": "updated_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Updated by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "upstream_published_files",
-        "column": "upstream_published_files",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Upstream Published Files",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "version",
-        "column": "version_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Version",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "version_number",
-        "column": "version_number",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Version Number",
-        "pgType": "integer",
-        "virtual": false
-      }
-    ],
-    "table": "published_files"
-  },
-  "sequence": {
-    "csv": "sequence.csv",
-    "entity": "sequence",
-    "fields": [
-      {
-        "code": "assets",
-        "column": "assets",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Assets",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "ayon_id",
-        "column": "ayon_id",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon ID",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "ayon_sync_status",
-        "column": "ayon_sync_status",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon Sync Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cached_display_name",
-        "column": "cached_display_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cached Display Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cc",
-        "column": "cc",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Cc",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "client_name",
-        "column": "client_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Client Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "created_by",
-        "column": "created_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Created by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "cuts",
-        "column": "cuts",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Cuts",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "date_created",
-        "column": "created_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Created",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "date_updated",
-        "column": "updated_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Updated",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "dd_client_name",
-        "column": "dd_client_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "DD Client Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "description",
-        "column": "description",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Description",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "episode",
-        "column": "episode",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Episode",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "filmstrip_thumbnail",
-        "column": "filmstrip_thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Filmstrip Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "id",
-        "column": "id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Id",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "image_source_entity",
-        "column": "image_source_entity",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Image Source Entity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "notes",
-        "column": "notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "open_notes",
-        "column": "open_notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Open Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "open_notes_count",
-        "column": "open_notes_count",
-        "dataType": "summary",
-        "defaultSql": "0",
-        "fieldType": "permanent",
-        "name": "Open Notes Count",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "plates",
-        "column": "plates",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Plates",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "project",
-        "column": "project_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Project",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "published_file_link",
-        "column": "published_file_links",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Published File <-> Link",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "scenes",
-        "column": "scenes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Scenes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "sequence_name",
-        "column": "name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Sequence Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "shots",
-        "column": "shots",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Shots",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "status",
-        "column": "status",
-        "dataType": "status_list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "tags",
-        "column": "tags",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tags",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "tasks",
-        "column": "tasks",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tasks",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "task_template",
-        "column": "task_template",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Task Template",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail",
-        "column": "thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail_blur_hash",
-        "column": "thumbnail_blur_hash",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Thumbnail Blur Hash",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "type",
-        "column": "sequence_type",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Type",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "updated_by",
-        "column": "updated_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Updated by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "vendor_groups",
-        "column": "vendor_groups",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Vendor Groups",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "version_link",
-        "column": "version_link",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Version <-> Link",
-        "pgType": "text[]",
-        "virtual": false
-      }
-    ],
-    "table": "sequences"
-  },
-  "shot": {
-    "csv": "shots.csv",
-    "entity": "shot",
-    "fields": [
-      {
-        "code": "assets",
-        "column": "assets",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Assets",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "ayon_id",
-        "column": "ayon_id",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon ID",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "ayon_sync_status",
-        "column": "ayon_sync_status",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon Sync Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cached_display_name",
-        "column": "cached_display_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cached Display Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cc",
-        "column": "cc",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Cc",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "client_name",
-        "column": "client_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Client Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "comp_note",
-        "column": "comp_note",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Comp Note",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "created_by",
-        "column": "created_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Created by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "cut_duration",
-        "column": "cut_duration",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cut Duration",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "cut_in",
-        "column": "cut_in",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cut In",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "cut_order",
-        "column": "cut_order",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Cut Order",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "cut_out",
-        "column": "cut_out",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Cut Out",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "cut_summary",
-        "column": "cut_summary",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cut Summary",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "date_created",
-        "column": "created_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Created",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "date_updated",
-        "column": "updated_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Updated",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "dd_client_name",
-        "column": "dd_client_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "DD Client Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "dd_location",
-        "column": "dd_location",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "DD Location",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "delivery_date",
-        "column": "delivery_date",
-        "dataType": "date",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Delivery Date",
-        "pgType": "date",
-        "virtual": false
-      },
-      {
-        "code": "description",
-        "column": "description",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Description",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "duration_summary",
-        "column": "duration_summary",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Duration Summary",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "filmstrip_thumbnail",
-        "column": "filmstrip_thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Filmstrip Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "head_duration",
-        "column": "head_duration",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Head Duration",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "head_in",
-        "column": "head_in",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Head In",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "head_out",
-        "column": "head_out",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Head Out",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "id",
-        "column": "id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Id",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "image_source_entity",
-        "column": "image_source_entity",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Image Source Entity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "next_review",
-        "column": "next_review",
-        "dataType": "date",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Next Review",
-        "pgType": "date",
-        "virtual": false
-      },
-      {
-        "code": "notes",
-        "column": "notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "open_notes",
-        "column": "open_notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Open Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "open_notes_count",
-        "column": "open_notes_count",
-        "dataType": "summary",
-        "defaultSql": "0",
-        "fieldType": "permanent",
-        "name": "Open Notes Count",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "parent_shots",
-        "column": "parent_shots",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Parent Shots",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "plates",
-        "column": "plates",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Plates",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "project",
-        "column": "project_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Project",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "published_file_link",
-        "column": "published_file_links",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Published File <-> Link",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "raw_cut_duration",
-        "column": "raw_cut_duration",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Cut Duration",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "raw_cut_in",
-        "column": "raw_cut_in",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Cut In",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "raw_cut_out",
-        "column": "raw_cut_out",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Cut Out",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "raw_head_duration",
-        "column": "raw_head_duration",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Head Duration",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "raw_head_in",
-        "column": "raw_head_in",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Head In",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "raw_head_out",
-        "column": "raw_head_out",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Head Out",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "raw_tail_duration",
-        "column": "raw_tail_duration",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Tail Duration",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "raw_tail_in",
-        "column": "raw_tail_in",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Tail In",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "raw_tail_out",
-        "column": "raw_tail_out",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Raw Tail Out",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "seq_shot",
-        "column": "seq_shot",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Seq Shot",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "sequence",
-        "column": "sequence_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Sequence",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "shot_name",
-        "column": "name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Shot Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "shot_code",
-        "column": "code",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Shot Code",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "shot_notes",
-        "column": "shot_notes",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Shot Notes",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "status",
-        "column": "status",
-        "dataType": "status_list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "sub_shots",
-        "column": "sub_shots",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Sub Shots",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "tags",
-        "column": "tags",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tags",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "tail_duration",
-        "column": "tail_duration",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Tail Duration",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "tail_in",
-        "column": "tail_in",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Tail In",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "tail_out",
-        "column": "tail_out",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Tail Out",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "target_date",
-        "column": "target_date",
-        "dataType": "date",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Target Date",
-        "pgType": "date",
-        "virtual": false
-      },
-      {
-        "code": "tasks",
-        "column": "tasks",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tasks",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "task_template",
-        "column": "task_template",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Task Template",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail",
-        "column": "thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail_blur_hash",
-        "column": "thumbnail_blur_hash",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Thumbnail Blur Hash",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "turnover",
-        "column": "turnover",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Turnover #",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "type",
-        "column": "shot_type",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Type",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "updated_by",
-        "column": "updated_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Updated by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "vendor_groups",
-        "column": "vendor_groups",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Vendor Groups",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "version_link",
-        "column": "version_link",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Version <-> Link",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "working_duration",
-        "column": "working_duration",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Working Duration",
-        "pgType": "integer",
-        "virtual": false
-      }
-    ],
-    "table": "shots"
-  },
-  "task": {
-    "csv": "task.csv",
-    "entity": "task",
-    "fields": [
-      {
-        "code": "assigned_to",
-        "column": "assigned_to",
-        "dataType": "multi_entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Assigned To",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "ayon_assignees",
-        "column": "ayon_assignees",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "ayon_assignees",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "ayon_id",
-        "column": "ayon_id",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon ID",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "ayon_sync_status",
-        "column": "ayon_sync_status",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon Sync Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "bid",
-        "column": "bid",
-        "dataType": "duration",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Bid",
-        "pgType": "numeric",
-        "virtual": false
-      },
-      {
-        "code": "bid_breakdown",
-        "column": "bid_breakdown",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Bid Breakdown",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cached_display_name",
-        "column": "cached_display_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cached Display Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "casting",
-        "column": "casting",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Casting",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cc",
-        "column": "cc",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Cc",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "created_by",
-        "column": "created_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Created by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "date_created",
-        "column": "created_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Created",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "date_updated",
-        "column": "updated_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Updated",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "ddna_bid",
-        "column": "ddna_bid",
-        "dataType": "duration",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "DDNA Bid",
-        "pgType": "numeric",
-        "virtual": false
-      },
-      {
-        "code": "ddna_id",
-        "column": "ddna_id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "DDNA ID#",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "ddna_to",
-        "column": "ddna_to",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "DDNA TO#",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "dependency_violation",
-        "column": "dependency_violation",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Dependency Violation",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "description",
-        "column": "description",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Description",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "downstream_dependency",
-        "column": "downstream_dependency",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Downstream Dependency",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "due_date",
-        "column": "due_date",
-        "dataType": "date",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Due Date",
-        "pgType": "date",
-        "virtual": false
-      },
-      {
-        "code": "duration",
-        "column": "duration",
-        "dataType": "duration",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Duration",
-        "pgType": "numeric",
-        "virtual": false
-      },
-      {
-        "code": "end_date",
-        "column": "end_date",
-        "dataType": "date",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "End Date",
-        "pgType": "date",
-        "virtual": false
-      },
-      {
-        "code": "filmstrip_thumbnail",
-        "column": "filmstrip_thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Filmstrip Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "gantt_bar_color",
-        "column": "gantt_bar_color",
-        "dataType": "color",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Gantt Bar Color",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "id",
-        "column": "id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Id",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "image_source_entity",
-        "column": "image_source_entity",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Image Source Entity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "implicit",
-        "column": "implicit",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Implicit",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "inventory_date",
-        "column": "inventory_date",
-        "dataType": "date",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Inventory Date",
-        "pgType": "date",
-        "virtual": false
-      },
-      {
-        "code": "link",
-        "column": null,
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Link",
-        "pgType": null,
-        "virtual": true
-      },
-      {
-        "code": "milestone",
-        "column": "milestone",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Milestone",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "notes",
-        "column": "notes_links",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "notes_text",
-        "column": "notes",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Notes",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "open_notes",
-        "column": "open_notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Open Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "open_notes_count",
-        "column": "open_notes_count",
-        "dataType": "summary",
-        "defaultSql": "0",
-        "fieldType": "permanent",
-        "name": "Open Notes Count",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "pinned",
-        "column": "pinned",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Pinned",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "pipeline_step",
-        "column": "step_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Pipeline Step",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "priority",
-        "column": "priority",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Priority",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "prod_comments",
-        "column": "prod_comments",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Prod Comments",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "project",
-        "column": "project_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Project",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "proposed_start_date",
-        "column": "proposed_start_date",
-        "dataType": "date",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Proposed Start Date",
-        "pgType": "date",
-        "virtual": false
-      },
-      {
-        "code": "publish_version_number",
-        "column": "publish_version_number",
-        "dataType": "summary",
-        "defaultSql": "0",
-        "fieldType": "dynamic",
-        "name": "Publish Version Number",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "reviewer",
-        "column": "reviewer",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "system_owned",
-        "name": "Reviewer",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "review_versions_task",
-        "column": "review_versions_task",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Review Versions <-> Task",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "schedule_change_comments",
-        "column": "schedule_change_comments",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Schedule change comments",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "sibling_tasks",
-        "column": "sibling_tasks",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Sibling Tasks",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "sort_order",
-        "column": "sort_order",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Sort Order",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "split_durations",
-        "column": "split_durations",
-        "dataType": "serializable",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Split Durations",
-        "pgType": "jsonb",
-        "virtual": false
-      },
-      {
-        "code": "splits",
-        "column": "splits",
-        "dataType": "serializable",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Splits",
-        "pgType": "jsonb",
-        "virtual": false
-      },
-      {
-        "code": "start_date",
-        "column": "start_date",
-        "dataType": "date",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Start Date",
-        "pgType": "date",
-        "virtual": false
-      },
-      {
-        "code": "status",
-        "column": "status",
-        "dataType": "status_list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "tags",
-        "column": "tags",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tags",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "task_complexity",
-        "column": "task_complexity",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Task Complexity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "task_name",
-        "column": "name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Task Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "task_template",
-        "column": "task_template",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Task Template",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "template_task",
-        "column": "template_task",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Template Task",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail",
-        "column": "thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail_blur_hash",
-        "column": "thumbnail_blur_hash",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Thumbnail Blur Hash",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "time_logged",
-        "column": "time_logged",
-        "dataType": "duration",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Time Logged",
-        "pgType": "numeric",
-        "virtual": false
-      },
-      {
-        "code": "time_logged_of_bid",
-        "column": "time_logged_of_bid",
-        "dataType": "percent",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Time Logged - % of Bid",
-        "pgType": "numeric",
-        "virtual": false
-      },
-      {
-        "code": "time_logged_over_under_bid",
-        "column": "time_logged_over_under_bid",
-        "dataType": "duration",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Time Logged - Over/Under Bid",
-        "pgType": "numeric",
-        "virtual": false
-      },
-      {
-        "code": "updated_by",
-        "column": "updated_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Updated by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "upstream_dependency",
-        "column": "upstream_dependency",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Upstream Dependency",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "versions",
-        "column": "versions",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "system_owned",
-        "name": "Versions",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "workload_assignee_count",
-        "column": "workload_assignee_count",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Workload Assignee Count",
-        "pgType": "integer",
-        "virtual": false
-      }
-    ],
-    "table": "tasks"
-  },
-  "version": {
-    "csv": "version.csv",
-    "entity": "version",
-    "fields": [
-      {
-        "code": "artist",
-        "column": "artist_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Artist",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "ayon_id",
-        "column": "ayon_id",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon ID",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "ayon_product_id",
-        "column": "ayon_product_id",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "ayon_product_id",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "ayon_sync_status",
-        "column": "ayon_sync_status",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Ayon Sync Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "ayon_version_id",
-        "column": "ayon_version_id",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "ayon_version_id",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "cached_display_name",
-        "column": "cached_display_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Cached Display Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "client_approved",
-        "column": "client_approved",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Client Approved",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "client_approved_at",
-        "column": "client_approved_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Client Approved At",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "client_approved_by",
-        "column": "client_approved_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Client Approved by",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "client_version_name",
-        "column": "client_version_name",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Client Version Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "created_by",
-        "column": "created_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Created by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "cuts",
-        "column": "cuts",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "system_owned",
-        "name": "Cuts",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "date_created",
-        "column": "created_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Created",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "date_updated",
-        "column": "updated_at",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Updated",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "date_viewed",
-        "column": "date_viewed",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Date Viewed",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "deliveries",
-        "column": "deliveries",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "dynamic",
-        "name": "Deliveries",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "department",
-        "column": "department",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Department",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "description",
-        "column": "description",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Description",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "editorial_qc",
-        "column": "editorial_qc",
-        "dataType": "status_list",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Editorial QC",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "filmstrip_thumbnail",
-        "column": "filmstrip_thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Filmstrip Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "first_frame",
-        "column": "first_frame",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "First Frame",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "flagged",
-        "column": "flagged",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "permanent",
-        "name": "Flagged",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "frame_count",
-        "column": "frame_count",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Frame Count",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "frame_range",
-        "column": "frame_range",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Frame Range",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "frame_rate",
-        "column": "frame_rate",
-        "dataType": "float",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Frame Rate",
-        "pgType": "double precision",
-        "virtual": false
-      },
-      {
-        "code": "frames_aspect_ratio",
-        "column": "frames_aspect_ratio",
-        "dataType": "float",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Frames Aspect Ratio",
-        "pgType": "double precision",
-        "virtual": false
-      },
-      {
-        "code": "frames_have_slate",
-        "column": "frames_have_slate",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "system_owned",
-        "name": "Frames Have Slate",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "id",
-        "column": "id",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Id",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "image_source_entity",
-        "column": "image_source_entity",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Image Source Entity",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "last_frame",
-        "column": "last_frame",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Last Frame",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "link",
-        "column": "link",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Link",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "media_center_import_time",
-        "column": "media_center_import_time",
-        "dataType": "date_time",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Media Center Import Time",
-        "pgType": "timestamptz",
-        "virtual": false
-      },
-      {
-        "code": "movie_aspect_ratio",
-        "column": "movie_aspect_ratio",
-        "dataType": "float",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Movie Aspect Ratio",
-        "pgType": "double precision",
-        "virtual": false
-      },
-      {
-        "code": "movie_has_slate",
-        "column": "movie_has_slate",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "system_owned",
-        "name": "Movie Has Slate",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "notes",
-        "column": "notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "nuke_script",
-        "column": "nuke_script",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Nuke script",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "open_notes",
-        "column": "open_notes",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Open Notes",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "open_notes_count",
-        "column": "open_notes_count",
-        "dataType": "summary",
-        "defaultSql": "0",
-        "fieldType": "permanent",
-        "name": "Open Notes Count",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "otio_playable",
-        "column": "otio_playable",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "OTIO Playable",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "path_to_frames",
-        "column": "frames_path",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Path to Frames",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "path_to_geometry",
-        "column": "path_to_geometry",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Path to Geometry",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "path_to_movie",
-        "column": "movie_url",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Path to Movie",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "playlists",
-        "column": "playlists",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Playlists",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "project",
-        "column": "project_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Project",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "published_files",
-        "column": "published_files",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Published Files",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "send_exrs",
-        "column": "send_exrs",
-        "dataType": "checkbox",
-        "defaultSql": "false",
-        "fieldType": "dynamic",
-        "name": "Send EXRs",
-        "pgType": "boolean",
-        "virtual": false
-      },
-      {
-        "code": "source_clip",
-        "column": "source_clip",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Source Clip",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "status",
-        "column": "status",
-        "dataType": "status_list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Status",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "tags",
-        "column": "tags",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tags",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "task",
-        "column": "task_id",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Task",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "tasks",
-        "column": "tasks",
-        "dataType": "multi_entity",
-        "defaultSql": "'{}'::text[]",
-        "fieldType": "permanent",
-        "name": "Tasks",
-        "pgType": "text[]",
-        "virtual": false
-      },
-      {
-        "code": "task_template",
-        "column": "task_template",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Task Template",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail",
-        "column": "thumbnail_url",
-        "dataType": "image",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Thumbnail",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "thumbnail_blur_hash",
-        "column": "thumbnail_blur_hash",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Thumbnail Blur Hash",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "translation_type",
-        "column": "translation_type",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "dynamic",
-        "name": "Translation Type",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "type",
-        "column": "version_type",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Type",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "updated_by",
-        "column": "updated_by",
-        "dataType": "entity",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Updated by",
-        "pgType": "uuid",
-        "virtual": false
-      },
-      {
-        "code": "uploaded_movie",
-        "column": "uploaded_movie",
-        "dataType": "url",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Uploaded Movie",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "uploaded_movie_audio_offset",
-        "column": "uploaded_movie_audio_offset",
-        "dataType": "float",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Uploaded Movie Audio Offset",
-        "pgType": "double precision",
-        "virtual": false
-      },
-      {
-        "code": "uploaded_movie_duration",
-        "column": "uploaded_movie_duration",
-        "dataType": "float",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Uploaded Movie Duration",
-        "pgType": "double precision",
-        "virtual": false
-      },
-      {
-        "code": "uploaded_movie_image",
-        "column": "uploaded_movie_image",
-        "dataType": "url",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Uploaded Movie Image",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "uploaded_movie_mp4",
-        "column": "uploaded_movie_mp4",
-        "dataType": "url",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Uploaded Movie MP4",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "uploaded_movie_transcoding_status",
-        "column": "uploaded_movie_transcoding_status",
-        "dataType": "number",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Uploaded Movie Transcoding Status",
-        "pgType": "integer",
-        "virtual": false
-      },
-      {
-        "code": "uploaded_movie_webm",
-        "column": "uploaded_movie_webm",
-        "dataType": "url",
-        "defaultSql": null,
-        "fieldType": "system_owned",
-        "name": "Uploaded Movie WebM",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "version_name",
-        "column": "code",
-        "dataType": "text",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Version Name",
-        "pgType": "text",
-        "virtual": false
-      },
-      {
-        "code": "viewed_unviewed",
-        "column": "viewed_status",
-        "dataType": "list",
-        "defaultSql": null,
-        "fieldType": "permanent",
-        "name": "Viewed/Unviewed",
-        "pgType": "text",
-        "virtual": false
-      }
-    ],
-    "table": "versions"
-  },
-  "post": {
-    "csv": "",
-    "entity": "post",
-    "fields": [
-      { "code": "id", "column": "id", "dataType": "number", "defaultSql": null, "fieldType": "permanent", "name": "Id", "pgType": "integer", "virtual": false },
-      { "code": "author_id", "column": "author_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "Author", "pgType": "uuid", "virtual": false },
-      { "code": "project", "column": "project_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "Project", "pgType": "integer", "virtual": false },
-      { "code": "content", "column": "content", "dataType": "text", "defaultSql": "''", "fieldType": "permanent", "name": "Content", "pgType": "text", "virtual": false },
-      { "code": "content_html", "column": "content_html", "dataType": "text", "defaultSql": null, "fieldType": "permanent", "name": "Content HTML", "pgType": "text", "virtual": false },
-      { "code": "media_count", "column": "media_count", "dataType": "number", "defaultSql": "0", "fieldType": "permanent", "name": "Media Count", "pgType": "integer", "virtual": false },
-      { "code": "comment_count", "column": "comment_count", "dataType": "number", "defaultSql": "0", "fieldType": "permanent", "name": "Comment Count", "pgType": "integer", "virtual": false },
-      { "code": "reaction_count", "column": "reaction_count", "dataType": "number", "defaultSql": "0", "fieldType": "permanent", "name": "Reaction Count", "pgType": "integer", "virtual": false },
-      { "code": "visibility", "column": "visibility", "dataType": "list", "defaultSql": "'global'", "fieldType": "permanent", "name": "Visibility", "pgType": "text", "virtual": false },
-      { "code": "date_created", "column": "created_at", "dataType": "date_time", "defaultSql": null, "fieldType": "permanent", "name": "Date Created", "pgType": "timestamptz", "virtual": false },
-      { "code": "date_updated", "column": "updated_at", "dataType": "date_time", "defaultSql": null, "fieldType": "permanent", "name": "Date Updated", "pgType": "timestamptz", "virtual": false }
-    ],
-    "table": "posts"
-  },
-  "post_media": {
-    "csv": "",
-    "entity": "post_media",
-    "fields": [
-      { "code": "id", "column": "id", "dataType": "number", "defaultSql": null, "fieldType": "permanent", "name": "Id", "pgType": "integer", "virtual": false },
-      { "code": "post_id", "column": "post_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "Post", "pgType": "integer", "virtual": false },
-      { "code": "storage_path", "column": "storage_path", "dataType": "text", "defaultSql": null, "fieldType": "permanent", "name": "Storage Path", "pgType": "text", "virtual": false },
-      { "code": "file_name", "column": "file_name", "dataType": "text", "defaultSql": "''", "fieldType": "permanent", "name": "File Name", "pgType": "text", "virtual": false },
-      { "code": "file_size", "column": "file_size", "dataType": "number", "defaultSql": "0", "fieldType": "permanent", "name": "File Size", "pgType": "bigint", "virtual": false },
-      { "code": "mime_type", "column": "mime_type", "dataType": "text", "defaultSql": "''", "fieldType": "permanent", "name": "MIME Type", "pgType": "text", "virtual": false },
-      { "code": "media_type", "column": "media_type", "dataType": "list", "defaultSql": "'image'", "fieldType": "permanent", "name": "Media Type", "pgType": "text", "virtual": false },
-      { "code": "thumbnail", "column": "thumbnail_url", "dataType": "image", "defaultSql": null, "fieldType": "permanent", "name": "Thumbnail", "pgType": "text", "virtual": false },
-      { "code": "width", "column": "width", "dataType": "number", "defaultSql": null, "fieldType": "permanent", "name": "Width", "pgType": "integer", "virtual": false },
-      { "code": "height", "column": "height", "dataType": "number", "defaultSql": null, "fieldType": "permanent", "name": "Height", "pgType": "integer", "virtual": false },
-      { "code": "duration_seconds", "column": "duration_seconds", "dataType": "float", "defaultSql": null, "fieldType": "permanent", "name": "Duration", "pgType": "decimal", "virtual": false },
-      { "code": "frame_count", "column": "frame_count", "dataType": "number", "defaultSql": null, "fieldType": "permanent", "name": "Frame Count", "pgType": "integer", "virtual": false },
-      { "code": "fps", "column": "fps", "dataType": "float", "defaultSql": null, "fieldType": "permanent", "name": "FPS", "pgType": "numeric", "virtual": false },
-      { "code": "sort_order", "column": "sort_order", "dataType": "number", "defaultSql": "0", "fieldType": "permanent", "name": "Sort Order", "pgType": "integer", "virtual": false },
-      { "code": "date_created", "column": "created_at", "dataType": "date_time", "defaultSql": null, "fieldType": "permanent", "name": "Date Created", "pgType": "timestamptz", "virtual": false }
-    ],
-    "table": "post_media"
-  },
-  "post_reaction": {
-    "csv": "",
-    "entity": "post_reaction",
-    "fields": [
-      { "code": "id", "column": "id", "dataType": "number", "defaultSql": null, "fieldType": "permanent", "name": "Id", "pgType": "integer", "virtual": false },
-      { "code": "user_id", "column": "user_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "User", "pgType": "uuid", "virtual": false },
-      { "code": "post_id", "column": "post_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "Post", "pgType": "integer", "virtual": false },
-      { "code": "comment_id", "column": "comment_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "Comment", "pgType": "integer", "virtual": false },
-      { "code": "reaction_type", "column": "reaction_type", "dataType": "list", "defaultSql": "'like'", "fieldType": "permanent", "name": "Reaction Type", "pgType": "text", "virtual": false },
-      { "code": "date_created", "column": "created_at", "dataType": "date_time", "defaultSql": null, "fieldType": "permanent", "name": "Date Created", "pgType": "timestamptz", "virtual": false }
-    ],
-    "table": "post_reactions"
-  },
-  "annotation": {
-    "csv": "",
-    "entity": "annotation",
-    "fields": [
-      { "code": "id", "column": "id", "dataType": "number", "defaultSql": null, "fieldType": "permanent", "name": "Id", "pgType": "integer", "virtual": false },
-      { "code": "post_media_id", "column": "post_media_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "Post Media", "pgType": "integer", "virtual": false },
-      { "code": "version_id", "column": "version_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "Version", "pgType": "integer", "virtual": false },
-      { "code": "author_id", "column": "author_id", "dataType": "entity", "defaultSql": null, "fieldType": "permanent", "name": "Author", "pgType": "uuid", "virtual": false },
-      { "code": "frame_number", "column": "frame_number", "dataType": "number", "defaultSql": "1", "fieldType": "permanent", "name": "Frame Number", "pgType": "integer", "virtual": false },
-      { "code": "timecode", "column": "timecode", "dataType": "text", "defaultSql": null, "fieldType": "permanent", "name": "Timecode", "pgType": "text", "virtual": false },
-      { "code": "annotation_data", "column": "annotation_data", "dataType": "serializable", "defaultSql": "'{}'", "fieldType": "permanent", "name": "Annotation Data", "pgType": "jsonb", "virtual": false },
-      { "code": "annotation_text", "column": "annotation_text", "dataType": "text", "defaultSql": null, "fieldType": "permanent", "name": "Annotation Text", "pgType": "text", "virtual": false },
-      { "code": "status", "column": "status", "dataType": "status_list", "defaultSql": "'active'", "fieldType": "permanent", "name": "Status", "pgType": "text", "virtual": false },
-      { "code": "date_created", "column": "created_at", "dataType": "date_time", "defaultSql": null, "fieldType": "permanent", "name": "Date Created", "pgType": "timestamptz", "virtual": false },
-      { "code": "date_updated", "column": "updated_at", "dataType": "date_time", "defaultSql": null, "fieldType": "permanent", "name": "Date Updated", "pgType": "timestamptz", "virtual": false }
-    ],
-    "table": "annotations"
-  }
-} as any
+export const LOOKUPS: Record<EntityKey, EntityLookups> = {
+  asset: asset_lookups,
+  sequence: sequence_lookups,
+  shot: shot_lookups,
+  task: task_lookups,
+  version: version_lookups,
+  note: note_lookups,
+  published_file: published_file_lookups,
+  post: post_lookups,
+  post_media: post_media_lookups,
+  post_reaction: post_reaction_lookups,
+  annotation: annotation_lookups,
+}
@@ -0,0 +1,122 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+//
+// Keyset (cursor) pagination for the entity list pages. Rows are ordered by one sortable
+// column with id as the tie-breaker (both in the same direction, Postgres' default NULL
+// placement), and each page resumes after the previous page's last row, so page N costs
+// the same as page 1 instead of scanning and discarding N * limit rows.
+
+// Sortable columns per entity, with their pgType.
+export const KEYSET_SORT_COLUMNS = {
+  asset: { name: 'text', created_at: 'timestamptz', updated_at: 'timestamptz', open_notes_count: 'integer' },
+  sequence: { created_at: 'timestamptz', updated_at: 'timestamptz', open_notes_count: 'integer', name: 'text' },
+  shot: { cut_duration: 'integer', cut_in: 'integer', cut_order: 'integer', cut_out: 'integer', created_at: 'timestamptz', updated_at: 'timestamptz', delivery_date: 'date', head_duration: 'integer', head_in: 'integer', head_out: 'integer', next_review: 'date', open_notes_count: 'integer', raw_cut_duration: 'integer', raw_cut_in: 'integer', raw_cut_out: 'integer', raw_head_duration: 'integer', raw_head_in: 'integer', raw_head_out: 'integer', raw_tail_duration: 'integer', raw_tail_in: 'integer', raw_tail_out: 'integer', name: 'text', code: 'text', tail_duration: 'integer', tail_in: 'integer', tail_out: 'integer', target_date: 'date', turnover: 'integer', working_duration: 'integer' },
+  task: { bid: 'numeric', created_at: 'timestamptz', updated_at: 'timestamptz', ddna_bid: 'numeric', ddna_id: 'integer', due_date: 'date', duration: 'numeric', end_date: 'date', inventory_date: 'date', open_notes_count: 'integer', proposed_start_date: 'date', publish_version_number: 'integer', sort_order: 'integer', start_date: 'date', name: 'text', time_logged: 'numeric', time_logged_of_bid: 'numeric', time_logged_over_under_bid: 'numeric', workload_assignee_count: 'integer' },
+  version: { client_approved_at: 'timestamptz', created_at: 'timestamptz', updated_at: 'timestamptz', date_viewed: 'timestamptz', first_frame: 'integer', frame_count: 'integer', frame_rate: 'double precision', frames_aspect_ratio: 'double precision', last_frame: 'integer', media_center_import_time: 'timestamptz', movie_aspect_ratio: 'double precision', open_notes_count: 'integer', uploaded_movie_audio_offset: 'double precision', uploaded_movie_duration: 'double precision', uploaded_movie_transcoding_status: 'integer', code: 'text' },
+  note: { client_note_id: 'integer', created_at: 'timestamptz', updated_at: 'timestamptz' },
+  published_file: { client_version: 'integer', created_at: 'timestamptz', updated_at: 'timestamptz', name: 'text', code: 'text', snapshot_id: 'integer', version_number: 'integer' },
+} as const
+
+// Sorts backed by a (project_id, <column>, id) index: constant time per page within a
+// project. The other sortable columns page correctly but sort the project's rows.
+export const KEYSET_INDEXED_SORT_COLUMNS = {
+  asset: ["created_at", "name"],
+  sequence: ["created_at", "name"],
+  shot: ["created_at", "code", "name"],
+  task: ["created_at", "name"],
+  version: ["created_at", "code"],
+  note: ["created_at"],
+  published_file: ["created_at", "code", "name"],
+} as const
+
+export type KeysetEntity = keyof typeof KEYSET_SORT_COLUMNS
+export type KeysetSortColumn<E extends KeysetEntity> = keyof (typeof KEYSET_SORT_COLUMNS)[E] & string
+
+export type KeysetValue = string | number | null
+
+export interface KeysetCursor {
+  value: KeysetValue
+  id: number
+}
+
+export interface KeysetPageRequest<E extends KeysetEntity = KeysetEntity> {
+  column: KeysetSortColumn<E>
+  ascending?: boolean
+  limit: number
+  // Opaque cursor from the previous page's nextCursor; omit for the first page.
+  cursor?: string | null
+}
+
+export function isKeysetSortColumn(entity: KeysetEntity, column: string): boolean {
+  return Object.prototype.hasOwnProperty.call(KEYSET_SORT_COLUMNS[entity], column)
+}
+
+// Cursors are URL-safe and only meaningful for the same entity, column and direction.
+export function encodeKeysetCursor(cursor: KeysetCursor): string {
+  return encodeURIComponent(JSON.stringify([cursor.value, cursor.id]))
+}
+
+export function decodeKeysetCursor(cursor: string | null | undefined): KeysetCursor | null {
+  if (!cursor) return null
+  try {
+    const parsed = JSON.parse(decodeURIComponent(cursor))
+    if (!Array.isArray(parsed) || parsed.length !== 2) return null
+    const [value, id] = parsed
+    if (!Number.isInteger(id)) return null
+    if (value !== null && typeof value !== 'string' && typeof value !== 'number') return null
+    return { value, id }
+  } catch {
+    return null
+  }
+}
+
+function quoteFilterValue(value: string | number): string {
+  return `"${String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"')}"`
+}
+
+// PostgREST `or` filter selecting the rows after `cursor` in (column, id) order.
+// ASC puts NULLs last and DESC puts them first, matching the index either way.
+export function keysetFilter(column: string, ascending: boolean, cursor: KeysetCursor): string {
+  const op = ascending ? 'gt' : 'lt'
+  const id = cursor.id
+  if (cursor.value === null) {
+    return ascending
+      ? `and(${column}.is.null,id.${op}.${id})`
+      : `${column}.not.is.null,and(${column}.is.null,id.${op}.${id})`
+  }
+  const value = quoteFilterValue(cursor.value)
+  const after = `${column}.${op}.${value},and(${column}.eq.${value},id.${op}.${id})`
+  return ascending ? `${after},${column}.is.null` : after
+}
+
+// Applies ordering, the cursor filter and limit + 1 (to detect a next page) to a
+// supabase-js query, e.g. supabase.from('versions').select('*').eq('project_id', id).
+export function applyKeysetPage<E extends KeysetEntity>(query: any, entity: E, page: KeysetPageRequest<E>): any {
+  if (!isKeysetSortColumn(entity, page.column)) {
+    throw new Error(`${entity}: ${page.column} is not a keyset sort column`)
+  }
+  const ascending = page.ascending ?? true
+  const cursor = decodeKeysetCursor(page.cursor)
+  let q = query
+  if (cursor) q = q.or(keysetFilter(page.column, ascending, cursor))
+  return q
+    .order(page.column, { ascending })
+    .order('id', { ascending })
+    .limit(page.limit + 1)
+}
+
+// Splits the limit + 1 rows fetched by applyKeysetPage into the page and the cursor
+// for the next one (null on the last page).
+export function keysetPageResult<T extends Record<string, any>>(
+  rows: readonly T[],
+  page: { column: string; limit: number }
+): { rows: T[]; nextCursor: string | null } {
+  const pageRows = rows.slice(0, page.limit)
+  if (rows.length <= page.limit || pageRows.length === 0) return { rows: pageRows, nextCursor: null }
+  const last = pageRows[pageRows.length - 1]
+  return {
+    rows: pageRows,
+    nextCursor: encodeKeysetCursor({ value: last[page.column] ?? null, id: last.id }),
+  }
+}
@@ -0,0 +1,33 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+//
+// Per-entity dynamic imports: only the requested entity's module is loaded.
+
+import type { EntityKey, EntityLookups, EntitySchema } from './schema.types.generated'
+
+export const ENTITY_KEYS: readonly EntityKey[] = ['asset', 'sequence', 'shot', 'task', 'version', 'note', 'published_file', 'post', 'post_media', 'post_reaction', 'annotation']
+
+type EntityModule = { schema: EntitySchema; lookups: EntityLookups }
+
+const LOADERS: Record<EntityKey, () => Promise<EntityModule>> = {
+  asset: () => import('./entities/asset.generated'),
+  sequence: () => import('./entities/sequence.generated'),
+  shot: () => import('./entities/shot.generated'),
+  task: () => import('./entities/task.generated'),
+  version: () => import('./entities/version.generated'),
+  note: () => import('./entities/note.generated'),
+  published_file: () => import('./entities/published_file.generated'),
+  post: () => import('./entities/post.generated'),
+  post_media: () => import('./entities/post_media.generated'),
+  post_reaction: () => import('./entities/post_reaction.generated'),
+  annotation: () => import('./entities/annotation.generated'),
+}
+
+export function loadEntitySchema(entity: EntityKey): Promise<EntitySchema> {
+  return LOADERS[entity]().then((m) => m.schema)
+}
+
+export function loadEntityLookups(entity: EntityKey): Promise<EntityLookups> {
+  return LOADERS[entity]().then((m) => m.lookups)
+}
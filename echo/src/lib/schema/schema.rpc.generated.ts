@@ -0,0 +1,136 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+//
+// Wrappers for the bulk_upsert_<table>(p_rows jsonb) RPCs (migration_bulk_upsert_rpc.sql):
+// one round trip per 1000 rows instead of one request per row.
+// Self-contained (no registry import), so it stays small in the '@/lib/schema' barrel.
+
+// Rows with an id update that row (only the keys present); rows without one are inserted.
+export type BulkUpsertRow = { id?: number | null } & Record<string, unknown>
+
+export interface BulkUpsertOptions {
+  // Extra columns to drop from every row (same as pickEntityColumns' deny).
+  deny?: ReadonlySet<string>
+}
+
+export const BULK_UPSERT_MAX_ROWS = 1000
+
+export const BULK_UPSERT_FUNCTIONS = {
+  asset: 'bulk_upsert_assets',
+  sequence: 'bulk_upsert_sequences',
+  shot: 'bulk_upsert_shots',
+  task: 'bulk_upsert_tasks',
+  version: 'bulk_upsert_versions',
+  note: 'bulk_upsert_notes',
+  published_file: 'bulk_upsert_published_files',
+} as const
+
+export type BulkUpsertEntity = keyof typeof BULK_UPSERT_FUNCTIONS
+
+// Columns the RPC writes: writableColumns plus the polymorphic link columns.
+const COLUMNS: Record<BulkUpsertEntity, ReadonlySet<string>> = {
+  asset: new Set(["name", "asset_sequence", "asset_shot", "cached_display_name", "cc", "client_name", "created_by", "creative_brief", "dd_client_name", "description", "episodes", "filmstrip_thumbnail_url", "image_source_entity", "keep", "levels", "linked_projects", "mocap_takes", "notes", "open_notes", "outsource", "parent_assets", "project_id", "published_file_links", "review_versions_link", "sequence_id", "sequences", "sequences_assets", "shot_id", "shots", "shots_assets", "status", "sub_assets", "tags", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "asset_type", "updated_by", "vendor_groups", "version_link"]),
+  sequence: new Set(["assets", "ayon_id", "ayon_sync_status", "cached_display_name", "cc", "client_name", "created_by", "cuts", "dd_client_name", "description", "episode", "filmstrip_thumbnail_url", "image_source_entity", "notes", "open_notes", "plates", "project_id", "published_file_links", "scenes", "name", "shots", "status", "tags", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "sequence_type", "updated_by", "vendor_groups", "version_link"]),
+  shot: new Set(["assets", "ayon_id", "ayon_sync_status", "cached_display_name", "cc", "client_name", "comp_note", "created_by", "cut_duration", "cut_in", "cut_order", "cut_out", "cut_summary", "dd_client_name", "dd_location", "delivery_date", "description", "duration_summary", "filmstrip_thumbnail_url", "head_duration", "head_in", "head_out", "image_source_entity", "next_review", "notes", "open_notes", "parent_shots", "plates", "project_id", "published_file_links", "raw_cut_duration", "raw_cut_in", "raw_cut_out", "raw_head_duration", "raw_head_in", "raw_head_out", "raw_tail_duration", "raw_tail_in", "raw_tail_out", "seq_shot", "sequence_id", "name", "code", "shot_notes", "status", "sub_shots", "tags", "tail_duration", "tail_in", "tail_out", "target_date", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "turnover", "shot_type", "updated_by", "vendor_groups", "version_link", "working_duration"]),
+  task: new Set(["assigned_to", "ayon_assignees", "ayon_id", "ayon_sync_status", "bid", "bid_breakdown", "cached_display_name", "casting", "cc", "created_by", "ddna_bid", "ddna_id", "ddna_to", "dependency_violation", "description", "downstream_dependency", "due_date", "duration", "end_date", "filmstrip_thumbnail_url", "gantt_bar_color", "image_source_entity", "implicit", "inventory_date", "milestone", "notes_links", "notes", "open_notes", "pinned", "step_id", "priority", "prod_comments", "project_id", "proposed_start_date", "publish_version_number", "reviewer", "review_versions_task", "schedule_change_comments", "sibling_tasks", "sort_order", "split_durations", "splits", "start_date", "status", "tags", "task_complexity", "name", "task_template", "template_task", "thumbnail_url", "thumbnail_blur_hash", "time_logged", "time_logged_of_bid", "time_logged_over_under_bid", "updated_by", "upstream_dependency", "versions", "entity_type", "entity_id"]),
+  version: new Set(["artist_id", "ayon_id", "ayon_product_id", "ayon_sync_status", "ayon_version_id", "cached_display_name", "client_approved", "client_approved_at", "client_approved_by", "client_version_name", "created_by", "cuts", "date_viewed", "deliveries", "department", "description", "editorial_qc", "filmstrip_thumbnail_url", "first_frame", "flagged", "frame_count", "frame_range", "frame_rate", "frames_aspect_ratio", "frames_have_slate", "image_source_entity", "last_frame", "link", "media_center_import_time", "movie_aspect_ratio", "movie_has_slate", "notes", "nuke_script", "open_notes", "otio_playable", "frames_path", "path_to_geometry", "movie_url", "playlists", "project_id", "published_files", "send_exrs", "source_clip", "status", "tags", "task_id", "tasks", "task_template", "thumbnail_url", "thumbnail_blur_hash", "translation_type", "version_type", "updated_by", "uploaded_movie", "uploaded_movie_audio_offset", "uploaded_movie_duration", "uploaded_movie_image", "uploaded_movie_mp4", "uploaded_movie_transcoding_status", "uploaded_movie_webm", "code", "viewed_status", "entity_type", "entity_id"]),
+  note: new Set(["attachments", "author_id", "ayon_id", "ayon_sync_status", "content", "cached_display_name", "cc", "client_approved", "client_note", "client_note_id", "composition", "created_by", "filmstrip_thumbnail_url", "image_source_entity", "links", "notes_app_context_entity", "otio_playable", "playlist", "project_id", "publish_status", "read_unread", "replies", "reply_content", "status", "subject", "suppress_email_notification", "tags", "tasks", "thumbnail_url", "thumbnail_blur_hash", "f_to", "note_type", "updated_by", "entity_type", "entity_id"]),
+  published_file: new Set(["ayon_representation_id", "cached_display_name", "client_version", "published_by", "description", "downstream_published_files", "element", "filmstrip_thumbnail_url", "image_source_entity", "name", "output", "file_path", "path_cache", "path_cache_storage", "path_to_source", "project_id", "code", "file_type", "snapshot_id", "snapshot_type", "status", "submission_notes", "tags", "target_name", "task_id", "thumbnail_url", "thumbnail_blur_hash", "updated_by", "upstream_published_files", "version_id", "version_number", "entity_type", "entity_id"]),
+}
+
+export function toBulkUpsertRows(
+  entity: BulkUpsertEntity,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+): BulkUpsertRow[] {
+  const columns = COLUMNS[entity]
+  const deny = options?.deny
+  return rows.map((row) => {
+    const out: BulkUpsertRow = {}
+    if (row.id != null) out.id = row.id
+    for (const [key, value] of Object.entries(row)) {
+      if (value === undefined || key === 'id') continue
+      if (!columns.has(key)) continue
+      if (deny?.has(key)) continue
+      out[key] = value
+    }
+    return out
+  })
+}
+
+// Sends the rows in chunks of BULK_UPSERT_MAX_ROWS; each chunk commits on its own, so
+// on error the chunks before it are already saved (their rows are in data).
+export async function bulkUpsert<T = Record<string, unknown>>(
+  supabase: any,
+  entity: BulkUpsertEntity,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+): Promise<{ data: T[]; error: any }> {
+  const payload = toBulkUpsertRows(entity, rows, options)
+  const data: T[] = []
+  for (let i = 0; i < payload.length; i += BULK_UPSERT_MAX_ROWS) {
+    const { data: chunk, error } = await supabase.rpc(BULK_UPSERT_FUNCTIONS[entity], {
+      p_rows: payload.slice(i, i + BULK_UPSERT_MAX_ROWS),
+    })
+    if (error) return { data, error }
+    data.push(...((chunk ?? []) as T[]))
+  }
+  return { data, error: null }
+}
+
+export function bulkUpsertAssets(
+  supabase: any,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+) {
+  return bulkUpsert(supabase, 'asset', rows, options)
+}
+
+export function bulkUpsertSequences(
+  supabase: any,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+) {
+  return bulkUpsert(supabase, 'sequence', rows, options)
+}
+
+export function bulkUpsertShots(
+  supabase: any,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+) {
+  return bulkUpsert(supabase, 'shot', rows, options)
+}
+
+export function bulkUpsertTasks(
+  supabase: any,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+) {
+  return bulkUpsert(supabase, 'task', rows, options)
+}
+
+export function bulkUpsertVersions(
+  supabase: any,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+) {
+  return bulkUpsert(supabase, 'version', rows, options)
+}
+
+export function bulkUpsertNotes(
+  supabase: any,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+) {
+  return bulkUpsert(supabase, 'note', rows, options)
+}
+
+export function bulkUpsertPublishedFiles(
+  supabase: any,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+) {
+  return bulkUpsert(supabase, 'published_file', rows, options)
+}
@@ -0,0 +1,97 @@
+/* eslint-disable */
+// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+// Generated by tools/schema/generate_from_csv.py
+
+export type EntityKey = 'asset' | 'sequence' | 'shot' | 'task' | 'version' | 'note' | 'published_file' | 'post' | 'post_media' | 'post_reaction' | 'annotation'
+
+export interface SchemaField {
+  name: string
+  dataType: string
+  fieldType: string
+  code: string
+  // When virtual=true, column/pgType/defaultSql will be null.
+  column: string | null
+  pgType: string | null
+  defaultSql: string | null
+  virtual: boolean
+}
+
+export interface EntitySchema {
+  entity: EntityKey
+  table: string
+  csv: string
+  // text[] columns with a GIN index: filter with @> (.contains) / && (.overlaps).
+  containmentColumns: string[]
+  // Allowed values of status_list/list/color columns, in enum/lookup id order
+  // (lookup id = index + 1). Only present once schema.values.json has values.
+  listValues?: Record<string, string[]>
+  fields: SchemaField[]
+}
+
+// Compact on-disk encoding of a SchemaField; virtual is implied by column === null.
+export type FieldTuple = [
+  name: string,
+  dataType: string,
+  fieldType: string,
+  code: string,
+  column: string | null,
+  pgType: string | null,
+  defaultSql: string | null,
+]
+
+export interface EncodedEntitySchema extends Omit<EntitySchema, 'fields'> {
+  fields: FieldTuple[]
+}
+
+// Precomputed per-entity lookups so hot paths (e.g. pickEntityColumns on every write)
+// do O(1) checks without rebuilding sets per call. Treat as immutable.
+export interface EntityLookups {
+  columns: ReadonlySet<string>
+  writableColumns: ReadonlySet<string>
+  codeToColumn: Readonly<Record<string, string>>
+  fieldByColumn: ReadonlyMap<string, SchemaField>
+  columnsByPgType: Readonly<Record<string, readonly string[]>>
+}
+
+export interface EncodedEntityLookups {
+  columns: string[]
+  writableColumns: string[]
+  codeToColumn: Record<string, string>
+  // Index into EntitySchema.fields.
+  fieldIndexByColumn: Record<string, number>
+  columnsByPgType: Record<string, string[]>
+}
+
+export function decodeEntityLookups(schema: EntitySchema, encoded: EncodedEntityLookups): EntityLookups {
+  const fieldByColumn = new Map<string, SchemaField>()
+  for (const [column, index] of Object.entries(encoded.fieldIndexByColumn)) {
+    fieldByColumn.set(column, schema.fields[index])
+  }
+  const columnsByPgType: Record<string, readonly string[]> = {}
+  for (const [pgType, columns] of Object.entries(encoded.columnsByPgType)) {
+    columnsByPgType[pgType] = Object.freeze(columns)
+  }
+  return Object.freeze({
+    columns: new Set(encoded.columns),
+    writableColumns: new Set(encoded.writableColumns),
+    codeToColumn: Object.freeze(encoded.codeToColumn),
+    fieldByColumn,
+    columnsByPgType: Object.freeze(columnsByPgType),
+  })
+}
+
+export function decodeEntitySchema(encoded: EncodedEntitySchema): EntitySchema {
+  return {
+    ...encoded,
+    fields: encoded.fields.map(([name, dataType, fieldType, code, column, pgType, defaultSql]) => ({
+      name,
+      dataType,
+      fieldType,
+      code,
+      column,
+      pgType,
+      defaultSql,
+      virtual: column === null,
+    })),
+  }
+}
@@ -3,8 +3,9 @@
 Audit Apex page table columns against CSV-derived schema columns.
 
 What this script checks:
-- Hardcoded page column ids (`const columns = [...]`) must map to schema columns
-  for the inferred entity, except for a small allowlist of computed UI-only columns.
+- Hardcoded page column ids (`id` / `accessorKey` in `const columns = [...]` or an
+  inline `columns={[...]}` prop) must map to schema columns for the inferred entity,
+  except for a small allowlist of computed UI-only columns.
 
 What this script does not check:
 - Runtime auto-appended schema columns from EntityTable.
@@ -13,18 +14,43 @@ What this script does not check:
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib.util
+import json
+import os
 import re
+import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Set
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 PAGES_ROOT = REPO_ROOT / "echo" / "src" / "app" / "(dashboard)" / "apex" / "[projectId]"
 GENERATOR = REPO_ROOT / "tools" / "schema" / "generate_from_csv.py"
 
+SNAPSHOT_REL = "echo/src/lib/schema/schema.snapshot.json"
+CSV_DIR_REL = "images/schema/"
+
+# Changes to these invalidate every page's result, so a scoped audit falls back to a full one.
+FULL_AUDIT_TRIGGERS = {
+    "tools/schema/audit_page_columns.py",
+    ".github/workflows/schema-column-audit.yml",
+}
+# Changes to these may alter any entity's columns (mapping tables, inference rules).
+SCHEMA_SOURCE_FILES = {
+    "tools/schema/generate_from_csv.py",
+    SNAPSHOT_REL,
+}
+
+# Per-file extraction results keyed on (path, mtime, size); gitignored with the generator's cache.
+PAGE_CACHE_PATH = REPO_ROOT / "tools" / "schema" / ".cache" / "page_scan_cache.json"
+# Bump when extraction logic changes so stale cache entries are ignored.
+PAGE_CACHE_VERSION = 3
+
 
 ENTITY_BY_ROUTE_TOKEN: Dict[str, str] = {
     "assets": "asset",
@@ -61,8 +87,21 @@ class FileAudit:
     entity: str
     unknown_columns: List[str]
     missing_schema_columns: List[str]
+    # First line each hardcoded column id appears on.
+    column_lines: Dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class PageScan:
+    path: str  # relative to REPO_ROOT
+    mtime_ns: int
+    size: int
+    entity: Optional[str]
+    column_ids: List[str]
+    column_lines: List[int]
+
+
+@functools.lru_cache(maxsize=None)
 def load_generator_module():
     spec = importlib.util.spec_from_file_location("schema_generator", str(GENERATOR))
     if spec is None or spec.loader is None:
@@ -74,6 +113,37 @@ def load_generator_module():
     return module
 
 
+def timings():
+    """The generator's PhaseTimings; disabled unless --timings/--profile was given."""
+    return load_generator_module().TIMINGS
+
+
+def load_schema_fields(generator) -> Dict[str, list]:
+    """
+    Prefer the generator's precompiled snapshot; only parse the CSVs when the snapshot
+    is missing or its source hash no longer matches the current CSVs/mappings.
+    """
+    snapshot = generator._load_snapshot(generator.OUT_SNAPSHOT)
+    if snapshot is not None:
+        try:
+            current = generator._source_hash(generator._current_entity_inputs())
+        except FileNotFoundError:
+            # CSVs are not available in this checkout; the committed snapshot is all we have.
+            current = None
+        if current is None or current == snapshot.get("source_sha256"):
+            return generator._snapshot_fields(snapshot)
+        reason = "stale"
+    else:
+        reason = "missing"
+
+    print(
+        f"Schema snapshot {reason}; rebuilding from CSV "
+        "(run tools/schema/generate_from_csv.py to refresh it).",
+        file=sys.stderr,
+    )
+    return generator._build_fields_for(list(generator.ENTITIES.keys()))
+
+
 def infer_entity_from_path(path: Path) -> str | None:
     for part in reversed(path.parts[:-1]):
         if part.startswith("["):
@@ -83,54 +153,587 @@ def infer_entity_from_path(path: Path) -> str | None:
     return None
 
 
-def extract_hardcoded_column_ids(tsx: str) -> List[str]:
-    match = re.search(r"const columns\s*=\s*\[(.*?)\n\s*\]", tsx, re.S)
-    if not match:
-        return []
-    return re.findall(r"id:\s*'([^']+)'", match.group(1))
+# ---------------------------------------------------------------------------
+# TSX column extraction
+#
+# A small single-pass tokenizer: it understands strings, template literals, comments
+# and regex literals well enough to track bracket nesting, which is all we need to find
+# column-definition arrays and the `id` / `accessorKey` of each top-level column object.
+# ---------------------------------------------------------------------------
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<nl>\n)
+    |(?P<ws>[ \t\r\f\v]+)
+    |(?P<line_comment>//[^\n]*)
+    |(?P<block_comment>/\*.*?\*/)
+    |(?P<string>'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?)
+    |(?P<template>`)
+    |(?P<ident>[A-Za-z_$][\w$]*)
+    |(?P<number>\d[\w.]*)
+    |(?P<punct>=>|===|!==|==|!=|\.\.\.|[^\s])
+    """,
+    re.S | re.X,
+)
+_REGEX_LITERAL_RE = re.compile(r"/(?:[^/\\\n\[]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+# Tokens after which `/` starts a regex literal rather than a division. Not `<`: in TSX
+# `</` is a JSX closing tag, and lexing `</span>{...` as a regex desyncs the brackets.
+_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%>~^") | {"=>", "==", "===", "!=", "!==", "return", "typeof"}
+
+# Bindings whose array literal is treated as a column-definition array.
+_COLUMNS_NAME_RE = re.compile(r"^(?:columns|\w*Columns)$")
+# Tokens allowed between `columns =` and the array, e.g. `= useMemo(() => [` or `={[`.
+_COLUMNS_WRAPPER_TOKENS = {"{", "(", ")", "=>", "useMemo", "React", ".", "return"}
+_COLUMN_KEY_NAMES = {"id", "accessorKey"}
 
 
-def audit_pages() -> List[FileAudit]:
-    generator = load_generator_module()
-
-    schema_columns: Dict[str, Set[str]] = {}
-    for entity in generator.ENTITIES.keys():
-        fields = generator._build_entity_fields(entity)
-        schema_columns[entity] = {f.column for f in fields if f.column}
-
-    audits: List[FileAudit] = []
-    for path in sorted(PAGES_ROOT.rglob("page.tsx")):
-        text = path.read_text(encoding="utf-8")
-        if "const columns = [" not in text:
+@dataclass
+class ColumnArray:
+    name: str  # binding or JSX prop name, e.g. "columns" or "attachmentColumns"
+    line: int
+    inline: bool  # passed directly as a JSX prop: columns={[...]}
+    ids: List[Tuple[str, int]]  # (column id, line)
+
+
+def _scan_template(tsx: str, pos: int) -> Tuple[int, bool]:
+    """Skip a template literal starting after the opening backtick. Returns (end, is_static)."""
+    depth = 0
+    static = True
+    n = len(tsx)
+    while pos < n:
+        ch = tsx[pos]
+        if ch == "\\":
+            pos += 2
             continue
-
-        entity = infer_entity_from_path(path.relative_to(PAGES_ROOT))
-        if not entity:
+        if depth == 0:
+            if ch == "`":
+                return pos + 1, static
+            if ch == "$" and tsx.startswith("${", pos):
+                static = False
+                depth = 1
+                pos += 2
+                continue
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+        pos += 1
+    return n, static
+
+
+def _tokenize_tsx(tsx: str) -> Iterator[Tuple[str, str, int]]:
+    """Yield (kind, value, line) for significant tokens; string values are unquoted."""
+    pos = 0
+    line = 1
+    n = len(tsx)
+    prev = ""
+    while pos < n:
+        if tsx[pos] == "/" and prev in _REGEX_PRECEDERS:
+            m = _REGEX_LITERAL_RE.match(tsx, pos)
+            if m:
+                pos = m.end()
+                prev = "regex"
+                continue
+        m = _TOKEN_RE.match(tsx, pos)
+        if m is None:  # unreachable: the punct branch matches any non-space char
+            break
+        kind = m.lastgroup
+        text = m.group()
+        pos = m.end()
+        if kind == "nl":
+            line += 1
+            continue
+        if kind in ("ws", "line_comment"):
+            continue
+        if kind == "block_comment":
+            line += text.count("\n")
+            continue
+        if kind == "template":
+            end, static = _scan_template(tsx, pos)
+            body = tsx[pos : end - 1]
+            yield ("string" if static else "template"), body, line
+            line += body.count("\n")
+            pos = end
+            prev = "template"
+            continue
+        if kind == "string":
+            yield "string", text[1:-1] if len(text) > 1 and text[-1] == text[0] else text[1:], line
+            prev = "string"
+            continue
+        yield kind, text, line
+        prev = text
+
+
+def extract_column_arrays(tsx: str) -> List[ColumnArray]:
+    """
+    Find every column-definition array in a TSX file: `const columns = [...]`,
+    `const fooColumns: T[] = useMemo(() => [...])` (also `useMemo<T[]>(...)`),
+    `columns: [...]` object properties and inline `<EntityTable columns={[...]} />` props.
+    Runs in one pass over the file.
+    """
+    arrays: List[ColumnArray] = []
+    # Bracket stack: (char, array opened by this bracket, is a column object).
+    stack: List[Tuple[str, Optional[ColumnArray], bool]] = []
+
+    # Pending `columns` binding: state is "name" (saw the identifier), "colon",
+    # "type" (inside a type annotation), "value" (after `=`) or "generic" (inside the
+    # `<...>` type arguments of `useMemo<T[]>(`).
+    binding_name = ""
+    binding_state = ""
+    binding_depth = 0
+    binding_inline = False
+    binding_last = ""  # previous wrapper token in the "value" state
+    binding_angles = 0
+
+    # Column-object key matching: "key" (expecting a property name), "colon", "value".
+    key_state = ""
+
+    for kind, value, line in _tokenize_tsx(tsx):
+        is_punct = kind == "punct"
+
+        if binding_state:
+            state = binding_state
+            binding_state = ""
+            if state == "name":
+                if is_punct and value == "=":
+                    binding_state, binding_inline, binding_last = "value", False, ""
+                    continue
+                if is_punct and value == ":":
+                    binding_state, binding_inline = "colon", False
+                    continue
+            elif state == "colon":
+                # `columns: [` is an object property holding the array itself.
+                if is_punct and value == "[":
+                    state = "value"
+                else:
+                    binding_state = "type"
+            elif state == "type":
+                if len(stack) == binding_depth and is_punct:
+                    if value == "=":
+                        binding_state, binding_inline, binding_last = "value", False, ""
+                        continue
+                    if value not in {",", ";", ")", "]", "}"}:
+                        binding_state = "type"
+                else:
+                    binding_state = "type"
+            elif state == "generic":
+                binding_state = "generic"
+                if is_punct and value in "<>":
+                    binding_angles += 1 if value == "<" else -1
+                    if binding_angles == 0:
+                        binding_state = "value"
+                        continue
+            if state == "value":
+                if is_punct and value == "[":
+                    column_array = ColumnArray(name=binding_name, line=line, inline=binding_inline, ids=[])
+                    arrays.append(column_array)
+                    stack.append(("[", column_array, False))
+                    continue
+                if is_punct and value == "<" and binding_last == "useMemo":
+                    binding_state, binding_angles = "generic", 1
+                    continue
+                if value in _COLUMNS_WRAPPER_TOKENS:
+                    binding_state, binding_last = "value", value
+                    if value == "{" and len(stack) == binding_depth:
+                        binding_inline = True
+
+        top = stack[-1] if stack else None
+        in_column_object = top is not None and top[2]
+
+        if in_column_object and key_state:
+            state = key_state
+            key_state = ""
+            if state == "key" and kind in ("ident", "string") and value in _COLUMN_KEY_NAMES:
+                key_state = "colon"
+                continue
+            if state == "colon" and is_punct and value == ":":
+                key_state = "value"
+                continue
+            if state == "value" and kind == "string":
+                stack[-2][1].ids.append((value, line))
+                continue
+
+        if kind == "ident" and not binding_state and _COLUMNS_NAME_RE.match(value):
+            binding_name = value
+            binding_state = "name"
+            binding_depth = len(stack)
             continue
 
-        ids = extract_hardcoded_column_ids(text)
-        if not ids:
+        if not is_punct or len(value) != 1:
             continue
+        if value in "([{":
+            column_object = value == "{" and top is not None and top[0] == "[" and top[1] is not None
+            stack.append((value, None, column_object))
+            if column_object:
+                key_state = "key"
+        elif value in ")]}":
+            if stack:
+                stack.pop()
+        elif value == "," and in_column_object:
+            key_state = "key"
+
+    return arrays
+
+
+def extract_hardcoded_column_ids(tsx: str) -> List[Tuple[str, int]]:
+    """(id, line) for every column of the page's main table arrays (bound to `columns`)."""
+    ids: List[Tuple[str, int]] = []
+    for column_array in extract_column_arrays(tsx):
+        if column_array.name == "columns":
+            ids.extend(column_array.ids)
+    return ids
+
+
+def scan_page(path: Path) -> PageScan:
+    stat = path.stat()
+    text = path.read_text(encoding="utf-8")
+    entity = infer_entity_from_path(path.relative_to(PAGES_ROOT))
+    ids: List[Tuple[str, int]] = []
+    if entity and "columns" in text:
+        started = time.perf_counter()
+        ids = extract_hardcoded_column_ids(text)
+        timings().add("extraction", time.perf_counter() - started, items=1, unit="files")
+    return PageScan(
+        path=path.relative_to(REPO_ROOT).as_posix(),
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        entity=entity,
+        column_ids=[column_id for column_id, _ in ids],
+        column_lines=[line for _, line in ids],
+    )
+
 
-        schema = schema_columns[entity]
-        computed = ALLOWED_COMPUTED.get(entity, set())
+def load_page_cache(cache_path: Path) -> Dict[str, PageScan]:
+    try:
+        raw = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != PAGE_CACHE_VERSION:
+        return {}
+    return {entry["path"]: PageScan(**entry) for entry in raw.get("pages", [])}
+
+
+def save_page_cache(cache_path: Path, scans: Iterable[PageScan]) -> None:
+    payload: Dict[str, Any] = {
+        "version": PAGE_CACHE_VERSION,
+        "pages": [asdict(scan) for scan in sorted(scans, key=lambda s: s.path)],
+    }
+    text = json.dumps(payload, indent=1, sort_keys=True) + "\n"
+    try:
+        if cache_path.read_text(encoding="utf-8") == text:
+            return
+    except OSError:
+        pass
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(text, encoding="utf-8")
+
+
+def scan_pages(
+    paths: List[Path],
+    *,
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+) -> List[PageScan]:
+    """
+    Scan page files in a thread pool. Files whose (path, mtime, size) match the cache
+    are not re-read. Results are returned in the order of `paths`.
+    """
+    with timings().phase("page_scan", "files") as stat:
+        stat.items += len(paths)
+        return _scan_pages(paths, jobs=jobs, use_cache=use_cache)
+
+
+def _scan_pages(paths: List[Path], *, jobs: Optional[int], use_cache: bool) -> List[PageScan]:
+    cache = load_page_cache(PAGE_CACHE_PATH) if use_cache else {}
+
+    def scan_cached(path: Path) -> PageScan:
+        rel = path.relative_to(REPO_ROOT).as_posix()
+        cached = cache.get(rel)
+        if cached is not None:
+            stat = path.stat()
+            if cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                return cached
+        return scan_page(path)
+
+    workers = jobs if jobs and jobs > 0 else min(32, (os.cpu_count() or 1) + 4)
+    if workers <= 1 or len(paths) <= 1:
+        scans = [scan_cached(p) for p in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            scans = list(pool.map(scan_cached, paths))
 
-        column_set = set(ids)
-        unknown = sorted(c for c in column_set if c not in schema and c not in computed)
-        missing = sorted(c for c in schema if c not in column_set)
+    if use_cache:
+        save_page_cache(PAGE_CACHE_PATH, scans)
+    return scans
 
-        audits.append(
-            FileAudit(
-                path=path.relative_to(REPO_ROOT),
-                entity=entity,
-                unknown_columns=unknown,
-                missing_schema_columns=missing,
-            )
+
+def git_changed_paths(base_ref: str) -> List[str]:
+    """Paths changed since the merge base with base_ref, including uncommitted edits."""
+
+    def git(*args: str) -> str:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
         )
+        return result.stdout
+
+    merge_base = git("merge-base", base_ref, "HEAD").strip()
+    out = git("diff", "--name-only", "--no-renames", merge_base)
+    return [line for line in out.splitlines() if line]
+
+
+def _columns_by_entity(fields_by_entity: Dict[str, list]) -> Dict[str, Set[str]]:
+    return {k: {f.column for f in fields if f.column} for k, fields in fields_by_entity.items()}
+
+
+def _entities_with_changed_columns(generator, base_ref: Optional[str]) -> Optional[Set[str]]:
+    """
+    Compare current schema columns against the snapshot committed at base_ref.
+    Returns None when that cannot be determined (no base ref or no snapshot at base).
+    """
+    if not base_ref:
+        return None
+    result = subprocess.run(
+        ["git", "show", f"{base_ref}:{SNAPSHOT_REL}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    try:
+        base_snapshot = json.loads(result.stdout)
+        base_columns = _columns_by_entity(generator._snapshot_fields(base_snapshot))
+    except (ValueError, KeyError, TypeError):
+        return None
+    current_columns = _columns_by_entity(load_schema_fields(generator))
+    return {
+        entity
+        for entity in set(base_columns) | set(current_columns)
+        if base_columns.get(entity) != current_columns.get(entity)
+    }
+
+
+def scope_from_changes(
+    changed: Iterable[str],
+    *,
+    base_ref: Optional[str] = None,
+) -> Optional[Tuple[Set[str], Set[str]]]:
+    """
+    Map changed repo-relative paths to (page paths, entities) that need re-auditing.
+    Returns None when the change requires a full audit.
+
+    Pages outside the scope are assumed to still pass as they did at the base ref; CI
+    runs the full audit on main, so this holds for PRs against it.
+    """
+    generator = load_generator_module()
+    entity_by_csv = {cfg["csv"]: key for key, cfg in generator.ENTITIES.items()}
+    pages_rel = PAGES_ROOT.relative_to(REPO_ROOT).as_posix() + "/"
+
+    pages: Set[str] = set()
+    entities: Set[str] = set()
+    schema_sources_changed = False
+    for raw in changed:
+        path = Path(raw)
+        if path.is_absolute():
+            try:
+                path = path.resolve().relative_to(REPO_ROOT)
+            except ValueError:
+                continue
+        rel = path.as_posix()
+        if rel in FULL_AUDIT_TRIGGERS:
+            return None
+        if rel in SCHEMA_SOURCE_FILES:
+            schema_sources_changed = True
+        elif rel.startswith(CSV_DIR_REL):
+            entity = entity_by_csv.get(rel[len(CSV_DIR_REL):])
+            if entity:
+                entities.add(entity)
+        elif rel.startswith(pages_rel) and path.name == "page.tsx":
+            pages.add(rel)
+
+    if schema_sources_changed:
+        changed_entities = _entities_with_changed_columns(generator, base_ref)
+        if changed_entities is None:
+            return None
+        entities |= changed_entities
+
+    if entities >= set(generator.ENTITIES.keys()):
+        return None
+    return pages, entities
+
+
+def audit_pages(
+    *,
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+    scope: Optional[Tuple[Set[str], Set[str]]] = None,
+) -> List[FileAudit]:
+    schema_columns: Dict[str, Set[str]] = {}
 
+    def columns_for(entity: str) -> Set[str]:
+        # Loaded on first use so runs with nothing to audit never touch the schema.
+        if not schema_columns:
+            with timings().phase("schema_load", "entities") as stat:
+                fields_by_entity = load_schema_fields(load_generator_module())
+                for key, fields in fields_by_entity.items():
+                    schema_columns[key] = {f.column for f in fields if f.column}
+                stat.items += len(schema_columns)
+        return schema_columns[entity]
+
+    paths = sorted(PAGES_ROOT.rglob("page.tsx"))
+    if scope is not None:
+        scoped_pages, scoped_entities = scope
+        paths = [
+            p
+            for p in paths
+            if p.relative_to(REPO_ROOT).as_posix() in scoped_pages
+            or infer_entity_from_path(p.relative_to(PAGES_ROOT)) in scoped_entities
+        ]
+    scans = scan_pages(paths, jobs=jobs, use_cache=use_cache)
+    with timings().phase("comparison", "pages") as stat:
+        audits = audit_scans(scans, columns_for)
+        stat.items += len(audits)
     return audits
 
 
+def audit_scan(scan: PageScan, schema: Set[str]) -> FileAudit:
+    assert scan.entity
+    ids = scan.column_ids
+    computed = ALLOWED_COMPUTED.get(scan.entity, set())
+
+    column_set = set(ids)
+    lines: Dict[str, int] = {}
+    for column_id, line in zip(ids, scan.column_lines):
+        lines.setdefault(column_id, line)
+    unknown = sorted(c for c in column_set if c not in schema and c not in computed)
+    missing = sorted(c for c in schema if c not in column_set)
+
+    return FileAudit(
+        path=Path(scan.path),
+        entity=scan.entity,
+        unknown_columns=unknown,
+        missing_schema_columns=missing,
+        column_lines=lines,
+    )
+
+
+def audit_scans(scans: Iterable[PageScan], columns_for: Callable[[str], Set[str]]) -> List[FileAudit]:
+    return [audit_scan(scan, columns_for(scan.entity)) for scan in scans if scan.entity and scan.column_ids]
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _print_audit_diff(before: Dict[str, FileAudit], after: Dict[str, FileAudit]) -> None:
+    for path in sorted(set(before) | set(after)):
+        old = set(before[path].unknown_columns) if path in before else set()
+        new = set(after[path].unknown_columns) if path in after else set()
+        added = sorted(new - old)
+        resolved = sorted(old - new)
+        if added:
+            audit = after[path]
+            located = [f"{c} (line {audit.column_lines[c]})" if c in audit.column_lines else c for c in added]
+            print(f"+ {path} [{audit.entity}] unknown: {', '.join(located)}")
+        if resolved:
+            print(f"- {path} resolved: {', '.join(resolved)}")
+
+
+def watch(*, interval: float = 0.25, regenerate: bool = True) -> int:
+    """
+    Poll CSVs, the generator and page files; keep parsed fields and page scans in memory
+    and only rebuild the entity / rescan the page that changed. Prints the audit diff.
+    """
+    generator = load_generator_module()
+    fields_by_entity = load_schema_fields(generator)
+    schema_columns = _columns_by_entity(fields_by_entity)
+
+    def csv_signatures() -> Dict[str, Optional[Tuple[int, int]]]:
+        return {k: _file_signature(generator.CSV_DIR / cfg["csv"]) for k, cfg in generator.ENTITIES.items()}
+
+    csv_sigs = csv_signatures()
+    generator_sig = _file_signature(GENERATOR)
+    page_paths = sorted(PAGES_ROOT.rglob("page.tsx"))
+    scans: Dict[Path, PageScan] = dict(zip(page_paths, scan_pages(page_paths)))
+    page_sigs = {p: (scan.mtime_ns, scan.size) for p, scan in scans.items()}
+
+    def current_audits() -> Dict[str, FileAudit]:
+        ordered = [scans[p] for p in sorted(scans)]
+        return {a.path.as_posix(): a for a in audit_scans(ordered, schema_columns.__getitem__)}
+
+    audits = current_audits()
+    print_summary(audits.values(), verbose=False)
+    print(f"Watching {len(scans)} pages and {len(csv_sigs)} CSVs (Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(interval)
+            started = time.perf_counter()
+            notes: List[str] = []
+
+            rebuilt: List[str] = []
+            new_generator_sig = _file_signature(GENERATOR)
+            if new_generator_sig != generator_sig:
+                # Mapping tables or inference rules changed: reload and rebuild everything.
+                generator_sig = new_generator_sig
+                load_generator_module.cache_clear()
+                generator = load_generator_module()
+                rebuilt = list(generator.ENTITIES.keys())
+                csv_sigs = csv_signatures()
+            else:
+                new_csv_sigs = csv_signatures()
+                rebuilt = [k for k, sig in new_csv_sigs.items() if sig != csv_sigs.get(k)]
+                csv_sigs = new_csv_sigs
+
+            rebuilt = [k for k in rebuilt if csv_sigs.get(k) is not None]
+            if rebuilt:
+                fields_by_entity.update(generator._build_fields_for(rebuilt))
+                schema_columns = _columns_by_entity(fields_by_entity)
+                notes.append(f"rebuilt {', '.join(rebuilt)}")
+                if regenerate:
+                    written = generator._write_outputs(
+                        fields_by_entity, generator._current_entity_inputs(), quiet=True
+                    )
+                    notes.append(f"wrote {len(written)} file(s)")
+
+            current_paths = set(PAGES_ROOT.rglob("page.tsx"))
+            changed_pages = 0
+            for path in set(scans) - current_paths:
+                del scans[path]
+                page_sigs.pop(path, None)
+                changed_pages += 1
+            for path in current_paths:
+                sig = _file_signature(path)
+                if sig is None or sig == page_sigs.get(path):
+                    continue
+                scans[path] = scan_page(path)
+                page_sigs[path] = sig
+                changed_pages += 1
+            if changed_pages:
+                notes.append(f"rescanned {changed_pages} page(s)")
+
+            if not notes:
+                continue
+            new_audits = current_audits()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            unknown_total = sum(1 for a in new_audits.values() if a.unknown_columns)
+            print(f"[{time.strftime('%H:%M:%S')}] {'; '.join(notes)} ({elapsed_ms:.1f} ms)")
+            _print_audit_diff(audits, new_audits)
+            print(f"  pages with unknown columns: {unknown_total}")
+            audits = new_audits
+    except KeyboardInterrupt:
+        return 0
+
+
 def print_summary(audits: Iterable[FileAudit], verbose: bool) -> int:
     audits = list(audits)
     with_unknown = [a for a in audits if a.unknown_columns]
@@ -139,7 +742,11 @@ def print_summary(audits: Iterable[FileAudit], verbose: bool) -> int:
         print("Unknown/non-schema hardcoded columns found:")
         for audit in with_unknown:
             print(f"- {audit.path} [{audit.entity}]")
-            print(f"  unknown: {', '.join(audit.unknown_columns)}")
+            located = [
+                f"{c} (line {audit.column_lines[c]})" if c in audit.column_lines else c
+                for c in audit.unknown_columns
+            ]
+            print(f"  unknown: {', '.join(located)}")
     else:
         print("Unknown/non-schema hardcoded columns: none")
 
@@ -159,6 +766,9 @@ def print_summary(audits: Iterable[FileAudit], verbose: bool) -> int:
     return len(with_unknown)
 
 
+AUDIT_PHASES = ["schema_load", "page_scan", "comparison"]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -171,11 +781,74 @@ def main() -> int:
         action="store_true",
         help="Print per-page hardcoded coverage snapshot.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Scan pages with N threads (default: based on CPU count).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-read every page instead of reusing cached extraction results.",
+    )
+    parser.add_argument(
+        "--base",
+        metavar="REF",
+        help="Only audit pages affected by changes since the merge base with REF.",
+    )
+    parser.add_argument(
+        "--changed",
+        nargs="+",
+        metavar="PATH",
+        help="Only audit pages affected by these changed repo paths.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: rebuild changed entities / rescan changed pages and print the audit diff.",
+    )
+    parser.add_argument(
+        "--no-regenerate",
+        action="store_true",
+        help="With --watch, do not rewrite the generator outputs when a CSV changes.",
+    )
+    generator = load_generator_module()
+    generator._add_timing_arguments(parser, AUDIT_PHASES)
     args = parser.parse_args()
 
-    audits = audit_pages()
+    if args.watch:
+        if args.timings or args.timings_json or args.profile:
+            parser.error("--timings/--profile cannot be combined with --watch")
+        return watch(regenerate=not args.no_regenerate)
+
+    generator.TIMINGS.configure(args, tool="audit")
+    jobs = args.jobs
+    if args.profile == "page_scan":
+        # cProfile only sees the calling thread; scan serially so extraction is captured.
+        jobs = 1
+
+    scope = None
+    if args.base or args.changed:
+        changed = list(args.changed or [])
+        if args.base:
+            changed += git_changed_paths(args.base)
+        scope = scope_from_changes(changed, base_ref=args.base)
+        if scope is None:
+            print("Scoped audit: changes affect every page; running full audit.")
+        else:
+            pages, entities = scope
+            print(
+                f"Scoped audit: {len(pages)} changed page(s), "
+                f"entities: {', '.join(sorted(entities)) or 'none'}"
+            )
+
+    audits = audit_pages(jobs=jobs, use_cache=not args.no_cache, scope=scope)
     unknown_count = print_summary(audits, verbose=args.verbose)
 
+    generator.TIMINGS.finish()
+
     if args.check and unknown_count > 0:
         return 1
     return 0
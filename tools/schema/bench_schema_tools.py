@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Benchmark the schema generator and the page column auditor on synthetic corpora.
+
+What this script does:
+- Writes synthetic ShotGrid-like CSVs (thousands of fields per entity, duplicate rows,
+  names that slugify to the same column) and synthetic Apex page.tsx trees into a
+  temporary directory.
+- Times _read_csv_fields, _build_entity_fields, _generate_sql, _generate_ts and
+  audit_pages at several sizes (best of N runs).
+- Normalizes every timing by a fixed pure-Python calibration loop so results recorded
+  on one machine can be compared on another (e.g. a CI runner).
+
+Usage:
+  python tools/schema/bench_schema_tools.py                    # run and print
+  python tools/schema/bench_schema_tools.py --write-baseline   # refresh bench_baseline.json
+  python tools/schema/bench_schema_tools.py --check            # exit 1 on regressions
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import importlib.util
+import json
+import math
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GENERATOR = REPO_ROOT / "tools" / "schema" / "generate_from_csv.py"
+AUDITOR = REPO_ROOT / "tools" / "schema" / "audit_page_columns.py"
+BASELINE_PATH = REPO_ROOT / "tools" / "schema" / "bench_baseline.json"
+BASELINE_VERSION = 1
+
+# Fields per entity CSV and number of page.tsx files per size.
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": {"fields": 250, "pages": 100},
+    "medium": {"fields": 1000, "pages": 400},
+    "large": {"fields": 3000, "pages": 1000},
+}
+
+DEFAULT_THRESHOLD = 0.50
+DEFAULT_REPEAT = 3
+# Fast benchmarks are looped until one sample takes at least this long, so that
+# sub-millisecond timings are not dominated by timer noise.
+MIN_SAMPLE_SECONDS = 0.05
+CALIBRATION_REPEAT = 7
+
+DATA_TYPES = [
+    "text",
+    "number",
+    "float",
+    "checkbox",
+    "date",
+    "date_time",
+    "duration",
+    "percent",
+    "list",
+    "status_list",
+    "entity",
+    "multi_entity",
+    "serializable",
+    "summary",
+    "url",
+    "image",
+    "color",
+]
+
+WORDS = [
+    "asset", "shot", "cut", "frame", "review", "client", "vendor", "bid", "comp", "plate",
+    "render", "layout", "anim", "light", "fx", "paint", "roto", "track", "delivery", "note",
+    "status", "count", "date", "path", "version", "publish", "step", "episode", "scene", "level",
+]
+
+ROUTE_TOKENS = ["assets", "shots", "sequences", "tasks", "versions", "published-files", "notes"]
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {path}")
+    module = importlib.util.module_from_spec(spec)
+    # Required for dataclasses to resolve module namespace correctly.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpora
+# ---------------------------------------------------------------------------
+
+
+def _field_name(rng: random.Random, i: int) -> str:
+    words = rng.sample(WORDS, rng.randint(1, 3))
+    name = " ".join(w.capitalize() for w in words)
+    # Every 7th name collides with an earlier one after slugifying ("Cut-Frame" vs "Cut Frame").
+    if i % 7 == 0:
+        name = name.replace(" ", "-")
+    return f"{name} {i // 3}"
+
+
+def write_synthetic_csvs(csv_dir: Path, entities: Dict[str, Dict[str, str]], fields: int, seed: int) -> None:
+    csv_dir.mkdir(parents=True, exist_ok=True)
+    for entity_key, cfg in entities.items():
+        rng = random.Random(f"{seed}:{entity_key}")
+        rows: List[Tuple[str, str, str]] = []
+        for i in range(fields):
+            rows.append((_field_name(rng, i), rng.choice(DATA_TYPES), rng.choice(["permanent", "dynamic"])))
+            if i % 11 == 0 and rows:
+                # Exact duplicate row (merged by the reader) and a same-name/different-type row.
+                rows.append(rows[-1])
+                rows.append((rows[-1][0], rng.choice(DATA_TYPES), "dynamic"))
+            if i % 97 == 0:
+                rows.append(("", "", ""))
+        with (csv_dir / cfg["csv"]).open("w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Field Name", "Data Type", "Field Type"])
+            writer.writerows(rows)
+
+
+def _page_source(rng: random.Random, column_ids: List[str], filler_lines: int) -> str:
+    columns = []
+    for column_id in column_ids:
+        if rng.random() < 0.3:
+            columns.append(
+                "    {\n"
+                f"      id: '{column_id}',\n"
+                f"      label: '{column_id.replace('_', ' ').title()}',\n"
+                "      type: 'text' as const,\n"
+                "      editable: true,\n"
+                "      formatValue: (v: unknown) => String(v ?? '').replace(/'/g, \"\"),\n"
+                "    },"
+            )
+        else:
+            columns.append(f"    {{ id: '{column_id}', label: 'Col', type: 'text' as const, width: '120px' }},")
+    filler = "\n".join(
+        f"  const value{i} = useMemo(() => [`row-${{{i}}}`, \"{i}\"].join(','), [])  // filler {i}"
+        for i in range(filler_lines)
+    )
+    return (
+        "'use client'\n\n"
+        "import { useMemo } from 'react'\n"
+        "import { EntityTable } from '@/components/table/entity-table'\n\n"
+        "export default function Page() {\n"
+        f"{filler}\n"
+        "  const columns = [\n"
+        + "\n".join(columns)
+        + "\n  ]\n\n"
+        "  return <EntityTable columns={columns} data={[]} />\n"
+        "}\n"
+    )
+
+
+def write_synthetic_pages(
+    pages_root: Path,
+    schema_columns: Dict[str, List[str]],
+    entity_by_route: Dict[str, str],
+    pages: int,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    for i in range(pages):
+        route = ROUTE_TOKENS[i % len(ROUTE_TOKENS)]
+        entity = entity_by_route[route]
+        available = schema_columns[entity]
+        ids = rng.sample(available, min(len(available), rng.randint(8, 40)))
+        if i % 13 == 0:
+            ids.append("not_a_schema_column")
+        # A few very large components to exercise the extractor on multi-thousand-line files.
+        filler = 3000 if i % 250 == 0 else rng.randint(20, 200)
+        page_dir = pages_root / f"group{i // 100}" / f"[id{i}]" / route
+        page_dir.mkdir(parents=True, exist_ok=True)
+        (page_dir / "page.tsx").write_text(_page_source(rng, ids, filler), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+
+def calibrate(repeat: int) -> float:
+    """Time a fixed pure-Python workload; used to normalize results across machines."""
+
+    def workload() -> None:
+        acc: Dict[str, int] = {}
+        for i in range(200_000):
+            key = f"k{i % 997}"
+            acc[key] = acc.get(key, 0) + len(key)
+
+    return best_of(workload, max(repeat, CALIBRATION_REPEAT))
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """Best per-call time over `repeat` samples; the first (warm-up) call sizes the samples."""
+    started = time.perf_counter()
+    fn()
+    first = time.perf_counter() - started
+    number = max(1, math.ceil(MIN_SAMPLE_SECONDS / first)) if first > 0 else 1000
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def run_benchmarks(sizes: List[str], repeat: int, seed: int) -> Dict[str, Any]:
+    generator = load_module("schema_generator", GENERATOR)
+    auditor = load_module("schema_auditor", AUDITOR)
+    # The auditor must see the generator instance we point at the synthetic CSVs.
+    auditor.load_generator_module = lambda: generator
+
+    # Calibrated again after every size; the minimum is the least disturbed measurement.
+    calibration = calibrate(repeat)
+    raw: Dict[str, float] = {}
+
+    for size in sizes:
+        spec = SIZES[size]
+        with tempfile.TemporaryDirectory(prefix=f"kong-bench-{size}-") as tmp:
+            root = Path(tmp)
+            generator.CSV_DIR = root / "csv"
+            generator.OUT_SNAPSHOT = root / "schema.snapshot.json"
+            write_synthetic_csvs(generator.CSV_DIR, generator.ENTITIES, spec["fields"], seed)
+
+            timings: Dict[str, float] = {}
+            first_entity = next(iter(generator.ENTITIES))
+            first_csv = generator.CSV_DIR / generator.ENTITIES[first_entity]["csv"]
+            timings["read_csv_fields"] = best_of(lambda: generator._read_csv_fields(first_csv), repeat)
+            timings["build_entity_fields"] = best_of(
+                lambda: generator._build_entity_fields(first_entity), repeat
+            )
+
+            all_fields = {k: generator._build_entity_fields(k) for k in generator.ENTITIES}
+            timings["generate_sql"] = best_of(lambda: generator._generate_sql(all_fields), repeat)
+            timings["generate_ts"] = best_of(lambda: generator._generate_ts(all_fields), repeat)
+
+            entity_inputs = generator._current_entity_inputs()
+            generator.OUT_SNAPSHOT.write_text(
+                generator._render_snapshot(generator._build_snapshot(all_fields, entity_inputs)),
+                encoding="utf-8",
+            )
+
+            auditor.REPO_ROOT = root
+            auditor.PAGES_ROOT = root / "app" / "apex" / "[projectId]"
+            auditor.PAGE_CACHE_PATH = root / "page_scan_cache.json"
+            schema_columns = {
+                k: sorted({f.column for f in fields if f.column}) for k, fields in all_fields.items()
+            }
+            write_synthetic_pages(
+                auditor.PAGES_ROOT, schema_columns, auditor.ENTITY_BY_ROUTE_TOKEN, spec["pages"], seed
+            )
+            timings["audit_pages_cold"] = best_of(lambda: auditor.audit_pages(use_cache=False), repeat)
+            auditor.audit_pages(use_cache=True)
+            timings["audit_pages_cached"] = best_of(lambda: auditor.audit_pages(use_cache=True), repeat)
+
+        for name, seconds in timings.items():
+            raw[f"{name}/{size}"] = seconds
+        calibration = min(calibration, calibrate(repeat))
+
+    results = {
+        key: {"seconds": round(seconds, 6), "normalized": round(seconds / calibration, 4)}
+        for key, seconds in raw.items()
+    }
+
+    return {
+        "version": BASELINE_VERSION,
+        "seed": seed,
+        "sizes": {k: SIZES[k] for k in sizes},
+        "calibration_seconds": round(calibration, 6),
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return one message per benchmark whose normalized time regressed beyond threshold."""
+    regressions: List[str] = []
+    for key, result in current["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if not base:
+            continue
+        limit = base["normalized"] * (1 + threshold)
+        if result["normalized"] > limit:
+            ratio = result["normalized"] / base["normalized"]
+            regressions.append(
+                f"{key}: {result['normalized']:.3f} vs baseline {base['normalized']:.3f} ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def print_results(current: Dict[str, Any], baseline: Dict[str, Any] | None) -> None:
+    print(f"Calibration: {current['calibration_seconds'] * 1000:.1f} ms")
+    for key, result in current["results"].items():
+        line = f"- {key}: {result['seconds'] * 1000:.2f} ms (normalized {result['normalized']:.3f})"
+        base = (baseline or {}).get("results", {}).get(key)
+        if base:
+            line += f" baseline {base['normalized']:.3f}"
+        print(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes",
+        default=",".join(SIZES.keys()),
+        help=f"Comma-separated sizes to run (default: all of {', '.join(SIZES)}).",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per benchmark; the best is kept.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the synthetic corpora.")
+    parser.add_argument("--output", type=Path, help="Also write the results JSON to this path.")
+    parser.add_argument(
+        "--write-baseline",
+        action="store_true",
+        help=f"Write results to {BASELINE_PATH.relative_to(REPO_ROOT)}.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if any benchmark is slower than the baseline by more than --threshold.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed slowdown for --check as a fraction (default: {DEFAULT_THRESHOLD}).",
+    )
+    args = parser.parse_args()
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes: {', '.join(unknown)}")
+
+    baseline = None
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+        if baseline.get("version") != BASELINE_VERSION:
+            baseline = None
+
+    current = run_benchmarks(sizes, args.repeat, args.seed)
+    print_results(current, baseline)
+
+    text = json.dumps(current, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    if args.write_baseline:
+        BASELINE_PATH.write_text(text, encoding="utf-8")
+        print(f"Wrote: {BASELINE_PATH}")
+
+    if args.check:
+        if baseline is None:
+            print(f"No baseline at {BASELINE_PATH}; run with --write-baseline first.")
+            return 1
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions above {args.threshold:.0%}:")
+            for message in regressions:
+                print(f"- {message}")
+            return 1
+        print(f"No regressions above {args.threshold:.0%}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
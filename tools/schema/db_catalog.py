@@ -0,0 +1,758 @@
+#!/usr/bin/env python3
+"""
+Read the current database schema (tables, columns, defaults, constraints, indexes,
+RLS policies) so the generator can diff it against the CSV schema and emit only the
+real deltas.
+
+Sources:
+- A live Postgres via psql (catalog queries; no Python driver required).
+- A pg_dump file, e.g. supabase/supabase-kubernetes/charts/kong220.sql, parsed in one
+  streaming pass without loading it into a database. Custom-format dumps (*.backup)
+  are streamed through `pg_restore --schema-only -f -`.
+
+Column types, defaults and constraint definitions are kept as Postgres prints them
+(format_type / pg_get_expr / pg_get_constraintdef), which is also what pg_dump writes,
+so both sources compare the same way.
+
+Usage:
+  python tools/schema/db_catalog.py supabase/supabase-kubernetes/charts/kong220.sql
+  python tools/schema/db_catalog.py kong220.sql --table tasks --json /tmp/kong220.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import re
+import subprocess
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Same order as generate_from_csv.FieldDef, so field_rows() lines up with the
+# "field_keys" / "fields" rows of echo/src/lib/schema/schema.snapshot.json.
+FIELD_KEYS = ["name", "data_type", "field_type", "code", "column", "pg_type", "default_sql"]
+
+
+@dataclass
+class CatalogColumn:
+    name: str
+    pg_type: str
+    default_sql: Optional[str] = None
+    not_null: bool = False
+
+
+@dataclass
+class CatalogIndex:
+    name: str
+    method: str
+    columns: List[str]  # column names or expressions, as written
+    unique: bool = False
+    predicate: Optional[str] = None  # partial index WHERE clause
+
+
+@dataclass
+class CatalogPolicy:
+    name: str
+    command: str = "ALL"
+    permissive: bool = True
+    roles: List[str] = field(default_factory=list)
+    using: Optional[str] = None
+    with_check: Optional[str] = None
+
+
+@dataclass
+class CatalogTable:
+    schema: str
+    name: str
+    columns: Dict[str, CatalogColumn] = field(default_factory=dict)
+    # constraint name -> definition, e.g. "CHECK ((entity_type = ANY (...))) NOT VALID"
+    constraints: Dict[str, str] = field(default_factory=dict)
+    indexes: Dict[str, CatalogIndex] = field(default_factory=dict)
+    policies: Dict[str, CatalogPolicy] = field(default_factory=dict)
+    rls_enabled: bool = False
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.schema}.{self.name}"
+
+    def field_rows(self) -> List[List[Optional[str]]]:
+        """Columns as FieldDef-shaped rows (see FIELD_KEYS); the database has no CSV data type."""
+        return [
+            [c.name, "", "database", c.name, c.name, c.pg_type, c.default_sql] for c in self.columns.values()
+        ]
+
+
+Catalog = Dict[str, CatalogTable]  # keyed by qualified name, e.g. "public.tasks"
+
+
+def _unquote_ident(ident: str) -> str:
+    ident = ident.strip()
+    if len(ident) >= 2 and ident[0] == '"' and ident[-1] == '"':
+        return ident[1:-1].replace('""', '"')
+    return ident
+
+
+def _split_qualified(name: str) -> Tuple[str, str]:
+    schema, _, table = name.partition(".")
+    if not table:
+        return "public", _unquote_ident(schema)
+    return _unquote_ident(schema), _unquote_ident(table)
+
+
+# ---------------------------------------------------------------------------
+# pg_dump statement splitting
+# ---------------------------------------------------------------------------
+
+_DOLLAR_TAG_RE = re.compile(r"\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$")
+
+
+def _scan_line(line: str, state: Dict[str, Optional[str]]) -> bool:
+    """
+    Advance quote/dollar-quote state over one line; return True when a top-level `;`
+    ends the statement on this line. `state["quote"]` is "'", '"', a dollar tag or None.
+    """
+    i = 0
+    n = len(line)
+    ended = False
+    while i < n:
+        quote = state["quote"]
+        ch = line[i]
+        if quote is None:
+            if ch == "'" or ch == '"':
+                state["quote"] = ch
+            elif ch == "$":
+                m = _DOLLAR_TAG_RE.match(line, i)
+                if m:
+                    state["quote"] = m.group(0)
+                    i = m.end()
+                    continue
+            elif ch == "-" and line.startswith("--", i):
+                break
+            elif ch == ";":
+                ended = True
+        elif quote in ("'", '"'):
+            if ch == quote:
+                # A doubled quote is an escaped quote inside the literal/identifier.
+                if i + 1 < n and line[i + 1] == quote:
+                    i += 2
+                    continue
+                state["quote"] = None
+        elif line.startswith(quote, i):
+            state["quote"] = None
+            i += len(quote)
+            continue
+        i += 1
+    return ended and state["quote"] is None
+
+
+def iter_dump_statements(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the SQL statements of a plain-format dump one at a time. Comment lines and
+    COPY ... FROM stdin data blocks are skipped, so memory stays bounded by the largest
+    single statement (typically a function body), not by the dump size.
+    """
+    buf: List[str] = []
+    state: Dict[str, Optional[str]] = {"quote": None}
+    in_copy = False
+    for line in lines:
+        if in_copy:
+            if line.rstrip("\r\n") == "\\.":
+                in_copy = False
+            continue
+        if not buf and (not line.strip() or line.startswith("--")):
+            continue
+        buf.append(line)
+        # Fast path: lines without quote or comment characters cannot change the quote state.
+        if state["quote"] is None and not any(c in line for c in ("'", '"', "$", "--")):
+            ended = line.rstrip().endswith(";")
+        else:
+            ended = _scan_line(line, state)
+        if ended:
+            statement = "".join(buf).strip()
+            buf = []
+            if statement.startswith("COPY ") and statement.rstrip(";").rstrip().endswith("FROM stdin"):
+                in_copy = True
+            yield statement
+    if buf and "".join(buf).strip():
+        yield "".join(buf).strip()
+
+
+# ---------------------------------------------------------------------------
+# Statement parsing
+# ---------------------------------------------------------------------------
+
+_IDENT = r'(?:"(?:[^"]|"")+"|[A-Za-z_][A-Za-z0-9_$]*)'
+_QUALIFIED = rf"{_IDENT}(?:\.{_IDENT})?"
+
+_CREATE_TABLE_RE = re.compile(
+    rf"^CREATE (?:UNLOGGED )?TABLE (?P<name>{_QUALIFIED}) \((?P<body>.*)\)(?P<tail>[^)]*);$",
+    re.S,
+)
+_ALTER_TABLE_RE = re.compile(
+    rf"^ALTER TABLE (?:ONLY )?(?P<name>{_QUALIFIED})\s+(?P<action>.*);$",
+    re.S,
+)
+_ADD_CONSTRAINT_RE = re.compile(rf"^ADD CONSTRAINT (?P<name>{_IDENT}) (?P<definition>.*)$", re.S)
+_SET_DEFAULT_RE = re.compile(rf"^ALTER COLUMN (?P<column>{_IDENT}) SET DEFAULT (?P<default>.*)$", re.S)
+_CREATE_INDEX_RE = re.compile(
+    rf"^CREATE (?P<unique>UNIQUE )?INDEX (?:CONCURRENTLY )?(?:IF NOT EXISTS )?(?P<name>{_IDENT}) "
+    rf"ON (?:ONLY )?(?P<table>{_QUALIFIED}) USING (?P<method>\w+) ",
+)
+_CREATE_POLICY_RE = re.compile(rf"^CREATE POLICY (?P<name>{_IDENT}) ON (?P<table>{_QUALIFIED})(?P<rest>.*)$", re.S)
+_POLICY_ROLES_RE = re.compile(r"^TO (?P<roles>.+?)(?= USING \(| WITH CHECK \(|$)", re.S)
+
+# Keywords that end a column's type (or its DEFAULT expression) at paren depth 0.
+_COLUMN_OPTION_KEYWORDS = (
+    "DEFAULT",
+    "NOT NULL",
+    "NULL",
+    "COLLATE",
+    "GENERATED",
+    "CONSTRAINT",
+    "CHECK",
+    "REFERENCES",
+    "PRIMARY KEY",
+    "UNIQUE",
+)
+
+
+def _top_level_positions(text: str) -> Iterator[Tuple[int, str]]:
+    """Yield (index, char) for characters outside quotes and parentheses."""
+    depth = 0
+    quote: Optional[str] = None
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if quote:
+            if ch == quote:
+                if i + 1 < n and text[i + 1] == quote:
+                    i += 2
+                    continue
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif depth == 0:
+            yield i, ch
+        i += 1
+
+
+def _take_parenthesized(text: str, open_idx: int) -> Tuple[str, int]:
+    """Contents of the parenthesized group opening at text[open_idx], and the index after it."""
+    depth = 0
+    quote: Optional[str] = None
+    i = open_idx
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if quote:
+            if ch == quote:
+                if i + 1 < n and text[i + 1] == quote:
+                    i += 2
+                    continue
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                return text[open_idx + 1 : i], i + 1
+        i += 1
+    raise ValueError("unbalanced parentheses")
+
+
+def _split_top_level(text: str, sep: str = ",") -> List[str]:
+    parts: List[str] = []
+    start = 0
+    for i, ch in _top_level_positions(text):
+        if ch == sep:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _keyword_offsets(text: str) -> List[Tuple[int, str]]:
+    """Offsets of column-option keywords that start a word at paren depth 0."""
+    found: List[Tuple[int, str]] = []
+    for i, _ in _top_level_positions(text):
+        if i > 0 and not text[i - 1].isspace():
+            continue
+        for kw in _COLUMN_OPTION_KEYWORDS:
+            end = i + len(kw)
+            if text.startswith(kw, i) and (end == len(text) or not (text[end].isalnum() or text[end] == "_")):
+                found.append((i, kw))
+                break
+    return found
+
+
+def _parse_column(element: str) -> Optional[CatalogColumn]:
+    m = re.match(rf"^({_IDENT})\s+(.*)$", element, re.S)
+    if not m:
+        return None
+    name, rest = _unquote_ident(m.group(1)), m.group(2).strip()
+    offsets = _keyword_offsets(rest)
+    pg_type = rest[: offsets[0][0]].strip() if offsets else rest
+    default_sql: Optional[str] = None
+    not_null = False
+    for idx, (pos, kw) in enumerate(offsets):
+        if kw == "NOT NULL":
+            not_null = True
+        elif kw == "DEFAULT":
+            end = offsets[idx + 1][0] if idx + 1 < len(offsets) else len(rest)
+            default_sql = rest[pos + len("DEFAULT") : end].strip()
+    return CatalogColumn(name=name, pg_type=pg_type, default_sql=default_sql, not_null=not_null)
+
+
+def _table_for(catalog: Catalog, schema: str, name: str) -> CatalogTable:
+    key = f"{schema}.{name}"
+    table = catalog.get(key)
+    if table is None:
+        table = catalog[key] = CatalogTable(schema=schema, name=name)
+    return table
+
+
+def _dump_table(catalog: Catalog, qualified: str, schemas: Optional[Iterable[str]]) -> Optional[CatalogTable]:
+    schema, name = _split_qualified(qualified)
+    if schemas is not None and schema not in schemas:
+        return None
+    return _table_for(catalog, schema, name)
+
+
+def _parse_index(statement: str) -> Optional[Tuple[str, CatalogIndex]]:
+    """(qualified table, index) from a CREATE INDEX statement (also pg_indexes.indexdef)."""
+    m = _CREATE_INDEX_RE.match(statement)
+    if not m or statement[m.end() : m.end() + 1] != "(":
+        return None
+    try:
+        inner, end = _take_parenthesized(statement, m.end())
+    except ValueError:
+        return None
+    rest = statement[end:].strip().rstrip(";").strip()
+    if rest.startswith("INCLUDE ("):
+        _, include_end = _take_parenthesized(rest, len("INCLUDE "))
+        rest = rest[include_end:].strip()
+    predicate = rest[len("WHERE ") :].strip() if rest.startswith("WHERE ") else None
+    index = CatalogIndex(
+        name=_unquote_ident(m.group("name")),
+        method=m.group("method"),
+        columns=_split_top_level(inner),
+        unique=bool(m.group("unique")),
+        predicate=predicate,
+    )
+    return m.group("table"), index
+
+
+def _parse_policy(rest: str, name: str) -> CatalogPolicy:
+    policy = CatalogPolicy(name=name)
+    rest = rest.strip().rstrip(";").strip()
+    for prefix, permissive in (("AS PERMISSIVE", True), ("AS RESTRICTIVE", False)):
+        if rest.startswith(prefix):
+            policy.permissive = permissive
+            rest = rest[len(prefix) :].strip()
+    m = re.match(r"^FOR (ALL|SELECT|INSERT|UPDATE|DELETE)\b", rest)
+    if m:
+        policy.command = m.group(1)
+        rest = rest[m.end() :].strip()
+    m = _POLICY_ROLES_RE.match(rest)
+    if m:
+        policy.roles = [_unquote_ident(r) for r in m.group("roles").split(",")]
+        rest = rest[m.end() :].strip()
+    for keyword, attr in (("USING", "using"), ("WITH CHECK", "with_check")):
+        if rest.startswith(keyword + " ("):
+            inner, end = _take_parenthesized(rest, len(keyword) + 1)
+            setattr(policy, attr, inner.strip())
+            rest = rest[end:].strip()
+    return policy
+
+
+def apply_statement(catalog: Catalog, statement: str, *, schemas: Optional[Iterable[str]] = ("public",)) -> None:
+    """Fold one dump statement into the catalog; statements it does not model are ignored."""
+    if statement.startswith("CREATE INDEX") or statement.startswith("CREATE UNIQUE INDEX"):
+        parsed = _parse_index(statement)
+        if parsed is not None:
+            table = _dump_table(catalog, parsed[0], schemas)
+            if table is not None:
+                table.indexes[parsed[1].name] = parsed[1]
+        return
+
+    if statement.startswith("CREATE POLICY"):
+        m = _CREATE_POLICY_RE.match(statement)
+        if m:
+            table = _dump_table(catalog, m.group("table"), schemas)
+            if table is not None:
+                name = _unquote_ident(m.group("name"))
+                try:
+                    table.policies[name] = _parse_policy(m.group("rest"), name)
+                except ValueError:
+                    pass
+        return
+
+    if statement.startswith("CREATE TABLE") or statement.startswith("CREATE UNLOGGED TABLE"):
+        m = _CREATE_TABLE_RE.match(statement)
+        if not m:
+            return
+        table = _dump_table(catalog, m.group("name"), schemas)
+        if table is None:
+            return
+        for element in _split_top_level(m.group("body")):
+            if element.startswith("CONSTRAINT "):
+                cm = re.match(rf"^CONSTRAINT ({_IDENT}) (.*)$", element, re.S)
+                if cm:
+                    table.constraints[_unquote_ident(cm.group(1))] = cm.group(2).strip()
+                continue
+            column = _parse_column(element)
+            if column is not None:
+                table.columns[column.name] = column
+        return
+
+    if statement.startswith("ALTER TABLE"):
+        m = _ALTER_TABLE_RE.match(statement)
+        if not m or m.group("name") == "IF":
+            return
+        action = " ".join(m.group("action").split())
+        constraint = _ADD_CONSTRAINT_RE.match(action)
+        default = _SET_DEFAULT_RE.match(action)
+        enable_rls = action == "ENABLE ROW LEVEL SECURITY"
+        if not (constraint or default or enable_rls):
+            return
+        table = _dump_table(catalog, m.group("name"), schemas)
+        if table is None:
+            return
+        if enable_rls:
+            table.rls_enabled = True
+        elif constraint:
+            table.constraints[_unquote_ident(constraint.group("name"))] = constraint.group("definition").strip()
+        elif default:
+            column = table.columns.get(_unquote_ident(default.group("column")))
+            if column is not None:
+                column.default_sql = default.group("default").strip()
+
+
+@contextlib.contextmanager
+def _open_dump_lines(path: Path, *, data: bool = False) -> Iterator[Iterable[str]]:
+    """
+    Lines of a plain-SQL dump; custom-format dumps are converted on the fly by pg_restore
+    (schema only, or data only with data=True).
+    """
+    with path.open("rb") as f:
+        custom_format = f.read(5) == b"PGDMP"
+    if not custom_format:
+        with path.open(encoding="utf-8") as f:
+            yield f
+        return
+    try:
+        proc = subprocess.Popen(
+            ["pg_restore", "--data-only" if data else "--schema-only", "-f", "-", str(path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+    except FileNotFoundError as e:
+        raise RuntimeError(f"{path} is a custom-format dump and pg_restore is not on PATH") from e
+    assert proc.stdout is not None and proc.stderr is not None
+    try:
+        yield proc.stdout
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        if proc.wait() != 0:
+            raise RuntimeError(f"pg_restore failed: {stderr.strip()}")
+
+
+def load_catalog_from_dump(path: Path, *, schemas: Optional[Iterable[str]] = ("public",)) -> Catalog:
+    """One streaming pass; memory is bounded by the catalog plus the largest single statement."""
+    schema_set = set(schemas) if schemas is not None else None
+    catalog: Catalog = {}
+    with _open_dump_lines(path) as lines:
+        for statement in iter_dump_statements(lines):
+            apply_statement(catalog, statement, schemas=schema_set)
+    return catalog
+
+
+# ---------------------------------------------------------------------------
+# Live database (psql)
+# ---------------------------------------------------------------------------
+
+_COLUMNS_QUERY = """
+SELECT n.nspname, c.relname, a.attname, format_type(a.atttypid, a.atttypmod),
+       pg_get_expr(d.adbin, d.adrelid), a.attnotnull
+FROM pg_attribute a
+JOIN pg_class c ON c.oid = a.attrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+WHERE c.relkind IN ('r', 'p') AND a.attnum > 0 AND NOT a.attisdropped
+  AND n.nspname = ANY (ARRAY[{schemas}])
+ORDER BY n.nspname, c.relname, a.attnum
+"""
+
+_CONSTRAINTS_QUERY = """
+SELECT n.nspname, c.relname, con.conname, pg_get_constraintdef(con.oid)
+FROM pg_constraint con
+JOIN pg_class c ON c.oid = con.conrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = ANY (ARRAY[{schemas}])
+ORDER BY n.nspname, c.relname, con.conname
+"""
+
+
+_INDEXES_QUERY = """
+SELECT schemaname, tablename, indexdef
+FROM pg_indexes
+WHERE schemaname = ANY (ARRAY[{schemas}])
+ORDER BY schemaname, tablename, indexname
+"""
+
+_POLICIES_QUERY = """
+SELECT n.nspname, c.relname, c.relrowsecurity, p.polname, p.polpermissive, p.polcmd,
+       COALESCE((SELECT string_agg(CASE WHEN r = 0 THEN 'public' ELSE pg_get_userbyid(r) END, ',')
+                 FROM unnest(p.polroles) AS r), ''),
+       pg_get_expr(p.polqual, p.polrelid), pg_get_expr(p.polwithcheck, p.polrelid)
+FROM pg_class c
+JOIN pg_namespace n ON n.oid = c.relnamespace
+LEFT JOIN pg_policy p ON p.polrelid = c.oid
+WHERE c.relkind IN ('r', 'p') AND n.nspname = ANY (ARRAY[{schemas}])
+ORDER BY n.nspname, c.relname, p.polname
+"""
+
+_POLICY_COMMANDS = {"*": "ALL", "r": "SELECT", "a": "INSERT", "w": "UPDATE", "d": "DELETE"}
+
+
+def _psql_rows(dsn: str, query: str) -> List[List[str]]:
+    try:
+        proc = subprocess.run(
+            ["psql", dsn, "-X", "-q", "--csv", "-v", "ON_ERROR_STOP=1", "-c", query],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError as e:
+        raise RuntimeError("psql not found on PATH; install the Postgres client or diff against a dump file") from e
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"psql failed: {e.stderr.strip()}") from e
+    rows = list(csv.reader(io.StringIO(proc.stdout)))
+    return rows[1:]  # header
+
+
+def load_catalog_from_psql(dsn: str, *, schemas: Iterable[str] = ("public",)) -> Catalog:
+    schema_list = list(schemas)
+    for schema in schema_list:
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", schema):
+            raise ValueError(f"Invalid schema name: {schema!r}")
+    literal = ", ".join(f"'{s}'" for s in schema_list)
+
+    catalog: Catalog = {}
+    for nspname, relname, attname, pg_type, default_sql, not_null in _psql_rows(
+        dsn, _COLUMNS_QUERY.format(schemas=literal)
+    ):
+        table = _table_for(catalog, nspname, relname)
+        table.columns[attname] = CatalogColumn(
+            name=attname,
+            pg_type=pg_type,
+            default_sql=default_sql or None,
+            not_null=not_null == "t",
+        )
+    for nspname, relname, conname, definition in _psql_rows(dsn, _CONSTRAINTS_QUERY.format(schemas=literal)):
+        table = _table_for(catalog, nspname, relname)
+        table.constraints[conname] = definition
+    for nspname, relname, indexdef in _psql_rows(dsn, _INDEXES_QUERY.format(schemas=literal)):
+        parsed = _parse_index(indexdef)
+        if parsed is not None:
+            _table_for(catalog, nspname, relname).indexes[parsed[1].name] = parsed[1]
+    for row in _psql_rows(dsn, _POLICIES_QUERY.format(schemas=literal)):
+        nspname, relname, rls, polname, permissive, cmd, roles, using, with_check = row
+        table = _table_for(catalog, nspname, relname)
+        table.rls_enabled = rls == "t"
+        if polname:
+            table.policies[polname] = CatalogPolicy(
+                name=polname,
+                command=_POLICY_COMMANDS.get(cmd, cmd),
+                permissive=permissive == "t",
+                roles=roles.split(",") if roles else [],
+                using=using or None,
+                with_check=with_check or None,
+            )
+    return catalog
+
+
+# ---------------------------------------------------------------------------
+# Column values (for list encoding): distinct values and their row counts
+# ---------------------------------------------------------------------------
+
+ValueCounts = Dict[Tuple[str, str], Dict[str, int]]  # (table, column) -> value -> rows
+
+_COPY_RE = re.compile(rf"^COPY (?P<name>{_QUALIFIED}) \((?P<columns>.*)\) FROM stdin;$")
+_COPY_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v", "\\": "\\"}
+_COPY_ESCAPE_RE = re.compile(r"\\(.)")
+_SIMPLE_IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _copy_unescape(value: str) -> Optional[str]:
+    if value == "\\N":
+        return None
+    if "\\" not in value:
+        return value
+    return _COPY_ESCAPE_RE.sub(lambda m: _COPY_ESCAPES.get(m.group(1), m.group(1)), value)
+
+
+def column_values_from_dump(path: Path, targets: Dict[str, List[str]], *, schema: str = "public") -> ValueCounts:
+    """
+    Count the values of `targets` (table -> columns) in the dump's COPY data, in one
+    streaming pass. NULLs and empty strings are not counted.
+    """
+    counts: ValueCounts = {(t, c): {} for t, columns in targets.items() for c in columns}
+    picks: Optional[List[Tuple[int, Dict[str, int]]]] = None
+    in_copy = False
+    with _open_dump_lines(path, data=True) as lines:
+        for line in lines:
+            if in_copy:
+                if line.startswith("\\."):
+                    in_copy = False
+                    continue
+                if picks:
+                    cells = line.rstrip("\n").split("\t")
+                    for index, bucket in picks:
+                        if index < len(cells):
+                            value = _copy_unescape(cells[index])
+                            if value:
+                                bucket[value] = bucket.get(value, 0) + 1
+                continue
+            if not line.startswith("COPY "):
+                continue
+            m = _COPY_RE.match(line.rstrip())
+            if not m:
+                continue
+            in_copy = True
+            table_schema, table = _split_qualified(m.group("name"))
+            columns = [_unquote_ident(c) for c in m.group("columns").split(",")]
+            wanted = targets.get(table, []) if table_schema == schema else []
+            picks = [(columns.index(c), counts[(table, c)]) for c in wanted if c in columns]
+    return counts
+
+
+def column_values_from_psql(dsn: str, targets: Dict[str, List[str]], *, schema: str = "public") -> ValueCounts:
+    """One GROUP BY scan per table (all of its columns at once through a VALUES lateral)."""
+    counts: ValueCounts = {(t, c): {} for t, columns in targets.items() for c in columns}
+    for table, columns in targets.items():
+        names = [schema, table, *columns]
+        bad = [n for n in names if not _SIMPLE_IDENT_RE.fullmatch(n)]
+        if bad:
+            raise ValueError(f"Invalid identifier(s): {bad}")
+        pairs = ", ".join(f"('{c}', {c}::text)" for c in columns)
+        query = (
+            f"SELECT v.col, v.val, count(*) FROM {schema}.{table} t, "
+            f"LATERAL (VALUES {pairs}) AS v(col, val) "
+            f"WHERE coalesce(v.val, '') <> '' GROUP BY 1, 2"
+        )
+        for column, value, count in _psql_rows(dsn, query):
+            counts[(table, column)][value] = int(count)
+    return counts
+
+
+def load_column_values(source: str, targets: Dict[str, List[str]]) -> ValueCounts:
+    """`source` as for load_catalog: a pg_dump file (with data) or a psql connection string."""
+    path = Path(source)
+    if path.is_file():
+        return column_values_from_dump(path, targets)
+    return column_values_from_psql(source, targets)
+
+
+def load_catalog(source: str) -> Catalog:
+    """`source` is a pg_dump file (plain or custom format) or a libpq connection string / URI for psql."""
+    path = Path(source)
+    if path.is_file():
+        return load_catalog_from_dump(path)
+    return load_catalog_from_psql(source)
+
+
+_CHECK_ANY_RE = re.compile(
+    r"^CHECK \(\((\"?[A-Za-z_][A-Za-z0-9_]*\"?) = ANY \(ARRAY\[(.*)\]\)\)\)(?: NOT VALID)?$", re.S
+)
+_CHECK_LITERAL_RE = re.compile(r"'((?:[^']|'')*)'::[A-Za-z ]+")
+
+
+def check_allowed_values(table: CatalogTable) -> Dict[str, List[str]]:
+    """
+    column -> allowed values for single-column `col = ANY (ARRAY[...])` CHECK constraints
+    (how Postgres prints `col IN (...)`), e.g. notes_status_check.
+    """
+    out: Dict[str, List[str]] = {}
+    for definition in table.constraints.values():
+        m = _CHECK_ANY_RE.match(definition.strip())
+        if not m:
+            continue
+        values = [v.replace("''", "'") for v in _CHECK_LITERAL_RE.findall(m.group(2))]
+        if values:
+            out[_unquote_ident(m.group(1))] = values
+    return out
+
+
+def catalog_to_json(catalog: Catalog) -> Dict[str, Any]:
+    tables: Dict[str, Any] = {}
+    for key in sorted(catalog):
+        table = catalog[key]
+        tables[key] = {
+            "fields": table.field_rows(),
+            "constraints": table.constraints,
+            "indexes": [asdict(ix) for ix in table.indexes.values()],
+            "policies": [asdict(p) for p in table.policies.values()],
+            "rls_enabled": table.rls_enabled,
+        }
+    return {"field_keys": FIELD_KEYS, "tables": tables}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("source", help="pg_dump file (plain SQL or custom format) or psql connection string.")
+    parser.add_argument(
+        "--schema",
+        action="append",
+        metavar="NAME",
+        help="Schema to read (repeatable; default: public).",
+    )
+    parser.add_argument("--table", action="append", metavar="NAME", help="Only report these tables (repeatable).")
+    parser.add_argument("--json", type=Path, metavar="PATH", help="Write the parsed model as JSON.")
+    args = parser.parse_args()
+
+    schemas = args.schema or ["public"]
+    path = Path(args.source)
+    try:
+        if path.is_file():
+            catalog = load_catalog_from_dump(path, schemas=schemas)
+        else:
+            catalog = load_catalog_from_psql(args.source, schemas=schemas)
+    except RuntimeError as e:
+        raise SystemExit(str(e))
+
+    if args.table:
+        wanted = set(args.table)
+        catalog = {k: t for k, t in catalog.items() if t.name in wanted or k in wanted}
+
+    tables = list(catalog.values())
+    print(
+        f"Tables: {len(tables)}, columns: {sum(len(t.columns) for t in tables)}, "
+        f"constraints: {sum(len(t.constraints) for t in tables)}, "
+        f"indexes: {sum(len(t.indexes) for t in tables)}, "
+        f"policies: {sum(len(t.policies) for t in tables)} "
+        f"(RLS enabled on {sum(1 for t in tables if t.rls_enabled)} table(s))"
+    )
+    if args.json:
+        args.json.write_text(json.dumps(catalog_to_json(catalog), indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
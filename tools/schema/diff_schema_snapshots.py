@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Compare two schema snapshots (echo/src/lib/schema/schema.snapshot.json) field by field.
+
+Reports added, removed, renamed (same CSV code, new column name), retyped and
+default-changed fields, keyed on entity and column, as text or as the same JSON
+report the generator writes to migrations&fixes/generated/schema_diff.json.
+
+Each side is a snapshot path or a git revision (`REV:` reads the snapshot committed
+at REV). NEW defaults to the snapshot in the working tree.
+
+Usage:
+  python tools/schema/diff_schema_snapshots.py HEAD~1:
+  python tools/schema/diff_schema_snapshots.py old.snapshot.json new.snapshot.json --json -
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GENERATOR = REPO_ROOT / "tools" / "schema" / "generate_from_csv.py"
+SNAPSHOT_REL = "echo/src/lib/schema/schema.snapshot.json"
+
+
+@functools.lru_cache(maxsize=None)
+def load_generator_module():
+    spec = importlib.util.spec_from_file_location("schema_generator", str(GENERATOR))
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load schema generator at {GENERATOR}")
+    module = importlib.util.module_from_spec(spec)
+    # Required for dataclasses to resolve module namespace correctly.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _read_snapshot(ref: str) -> Dict[str, Any]:
+    if ref.endswith(":") and not Path(ref).exists():
+        proc = subprocess.run(
+            ["git", "show", f"{ref}{SNAPSHOT_REL}"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise SystemExit(f"{ref}: {proc.stderr.strip() or 'git show failed'}")
+        text = proc.stdout
+    else:
+        try:
+            text = Path(ref).read_text(encoding="utf-8")
+        except OSError as e:
+            raise SystemExit(f"{ref}: {e}")
+    try:
+        snapshot = json.loads(text)
+    except ValueError as e:
+        raise SystemExit(f"{ref}: not a JSON snapshot ({e})")
+    gen = load_generator_module()
+    if not isinstance(snapshot, dict) or snapshot.get("version") != gen.SNAPSHOT_VERSION:
+        raise SystemExit(f"{ref}: unsupported snapshot version {snapshot.get('version')!r}")
+    return snapshot
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("old", help="Previous snapshot: a path or REV: (e.g. HEAD~1:).")
+    parser.add_argument(
+        "new",
+        nargs="?",
+        default=str(REPO_ROOT / SNAPSHOT_REL),
+        help="Current snapshot: a path or REV: (default: the working tree snapshot).",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Write the JSON report to PATH ('-' for stdout).")
+    parser.add_argument(
+        "--exit-code",
+        action="store_true",
+        help="Exit with status 1 when the snapshots differ (like git diff --exit-code).",
+    )
+    args = parser.parse_args()
+
+    gen = load_generator_module()
+    old, new = _read_snapshot(args.old), _read_snapshot(args.new)
+    changes = gen._diff_schema(gen._snapshot_fields(old), gen._snapshot_fields(new))
+
+    if args.json:
+        report = gen._render_schema_diff_json(
+            changes,
+            from_sha256=old.get("source_sha256", ""),
+            to_sha256=new.get("source_sha256", ""),
+        )
+        if args.json == "-":
+            sys.stdout.write(report)
+        else:
+            Path(args.json).write_text(report, encoding="utf-8")
+            print(f"Wrote: {args.json}")
+    if args.json != "-":
+        print(gen._render_schema_diff_text(changes))
+    return 1 if args.exit_code and changes else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
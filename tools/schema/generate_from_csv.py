@@ -16,14 +16,25 @@ Notes:
 
 from __future__ import annotations
 
+import argparse
+import contextlib
+import cProfile
 import csv
 import dataclasses
-import datetime as dt
+import hashlib
+import importlib.util
+import inspect
 import json
+import os
 import re
+import sys
+import threading
+import time
+import tracemalloc
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -36,8 +47,41 @@ OUT_SQL = (
     / "generated"
     / "migration_align_schema_from_csv.sql"
 )
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction, so indexes get their own file.
+OUT_INDEX_SQL = OUT_SQL.parent / "migration_indexes_from_csv.sql"
+# Trigger-maintained summary counters (plus their backfill).
+OUT_SUMMARY_SQL = OUT_SQL.parent / "migration_summary_counters.sql"
+# bulk_upsert_<table>(p_rows jsonb) RPCs used by the TS bulkUpsert wrappers.
+OUT_BULK_UPSERT_SQL = OUT_SQL.parent / "migration_bulk_upsert_rpc.sql"
+# Written by --list-values / --sample-values.
+OUT_LIST_ENCODING_SQL = OUT_SQL.parent / "migration_list_encoding.sql"
+# Field-level changes since the previous run (see _diff_schema); kept until the next change.
+OUT_SCHEMA_DIFF = OUT_SQL.parent / "schema_diff.json"
+# Written by --diff-against instead of the full migration.
+OUT_DELTA_SQL = OUT_SQL.parent / "migration_align_schema_delta.sql"
+DB_CATALOG = Path(__file__).resolve().parent / "db_catalog.py"
+# Latest committed pg_dump of the production schema. Planned indexes it already has (under
+# any name) are left out of OUT_INDEX_SQL; --index-against points at another dump or a DSN.
+INDEX_BASELINE_DUMP = REPO_ROOT / "supabase" / "supabase-kubernetes" / "charts" / "kong220.sql"
 OUT_TS = REPO_ROOT / "echo" / "src" / "lib" / "schema" / "schema.generated.ts"
 
+# Compact machine-readable copy of the built schema for tools (e.g. audit_page_columns.py)
+# that need columns/types without re-parsing the CSVs.
+OUT_SNAPSHOT = REPO_ROOT / "echo" / "src" / "lib" / "schema" / "schema.snapshot.json"
+SNAPSHOT_VERSION = 1
+# Allowed values of status_list / list / color columns (see _write_list_encoding).
+OUT_LIST_VALUES = OUT_SNAPSHOT.parent / "schema.values.json"
+# Hand-maintained entities with no ShotGrid CSV (posts, annotations, ...): FieldDef rows
+# rendered into the TS registry next to ENTITIES. No SQL is generated for them.
+MANUAL_ENTITIES_PATH = OUT_SNAPSHOT.parent / "schema.manual.json"
+MANUAL_ENTITIES_VERSION = 1
+
+# Local build cache (gitignored). Records input hashes and the last built fields per entity
+# so unchanged entities are not re-parsed on the next run.
+CACHE_DIR = REPO_ROOT / "tools" / "schema" / ".cache"
+MANIFEST_PATH = CACHE_DIR / "generate_manifest.json"
+MANIFEST_VERSION = 1
+
 
 ENTITIES: Dict[str, Dict[str, str]] = {
     "asset": {"csv": "asset.csv", "table": "assets"},
@@ -348,6 +392,89 @@ VIRTUAL_FIELDS: Dict[str, List[str]] = {
 }
 
 
+# Allowed entity_type values for tables with a polymorphic (entity_type, entity_id) link.
+ENTITY_TYPE_CHECKS: Dict[str, List[str]] = {
+    "tasks": ["asset", "shot", "sequence", "project"],
+    "versions": ["asset", "shot", "sequence"],
+    # 'post': feed comments (echo/src/actions/posts.ts) hang off posts, which have no CSV.
+    "notes": ["task", "asset", "shot", "sequence", "version", "project", "published_file", "post"],
+    "published_files": ["asset", "shot", "sequence", "task", "version", "note", "project"],
+}
+
+
+# FK-ish columns used by list-page filters, joins and RLS checks; each gets a btree index.
+INDEXED_FK_COLUMNS: List[str] = [
+    "project_id",
+    "sequence_id",
+    "shot_id",
+    "task_id",
+    "version_id",
+    "step_id",
+    "assigned_to",
+    "artist_id",
+    "author_id",
+    "published_by",
+]
+
+# multi_entity (text[]) columns the UI filters by membership ("shots tagged X",
+# "versions in playlist Y"). They get GIN indexes and are exposed to the frontend as
+# supporting @> / && so filters can run in Postgres instead of client-side.
+FILTERABLE_ARRAY_COLUMNS: Dict[str, List[str]] = {
+    "asset": ["tags", "sequences", "shots", "vendor_groups"],
+    "sequence": ["tags", "shots", "assets"],
+    "shot": ["tags", "assets", "vendor_groups"],
+    "task": ["tags", "reviewer", "versions"],
+    "version": ["tags", "playlists", "published_files"],
+    "note": ["tags", "links"],
+    "published_file": ["tags"],
+}
+
+# Columns indexed together with project_id for the per-project list pages.
+PROJECT_SCOPED_INDEX_COLUMNS: List[str] = ["status"]
+
+# Keyset pagination (schema.keyset.generated.ts): list pages order by one sortable column
+# with id as the tie-breaker and resume after the last row instead of using an offset.
+# Sortable: scalar timestamp/date/numeric fields (not FK ids) and the code/name columns.
+KEYSET_SORT_PG_TYPES = {"timestamptz", "date", "integer", "bigint", "smallint", "numeric", "double precision"}
+KEYSET_TEXT_SORT_COLUMNS: List[str] = ["code", "name"]
+# The default list-page sorts; each gets a (project_id, <column>, id) index so a page
+# is one index range scan at any depth. Other sortable columns page correctly but sort.
+KEYSET_INDEXED_SORT_COLUMNS: List[str] = ["created_at", "code", "name"]
+
+
+def _containment_columns(entity_key: str, fields: List[FieldDef]) -> List[str]:
+    """Filterable multi_entity columns that actually exist as text[] on this entity."""
+    array_columns = {f.column for f in fields if f.column and f.pg_type == "text[]"}
+    return [c for c in FILTERABLE_ARRAY_COLUMNS.get(entity_key, []) if c in array_columns]
+
+
+def _sortable_columns(fields: List[FieldDef]) -> List[Tuple[str, str]]:
+    """(column, pg_type) usable as a keyset sort key, in field order."""
+    out: List[Tuple[str, str]] = []
+    seen: Set[str] = set()
+    for f in fields:
+        if not f.column or not f.pg_type or f.column == "id" or f.column in seen:
+            continue
+        if (f.pg_type in KEYSET_SORT_PG_TYPES and f.data_type != "entity") or (
+            f.pg_type == "text" and f.column in KEYSET_TEXT_SORT_COLUMNS
+        ):
+            seen.add(f.column)
+            out.append((f.column, f.pg_type))
+    return out
+
+
+def _keyset_indexed_columns(fields: List[FieldDef]) -> List[str]:
+    sortable = {column for column, _ in _sortable_columns(fields)}
+    if not any(f.column == "project_id" for f in fields):
+        return []
+    return [c for c in KEYSET_INDEXED_SORT_COLUMNS if c in sortable]
+
+
+def _entity_type_check_body(table: str, values: Optional[Iterable[str]] = None) -> str:
+    listed = ", ".join(_sql_literal(v) for v in (ENTITY_TYPE_CHECKS[table] if values is None else values))
+    return f"entity_type IN ({listed})"
+
+
 @dataclasses.dataclass(frozen=True)
 class FieldDef:
     name: str
@@ -359,39 +486,362 @@ class FieldDef:
     default_sql: Optional[str]
 
 
-def _read_csv_fields(csv_path: Path) -> List[Tuple[str, str, str]]:
-    with csv_path.open(newline="") as f:
-        rows = list(csv.reader(f))
-    if not rows:
-        return []
+@dataclasses.dataclass(frozen=True)
+class IndexDef:
+    table: str
+    columns: Tuple[str, ...]
+    method: str = "btree"
+    reason: str = ""
+
+    @property
+    def name(self) -> str:
+        suffix = "" if self.method == "btree" else f"_{self.method}"
+        # Postgres identifiers are capped at 63 bytes.
+        return f"idx_{self.table}_{'_'.join(self.columns)}{suffix}"[:63].rstrip("_")
+
+    def create_sql(self) -> str:
+        using = "" if self.method == "btree" else f" USING {self.method}"
+        return (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.name}"
+            f" ON public.{self.table}{using} ({', '.join(self.columns)});"
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class SummaryCounter:
+    """An integer column kept equal to the number of matching rows in a source table."""
+
+    column: str
+    source: str
+    # Source columns that point at the counted row: ("task_id",) or the polymorphic
+    # ("entity_type", "entity_id") pair.
+    link: Tuple[str, ...]
+    # Extra predicate on the source row; {row} is the row alias.
+    where: str = ""
+
+    @property
+    def polymorphic(self) -> bool:
+        return len(self.link) == 2
+
+
+# Soft-deleted notes (deleted_at set) are not open; the UPDATE trigger fires for any
+# column, so setting or clearing deleted_at moves the count.
+_OPEN_NOTES = SummaryCounter(
+    "open_notes_count",
+    "notes",
+    ("entity_type", "entity_id"),
+    "{row}.status = 'open' AND {row}.deleted_at IS NULL",
+)
+
+# Summary fields maintained by triggers on their source tables (see _generate_summary_sql)
+# instead of being counted by the UI on every read. Only emitted when the column exists
+# as an integer on the entity.
+SUMMARY_COUNTERS: Dict[str, List[SummaryCounter]] = {
+    "asset": [_OPEN_NOTES],
+    "sequence": [_OPEN_NOTES],
+    "shot": [_OPEN_NOTES],
+    "task": [_OPEN_NOTES, SummaryCounter("workload_assignee_count", "task_assignments", ("task_id",))],
+    "version": [_OPEN_NOTES],
+}
 
-    data = [r for r in rows[1:] if any(c.strip() for c in r)]
+SUMMARY_BACKFILL_BATCH_SIZE = 5000
+SUMMARY_LOCK_TIMEOUT = "5s"
 
-    out: List[Tuple[str, str, str]] = []
-    for r in data:
+
+# ---------------------------------------------------------------------------
+# Phase timings (--timings / --profile)
+#
+# Shared with audit_page_columns.py, which reaches it through load_generator_module().
+# ---------------------------------------------------------------------------
+
+
+@dataclasses.dataclass
+class PhaseStat:
+    name: str
+    depth: int = 0
+    seconds: float = 0.0
+    calls: int = 0
+    items: int = 0
+    unit: str = ""
+    peak_bytes: Optional[int] = None  # peak traced memory while the phase was open
+    threaded: bool = False  # recorded via add(); seconds are summed across worker threads
+
+
+class PhaseTimings:
+    """
+    Opt-in per-phase wall time, item counts and peak memory (tracemalloc).
+    Disabled by default; phase() then yields a throwaway stat and records nothing.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.trace_memory = False
+        self.tool = ""
+        self.profile_phase: Optional[str] = None
+        self.profile_path: Optional[Path] = None
+        self.json_path: Optional[Path] = None
+        self.stats: Dict[str, PhaseStat] = {}
+        self._running_peaks: List[int] = []
+        self._profiler: Optional[cProfile.Profile] = None
+        self._lock = threading.Lock()
+        self._started = 0.0
+
+    def configure(self, args: argparse.Namespace, *, tool: str) -> None:
+        """Enable from the flags added by _add_timing_arguments()."""
+        if not (args.timings or args.timings_json or args.profile):
+            return
+        self.enabled = True
+        self.tool = tool
+        self.json_path = args.timings_json
+        self.trace_memory = not args.no_trace_memory
+        if args.profile:
+            self.profile_phase = args.profile
+            self.profile_path = args.profile_out or CACHE_DIR / f"{tool}-{args.profile}.prof"
+            self._profiler = cProfile.Profile()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._started = time.perf_counter()
+
+    def _stat(self, name: str, unit: str) -> PhaseStat:
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats[name] = PhaseStat(name, depth=len(self._running_peaks), unit=unit)
+        return stat
+
+    @contextlib.contextmanager
+    def phase(self, name: str, unit: str = "") -> Iterator[PhaseStat]:
+        """Time a main-thread phase; phases may nest (a child's peak also counts for its parent)."""
+        if not self.enabled:
+            yield PhaseStat(name)
+            return
+        stat = self._stat(name, unit)
+        if self.trace_memory:
+            # reset_peak() is global, so fold the parent's peak so far in before resetting.
+            if self._running_peaks:
+                self._running_peaks[-1] = max(self._running_peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self._running_peaks.append(0)
+        profiling = self._profiler is not None and name == self.profile_phase
+        started = time.perf_counter()
+        if profiling:
+            self._profiler.enable()
+        try:
+            yield stat
+        finally:
+            if profiling:
+                self._profiler.disable()
+            stat.seconds += time.perf_counter() - started
+            stat.calls += 1
+            running = self._running_peaks.pop()
+            if self.trace_memory:
+                peak = max(running, tracemalloc.get_traced_memory()[1])
+                stat.peak_bytes = max(stat.peak_bytes or 0, peak)
+                if self._running_peaks:
+                    self._running_peaks[-1] = max(self._running_peaks[-1], peak)
+
+    def add(self, name: str, seconds: float, *, items: int = 0, unit: str = "") -> None:
+        """Accumulate work done on worker threads (time is summed across threads; no memory)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stat = self._stat(name, unit)
+            stat.threaded = True
+            stat.seconds += seconds
+            stat.calls += 1
+            stat.items += items
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "tool": self.tool,
+            "total_seconds": round(time.perf_counter() - self._started, 6),
+            "trace_memory": self.trace_memory,
+            "profile": _repo_relative(self.profile_path) if self.profile_path else None,
+            "phases": [
+                {**dataclasses.asdict(s), "seconds": round(s.seconds, 6)} for s in self.stats.values()
+            ],
+        }
+
+    def render_text(self) -> str:
+        report = self.report()
+        lines = [f"Timings ({self.tool}, total {report['total_seconds'] * 1000:.1f} ms):"]
+        for s in self.stats.values():
+            label = "  " * s.depth + s.name
+            line = f"  {label:<24} {s.seconds * 1000:>10.1f} ms  {s.calls:>5}x"
+            if s.unit:
+                line += f"  {s.items} {s.unit}"
+            if s.peak_bytes is not None:
+                line += f"  peak {s.peak_bytes / (1024 * 1024):.1f} MiB"
+            if s.threaded:
+                line += "  (sum of per-call times)"
+            lines.append(line)
+        if not self.trace_memory:
+            lines.append("  (memory not traced)")
+        return "\n".join(lines)
+
+    def finish(self) -> None:
+        """Print the text report and write the JSON report / profile dump if requested."""
+        if not self.enabled:
+            return
+        if self._profiler is not None and self.profile_path is not None:
+            if self.profile_phase not in self.stats:
+                print(f"Profile: phase {self.profile_phase!r} did not run; nothing to dump.")
+            else:
+                self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+                self._profiler.dump_stats(str(self.profile_path))
+                print(f"Profile: {self.profile_path} (inspect with: python -m pstats {self.profile_path})")
+        print(self.render_text())
+        if self.json_path is not None:
+            self.json_path.parent.mkdir(parents=True, exist_ok=True)
+            self.json_path.write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+            print(f"Wrote: {self.json_path}")
+
+
+TIMINGS = PhaseTimings()
+
+GENERATE_PHASES = [
+    "manifest_load",
+    "field_build",
+    "csv_read",
+    "sql_render",
+    "index_sql_render",
+    "summary_sql_render",
+    "bulk_upsert_sql_render",
+    "snapshot_render",
+    "ts_render",
+    "write",
+    "schema_diff",
+    "catalog_load",
+    "delta_render",
+    "type_change_render",
+    "list_values_load",
+    "list_encoding_render",
+]
+
+
+def _add_timing_arguments(parser: argparse.ArgumentParser, phases: List[str]) -> None:
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report wall time, items processed and peak memory per phase.",
+    )
+    parser.add_argument(
+        "--timings-json",
+        type=Path,
+        metavar="PATH",
+        help="Also write the timings report as JSON to PATH (implies --timings).",
+    )
+    parser.add_argument(
+        "--no-trace-memory",
+        action="store_true",
+        help="Skip tracemalloc peak-memory tracking, which slows the run down noticeably.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=phases,
+        metavar="PHASE",
+        help=f"cProfile one phase and dump the stats (implies --timings). Phases: {', '.join(phases)}.",
+    )
+    parser.add_argument(
+        "--profile-out",
+        type=Path,
+        metavar="PATH",
+        help="Where to dump --profile stats (default: tools/schema/.cache/<tool>-<phase>.prof).",
+    )
+
+
+@dataclasses.dataclass
+class CsvReadReport:
+    """Rows dropped while reading one CSV. Only counts and a capped sample of line numbers are kept."""
+
+    rows: int = 0
+    blank: int = 0
+    unnamed: int = 0
+    duplicates: int = 0
+    samples: List[Tuple[int, str]] = dataclasses.field(default_factory=list)
+
+    MAX_SAMPLES = 10
+
+    def note(self, line: int, reason: str) -> None:
+        if len(self.samples) < self.MAX_SAMPLES:
+            self.samples.append((line, reason))
+
+    def summary(self) -> str:
+        parts = []
+        if self.blank:
+            parts.append(f"{self.blank} blank row(s) skipped")
+        if self.unnamed:
+            parts.append(f"{self.unnamed} row(s) without a Field Name skipped")
+        if self.duplicates:
+            parts.append(f"{self.duplicates} duplicate row(s) merged")
+        if not parts:
+            return ""
+        samples = "; ".join(f"line {line}: {reason}" for line, reason in self.samples)
+        return f"{', '.join(parts)} ({samples})" if samples else ", ".join(parts)
+
+
+def _iter_csv_records(csv_path: Path) -> Iterator[Tuple[int, List[str]]]:
+    """Yield (line_number, row) for every data row; the header row is skipped."""
+    with csv_path.open(newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def _iter_field_triples(
+    records: Iterable[Tuple[int, List[str]]],
+    report: CsvReadReport,
+) -> Iterator[Tuple[int, str, str, str]]:
+    for line, r in records:
+        report.rows += 1
+        if not any(c.strip() for c in r):
+            report.blank += 1
+            continue
         name = (r[0] if len(r) > 0 else "").strip().strip('"')
         data_type = (r[1] if len(r) > 1 else "").strip().strip('"')
         field_type = (r[2] if len(r) > 2 else "").strip().strip('"')
-        if name:
-            out.append((name, data_type, field_type))
+        if not name:
+            report.unnamed += 1
+            report.note(line, "no field name")
+            continue
+        yield line, name, data_type, field_type
 
+
+def _dedupe_field_triples(
+    triples: Iterable[Tuple[int, str, str, str]],
+    report: CsvReadReport,
+) -> Iterator[Tuple[str, str, str]]:
     # Deduplicate by (name, data_type) keeping first occurrence.
-    seen = set()
-    deduped: List[Tuple[str, str, str]] = []
-    for name, data_type, field_type in out:
+    seen: Set[Tuple[str, str]] = set()
+    for line, name, data_type, field_type in triples:
         key = (name, data_type)
         if key in seen:
+            report.duplicates += 1
+            report.note(line, f"duplicate {name!r} ({data_type})")
             continue
         seen.add(key)
-        deduped.append((name, data_type, field_type))
+        yield name, data_type, field_type
+
 
-    return deduped
+def _read_csv_fields(csv_path: Path, report: Optional[CsvReadReport] = None) -> List[Tuple[str, str, str]]:
+    """
+    Stream the CSV through skip/dedupe stages; only the distinct fields are held in memory.
+    Dropped rows are counted on `report` when one is passed.
+    """
+    if report is None:
+        report = CsvReadReport()
+    records = _iter_csv_records(csv_path)
+    return list(_dedupe_field_triples(_iter_field_triples(records, report), report))
 
 
-def _build_entity_fields(entity_key: str) -> List[FieldDef]:
+def _build_entity_fields(entity_key: str, report: Optional[CsvReadReport] = None) -> List[FieldDef]:
     entity_cfg = ENTITIES[entity_key]
     csv_path = CSV_DIR / entity_cfg["csv"]
-    rows = _read_csv_fields(csv_path)
+    if report is None:
+        report = CsvReadReport()
+    with TIMINGS.phase("csv_read", "rows") as stat:
+        rows = _read_csv_fields(csv_path, report)
+        stat.items += report.rows
 
     # Some snapshots of shots.csv do not include "Shot Name" explicitly even though
     # the DB column exists and the UI expects it as the primary clickable field.
@@ -457,6 +907,351 @@ def _build_entity_fields(entity_key: str) -> List[FieldDef]:
     return fields
 
 
+# ---------------------------------------------------------------------------
+# Incremental build support
+# ---------------------------------------------------------------------------
+
+
+# Functions whose source feeds the rules hash (see _rules_hash).
+_FIELD_RULES = (
+    _slugify_field,
+    _infer_pg_type,
+    _iter_csv_records,
+    _iter_field_triples,
+    _dedupe_field_triples,
+    _read_csv_fields,
+    _build_entity_fields,
+)
+
+
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _sha256_json(obj: Any) -> str:
+    return _sha256_bytes(json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+def _repo_relative(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _rules_hash() -> str:
+    """
+    Hash of the code that turns CSV rows into FieldDefs.
+    Any edit to these functions invalidates every cached entity.
+    """
+    sources = [inspect.getsource(fn) for fn in _FIELD_RULES]
+    sources.append(repr([f.name for f in dataclasses.fields(FieldDef)]))
+    return _sha256_bytes("\n".join(sources).encode("utf-8"))
+
+
+def _mapping_hashes() -> Dict[str, str]:
+    return {
+        "COMMON_FIELD_MAP": _sha256_json(COMMON_FIELD_MAP),
+        "ENTITY_FIELD_MAP": _sha256_json(ENTITY_FIELD_MAP),
+        "VIRTUAL_FIELDS": _sha256_json(VIRTUAL_FIELDS),
+    }
+
+
+def _entity_inputs(entity_key: str, *, rules_hash: str, mapping_hashes: Dict[str, str]) -> Dict[str, str]:
+    """
+    Everything that determines the FieldDef list of one entity.
+    Only this entity's slice of ENTITY_FIELD_MAP / VIRTUAL_FIELDS is included, so editing
+    another entity's mapping does not force a rebuild here.
+    """
+    csv_path = CSV_DIR / ENTITIES[entity_key]["csv"]
+    inputs = {
+        "csv": ENTITIES[entity_key]["csv"],
+        "csv_sha256": _sha256_bytes(csv_path.read_bytes()),
+        "entity_field_map_sha256": _sha256_json(ENTITY_FIELD_MAP.get(entity_key, {})),
+        "virtual_fields_sha256": _sha256_json(VIRTUAL_FIELDS.get(entity_key, [])),
+        "common_field_map_sha256": mapping_hashes["COMMON_FIELD_MAP"],
+        "rules_sha256": rules_hash,
+    }
+    inputs["input_sha256"] = _sha256_json(inputs)
+    return inputs
+
+
+def _field_to_row(f: FieldDef) -> List[Optional[str]]:
+    return list(dataclasses.astuple(f))
+
+
+def _field_from_row(row: List[Optional[str]]) -> FieldDef:
+    return FieldDef(*row)
+
+
+def _fields_hash(all_fields: Dict[str, List[FieldDef]]) -> str:
+    """Deterministic stamp for generated files (replaces the old wall-clock timestamp)."""
+    payload = {k: [_field_to_row(f) for f in v] for k, v in all_fields.items()}
+    return _sha256_json(payload)[:16]
+
+
+def _current_entity_inputs() -> Dict[str, Dict[str, str]]:
+    rules_hash = _rules_hash()
+    mapping_hashes = _mapping_hashes()
+    return {
+        k: _entity_inputs(k, rules_hash=rules_hash, mapping_hashes=mapping_hashes)
+        for k in ENTITIES.keys()
+    }
+
+
+def _source_hash(entity_inputs: Dict[str, Dict[str, str]]) -> str:
+    return _sha256_json({k: v["input_sha256"] for k, v in entity_inputs.items()})
+
+
+def _build_snapshot(
+    all_fields: Dict[str, List[FieldDef]],
+    entity_inputs: Dict[str, Dict[str, str]],
+) -> Dict[str, Any]:
+    return {
+        "version": SNAPSHOT_VERSION,
+        "source_sha256": _source_hash(entity_inputs),
+        "field_keys": [f.name for f in dataclasses.fields(FieldDef)],
+        "entities": {
+            entity_key: {
+                "table": cfg["table"],
+                "csv": cfg["csv"],
+                "fields": [_field_to_row(f) for f in all_fields[entity_key]],
+            }
+            for entity_key, cfg in ENTITIES.items()
+        },
+    }
+
+
+def _render_snapshot(snapshot: Dict[str, Any]) -> str:
+    # One field per line keeps the file compact but still reviewable in diffs.
+    lines = [
+        "{",
+        f'"version": {snapshot["version"]},',
+        f'"source_sha256": {json.dumps(snapshot["source_sha256"])},',
+        f'"field_keys": {json.dumps(snapshot["field_keys"])},',
+        '"entities": {',
+    ]
+    entity_items = list(snapshot["entities"].items())
+    for i, (entity_key, entity) in enumerate(entity_items):
+        lines.append(f"{json.dumps(entity_key)}: {{")
+        lines.append(f'"table": {json.dumps(entity["table"])},')
+        lines.append(f'"csv": {json.dumps(entity["csv"])},')
+        lines.append('"fields": [')
+        rows = [json.dumps(r, separators=(",", ":")) for r in entity["fields"]]
+        lines.append(",\n".join(rows))
+        lines.append("]")
+        lines.append("}" + ("," if i < len(entity_items) - 1 else ""))
+    lines.append("}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _load_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _snapshot_fields(snapshot: Dict[str, Any]) -> Dict[str, List[FieldDef]]:
+    return {
+        entity_key: [_field_from_row(r) for r in entity["fields"]]
+        for entity_key, entity in snapshot["entities"].items()
+    }
+
+
+SCHEMA_DIFF_VERSION = 1
+SCHEMA_CHANGE_KINDS = ["added", "removed", "renamed", "retyped", "default_changed"]
+
+
+@dataclasses.dataclass(frozen=True)
+class SchemaChange:
+    kind: str
+    entity_key: str
+    # None for virtual fields, which are matched on their code instead.
+    column: Optional[str]
+    code: str
+    old: Optional[FieldDef] = None
+    new: Optional[FieldDef] = None
+
+    def to_json(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"kind": self.kind, "entity": self.entity_key, "column": self.column, "code": self.code}
+        if self.kind == "renamed":
+            out["old_column"] = self.old.column if self.old else None
+        if self.kind in ("added", "removed", "retyped"):
+            out["old_type"] = self.old.pg_type if self.old else None
+            out["new_type"] = self.new.pg_type if self.new else None
+        if self.kind in ("added", "removed", "default_changed"):
+            out["old_default"] = self.old.default_sql if self.old else None
+            out["new_default"] = self.new.default_sql if self.new else None
+        return out
+
+    def describe(self) -> str:
+        where = f"{self.entity_key}.{self.column or self.code}"
+        old, new = self.old, self.new
+        if self.kind == "added":
+            return f"+ {where} {new.pg_type or 'virtual'}" if new else f"+ {where}"
+        if self.kind == "removed":
+            return f"- {where} {old.pg_type or 'virtual'}" if old else f"- {where}"
+        if self.kind == "renamed":
+            return f"~ {self.entity_key}.{old.column if old else '?'} -> {self.column} (code {self.code})"
+        if self.kind == "retyped":
+            return f"~ {where} type {old.pg_type if old else None} -> {new.pg_type if new else None}"
+        return f"~ {where} default {old.default_sql if old else None} -> {new.default_sql if new else None}"
+
+
+def _field_key(f: FieldDef) -> str:
+    # Stored fields are identified by column, virtual ones (no column) by their code.
+    return f.column or f"virtual:{f.code}"
+
+
+def _diff_entity_fields(entity_key: str, old_fields: List[FieldDef], new_fields: List[FieldDef]) -> List[SchemaChange]:
+    old_by_key = {_field_key(f): f for f in old_fields}
+    new_by_key = {_field_key(f): f for f in new_fields}
+    pairs: List[Tuple[FieldDef, FieldDef]] = []
+    added: List[FieldDef] = []
+    for key, f in new_by_key.items():
+        if key in old_by_key:
+            pairs.append((old_by_key[key], f))
+        else:
+            added.append(f)
+    removed = [f for key, f in old_by_key.items() if key not in new_by_key]
+
+    # A column whose CSV code (slug) is unchanged but whose column name differs was
+    # renamed, not dropped and re-added. Only unambiguous (1:1) codes are paired.
+    changes: List[SchemaChange] = []
+    removed_by_code: Dict[str, List[FieldDef]] = defaultdict(list)
+    for f in removed:
+        if f.column:
+            removed_by_code[f.code].append(f)
+    added_by_code: Dict[str, List[FieldDef]] = defaultdict(list)
+    for f in added:
+        if f.column:
+            added_by_code[f.code].append(f)
+    renamed_old: Set[str] = set()
+    renamed_new: Set[str] = set()
+    for code, olds in removed_by_code.items():
+        news = added_by_code.get(code, [])
+        if len(olds) == 1 and len(news) == 1:
+            old, new = olds[0], news[0]
+            changes.append(SchemaChange("renamed", entity_key, new.column, code, old, new))
+            pairs.append((old, new))
+            renamed_old.add(_field_key(old))
+            renamed_new.add(_field_key(new))
+
+    for f in added:
+        if _field_key(f) not in renamed_new:
+            changes.append(SchemaChange("added", entity_key, f.column, f.code, None, f))
+    for f in removed:
+        if _field_key(f) not in renamed_old:
+            changes.append(SchemaChange("removed", entity_key, f.column, f.code, f, None))
+    for old, new in pairs:
+        if old.pg_type and new.pg_type and _normalize_pg_type(old.pg_type) != _normalize_pg_type(new.pg_type):
+            changes.append(SchemaChange("retyped", entity_key, new.column, new.code, old, new))
+        if new.column and (old.default_sql or None) != (new.default_sql or None):
+            changes.append(SchemaChange("default_changed", entity_key, new.column, new.code, old, new))
+    return changes
+
+
+def _diff_schema(
+    previous: Dict[str, List[FieldDef]], all_fields: Dict[str, List[FieldDef]]
+) -> List[SchemaChange]:
+    """
+    Field-level changes between two builds, keyed on (entity, column). One pass over
+    each side with dict lookups, so it stays linear in the number of fields.
+    """
+    order = {kind: i for i, kind in enumerate(SCHEMA_CHANGE_KINDS)}
+    changes: List[SchemaChange] = []
+    for entity_key in list(all_fields) + [k for k in previous if k not in all_fields]:
+        entity_changes = _diff_entity_fields(entity_key, previous.get(entity_key, []), all_fields.get(entity_key, []))
+        # Stable sort: grouped by kind, in field order within each kind.
+        changes.extend(sorted(entity_changes, key=lambda c: order[c.kind]))
+    return changes
+
+
+def _render_schema_diff_json(changes: List[SchemaChange], *, from_sha256: str, to_sha256: str) -> str:
+    summary = {kind: 0 for kind in SCHEMA_CHANGE_KINDS}
+    for c in changes:
+        summary[c.kind] += 1
+    report = {
+        "version": SCHEMA_DIFF_VERSION,
+        "from_source_sha256": from_sha256,
+        "to_source_sha256": to_sha256,
+        "summary": summary,
+        "changes": [c.to_json() for c in changes],
+    }
+    return json.dumps(report, indent=2) + "\n"
+
+
+def _render_schema_diff_text(changes: List[SchemaChange]) -> str:
+    if not changes:
+        return "Schema diff: no field changes"
+    summary: Dict[str, int] = defaultdict(int)
+    for c in changes:
+        summary[c.kind] += 1
+    counts = ", ".join(f"{summary[k]} {k.replace('_', ' ')}" for k in SCHEMA_CHANGE_KINDS if summary[k])
+    return "\n".join([f"Schema diff: {counts}"] + [f"  {c.describe()}" for c in changes])
+
+
+def _load_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already has exactly these bytes (keeps mtime stable)."""
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def _build_entity_fields_with_report(entity_key: str) -> Tuple[List[FieldDef], CsvReadReport]:
+    report = CsvReadReport()
+    return _build_entity_fields(entity_key, report), report
+
+
+def _build_fields_for(
+    entity_keys: List[str],
+    *,
+    jobs: int = 1,
+    reports: Optional[Dict[str, CsvReadReport]] = None,
+) -> Dict[str, List[FieldDef]]:
+    """
+    Build FieldDefs for the given entities, optionally in a process pool.
+    Results are keyed by entity so callers merge them in ENTITIES order regardless of
+    which worker finished first; output is identical to a serial run.
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(entity_keys))
+    if jobs <= 1:
+        results = [_build_entity_fields_with_report(k) for k in entity_keys]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_build_entity_fields_with_report, entity_keys))
+
+    out: Dict[str, List[FieldDef]] = {}
+    for entity_key, (fields, report) in zip(entity_keys, results):
+        out[entity_key] = fields
+        if reports is not None:
+            reports[entity_key] = report
+    return out
+
+
 def _sql_column_def(f: FieldDef, *, entity_key: str) -> str:
     assert f.column and f.pg_type
 
@@ -481,13 +1276,13 @@ def _sql_column_def(f: FieldDef, *, entity_key: str) -> str:
 
 
 def _generate_sql(all_fields: Dict[str, List[FieldDef]]) -> str:
-    now = dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    schema_hash = _fields_hash(all_fields)
     lines: List[str] = []
 
     lines.append("-- ============================================================================")
     lines.append("-- KONG: Align DB schema with CSV schema definitions")
-    lines.append(f"-- Generated: {now}")
-    lines.append(f"-- Source CSV dir: {CSV_DIR}")
+    lines.append(f"-- Schema hash: {schema_hash}")
+    lines.append(f"-- Source CSV dir: {_repo_relative(CSV_DIR)}")
     lines.append("--")
     lines.append("-- This migration is designed to be safe to re-run:")
     lines.append("-- - Uses ALTER TABLE ... ADD COLUMN IF NOT EXISTS")
@@ -509,37 +1304,16 @@ def _generate_sql(all_fields: Dict[str, List[FieldDef]]) -> str:
     lines.append(
         "--       They are still enforced for new/updated rows. Optionally validate later after cleanup:"
     )
-    lines.append("--         ALTER TABLE public.tasks VALIDATE CONSTRAINT tasks_entity_type_check;")
-    lines.append("--         ALTER TABLE public.versions VALIDATE CONSTRAINT versions_entity_type_check;")
-    lines.append("--         ALTER TABLE public.notes VALIDATE CONSTRAINT notes_entity_type_check;")
-    lines.append("--         ALTER TABLE public.published_files VALIDATE CONSTRAINT published_files_entity_type_check;")
-    lines.append("")
-
-    lines.append("ALTER TABLE public.tasks DROP CONSTRAINT IF EXISTS tasks_entity_type_check;")
-    lines.append("ALTER TABLE public.tasks")
-    lines.append("  ADD CONSTRAINT tasks_entity_type_check")
-    lines.append("  CHECK (entity_type IN ('asset', 'shot', 'sequence', 'project')) NOT VALID;")
+    for table in ENTITY_TYPE_CHECKS:
+        lines.append(f"--         ALTER TABLE public.{table} VALIDATE CONSTRAINT {table}_entity_type_check;")
     lines.append("")
 
-    lines.append("ALTER TABLE public.versions DROP CONSTRAINT IF EXISTS versions_entity_type_check;")
-    lines.append("ALTER TABLE public.versions")
-    lines.append("  ADD CONSTRAINT versions_entity_type_check")
-    lines.append("  CHECK (entity_type IN ('asset', 'shot', 'sequence')) NOT VALID;")
-    lines.append("")
-
-    lines.append("ALTER TABLE public.notes DROP CONSTRAINT IF EXISTS notes_entity_type_check;")
-    lines.append("ALTER TABLE public.notes")
-    lines.append("  ADD CONSTRAINT notes_entity_type_check")
-    lines.append(
-        "  CHECK (entity_type IN ('task', 'asset', 'shot', 'sequence', 'version', 'project', 'published_file')) NOT VALID;"
-    )
-    lines.append("")
-
-    lines.append("ALTER TABLE public.published_files DROP CONSTRAINT IF EXISTS published_files_entity_type_check;")
-    lines.append("ALTER TABLE public.published_files")
-    lines.append("  ADD CONSTRAINT published_files_entity_type_check")
-    lines.append("  CHECK (entity_type IN ('asset', 'shot', 'sequence', 'task', 'version', 'note', 'project')) NOT VALID;")
-    lines.append("")
+    for table in ENTITY_TYPE_CHECKS:
+        lines.append(f"ALTER TABLE public.{table} DROP CONSTRAINT IF EXISTS {table}_entity_type_check;")
+        lines.append(f"ALTER TABLE public.{table}")
+        lines.append(f"  ADD CONSTRAINT {table}_entity_type_check")
+        lines.append(f"  CHECK ({_entity_type_check_body(table)}) NOT VALID;")
+        lines.append("")
 
     # 1) Add columns per entity.
     for entity_key, cfg in ENTITIES.items():
@@ -567,39 +1341,1288 @@ def _generate_sql(all_fields: Dict[str, List[FieldDef]]) -> str:
     return "\n".join(lines)
 
 
-def _generate_ts(all_fields: Dict[str, List[FieldDef]]) -> str:
-    now = dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+def _index_key_columns(columns: Iterable[str]) -> Tuple[str, ...]:
+    """Catalog index columns as bare lower-case names ('"Status"' -> 'status'); ASC is implied."""
+    keys = []
+    for col in columns:
+        col = re.sub(r"\s+ASC$", "", col.strip(), flags=re.IGNORECASE)
+        keys.append(col[1:-1] if col.startswith('"') and col.endswith('"') else col.lower())
+    return tuple(keys)
+
+
+def _existing_index_covering(ix: IndexDef, catalog: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Name of a full (non-partial) index on the same table and method whose leading columns are
+    ix.columns, or None. Such an index serves every lookup ix would, so ix would only add
+    write amplification.
+    """
+    table = (catalog or {}).get(f"public.{ix.table}")
+    if table is None:
+        return None
+    for existing in sorted(table.indexes.values(), key=lambda e: e.name):
+        if existing.method != ix.method or existing.predicate:
+            continue
+        if _index_key_columns(existing.columns)[: len(ix.columns)] == ix.columns:
+            return existing.name
+    return None
+
 
-    schema_obj: Dict[str, Any] = {}
+def _plan_indexes(
+    all_fields: Dict[str, List[FieldDef]],
+    catalog: Optional[Dict[str, Any]] = None,
+) -> List[IndexDef]:
+    """
+    Derive indexes from FieldDef metadata: the polymorphic (entity_type, entity_id) pair,
+    (project_id, <filter column>) composites, (project_id, <sort column>, id) keyset
+    composites, one btree per FK-ish column and a GIN index per filterable multi_entity
+    column.
+    A single project_id index is skipped when a composite already leads with it, and any
+    index already covered by one in `catalog` (db_catalog.load_catalog) is skipped.
+    """
+    indexes: List[IndexDef] = []
     for entity_key, cfg in ENTITIES.items():
-        schema_obj[entity_key] = {
-            "entity": entity_key,
-            "table": cfg["table"],
-            "csv": cfg["csv"],
-            "fields": [
-                {
-                    "name": f.name,
-                    "dataType": f.data_type,
-                    "fieldType": f.field_type,
-                    "code": f.code,
-                    "column": f.column,
-                    "pgType": f.pg_type,
-                    "defaultSql": f.default_sql,
-                    "virtual": f.column is None,
-                }
-                for f in all_fields[entity_key]
-            ],
-        }
+        table = cfg["table"]
+        columns = {f.column for f in all_fields[entity_key] if f.column and f.pg_type}
+        planned: List[IndexDef] = []
+
+        if table in ENTITY_TYPE_CHECKS:
+            planned.append(
+                IndexDef(table, ("entity_type", "entity_id"), reason="polymorphic link lookups")
+            )
+
+        if "project_id" in columns:
+            for col in PROJECT_SCOPED_INDEX_COLUMNS:
+                if col in columns:
+                    planned.append(
+                        IndexDef(table, ("project_id", col), reason="per-project list filters")
+                    )
+
+        for col in _keyset_indexed_columns(all_fields[entity_key]):
+            planned.append(IndexDef(table, ("project_id", col, "id"), reason="keyset pagination"))
+
+        leading = {ix.columns[0] for ix in planned}
+        for col in INDEXED_FK_COLUMNS:
+            if col in columns and col not in leading:
+                planned.append(IndexDef(table, (col,), reason="FK filter / join / RLS"))
+
+        for col in _containment_columns(entity_key, all_fields[entity_key]):
+            planned.append(
+                IndexDef(table, (col,), method="gin", reason="array containment filters (@>, &&)")
+            )
+
+        indexes.extend(ix for ix in planned if _existing_index_covering(ix, catalog) is None)
+    return indexes
+
+
+def _generate_index_sql(
+    all_fields: Dict[str, List[FieldDef]],
+    indexes: List[IndexDef],
+    baseline: Optional[str] = None,
+) -> str:
+    schema_hash = _fields_hash(all_fields)
+    lines: List[str] = []
+
+    lines.append("-- ============================================================================")
+    lines.append("-- KONG: Indexes for CSV-derived filter / FK columns")
+    lines.append(f"-- Schema hash: {schema_hash}")
+    lines.append("--")
+    lines.append("-- NON-TRANSACTIONAL: CREATE INDEX CONCURRENTLY cannot run inside a transaction block.")
+    lines.append("-- Run with psql (no -1 / --single-transaction), one statement at a time.")
+    lines.append("--")
+    lines.append("-- Safe to re-run (IF NOT EXISTS). If a concurrent build was interrupted, the index")
+    lines.append("-- is left INVALID and IF NOT EXISTS will skip it; find and drop those first:")
+    lines.append("--   SELECT indexrelid::regclass FROM pg_index WHERE NOT indisvalid;")
+    if baseline:
+        lines.append("--")
+        lines.append(f"-- Left out: indexes already in {baseline}")
+        lines.append("-- (same table, method and leading columns, under any name).")
+    lines.append("-- ============================================================================")
+
+    current_table = None
+    for ix in indexes:
+        if ix.table != current_table:
+            current_table = ix.table
+            lines.append("")
+            lines.append(f"-- {ix.table}")
+        if ix.reason:
+            lines.append(f"-- {', '.join(ix.columns)}: {ix.reason}")
+        lines.append(ix.create_sql())
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Summary counters: statement-level AFTER triggers (with transition tables) on the
+# source tables apply net +/- deltas to the counter columns, so list pages read counts
+# in O(1); a keyset-batched backfill sets the starting values.
+# ---------------------------------------------------------------------------
+
+
+def _plan_summary_counters(all_fields: Dict[str, List[FieldDef]]) -> List[Tuple[str, SummaryCounter]]:
+    """(entity_key, counter) for every configured counter whose column exists as an integer."""
+    planned: List[Tuple[str, SummaryCounter]] = []
+    for entity_key, counters in SUMMARY_COUNTERS.items():
+        types = {f.column: f.pg_type for f in all_fields.get(entity_key, []) if f.column}
+        for counter in counters:
+            if types.get(counter.column) != "integer":
+                continue
+            if counter.polymorphic and entity_key not in ENTITY_TYPE_CHECKS.get(counter.source, [entity_key]):
+                continue
+            planned.append((entity_key, counter))
+    return planned
+
+
+def _summary_columns(entity_key: str, fields: List[FieldDef]) -> List[str]:
+    return [c.column for _, c in _plan_summary_counters({entity_key: fields})]
+
+
+def _summary_match(entity_key: str, counter: SummaryCounter, row: str) -> str:
+    """Predicate selecting the source rows counted for entity_key (row is the source alias)."""
+    conditions = [f"{row}.{counter.link[-1]} IS NOT NULL"]
+    if counter.polymorphic:
+        conditions.insert(0, f"{row}.{counter.link[0]} = '{entity_key}'")
+    if counter.where:
+        conditions.append(counter.where.format(row=row))
+    return " AND ".join(conditions)
+
+
+def _summary_trigger_update(entity_key: str, counter: SummaryCounter, op: str) -> List[str]:
+    """UPDATE applying one statement's net change (new_rows minus old_rows) to the counter."""
+    table = ENTITIES[entity_key]["table"]
+    target = counter.link[-1]
+    parts: List[str] = []
+    if op in ("INSERT", "UPDATE"):
+        parts.append(f"SELECT r.{target} AS id, 1 AS n FROM new_rows r WHERE {_summary_match(entity_key, counter, 'r')}")
+    if op in ("UPDATE", "DELETE"):
+        parts.append(f"SELECT r.{target} AS id, -1 AS n FROM old_rows r WHERE {_summary_match(entity_key, counter, 'r')}")
+    lines = [
+        f"    UPDATE public.{table} AS t SET {counter.column} = coalesce(t.{counter.column}, 0) + d.n",
+        "      FROM (",
+        "        SELECT id, sum(n) AS n FROM (",
+    ]
+    for i, part in enumerate(parts):
+        lines.append(f"          {part}" + ("" if i == len(parts) - 1 else " UNION ALL"))
+    lines.append("        ) s GROUP BY id HAVING sum(n) <> 0")
+    lines.append("      ) AS d")
+    lines.append("      WHERE t.id = d.id;")
+    return lines
+
+
+def _counter_only_update_guard(columns: List[str]) -> str:
+    """
+    WHEN condition for an updated_at trigger: false only when an UPDATE changes nothing but
+    the counter columns, so counter maintenance does not bump updated_at. Updates that change
+    nothing at all still fire, as before.
+    """
+    counters = _sql_text_array(columns)
+    old = ", ".join(f"OLD.{c}" for c in columns)
+    new = ", ".join(f"NEW.{c}" for c in columns)
+    return (
+        f"(to_jsonb(OLD) - {counters}) IS DISTINCT FROM (to_jsonb(NEW) - {counters})"
+        f" OR ROW({old}) IS NOT DISTINCT FROM ROW({new})"
+    )
+
+
+def _generate_summary_sql(all_fields: Dict[str, List[FieldDef]]) -> str:
+    schema_hash = _fields_hash(all_fields)
+    planned = _plan_summary_counters(all_fields)
+    lines: List[str] = []
+
+    lines.append("-- ============================================================================")
+    lines.append("-- KONG: Trigger-maintained summary counters")
+    lines.append(f"-- Schema hash: {schema_hash}")
+    lines.append("--")
+    for entity_key, c in planned:
+        link = ", ".join(c.link)
+        where = f" WHERE {c.where.format(row=c.source)}" if c.where else ""
+        lines.append(f"--   {ENTITIES[entity_key]['table']}.{c.column} = count of {c.source} by ({link}){where}")
+    lines.append("--")
+    lines.append("-- Run with psql, NOT inside a transaction block: step 2 commits after every batch.")
+    lines.append("-- Install the triggers (step 1) before the backfill so no change is missed; both")
+    lines.append("-- steps are safe to re-run, and the backfill only rewrites rows that drifted (e.g.")
+    lines.append("-- after a TRUNCATE of a source table, which the triggers do not see).")
+    lines.append("-- The counters are derived data: clients should not write them, and changing only")
+    lines.append("-- a counter leaves updated_at alone (step 0).")
+    lines.append("-- ============================================================================")
+
+    by_source: Dict[str, List[Tuple[str, SummaryCounter]]] = {}
+    by_table: Dict[str, List[str]] = {}
+    for entity_key, c in planned:
+        by_source.setdefault(c.source, []).append((entity_key, c))
+        by_table.setdefault(ENTITIES[entity_key]["table"], []).append(c.column)
+
+    lines.append("")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append("-- Step 0: counter updates (steps 1 and 2) must not bump updated_at. The existing")
+    lines.append("-- BEFORE UPDATE row triggers that set updated_at (e.g. update_tasks_updated_at)")
+    lines.append("-- are recreated with a WHEN clause that skips counter-only changes.")
+    lines.append("-- ----------------------------------------------------------------------------")
+    for table, columns in by_table.items():
+        lines.append("")
+        lines.append("BEGIN;")
+        lines.append(f"SET LOCAL lock_timeout = '{SUMMARY_LOCK_TIMEOUT}';")
+        lines.append("DO $guard$")
+        lines.append("DECLARE")
+        lines.append("  t record;")
+        lines.append("BEGIN")
+        lines.append("  FOR t IN")
+        lines.append("    SELECT tg.tgname, p.oid::regprocedure AS fn")
+        lines.append("    FROM pg_trigger tg")
+        lines.append("    JOIN pg_proc p ON p.oid = tg.tgfoid")
+        lines.append(f"    WHERE tg.tgrelid = 'public.{table}'::regclass")
+        lines.append("      AND NOT tg.tgisinternal")
+        lines.append("      AND tg.tgtype & 127 = 19  -- FOR EACH ROW, BEFORE, UPDATE only")
+        lines.append("      AND tg.tgnargs = 0")
+        lines.append("      AND tg.tgattr = ''::int2vector")
+        lines.append("      AND p.prosrc ~ 'updated_at'")
+        lines.append("  LOOP")
+        lines.append("    EXECUTE format(")
+        lines.append(
+            f"      'CREATE OR REPLACE TRIGGER %I BEFORE UPDATE ON public.{table} FOR EACH ROW WHEN (%s) EXECUTE FUNCTION %s',"
+        )
+        lines.append(f"      t.tgname, {_sql_literal(_counter_only_update_guard(columns))}, t.fn")
+        lines.append("    );")
+        lines.append("  END LOOP;")
+        lines.append("END")
+        lines.append("$guard$;")
+        lines.append("COMMIT;")
+
+    lines.append("")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append("-- Step 1: one statement-level trigger per source table and operation; bulk")
+    lines.append("-- writes cost one aggregated UPDATE per counter instead of one per row.")
+    lines.append("-- ----------------------------------------------------------------------------")
+    for source, counters in by_source.items():
+        fn = f"{source}_summary_counts_fn"
+        lines.append("")
+        lines.append("BEGIN;")
+        lines.append(f"SET LOCAL lock_timeout = '{SUMMARY_LOCK_TIMEOUT}';")
+        lines.append(f"CREATE OR REPLACE FUNCTION public.{fn}() RETURNS trigger")
+        # Definer rights: the writer's RLS must not hide the counted rows from the UPDATE.
+        lines.append("LANGUAGE plpgsql")
+        lines.append("SECURITY DEFINER")
+        lines.append("SET search_path = public, pg_temp")
+        lines.append("AS $fn$")
+        lines.append("BEGIN")
+        for i, op in enumerate(("INSERT", "UPDATE", "DELETE")):
+            lines.append(f"  {'IF' if i == 0 else 'ELSIF'} TG_OP = '{op}' THEN")
+            for entity_key, c in counters:
+                lines.extend(_summary_trigger_update(entity_key, c, op))
+        lines.append("  END IF;")
+        lines.append("  RETURN NULL;")
+        lines.append("END")
+        lines.append("$fn$;")
+        for suffix, op, referencing in (
+            ("ins", "INSERT", "NEW TABLE AS new_rows"),
+            ("upd", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("del", "DELETE", "OLD TABLE AS old_rows"),
+        ):
+            trigger = f"{source}_summary_counts_{suffix}"
+            lines.append(f"DROP TRIGGER IF EXISTS {trigger} ON public.{source};")
+            lines.append(f"CREATE TRIGGER {trigger} AFTER {op} ON public.{source}")
+            lines.append(f"  REFERENCING {referencing}")
+            lines.append(f"  FOR EACH STATEMENT EXECUTE FUNCTION public.{fn}();")
+        lines.append("COMMIT;")
+
+    lines.append("")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append(f"-- Step 2: backfill in keyset batches of {SUMMARY_BACKFILL_BATCH_SIZE} rows (ordered by id),")
+    lines.append("-- one transaction per batch; only rows whose count differs are updated.")
+    lines.append("-- ----------------------------------------------------------------------------")
+    for entity_key, c in planned:
+        table = ENTITIES[entity_key]["table"]
+        lines.append("")
+        lines.append(f"-- {table}.{c.column}")
+        lines.append("DO $backfill$")
+        lines.append("DECLARE")
+        lines.append("  last_id integer := 0;")
+        lines.append("  batch_max integer;")
+        lines.append("BEGIN")
+        lines.append("  LOOP")
+        lines.append(f"    PERFORM set_config('lock_timeout', '{SUMMARY_LOCK_TIMEOUT}', true);")
+        lines.append("    SELECT max(id) INTO batch_max FROM (")
+        lines.append(
+            f"      SELECT id FROM public.{table} WHERE id > last_id ORDER BY id LIMIT {SUMMARY_BACKFILL_BATCH_SIZE}"
+        )
+        lines.append("    ) batch;")
+        lines.append("    EXIT WHEN batch_max IS NULL;")
+        lines.append(f"    UPDATE public.{table} AS t SET {c.column} = c.n")
+        lines.append("      FROM (")
+        lines.append(f"        SELECT b.id, count(r.{c.link[-1]}) AS n")
+        lines.append(f"        FROM public.{table} b")
+        lines.append(f"        LEFT JOIN public.{c.source} r")
+        lines.append(f"          ON r.{c.link[-1]} = b.id AND {_summary_match(entity_key, c, 'r')}")
+        lines.append("        WHERE b.id > last_id AND b.id <= batch_max")
+        lines.append("        GROUP BY b.id")
+        lines.append("      ) AS c")
+        lines.append(f"      WHERE t.id = c.id AND t.{c.column} IS DISTINCT FROM c.n;")
+        lines.append("    last_id := batch_max;")
+        lines.append("    COMMIT;")
+        lines.append("  END LOOP;")
+        lines.append("END")
+        lines.append("$backfill$;")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Bulk upsert RPCs: one bulk_upsert_<table>(p_rows jsonb) function per entity, typed
+# through the table's row type (jsonb_populate_recordset), so a multi-row edit is one
+# PostgREST round trip. Only the columns the TS pickers accept are written.
+# ---------------------------------------------------------------------------
+
+BULK_UPSERT_MAX_ROWS = 1000
+# Not FieldDefs (Link stays virtual) but required to insert rows of polymorphic tables.
+POLYMORPHIC_LINK_COLUMNS: List[str] = ["entity_type", "entity_id"]
+
+
+def _bulk_upsert_function(table: str) -> str:
+    return f"bulk_upsert_{table}"
+
+
+def _bulk_upsert_columns(entity_key: str, fields: List[FieldDef]) -> List[str]:
+    """
+    Columns written by bulk_upsert_<table>, in field order. Only names: the function reads
+    rows through the table's own row type, since the CSV pg_type can lag the database.
+    """
+    denied = set(TS_READONLY_COLUMNS) | set(_summary_columns(entity_key, fields))
+    out: List[str] = []
+    for f in fields:
+        if f.column and f.pg_type and f.column not in denied and f.column not in out:
+            out.append(f.column)
+    if ENTITIES[entity_key]["table"] in ENTITY_TYPE_CHECKS:
+        out.extend(column for column in POLYMORPHIC_LINK_COLUMNS if column not in out)
+    return out
 
-    json_text = json.dumps(schema_obj, indent=2, sort_keys=True)
-    entity_keys = " | ".join([f"'{k}'" for k in schema_obj.keys()])
 
-    return f"""/* eslint-disable */
+def _sql_text_array(values: List[str]) -> str:
+    return "ARRAY[" + ", ".join(_sql_literal(v) for v in values) + "]::text[]"
+
+
+def _generate_bulk_upsert_sql(all_fields: Dict[str, List[FieldDef]]) -> str:
+    schema_hash = _fields_hash(all_fields)
+    lines: List[str] = []
+
+    lines.append("-- ============================================================================")
+    lines.append("-- KONG: Bulk upsert RPCs (one per entity table)")
+    lines.append(f"-- Schema hash: {schema_hash}")
+    lines.append("--")
+    lines.append("-- bulk_upsert_<table>(p_rows jsonb) takes a JSON array of row objects:")
+    lines.append("-- - rows with an id update that row, setting only the keys present (a key with")
+    lines.append("--   null clears the column); rows with nothing writable to set are skipped;")
+    lines.append("-- - rows without an id are inserted with only the keys present, so absent")
+    lines.append("--   columns get their database defaults.")
+    lines.append("-- Rows are grouped by key set and each group is one UPDATE or INSERT, so only")
+    lines.append("-- the columns sent are assigned (UPDATE OF triggers see just those).")
+    lines.append("-- Keys outside the writable columns (id/created_at/updated_at, summary counters,")
+    lines.append("-- unknown names) are ignored. Runs as the caller (SECURITY INVOKER), so RLS")
+    lines.append("-- applies, and in the caller's transaction: the whole batch commits or fails")
+    lines.append(f"-- together. At most {BULK_UPSERT_MAX_ROWS} rows per call; ids must be unique within a call.")
+    lines.append("-- Values are converted through the table's row type (jsonb_populate_recordset),")
+    lines.append("-- so the database column types apply, not the CSV ones.")
+    lines.append("-- Returns the updated and inserted rows.")
+    lines.append("-- ============================================================================")
+
+    for entity_key, cfg in ENTITIES.items():
+        table = cfg["table"]
+        fn = _bulk_upsert_function(table)
+        columns = _bulk_upsert_columns(entity_key, all_fields[entity_key])
+        lines.append("")
+        lines.append("BEGIN;")
+        lines.append("")
+        lines.append(f"CREATE OR REPLACE FUNCTION public.{fn}(p_rows jsonb)")
+        lines.append(f"RETURNS SETOF public.{table}")
+        lines.append("LANGUAGE plpgsql")
+        lines.append("SECURITY INVOKER")
+        lines.append("SET search_path = public, pg_temp")
+        lines.append("AS $$")
+        lines.append("DECLARE")
+        lines.append("  -- Writable columns.")
+        lines.append(f"  v_columns text[] := {_sql_text_array(columns)};")
+        lines.append("  v_group record;")
+        lines.append("  v_names text;")
+        lines.append("  v_select text;")
+        lines.append("  v_set text;")
+        lines.append("BEGIN")
+        lines.append("  IF jsonb_typeof(p_rows) IS DISTINCT FROM 'array' THEN")
+        lines.append(f"    RAISE EXCEPTION '{fn}: p_rows must be a JSON array' USING ERRCODE = '22023';")
+        lines.append("  END IF;")
+        lines.append(f"  IF jsonb_array_length(p_rows) > {BULK_UPSERT_MAX_ROWS} THEN")
+        lines.append(
+            f"    RAISE EXCEPTION '{fn}: at most {BULK_UPSERT_MAX_ROWS} rows per call' USING ERRCODE = '54000';"
+        )
+        lines.append("  END IF;")
+        lines.append("  IF EXISTS (")
+        lines.append("    SELECT 1 FROM jsonb_array_elements(p_rows) AS e(r)")
+        lines.append("    WHERE coalesce(e.r -> 'id', 'null') <> 'null'")
+        lines.append("    GROUP BY e.r -> 'id' HAVING count(*) > 1")
+        lines.append("  ) THEN")
+        lines.append(f"    RAISE EXCEPTION '{fn}: duplicate id in p_rows' USING ERRCODE = '21000';")
+        lines.append("  END IF;")
+        lines.append("")
+        lines.append("  -- Updates first, then inserts; groups in the order their first row was sent.")
+        lines.append("  FOR v_group IN")
+        lines.append("    SELECT g.has_id, g.keys, jsonb_agg(g.r ORDER BY g.ord) AS payload")
+        lines.append("    FROM (")
+        lines.append("      SELECT")
+        lines.append("        e.r,")
+        lines.append("        e.ord,")
+        lines.append("        coalesce(e.r -> 'id', 'null') <> 'null' AS has_id,")
+        lines.append("        ARRAY(")
+        lines.append("          SELECT k FROM jsonb_object_keys(e.r) AS k WHERE k = ANY(v_columns) ORDER BY k")
+        lines.append("        ) AS keys")
+        lines.append("      FROM jsonb_array_elements(p_rows) WITH ORDINALITY AS e(r, ord)")
+        lines.append("    ) AS g")
+        lines.append("    GROUP BY g.has_id, g.keys")
+        lines.append("    ORDER BY g.has_id DESC, min(g.ord)")
+        lines.append("  LOOP")
+        lines.append("    SELECT")
+        lines.append("      string_agg(format('%I', k), ', '),")
+        lines.append("      string_agg(format('r.%I', k), ', '),")
+        lines.append("      string_agg(format('%I = r.%I', k, k), ', ')")
+        lines.append("    INTO v_names, v_select, v_set")
+        lines.append("    FROM unnest(v_group.keys) AS k;")
+        lines.append("")
+        lines.append("    IF v_group.has_id THEN")
+        lines.append("      CONTINUE WHEN cardinality(v_group.keys) = 0;")
+        lines.append("      RETURN QUERY EXECUTE format(")
+        lines.append(
+            f"        'UPDATE public.{table} AS t SET %s FROM jsonb_populate_recordset(NULL::public.{table}, $1) AS r '"
+        )
+        lines.append("        'WHERE t.id = r.id RETURNING t.*',")
+        lines.append("        v_set")
+        lines.append("      ) USING v_group.payload;")
+        lines.append("    ELSIF cardinality(v_group.keys) = 0 THEN")
+        lines.append("      FOR i IN 1..jsonb_array_length(v_group.payload) LOOP")
+        lines.append(f"        RETURN QUERY INSERT INTO public.{table} DEFAULT VALUES RETURNING *;")
+        lines.append("      END LOOP;")
+        lines.append("    ELSE")
+        lines.append("      RETURN QUERY EXECUTE format(")
+        lines.append(f"        'INSERT INTO public.{table} (%s) SELECT %s '")
+        lines.append(f"        'FROM jsonb_populate_recordset(NULL::public.{table}, $1) AS r RETURNING *',")
+        lines.append("        v_names, v_select")
+        lines.append("      ) USING v_group.payload;")
+        lines.append("    END IF;")
+        lines.append("  END LOOP;")
+        lines.append("END")
+        lines.append("$$;")
+        lines.append("")
+        lines.append(f"REVOKE ALL ON FUNCTION public.{fn}(jsonb) FROM PUBLIC, anon;")
+        lines.append(f"GRANT EXECUTE ON FUNCTION public.{fn}(jsonb) TO authenticated, service_role;")
+        lines.append("")
+        lines.append("COMMIT;")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Diff mode (--diff-against): compare with the live catalog or a pg_dump file and
+# emit only the statements for real differences.
+# ---------------------------------------------------------------------------
+
+_PG_TYPE_ALIASES: Dict[str, str] = {
+    "timestamptz": "timestamp with time zone",
+    "timestamp": "timestamp without time zone",
+    "int": "integer",
+    "int4": "integer",
+    "int8": "bigint",
+    "bool": "boolean",
+    "float8": "double precision",
+    "varchar": "character varying",
+}
+
+# Lock wait cap for the delta migration: fail fast instead of queueing behind long
+# transactions (and blocking every query queued behind the ALTER).
+DELTA_LOCK_TIMEOUT = "5s"
+
+
+def _load_db_catalog_module():
+    spec = importlib.util.spec_from_file_location("schema_db_catalog", str(DB_CATALOG))
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {DB_CATALOG}")
+    module = importlib.util.module_from_spec(spec)
+    # Required for dataclasses to resolve module namespace correctly.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _normalize_pg_type(pg_type: str) -> str:
+    t = " ".join(pg_type.lower().split())
+    suffix = ""
+    while t.endswith("[]"):
+        t, suffix = t[:-2].rstrip(), suffix + "[]"
+    return _PG_TYPE_ALIASES.get(t, t) + suffix
+
+
+def _normalize_default(default_sql: Optional[str]) -> Optional[str]:
+    if default_sql is None:
+        return None
+    d = default_sql.strip()
+    while d.startswith("(") and d.endswith(")") and d.count("(") == d.count(")"):
+        d = d[1:-1].strip()
+    return d
+
+
+def _check_values(body: str) -> Set[str]:
+    """Quoted literals of an entity_type check, from either `IN (...)` or `= ANY (ARRAY[...])` form."""
+    return {v.replace("''", "'") for v in re.findall(r"'((?:[^']|'')*)'", body)}
+
+
+@dataclasses.dataclass
+class TableDelta:
+    table: str
+    actions: List[str] = dataclasses.field(default_factory=list)  # ALTER TABLE sub-commands
+    notes: List[str] = dataclasses.field(default_factory=list)
+    # Differences that would narrow what the database accepts; never emitted, only reported.
+    warnings: List[str] = dataclasses.field(default_factory=list)
+    missing_columns: int = 0
+    changed_defaults: int = 0
+    changed_constraints: int = 0
+
+
+def _plan_schema_delta(all_fields: Dict[str, List[FieldDef]], catalog: Dict[str, Any]) -> List[TableDelta]:
+    """
+    Per table: columns missing from the catalog, defaults that differ from the CSV-derived
+    default, and entity_type checks missing allowed values. Type differences are only
+    reported; changing a column type needs a backfill and is never emitted here.
+
+    Checks are only ever widened: values the database allows but the CSV schema does not
+    are kept and reported as warnings, since rows (or app code) may still use them.
+    """
+    deltas: List[TableDelta] = []
+    for entity_key, cfg in ENTITIES.items():
+        table = cfg["table"]
+        delta = TableDelta(table=table)
+        current = catalog.get(f"public.{table}")
+        if current is None:
+            delta.notes.append(f"public.{table} does not exist in the catalog; skipped.")
+            deltas.append(delta)
+            continue
+
+        if table in ENTITY_TYPE_CHECKS:
+            name = f"{table}_entity_type_check"
+            wanted = ENTITY_TYPE_CHECKS[table]
+            existing = current.constraints.get(name)
+            allowed = _check_values(existing) if existing is not None else set()
+            extra = sorted(allowed - set(wanted))
+            if extra:
+                delta.warnings.append(
+                    f"{name}: database also allows {', '.join(repr(v) for v in extra)}; the CSV "
+                    "schema does not. Kept; review manually before narrowing the check."
+                )
+            if existing is None or not allowed >= set(wanted):
+                if existing is not None:
+                    delta.actions.append(f"DROP CONSTRAINT IF EXISTS {name}")
+                delta.actions.append(
+                    f"ADD CONSTRAINT {name} CHECK ({_entity_type_check_body(table, wanted + extra)}) NOT VALID"
+                )
+                delta.changed_constraints += 1
+
+        for f in all_fields[entity_key]:
+            if not (f.column and f.pg_type):
+                continue
+            column = current.columns.get(f.column)
+            if column is None:
+                delta.actions.append("ADD COLUMN IF NOT EXISTS " + _sql_column_def(f, entity_key=entity_key))
+                delta.missing_columns += 1
+                continue
+            if _normalize_pg_type(column.pg_type) != _normalize_pg_type(f.pg_type):
+                # The CSV default would not even be valid for the current type; leave both alone.
+                delta.notes.append(
+                    f"{f.column}: type is {column.pg_type} in the database, "
+                    f"{f.pg_type} in the CSV schema (not altered)."
+                )
+                continue
+            if f.default_sql is not None and _normalize_default(column.default_sql) != _normalize_default(
+                f.default_sql
+            ):
+                delta.actions.append(f"ALTER COLUMN {f.column} SET DEFAULT {f.default_sql}")
+                delta.changed_defaults += 1
+
+        deltas.append(delta)
+    return deltas
+
+
+def _generate_delta_sql(all_fields: Dict[str, List[FieldDef]], deltas: List[TableDelta], source_label: str) -> str:
+    schema_hash = _fields_hash(all_fields)
+    lines: List[str] = []
+
+    lines.append("-- ============================================================================")
+    lines.append("-- KONG: Schema delta (CSV schema vs current database)")
+    lines.append(f"-- Schema hash: {schema_hash}")
+    lines.append(f"-- Compared against: {source_label}")
+    lines.append("--")
+    lines.append("-- Only real differences are emitted, as one ALTER TABLE per changed table, so")
+    lines.append("-- tables without differences are never locked.")
+    lines.append("-- Re-generate against the target database right before applying.")
+    lines.append("-- ============================================================================")
+    lines.append("")
+    lines.append(f"SET lock_timeout = '{DELTA_LOCK_TIMEOUT}';")
+
+    for delta in deltas:
+        if not (delta.actions or delta.notes or delta.warnings):
+            continue
+        lines.append("")
+        lines.append(f"-- {delta.table}")
+        for warning in delta.warnings:
+            lines.append(f"-- WARNING: {warning}")
+        for note in delta.notes:
+            lines.append(f"-- NOTE: {note}")
+        if not delta.actions:
+            continue
+        lines.append(f"ALTER TABLE public.{delta.table}")
+        for i, action in enumerate(delta.actions):
+            suffix = "," if i < len(delta.actions) - 1 else ";"
+            lines.append(f"  {action}{suffix}")
+    if not any(d.actions for d in deltas):
+        lines.append("")
+        lines.append("-- No differences.")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Type changes: ADD COLUMN IF NOT EXISTS skips existing columns, so a changed CSV
+# Data Type is detected against the previous snapshot and converted through a shadow
+# column: add + sync trigger, keyset-batched backfill (one commit per batch), swap.
+# ---------------------------------------------------------------------------
+
+TYPE_CHANGE_BATCH_SIZE = 5000
+TYPE_CHANGE_LOCK_TIMEOUT = "2s"
+
+_INT_RE_SQL = r"'^\s*[-+]?[0-9]+\s*$'"
+_NUMERIC_RE_SQL = r"'^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$'"
+# Cheap prefilter only: '2024-13-45' or '2024-01-05 junk' match it, so the cast itself
+# goes through a try_cast_* helper (_safe_cast) that returns NULL instead of raising.
+_DATE_RE_SQL = r"'^\s*[0-9]{4}-[0-9]{2}-[0-9]{2}'"
+# Integer targets are range-checked inline (a nested CASE, so the bounds are only compared
+# once the value is known to be numeric) rather than through a helper: an EXCEPTION block
+# is a subtransaction per row.
+_INT_RANGES: Dict[str, Tuple[int, int]] = {
+    "smallint": (-(2**15), 2**15 - 1),
+    "integer": (-(2**31), 2**31 - 1),
+    "bigint": (-(2**63), 2**63 - 1),
+}
+# Casts that cannot fail for any value of the old type; every other fallback cast goes
+# through a try_cast_* helper.
+_LOSSLESS_CASTS: Set[Tuple[str, str]] = {
+    ("smallint", "integer"),
+    ("smallint", "bigint"),
+    ("smallint", "numeric"),
+    ("integer", "bigint"),
+    ("integer", "numeric"),
+    ("integer", "double precision"),
+    ("bigint", "numeric"),
+    ("date", "timestamp with time zone"),
+    ("timestamp with time zone", "date"),
+}
+# Helper names for types whose spelling is not a usable identifier suffix.
+_SAFE_CAST_NAMES: Dict[str, str] = {
+    "timestamp with time zone": "try_cast_timestamptz",
+    "timestamp without time zone": "try_cast_timestamp",
+    "double precision": "try_cast_float8",
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class TypeChange:
+    entity_key: str
+    table: str
+    column: str
+    old_type: str
+    new: FieldDef
+    # Overrides _conversion_expr: SQL template with a {value} placeholder.
+    using: str = ""
+
+    def conversion(self, value: str) -> str:
+        if self.using:
+            return self.using.format(value=value)
+        return _conversion_expr(value, self.old_type, self.new.pg_type)
+
+    @property
+    def shadow(self) -> str:
+        return f"{self.column[:55]}__new"
+
+    @property
+    def old_column(self) -> str:
+        return f"{self.column[:55]}__old"
+
+    @property
+    def trigger(self) -> str:
+        return f"{self.table}_{self.column}_sync"[:55] + "_trg"
+
+
+def _detect_type_changes(changes: List[SchemaChange]) -> List[TypeChange]:
+    # Renamed columns are left to the full migration; the shadow-column steps assume the
+    # column keeps its name.
+    return [
+        TypeChange(c.entity_key, ENTITIES[c.entity_key]["table"], c.new.column, c.old.pg_type, c.new)
+        for c in changes
+        if c.kind == "retyped" and c.old and c.new and c.old.column == c.new.column and c.entity_key in ENTITIES
+    ]
+
+
+def _safe_cast_function(pg_type: str) -> str:
+    """Name of the try_cast_* helper returning `pg_type` (normalized) or NULL."""
+    if pg_type in _SAFE_CAST_NAMES:
+        return _SAFE_CAST_NAMES[pg_type]
+    return "try_cast_" + re.sub(r"\W+", "_", pg_type.replace("[]", " array")).strip("_")
+
+
+def _safe_cast(text_value: str, pg_type: str) -> str:
+    return f"public.{_safe_cast_function(pg_type)}({text_value})"
+
+
+def _int_in_range(value: str, checked: str, pg_type: str) -> str:
+    """`value`::pg_type when `checked` (the same number, as numeric) fits, else NULL."""
+    low, high = _INT_RANGES[pg_type]
+    return f"CASE WHEN {checked} BETWEEN {low} AND {high} THEN {value}::{pg_type} END"
+
+
+def _conversion_expr(value: str, old_type: str, new_type: str) -> str:
+    """
+    SQL converting `value` from old_type to new_type. Values that do not parse or do not
+    fit become NULL (or '{}' for arrays) instead of failing the batch or the sync trigger;
+    the old column is kept.
+    """
+    old, new = _normalize_pg_type(old_type), _normalize_pg_type(new_type)
+    if new == "text":
+        return f"array_to_string({value}, ',')" if old.endswith("[]") else f"{value}::text"
+    if new == "text[]":
+        if old == "text":
+            return (
+                f"CASE WHEN coalesce(btrim({value}), '') = '' THEN '{{}}'::text[] "
+                f"ELSE regexp_split_to_array(btrim({value}), '\\s*,\\s*') END"
+            )
+        return f"CASE WHEN {value} IS NULL THEN '{{}}'::text[] ELSE ARRAY[{value}::text] END"
+    if old == "text":
+        if new in _INT_RANGES:
+            trimmed = f"btrim({value})"
+            return (
+                f"CASE WHEN {value} ~ {_INT_RE_SQL} THEN "
+                f"{_int_in_range(trimmed, trimmed + '::numeric', new)} END"
+            )
+        if new in ("numeric", "double precision"):
+            # The regex admits exponents past the type's range (1e400); the helper catches those.
+            return f"CASE WHEN {value} ~ {_NUMERIC_RE_SQL} THEN {_safe_cast(value, new)} END"
+        if new == "boolean":
+            return (
+                f"CASE lower(btrim({value})) WHEN 'true' THEN true WHEN 't' THEN true WHEN 'yes' THEN true "
+                f"WHEN '1' THEN true WHEN 'false' THEN false WHEN 'f' THEN false WHEN 'no' THEN false "
+                f"WHEN '0' THEN false END"
+            )
+        if new in ("date", "timestamp with time zone"):
+            return f"CASE WHEN {value} ~ {_DATE_RE_SQL} THEN {_safe_cast(value, new)} END"
+        if new == "jsonb":
+            return f"to_jsonb({value})"
+    if old in ("numeric", "double precision") and new in _INT_RANGES:
+        # Compared as numeric: a float8 bound rounds 2^63-1 up to 2^63. NaN and +/-Infinity
+        # compare outside every range.
+        rounded = f"round({value})"
+        return _int_in_range(rounded, rounded if old == "numeric" else f"{rounded}::numeric", new)
+    if old in _INT_RANGES and new in _INT_RANGES:
+        if _INT_RANGES[new][1] >= _INT_RANGES[old][1]:
+            return f"{value}::{new}"
+        return _int_in_range(value, value, new)
+    if old == "boolean" and new in ("integer", "numeric"):
+        return f"{value}::integer::{new}"
+    if old == new or (old, new) in _LOSSLESS_CASTS:
+        return f"{value}::{new}"
+    return _safe_cast(value if old == "text" else f"{value}::text", new)
+
+
+def _type_change_id(changes: List[TypeChange]) -> str:
+    return _sha256_json([[c.table, c.column, c.old_type, c.new.pg_type] for c in changes])[:8]
+
+
+def _generate_type_change_sql(
+    all_fields: Dict[str, List[FieldDef]],
+    changes: List[TypeChange],
+    *,
+    batch_size: int,
+    lock_timeout: str,
+) -> str:
+    schema_hash = _fields_hash(all_fields)
+    lines: List[str] = []
+
+    lines.append("-- ============================================================================")
+    lines.append("-- KONG: Column type changes (CSV Data Type changed since the previous snapshot)")
+    lines.append(f"-- Schema hash: {schema_hash}")
+    lines.append("--")
+    for c in changes:
+        lines.append(f"--   {c.table}.{c.column}: {c.old_type} -> {c.new.pg_type}")
+    lines.append("--")
+    lines.append("-- Run the steps in order, with psql, NOT inside a transaction block (step 2 commits")
+    lines.append("-- after every batch). Each step only takes short locks, bounded by lock_timeout;")
+    lines.append("-- if a step times out, re-run it. Steps 1-2 are safe to re-run.")
+    lines.append("--")
+    lines.append("-- Indexes, views, policies and functions follow the renamed (old) column after")
+    lines.append("-- step 3; check pg_depend / pg_policies before swapping and re-run")
+    lines.append("-- migration_indexes_from_csv.sql afterwards.")
+    lines.append("-- ============================================================================")
+    lines.extend(_type_change_steps(changes, batch_size=batch_size, lock_timeout=lock_timeout))
+    return "\n".join(lines)
+
+
+def _carry_default_sql(c: TypeChange) -> List[str]:
+    """
+    DO block (inside the step 3 transaction) giving the swapped column the old column's
+    default, evaluated and converted like the data; dropped with a NOTICE if it does not convert.
+    """
+    convert = _sql_literal(f"SELECT ({c.conversion('s.v')})::text FROM (SELECT ")
+    return [
+        "DO $default$",
+        "DECLARE",
+        "  v_default text;",
+        "  v_value text;",
+        "BEGIN",
+        "  SELECT pg_get_expr(d.adbin, d.adrelid) INTO v_default",
+        "    FROM pg_attrdef d",
+        "    JOIN pg_attribute a ON a.attrelid = d.adrelid AND a.attnum = d.adnum",
+        f"    WHERE d.adrelid = 'public.{c.table}'::regclass AND a.attname = {_sql_literal(c.old_column)};",
+        "  IF v_default IS NULL THEN",
+        "    RETURN;",
+        "  END IF;",
+        f"  EXECUTE {convert} || v_default || ' AS v) s' INTO v_value;",
+        "  IF v_value IS NULL THEN",
+        f"    RAISE NOTICE '{c.table}.{c.column}: default % does not convert to {c.new.pg_type}; dropped', v_default;",
+        "  ELSE",
+        f"    EXECUTE format('ALTER TABLE public.{c.table} ALTER COLUMN {c.column} SET DEFAULT %L::{c.new.pg_type}', v_value);",
+        "  END IF;",
+        "END",
+        "$default$;",
+    ]
+
+
+def _release_old_column_sql(c: TypeChange) -> List[str]:
+    """
+    Step 3 statements leaving the renamed old column unconstrained: new rows leave it NULL,
+    so its NOT NULL and CHECK constraints would reject every insert. Dropped checks are
+    echoed as NOTICEs to re-create them on the new column if still wanted.
+    """
+    return [
+        f"ALTER TABLE public.{c.table} ALTER COLUMN {c.old_column} DROP NOT NULL;",
+        "DO $checks$",
+        "DECLARE",
+        "  v_check record;",
+        "BEGIN",
+        "  FOR v_check IN",
+        "    SELECT con.conname, pg_get_constraintdef(con.oid) AS def",
+        "    FROM pg_constraint con",
+        "    JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = ANY (con.conkey)",
+        f"    WHERE con.conrelid = 'public.{c.table}'::regclass AND con.contype = 'c'",
+        f"      AND a.attname = {_sql_literal(c.old_column)}",
+        "  LOOP",
+        f"    EXECUTE format('ALTER TABLE public.{c.table} DROP CONSTRAINT %I', v_check.conname);",
+        f"    RAISE NOTICE '{c.table}.{c.old_column}: dropped % (%)', v_check.conname, v_check.def;",
+        "  END LOOP;",
+        "END",
+        "$checks$;",
+    ]
+
+
+def _type_change_steps(changes: List[TypeChange], *, batch_size: int, lock_timeout: str) -> List[str]:
+    """Steps 1-4 of a shadow-column type change (also used by the list encoding migration)."""
+    lines: List[str] = []
+    conversions = "\n".join(c.conversion(c.column) for c in changes)
+    helpers = {_safe_cast_function(t): t for t in sorted({_normalize_pg_type(c.new.pg_type) for c in changes})}
+    for fn, pg_type in helpers.items():
+        if f"public.{fn}(" not in conversions:
+            continue
+        lines.append("")
+        lines.append(f"-- {pg_type} or NULL when the value does not convert (used by steps 1-2; kept afterwards).")
+        lines.append(f"CREATE OR REPLACE FUNCTION public.{fn}(p_value text) RETURNS {pg_type}")
+        lines.append("LANGUAGE plpgsql STABLE AS $fn$")
+        lines.append("BEGIN")
+        lines.append(f"  RETURN btrim(p_value)::{pg_type};")
+        # Class 22: bad text representation, out-of-range values, bad dates.
+        lines.append("EXCEPTION WHEN data_exception THEN")
+        lines.append("  RETURN NULL;")
+        lines.append("END")
+        lines.append("$fn$;")
+    lines.append("")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append("-- Step 1: shadow columns, kept in sync for new writes by a trigger")
+    lines.append("-- ----------------------------------------------------------------------------")
+    for c in changes:
+        expr = c.conversion(f"NEW.{c.column}")
+        lines.append("")
+        lines.append(f"SET lock_timeout = '{lock_timeout}';")
+        lines.append(f"ALTER TABLE public.{c.table} ADD COLUMN IF NOT EXISTS {c.shadow} {c.new.pg_type};")
+        lines.append(f"CREATE OR REPLACE FUNCTION public.{c.trigger}_fn() RETURNS trigger")
+        lines.append("LANGUAGE plpgsql AS $fn$")
+        lines.append("BEGIN")
+        lines.append(f"  NEW.{c.shadow} := {expr};")
+        lines.append("  RETURN NEW;")
+        lines.append("END")
+        lines.append("$fn$;")
+        lines.append(f"DROP TRIGGER IF EXISTS {c.trigger} ON public.{c.table};")
+        lines.append(f"CREATE TRIGGER {c.trigger} BEFORE INSERT OR UPDATE OF {c.column} ON public.{c.table}")
+        lines.append(f"  FOR EACH ROW EXECUTE FUNCTION public.{c.trigger}_fn();")
+
+    lines.append("")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append(f"-- Step 2: backfill in keyset batches of {batch_size} rows (ordered by id), one")
+    lines.append("-- transaction per batch so row locks are short and autovacuum keeps up.")
+    lines.append("-- ----------------------------------------------------------------------------")
+    for c in changes:
+        expr = c.conversion(c.column)
+        lines.append("")
+        lines.append("DO $backfill$")
+        lines.append("DECLARE")
+        lines.append("  last_id integer := 0;")
+        lines.append("  batch_max integer;")
+        lines.append("BEGIN")
+        lines.append("  LOOP")
+        lines.append(f"    PERFORM set_config('lock_timeout', '{lock_timeout}', true);")
+        lines.append("    SELECT max(id) INTO batch_max FROM (")
+        lines.append(f"      SELECT id FROM public.{c.table} WHERE id > last_id ORDER BY id LIMIT {batch_size}")
+        lines.append("    ) batch;")
+        lines.append("    EXIT WHEN batch_max IS NULL;")
+        lines.append(f"    UPDATE public.{c.table} SET {c.shadow} = {expr}")
+        lines.append("      WHERE id > last_id AND id <= batch_max;")
+        lines.append("    last_id := batch_max;")
+        lines.append("    COMMIT;")
+        lines.append("  END LOOP;")
+        lines.append("END")
+        lines.append("$backfill$;")
+
+    lines.append("")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append("-- Step 3: swap (metadata-only renames under a short ACCESS EXCLUSIVE lock). The old")
+    lines.append("-- column loses its NOT NULL and CHECK constraints, since new rows leave it NULL.")
+    lines.append("-- Check first that the conversion kept what you expect, e.g.:")
+    for c in changes:
+        lines.append(
+            f"--   SELECT count(*) FROM public.{c.table} WHERE {c.column} IS NOT NULL AND {c.shadow} IS NULL;"
+        )
+    lines.append("-- ----------------------------------------------------------------------------")
+    for c in changes:
+        lines.append("")
+        lines.append("BEGIN;")
+        lines.append(f"SET LOCAL lock_timeout = '{lock_timeout}';")
+        lines.append(f"DROP TRIGGER IF EXISTS {c.trigger} ON public.{c.table};")
+        lines.append(f"ALTER TABLE public.{c.table} RENAME COLUMN {c.column} TO {c.old_column};")
+        lines.append(f"ALTER TABLE public.{c.table} RENAME COLUMN {c.shadow} TO {c.column};")
+        lines.extend(_release_old_column_sql(c))
+        if c.new.default_sql is not None:
+            lines.append(f"ALTER TABLE public.{c.table} ALTER COLUMN {c.column} SET DEFAULT {c.new.default_sql};")
+        else:
+            lines.extend(_carry_default_sql(c))
+        lines.append("COMMIT;")
+        lines.append(f"DROP FUNCTION IF EXISTS public.{c.trigger}_fn();")
+
+    lines.append("")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append("-- Step 4 (later, once nothing reads the old columns):")
+    for c in changes:
+        lines.append(f"--   ALTER TABLE public.{c.table} DROP COLUMN {c.old_column};")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append("")
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# List encoding (--list-values / --sample-values): status_list / list / color columns
+# stored as enums or smallint-keyed lookup tables instead of free text. The allowed
+# values are kept append-only in OUT_LIST_VALUES, so enum order and lookup ids are
+# stable across runs, and exported to the TS registry (EntitySchema.listValues).
+# ---------------------------------------------------------------------------
+
+LIST_DATA_TYPES = {"status_list", "list", "color"}
+# Columns with more distinct values than this are free text in practice; left as text.
+LIST_ENCODING_MAX_VALUES = 250
+LIST_VALUES_VERSION = 1
+LIST_ENCODINGS = ["enum", "lookup"]
+
+
+def _list_fields(all_fields: Dict[str, List[FieldDef]]) -> Dict[str, List[FieldDef]]:
+    """entity_key -> its status_list / list / color fields stored as a text column."""
+    out: Dict[str, List[FieldDef]] = {}
+    for entity_key, fields in all_fields.items():
+        seen: Set[str] = set()
+        for f in fields:
+            if f.column and f.pg_type == "text" and f.data_type.strip().lower() in LIST_DATA_TYPES:
+                if f.column not in seen:
+                    seen.add(f.column)
+                    out.setdefault(entity_key, []).append(f)
+    return out
+
+
+def _load_list_values(path: Path) -> Dict[str, Dict[str, List[str]]]:
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != LIST_VALUES_VERSION:
+        raise SystemExit(f"{path}: unsupported list values version {data.get('version')!r}")
+    return data["entities"]
+
+
+def _render_list_values(catalog: Dict[str, Dict[str, List[str]]]) -> str:
+    entities = {k: dict(sorted(columns.items())) for k, columns in sorted(catalog.items()) if columns}
+    return json.dumps({"version": LIST_VALUES_VERSION, "entities": entities}, indent=2) + "\n"
+
+
+def _read_list_values_csv(path: Path, list_fields: Dict[str, List[FieldDef]]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Values CSV with `entity`, `field` and `value` columns, in sort order. `field` is the
+    CSV Field Name or the db column; rows for non-list fields are reported and skipped.
+    """
+    out: Dict[str, Dict[str, List[str]]] = {}
+    skipped: Set[str] = set()
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        missing = {"entity", "field", "value"} - set(reader.fieldnames or [])
+        if missing:
+            raise SystemExit(f"{path}: missing column(s): {', '.join(sorted(missing))}")
+        for row in reader:
+            entity_key = (row["entity"] or "").strip()
+            name = (row["field"] or "").strip()
+            value = (row["value"] or "").strip()
+            if not value:
+                continue
+            field = next(
+                (f for f in list_fields.get(entity_key, []) if name in (f.name, f.column)),
+                None,
+            )
+            if field is None:
+                skipped.add(f"{entity_key}.{name}")
+                continue
+            values = out.setdefault(entity_key, {}).setdefault(str(field.column), [])
+            if value not in values:
+                values.append(value)
+    if skipped:
+        print(f"{path}: skipped values of non-list fields: {', '.join(sorted(skipped))}")
+    return out
+
+
+def _sample_list_values(source: str, list_fields: Dict[str, List[FieldDef]]) -> Dict[str, Dict[str, List[str]]]:
+    """Distinct values currently in the database (or dump), most frequent first."""
+    db_catalog = _load_db_catalog_module()
+    targets = {ENTITIES[k]["table"]: [str(f.column) for f in fields] for k, fields in list_fields.items()}
+    try:
+        counts = db_catalog.load_column_values(source, targets)
+    except RuntimeError as e:
+        raise SystemExit(str(e))
+    out: Dict[str, Dict[str, List[str]]] = {}
+    for entity_key, fields in list_fields.items():
+        table = ENTITIES[entity_key]["table"]
+        for f in fields:
+            values = counts.get((table, str(f.column)), {})
+            if values:
+                ranked = sorted(values.items(), key=lambda kv: (-kv[1], kv[0]))
+                out.setdefault(entity_key, {})[str(f.column)] = [v for v, _ in ranked]
+    return out
+
+
+def _merge_list_values(
+    list_fields: Dict[str, List[FieldDef]],
+    previous: Dict[str, Dict[str, List[str]]],
+    *additions: Dict[str, Dict[str, List[str]]],
+) -> Dict[str, Dict[str, List[str]]]:
+    """Append-only merge: known values keep their position, new ones go at the end."""
+    merged: Dict[str, Dict[str, List[str]]] = {}
+    for entity_key, fields in list_fields.items():
+        for f in fields:
+            column = str(f.column)
+            values = list(previous.get(entity_key, {}).get(column, []))
+            for source in additions:
+                values.extend(v for v in source.get(entity_key, {}).get(column, []) if v not in values)
+            if values:
+                merged.setdefault(entity_key, {})[column] = values
+    return merged
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _list_type_name(table: str, column: str, encoding: str) -> str:
+    # Postgres identifiers are capped at 63 bytes.
+    if encoding == "enum":
+        return f"{table}_{column}"[:58] + "_enum"
+    return f"{table}_{column}"[:56] + "_values"
+
+
+def _plan_list_encoding(
+    all_fields: Dict[str, List[FieldDef]],
+    catalog: Dict[str, Dict[str, List[str]]],
+    encoding: str,
+) -> Tuple[List[Tuple[TypeChange, List[str]]], List[str]]:
+    """(type change + values per encoded column, skipped "table.column (reason)")."""
+    planned: List[Tuple[TypeChange, List[str]]] = []
+    skipped: List[str] = []
+    for entity_key, fields in _list_fields(all_fields).items():
+        table = ENTITIES[entity_key]["table"]
+        for f in fields:
+            column = str(f.column)
+            values = catalog.get(entity_key, {}).get(column, [])
+            if not values:
+                skipped.append(f"{table}.{column} (no values)")
+                continue
+            if len(values) > LIST_ENCODING_MAX_VALUES:
+                skipped.append(f"{table}.{column} ({len(values)} values > {LIST_ENCODING_MAX_VALUES})")
+                continue
+            type_name = _list_type_name(table, column, encoding)
+            if encoding == "enum":
+                # Step 3 carries the live column default over (converted with `using`).
+                new = dataclasses.replace(f, pg_type=f"public.{type_name}", default_sql=None)
+                # Values not (yet) in the enum become NULL instead of failing the write.
+                using = (
+                    f"CASE WHEN btrim({{value}}) = ANY (enum_range(NULL::public.{type_name})::text[]) "
+                    f"THEN btrim({{value}})::public.{type_name} END"
+                )
+            else:
+                new = dataclasses.replace(f, pg_type="smallint", default_sql=None)
+                using = f"(SELECT l.id FROM public.{type_name} l WHERE l.value = btrim({{value}}))"
+            planned.append((TypeChange(entity_key, table, column, "text", new, using=using), values))
+    return planned, skipped
+
+
+def _generate_list_encoding_sql(
+    all_fields: Dict[str, List[FieldDef]],
+    catalog: Dict[str, Dict[str, List[str]]],
+    *,
+    encoding: str,
+    batch_size: int,
+    lock_timeout: str,
+) -> str:
+    schema_hash = _fields_hash(all_fields)
+    planned, skipped = _plan_list_encoding(all_fields, catalog, encoding)
+    changes = [c for c, _ in planned]
+    lines: List[str] = []
+
+    lines.append("-- ============================================================================")
+    kind = "enum types" if encoding == "enum" else "smallint-keyed lookup tables"
+    lines.append(f"-- KONG: status_list / list / color columns as {kind}")
+    lines.append(f"-- Schema hash: {schema_hash}")
+    lines.append(f"-- Values: {_repo_relative(OUT_LIST_VALUES)}")
+    lines.append("--")
+    for c, values in planned:
+        lines.append(f"--   {c.table}.{c.column}: {len(values)} value(s) -> {c.new.pg_type}")
+    for item in skipped:
+        lines.append(f"--   skipped: {item}")
+    lines.append("--")
+    lines.append("-- Run with psql, NOT inside a transaction block. Step 0 is safe to re-run and")
+    lines.append("-- picks up values appended to the catalog later; its checks must return no rows")
+    lines.append("-- before step 2 (values missing from the catalog become NULL there).")
+    lines.append("-- Step 3 moves each column's current default over, converted to the new type.")
+    if encoding == "lookup":
+        lines.append("-- Clients then read and write the smallint ids; EntitySchema.listValues lists")
+        lines.append("-- the values in id order (id = position + 1).")
+    else:
+        lines.append("-- Enum columns still read and write as strings through PostgREST.")
+    lines.append("-- ============================================================================")
+
+    lines.append("")
+    lines.append("-- ----------------------------------------------------------------------------")
+    lines.append(f"-- Step 0: {kind} (append-only, in catalog order) and value checks")
+    lines.append("-- ----------------------------------------------------------------------------")
+    for c, values in planned:
+        type_name = _list_type_name(c.table, c.column, encoding)
+        lines.append("")
+        if encoding == "enum":
+            lines.append("DO $enum$")
+            lines.append("BEGIN")
+            lines.append(f"  CREATE TYPE public.{type_name} AS ENUM ({_sql_literal(values[0])});")
+            lines.append("EXCEPTION WHEN duplicate_object THEN NULL;")
+            lines.append("END")
+            lines.append("$enum$;")
+            for value in values:
+                lines.append(f"ALTER TYPE public.{type_name} ADD VALUE IF NOT EXISTS {_sql_literal(value)};")
+        else:
+            lines.append(f"CREATE TABLE IF NOT EXISTS public.{type_name} (")
+            lines.append("  id smallint PRIMARY KEY,")
+            lines.append("  value text NOT NULL UNIQUE")
+            lines.append(");")
+            rows = ", ".join(f"({i}, {_sql_literal(v)})" for i, v in enumerate(values, start=1))
+            lines.append(f"INSERT INTO public.{type_name} (id, value) VALUES {rows}")
+            lines.append("  ON CONFLICT DO NOTHING;")
+        literals = ", ".join(_sql_literal(v) for v in values)
+        lines.append(f"SELECT DISTINCT {c.column} AS missing_from_catalog FROM public.{c.table}")
+        lines.append(f"  WHERE btrim({c.column}) <> '' AND btrim({c.column}) <> ALL (ARRAY[{literals}]);")
+
+    lines.extend(_type_change_steps(changes, batch_size=batch_size, lock_timeout=lock_timeout))
+
+    if encoding == "lookup":
+        lines.append("-- ----------------------------------------------------------------------------")
+        lines.append("-- Step 5: foreign keys to the lookup tables (NOT VALID, then validated without")
+        lines.append("-- blocking writes).")
+        lines.append("-- ----------------------------------------------------------------------------")
+        for c in changes:
+            type_name = _list_type_name(c.table, c.column, encoding)
+            constraint = f"{c.table}_{c.column}"[:58] + "_fkey"
+            lines.append("")
+            lines.append(f"SET lock_timeout = '{lock_timeout}';")
+            lines.append(f"ALTER TABLE public.{c.table} DROP CONSTRAINT IF EXISTS {constraint};")
+            lines.append(
+                f"ALTER TABLE public.{c.table} ADD CONSTRAINT {constraint} "
+                f"FOREIGN KEY ({c.column}) REFERENCES public.{type_name}(id) NOT VALID;"
+            )
+            lines.append(f"ALTER TABLE public.{c.table} VALIDATE CONSTRAINT {constraint};")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _write_list_encoding(
+    all_fields: Dict[str, List[FieldDef]],
+    *,
+    values_csv: Optional[Path],
+    sample_source: Optional[str],
+    encoding: str,
+    batch_size: int,
+    lock_timeout: str,
+) -> None:
+    """Merge new values into OUT_LIST_VALUES and write the list encoding migration."""
+    list_fields = _list_fields(all_fields)
+    with TIMINGS.phase("list_values_load", "columns") as stat:
+        additions: List[Dict[str, Dict[str, List[str]]]] = []
+        if values_csv is not None:
+            additions.append(_read_list_values_csv(values_csv, list_fields))
+        if sample_source is not None:
+            additions.append(_sample_list_values(sample_source, list_fields))
+        catalog = _merge_list_values(list_fields, _load_list_values(OUT_LIST_VALUES), *additions)
+        stat.items += sum(len(columns) for columns in catalog.values())
+    with TIMINGS.phase("list_encoding_render", "columns") as stat:
+        text = _generate_list_encoding_sql(
+            all_fields, catalog, encoding=encoding, batch_size=batch_size, lock_timeout=lock_timeout
+        )
+        stat.items += sum(len(columns) for columns in catalog.values())
+    for path, content in ((OUT_LIST_VALUES, _render_list_values(catalog)), (OUT_LIST_ENCODING_SQL, text)):
+        state = "Wrote" if _write_if_changed(path, content) else "Unchanged"
+        print(f"{state}: {path}")
+
+
+# Never accepted from clients by the generic column pickers in echo/src/lib/schema/eager.ts;
+# excluded from each entity's precomputed writableColumns (as are trigger-maintained
+# summary counters).
+TS_READONLY_COLUMNS: List[str] = ["id", "created_at", "updated_at"]
+
+
+_TS_HEADER = """/* eslint-disable */
 // AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
-// Generated by tools/schema/generate_from_csv.py
-// Generated: {now}
+// Generated by tools/schema/generate_from_csv.py"""
+
+
+def _ts_entity_module_name(entity_key: str) -> str:
+    return f"entities/{entity_key}.generated"
+
+
+def _ts_pascal(name: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in name.split("_"))
+
+
+def _generate_ts_types(entity_keys: List[str]) -> str:
+    entity_union = " | ".join(f"'{k}'" for k in entity_keys)
+    return f"""{_TS_HEADER}
 
-export type EntityKey = {entity_keys}
+export type EntityKey = {entity_union}
 
 export interface SchemaField {{
   name: string
@@ -617,32 +2640,868 @@ export interface EntitySchema {{
   entity: EntityKey
   table: string
   csv: string
+  // text[] columns with a GIN index: filter with @> (.contains) / && (.overlaps).
+  containmentColumns: string[]
+  // Allowed values of status_list/list/color columns, in enum/lookup id order
+  // (lookup id = index + 1). Only present once schema.values.json has values.
+  listValues?: Record<string, string[]>
   fields: SchemaField[]
 }}
 
-export const SCHEMA: Record<EntityKey, EntitySchema> = {json_text} as any
+// Compact on-disk encoding of a SchemaField; virtual is implied by column === null.
+export type FieldTuple = [
+  name: string,
+  dataType: string,
+  fieldType: string,
+  code: string,
+  column: string | null,
+  pgType: string | null,
+  defaultSql: string | null,
+]
+
+export interface EncodedEntitySchema extends Omit<EntitySchema, 'fields'> {{
+  fields: FieldTuple[]
+}}
+
+// Precomputed per-entity lookups so hot paths (e.g. pickEntityColumns on every write)
+// do O(1) checks without rebuilding sets per call. Treat as immutable.
+export interface EntityLookups {{
+  columns: ReadonlySet<string>
+  writableColumns: ReadonlySet<string>
+  codeToColumn: Readonly<Record<string, string>>
+  fieldByColumn: ReadonlyMap<string, SchemaField>
+  columnsByPgType: Readonly<Record<string, readonly string[]>>
+}}
+
+export interface EncodedEntityLookups {{
+  columns: string[]
+  writableColumns: string[]
+  codeToColumn: Record<string, string>
+  // Index into EntitySchema.fields.
+  fieldIndexByColumn: Record<string, number>
+  columnsByPgType: Record<string, string[]>
+}}
+
+export function decodeEntityLookups(schema: EntitySchema, encoded: EncodedEntityLookups): EntityLookups {{
+  const fieldByColumn = new Map<string, SchemaField>()
+  for (const [column, index] of Object.entries(encoded.fieldIndexByColumn)) {{
+    fieldByColumn.set(column, schema.fields[index])
+  }}
+  const columnsByPgType: Record<string, readonly string[]> = {{}}
+  for (const [pgType, columns] of Object.entries(encoded.columnsByPgType)) {{
+    columnsByPgType[pgType] = Object.freeze(columns)
+  }}
+  return Object.freeze({{
+    columns: new Set(encoded.columns),
+    writableColumns: new Set(encoded.writableColumns),
+    codeToColumn: Object.freeze(encoded.codeToColumn),
+    fieldByColumn,
+    columnsByPgType: Object.freeze(columnsByPgType),
+  }})
+}}
+
+export function decodeEntitySchema(encoded: EncodedEntitySchema): EntitySchema {{
+  return {{
+    ...encoded,
+    fields: encoded.fields.map(([name, dataType, fieldType, code, column, pgType, defaultSql]) => ({{
+      name,
+      dataType,
+      fieldType,
+      code,
+      column,
+      pgType,
+      defaultSql,
+      virtual: column === null,
+    }})),
+  }}
+}}
+"""
+
+
+def _ts_lookups(fields: List[FieldDef], readonly: List[str]) -> Dict[str, Any]:
+    columns: List[str] = []
+    code_to_column: Dict[str, str] = {}
+    field_index: Dict[str, int] = {}
+    by_pg_type: Dict[str, List[str]] = {}
+    for i, f in enumerate(fields):
+        if not f.column:
+            continue
+        columns.append(f.column)
+        code_to_column[f.code] = f.column
+        field_index[f.column] = i
+        if f.pg_type:
+            by_pg_type.setdefault(f.pg_type, []).append(f.column)
+    return {
+        "columns": columns,
+        "writableColumns": [c for c in columns if c not in readonly],
+        "codeToColumn": code_to_column,
+        "fieldIndexByColumn": field_index,
+        "columnsByPgType": dict(sorted(by_pg_type.items())),
+    }
+
+
+def _load_manual_entities(path: Path) -> Dict[str, Tuple[str, List[FieldDef]]]:
+    """entity_key -> (table, fields) from MANUAL_ENTITIES_PATH; empty when the file is absent."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != MANUAL_ENTITIES_VERSION:
+        raise SystemExit(f"{path}: unsupported version {data.get('version')!r}")
+    overlap = sorted(set(data["entities"]) & set(ENTITIES))
+    if overlap:
+        raise SystemExit(f"{path}: entities also built from CSV: {overlap}")
+    return {
+        entity_key: (entity["table"], [_field_from_row(r) for r in entity["fields"]])
+        for entity_key, entity in data["entities"].items()
+    }
+
+
+def _generate_ts_entity(
+    entity_key: str,
+    fields: List[FieldDef],
+    list_values: Optional[Dict[str, List[str]]] = None,
+    *,
+    manual_table: Optional[str] = None,
+) -> str:
+    if manual_table is None:
+        cfg = ENTITIES[entity_key]
+        source = ""
+    else:
+        cfg = {"table": manual_table, "csv": ""}
+        source = f"\n// Source: {_repo_relative(MANUAL_ENTITIES_PATH)} (hand-maintained; edit that file)"
+    # Stamp with this entity's hash only, so editing one CSV leaves the other modules untouched.
+    schema_hash = _fields_hash({entity_key: fields})
+    field_rows = ",\n".join(
+        "    " + json.dumps(_field_to_row(f), separators=(",", ":")) for f in fields
+    )
+    # One key per line, values kept on a single line to stay compact.
+    lookups_json = (
+        "{\n"
+        + "".join(f"  {k}: {json.dumps(v)},\n" for k, v in _ts_lookups(fields, TS_READONLY_COLUMNS + _summary_columns(entity_key, fields)).items())
+        + "}"
+    )
+    columns = {f.column for f in fields if f.column}
+    list_values = {c: v for c, v in (list_values or {}).items() if c in columns}
+    list_values_line = f"  listValues: {json.dumps(list_values)},\n" if list_values else ""
+    return f"""{_TS_HEADER}{source}
+// Schema hash: {schema_hash}
+
+import {{
+  decodeEntityLookups,
+  decodeEntitySchema,
+  type EntityLookups,
+  type EntitySchema,
+}} from '../schema.types.generated'
+
+// fields: [name, dataType, fieldType, code, column, pgType, defaultSql]
+export const schema: EntitySchema = decodeEntitySchema({{
+  entity: {json.dumps(entity_key)},
+  table: {json.dumps(cfg["table"])},
+  csv: {json.dumps(cfg["csv"])},
+  containmentColumns: {json.dumps(_containment_columns(entity_key, fields))},
+{list_values_line}  fields: [
+{field_rows},
+  ],
+}})
+
+export const lookups: EntityLookups = decodeEntityLookups(schema, {lookups_json})
+
+export default schema
+"""
+
+
+def _generate_ts_lazy_index(entity_keys: List[str]) -> str:
+    loaders = "\n".join(
+        f"  {k}: () => import('./{_ts_entity_module_name(k)}')," for k in entity_keys
+    )
+    keys = ", ".join(f"'{k}'" for k in entity_keys)
+    return f"""{_TS_HEADER}
+//
+// Per-entity dynamic imports: only the requested entity's module is loaded.
+
+import type {{ EntityKey, EntityLookups, EntitySchema }} from './schema.types.generated'
+
+export const ENTITY_KEYS: readonly EntityKey[] = [{keys}]
+
+type EntityModule = {{ schema: EntitySchema; lookups: EntityLookups }}
+
+const LOADERS: Record<EntityKey, () => Promise<EntityModule>> = {{
+{loaders}
+}}
+
+export function loadEntitySchema(entity: EntityKey): Promise<EntitySchema> {{
+  return LOADERS[entity]().then((m) => m.schema)
+}}
+
+export function loadEntityLookups(entity: EntityKey): Promise<EntityLookups> {{
+  return LOADERS[entity]().then((m) => m.lookups)
+}}
 """
 
 
+def _generate_ts_eager_index(entity_keys: List[str]) -> str:
+    imports = "\n".join(
+        f"import {{ lookups as {k}_lookups, schema as {k} }} from './{_ts_entity_module_name(k)}'"
+        for k in entity_keys
+    )
+    entries = "\n".join(f"  {k}," for k in entity_keys)
+    lookup_entries = "\n".join(f"  {k}: {k}_lookups," for k in entity_keys)
+    return f"""{_TS_HEADER}
+//
+// Eager registry of every entity. Code that needs a single entity should import
+// './entities/<entity>.generated' or use loadEntitySchema() from './schema.lazy.generated'.
+
+import type {{ EntityKey, EntityLookups, EntitySchema }} from './schema.types.generated'
+{imports}
+
+export type {{
+  EncodedEntitySchema,
+  EntityKey,
+  EntityLookups,
+  EntitySchema,
+  FieldTuple,
+  SchemaField,
+}} from './schema.types.generated'
+
+export const SCHEMA: Record<EntityKey, EntitySchema> = {{
+{entries}
+}}
+
+export const LOOKUPS: Record<EntityKey, EntityLookups> = {{
+{lookup_entries}
+}}
+"""
+
+
+def _generate_ts_rpc(all_fields: Dict[str, List[FieldDef]]) -> str:
+    functions = "\n".join(
+        f"  {k}: '{_bulk_upsert_function(cfg['table'])}'," for k, cfg in ENTITIES.items()
+    )
+    columns = "\n".join(
+        f"  {k}: new Set({json.dumps(_bulk_upsert_columns(k, all_fields[k]))}),"
+        for k in ENTITIES.keys()
+    )
+    wrappers = "\n\n".join(
+        f"export function bulkUpsert{_ts_pascal(cfg['table'])}(\n"
+        f"  supabase: any,\n"
+        f"  rows: readonly BulkUpsertRow[],\n"
+        f"  options?: BulkUpsertOptions\n"
+        f") {{\n"
+        f"  return bulkUpsert(supabase, '{k}', rows, options)\n"
+        f"}}"
+        for k, cfg in ENTITIES.items()
+    )
+    return f"""{_TS_HEADER}
+//
+// Wrappers for the bulk_upsert_<table>(p_rows jsonb) RPCs (migration_bulk_upsert_rpc.sql):
+// one round trip per {BULK_UPSERT_MAX_ROWS} rows instead of one request per row.
+// Self-contained (no registry import), so it stays small in the '@/lib/schema' barrel.
+
+// Rows with an id update that row (only the keys present); rows without one are inserted.
+export type BulkUpsertRow = {{ id?: number | null }} & Record<string, unknown>
+
+export interface BulkUpsertOptions {{
+  // Extra columns to drop from every row (same as pickEntityColumns' deny).
+  deny?: ReadonlySet<string>
+}}
+
+export const BULK_UPSERT_MAX_ROWS = {BULK_UPSERT_MAX_ROWS}
+
+export const BULK_UPSERT_FUNCTIONS = {{
+{functions}
+}} as const
+
+export type BulkUpsertEntity = keyof typeof BULK_UPSERT_FUNCTIONS
+
+// Columns the RPC writes: writableColumns plus the polymorphic link columns.
+const COLUMNS: Record<BulkUpsertEntity, ReadonlySet<string>> = {{
+{columns}
+}}
+
+export function toBulkUpsertRows(
+  entity: BulkUpsertEntity,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+): BulkUpsertRow[] {{
+  const columns = COLUMNS[entity]
+  const deny = options?.deny
+  return rows.map((row) => {{
+    const out: BulkUpsertRow = {{}}
+    if (row.id != null) out.id = row.id
+    for (const [key, value] of Object.entries(row)) {{
+      if (value === undefined || key === 'id') continue
+      if (!columns.has(key)) continue
+      if (deny?.has(key)) continue
+      out[key] = value
+    }}
+    return out
+  }})
+}}
+
+// Sends the rows in chunks of BULK_UPSERT_MAX_ROWS; each chunk commits on its own, so
+// on error the chunks before it are already saved (their rows are in data).
+export async function bulkUpsert<T = Record<string, unknown>>(
+  supabase: any,
+  entity: BulkUpsertEntity,
+  rows: readonly BulkUpsertRow[],
+  options?: BulkUpsertOptions
+): Promise<{{ data: T[]; error: any }}> {{
+  const payload = toBulkUpsertRows(entity, rows, options)
+  const data: T[] = []
+  for (let i = 0; i < payload.length; i += BULK_UPSERT_MAX_ROWS) {{
+    const {{ data: chunk, error }} = await supabase.rpc(BULK_UPSERT_FUNCTIONS[entity], {{
+      p_rows: payload.slice(i, i + BULK_UPSERT_MAX_ROWS),
+    }})
+    if (error) return {{ data, error }}
+    data.push(...((chunk ?? []) as T[]))
+  }}
+  return {{ data, error: null }}
+}}
+
+{wrappers}
+"""
+
+
+def _generate_ts_keyset(all_fields: Dict[str, List[FieldDef]]) -> str:
+    sorts = "\n".join(
+        f"  {k}: {{ "
+        + ", ".join(f"{column}: '{pg_type}'" for column, pg_type in _sortable_columns(all_fields[k]))
+        + " },"
+        for k in ENTITIES.keys()
+    )
+    indexed = "\n".join(
+        f"  {k}: {json.dumps(_keyset_indexed_columns(all_fields[k]))}," for k in ENTITIES.keys()
+    )
+    return f"""{_TS_HEADER}
+//
+// Keyset (cursor) pagination for the entity list pages. Rows are ordered by one sortable
+// column with id as the tie-breaker (both in the same direction, Postgres' default NULL
+// placement), and each page resumes after the previous page's last row, so page N costs
+// the same as page 1 instead of scanning and discarding N * limit rows.
+
+// Sortable columns per entity, with their pgType.
+export const KEYSET_SORT_COLUMNS = {{
+{sorts}
+}} as const
+
+// Sorts backed by a (project_id, <column>, id) index: constant time per page within a
+// project. The other sortable columns page correctly but sort the project's rows.
+export const KEYSET_INDEXED_SORT_COLUMNS = {{
+{indexed}
+}} as const
+
+export type KeysetEntity = keyof typeof KEYSET_SORT_COLUMNS
+export type KeysetSortColumn<E extends KeysetEntity> = keyof (typeof KEYSET_SORT_COLUMNS)[E] & string
+
+export type KeysetValue = string | number | null
+
+export interface KeysetCursor {{
+  value: KeysetValue
+  id: number
+}}
+
+export interface KeysetPageRequest<E extends KeysetEntity = KeysetEntity> {{
+  column: KeysetSortColumn<E>
+  ascending?: boolean
+  limit: number
+  // Opaque cursor from the previous page's nextCursor; omit for the first page.
+  cursor?: string | null
+}}
+
+export function isKeysetSortColumn(entity: KeysetEntity, column: string): boolean {{
+  return Object.prototype.hasOwnProperty.call(KEYSET_SORT_COLUMNS[entity], column)
+}}
+
+// Cursors are URL-safe and only meaningful for the same entity, column and direction.
+export function encodeKeysetCursor(cursor: KeysetCursor): string {{
+  return encodeURIComponent(JSON.stringify([cursor.value, cursor.id]))
+}}
+
+export function decodeKeysetCursor(cursor: string | null | undefined): KeysetCursor | null {{
+  if (!cursor) return null
+  try {{
+    const parsed = JSON.parse(decodeURIComponent(cursor))
+    if (!Array.isArray(parsed) || parsed.length !== 2) return null
+    const [value, id] = parsed
+    if (!Number.isInteger(id)) return null
+    if (value !== null && typeof value !== 'string' && typeof value !== 'number') return null
+    return {{ value, id }}
+  }} catch {{
+    return null
+  }}
+}}
+
+function quoteFilterValue(value: string | number): string {{
+  return `"${{String(value).replace(/\\\\/g, '\\\\\\\\').replace(/"/g, '\\\\"')}}"`
+}}
+
+// PostgREST `or` filter selecting the rows after `cursor` in (column, id) order.
+// ASC puts NULLs last and DESC puts them first, matching the index either way.
+export function keysetFilter(column: string, ascending: boolean, cursor: KeysetCursor): string {{
+  const op = ascending ? 'gt' : 'lt'
+  const id = cursor.id
+  if (cursor.value === null) {{
+    return ascending
+      ? `and(${{column}}.is.null,id.${{op}}.${{id}})`
+      : `${{column}}.not.is.null,and(${{column}}.is.null,id.${{op}}.${{id}})`
+  }}
+  const value = quoteFilterValue(cursor.value)
+  const after = `${{column}}.${{op}}.${{value}},and(${{column}}.eq.${{value}},id.${{op}}.${{id}})`
+  return ascending ? `${{after}},${{column}}.is.null` : after
+}}
+
+// Applies ordering, the cursor filter and limit + 1 (to detect a next page) to a
+// supabase-js query, e.g. supabase.from('versions').select('*').eq('project_id', id).
+export function applyKeysetPage<E extends KeysetEntity>(query: any, entity: E, page: KeysetPageRequest<E>): any {{
+  if (!isKeysetSortColumn(entity, page.column)) {{
+    throw new Error(`${{entity}}: ${{page.column}} is not a keyset sort column`)
+  }}
+  const ascending = page.ascending ?? true
+  const cursor = decodeKeysetCursor(page.cursor)
+  let q = query
+  if (cursor) q = q.or(keysetFilter(page.column, ascending, cursor))
+  return q
+    .order(page.column, {{ ascending }})
+    .order('id', {{ ascending }})
+    .limit(page.limit + 1)
+}}
+
+// Splits the limit + 1 rows fetched by applyKeysetPage into the page and the cursor
+// for the next one (null on the last page).
+export function keysetPageResult<T extends Record<string, any>>(
+  rows: readonly T[],
+  page: {{ column: string; limit: number }}
+): {{ rows: T[]; nextCursor: string | null }} {{
+  const pageRows = rows.slice(0, page.limit)
+  if (rows.length <= page.limit || pageRows.length === 0) return {{ rows: pageRows, nextCursor: null }}
+  const last = pageRows[pageRows.length - 1]
+  return {{
+    rows: pageRows,
+    nextCursor: encodeKeysetCursor({{ value: last[page.column] ?? null, id: last.id }}),
+  }}
+}}
+"""
+
+
+def _generate_ts(
+    all_fields: Dict[str, List[FieldDef]],
+    list_values: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    manual: Optional[Dict[str, Tuple[str, List[FieldDef]]]] = None,
+) -> Dict[str, str]:
+    """
+    Render the TS registry as {path relative to OUT_TS.parent: contents}:
+    shared types/codec, one compact module per entity, a lazy (dynamic import) index,
+    the bulk upsert RPC wrappers, the keyset pagination helpers and the eager schema.generated.ts aggregate kept for
+    existing SCHEMA imports. `manual` entities (_load_manual_entities) join the registry
+    but not the RPC / keyset helpers, whose SQL is only generated for ENTITIES.
+    """
+    manual = manual or {}
+    entity_keys = list(ENTITIES.keys()) + list(manual)
+    files: Dict[str, str] = {
+        "schema.types.generated.ts": _generate_ts_types(entity_keys),
+        "schema.lazy.generated.ts": _generate_ts_lazy_index(entity_keys),
+        "schema.rpc.generated.ts": _generate_ts_rpc(all_fields),
+        "schema.keyset.generated.ts": _generate_ts_keyset(all_fields),
+        OUT_TS.name: _generate_ts_eager_index(entity_keys),
+    }
+    for entity_key in ENTITIES.keys():
+        files[_ts_entity_module_name(entity_key) + ".ts"] = _generate_ts_entity(
+            entity_key, all_fields[entity_key], (list_values or {}).get(entity_key)
+        )
+    for entity_key, (table, fields) in manual.items():
+        files[_ts_entity_module_name(entity_key) + ".ts"] = _generate_ts_entity(
+            entity_key, fields, manual_table=table
+        )
+    return files
+
+
+def _render_outputs(
+    all_fields: Dict[str, List[FieldDef]],
+    entity_inputs: Dict[str, Dict[str, str]],
+    index_catalog: Optional[Tuple[str, Dict[str, Any]]] = None,
+) -> Tuple[List[Tuple[Path, str]], List[str]]:
+    """
+    (path, contents) of every generated file, and the TS files relative to OUT_TS.parent.
+    `index_catalog`: (label, catalog) of the database whose existing indexes are not planned.
+    """
+    baseline, catalog = index_catalog or (None, None)
+    with TIMINGS.phase("sql_render", "tables") as stat:
+        sql = _generate_sql(all_fields) + "\n"
+        stat.items += len(all_fields)
+    with TIMINGS.phase("index_sql_render", "indexes") as stat:
+        indexes = _plan_indexes(all_fields, catalog)
+        index_sql = _generate_index_sql(all_fields, indexes, baseline)
+        stat.items += len(indexes)
+    with TIMINGS.phase("summary_sql_render", "counters") as stat:
+        summary_sql = _generate_summary_sql(all_fields)
+        stat.items += len(_plan_summary_counters(all_fields))
+    with TIMINGS.phase("bulk_upsert_sql_render", "functions") as stat:
+        bulk_upsert_sql = _generate_bulk_upsert_sql(all_fields)
+        stat.items += len(all_fields)
+    with TIMINGS.phase("snapshot_render", "fields") as stat:
+        snapshot = _render_snapshot(_build_snapshot(all_fields, entity_inputs))
+        stat.items += sum(len(fields) for fields in all_fields.values())
+    with TIMINGS.phase("ts_render", "files") as stat:
+        ts_files = _generate_ts(
+            all_fields, _load_list_values(OUT_LIST_VALUES), _load_manual_entities(MANUAL_ENTITIES_PATH)
+        )
+        stat.items += len(ts_files)
+
+    outputs: List[Tuple[Path, str]] = [
+        (OUT_SQL, sql),
+        (OUT_INDEX_SQL, index_sql),
+        (OUT_SUMMARY_SQL, summary_sql),
+        (OUT_BULK_UPSERT_SQL, bulk_upsert_sql),
+        (OUT_SNAPSHOT, snapshot),
+    ]
+    outputs.extend((OUT_TS.parent / rel, text) for rel, text in ts_files.items())
+    return outputs, list(ts_files)
+
+
+def _write_outputs(
+    all_fields: Dict[str, List[FieldDef]],
+    entity_inputs: Dict[str, Dict[str, str]],
+    *,
+    owned_modules: Iterable[str] = (),
+    index_catalog: Optional[Tuple[str, Dict[str, Any]]] = None,
+    quiet: bool = False,
+) -> List[Path]:
+    """
+    Render every generated file and write the ones whose contents changed. Returns those paths.
+
+    `owned_modules`: entity modules (relative to OUT_TS.parent) written by the previous run,
+    from the manifest; only those are removed when their entity is gone, so modules this
+    generator did not write are kept.
+    """
+    outputs, ts_files = _render_outputs(all_fields, entity_inputs, index_catalog)
+    changed: List[Path] = []
+    with TIMINGS.phase("write", "files") as stat:
+        for path, text in outputs:
+            stat.items += 1
+            if _write_if_changed(path, text):
+                changed.append(path)
+                if not quiet:
+                    print(f"Wrote: {path}")
+            elif not quiet:
+                print(f"Unchanged: {path}")
+
+    # Drop modules this generator wrote for entities that no longer exist.
+    for rel in sorted(set(owned_modules) - set(ts_files)):
+        stale = OUT_TS.parent / rel
+        if stale.exists():
+            stale.unlink()
+            changed.append(stale)
+            if not quiet:
+                print(f"Removed: {stale}")
+    return changed
+
+
+def _stale_outputs(
+    all_fields: Dict[str, List[FieldDef]],
+    entity_inputs: Dict[str, Dict[str, str]],
+) -> List[Path]:
+    """Committed outputs (the TS registry and the snapshot, under OUT_TS.parent) a fresh build would change."""
+    outputs, _ = _render_outputs(all_fields, entity_inputs)
+    stale: List[Path] = []
+    for path, text in outputs:
+        if OUT_TS.parent not in path.parents:
+            continue
+        try:
+            current = path.read_bytes()
+        except OSError:
+            current = None
+        if current != text.encode("utf-8"):
+            stale.append(path)
+    return stale
+
+
+def _write_schema_diff(
+    all_fields: Dict[str, List[FieldDef]],
+    previous: Dict[str, Any],
+    entity_inputs: Dict[str, Dict[str, str]],
+) -> List[SchemaChange]:
+    """Diff against the previous snapshot; the report is only rewritten when something changed."""
+    with TIMINGS.phase("schema_diff", "changes") as stat:
+        changes = _diff_schema(_snapshot_fields(previous), all_fields)
+        stat.items += len(changes)
+    print(_render_schema_diff_text(changes))
+    if changes:
+        text = _render_schema_diff_json(
+            changes,
+            from_sha256=previous.get("source_sha256", ""),
+            to_sha256=_source_hash(entity_inputs),
+        )
+        state = "Wrote" if _write_if_changed(OUT_SCHEMA_DIFF, text) else "Unchanged"
+        print(f"{state}: {OUT_SCHEMA_DIFF}")
+    return changes
+
+
+def _write_type_changes(
+    all_fields: Dict[str, List[FieldDef]],
+    schema_changes: List[SchemaChange],
+    *,
+    batch_size: int,
+    lock_timeout: str,
+) -> None:
+    """Write a type-change migration per distinct set of changes; nothing when no type drifted."""
+    with TIMINGS.phase("type_change_render", "columns") as stat:
+        changes = _detect_type_changes(schema_changes)
+        stat.items += len(changes)
+        if not changes:
+            return
+        text = _generate_type_change_sql(all_fields, changes, batch_size=batch_size, lock_timeout=lock_timeout)
+    # Named by the change set, so the plan survives later runs (the snapshot no longer
+    # differs once it has been rewritten) until it is applied and deleted.
+    path = OUT_SQL.parent / f"migration_type_changes_{_type_change_id(changes)}.sql"
+    state = "Wrote" if _write_if_changed(path, text) else "Unchanged"
+    print(f"{state}: {path}")
+    for c in changes:
+        print(f"Type change: {c.table}.{c.column} {c.old_type} -> {c.new.pg_type}")
+
+
+def _load_index_catalog(source: Optional[str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """(label, catalog) for _plan_indexes; None when no source is given and the baseline dump is absent."""
+    if source is None:
+        if not INDEX_BASELINE_DUMP.exists():
+            return None
+        source = str(INDEX_BASELINE_DUMP)
+    source_path = Path(source)
+    with TIMINGS.phase("catalog_load", "tables") as stat:
+        try:
+            catalog = _load_db_catalog_module().load_catalog(source)
+        except RuntimeError as e:
+            raise SystemExit(str(e))
+        stat.items += len(catalog)
+    # Never echo a connection string into the file; it may carry a password.
+    label = _repo_relative(source_path.resolve()) if source_path.is_file() else "the live database"
+    return label, catalog
+
+
+def _write_delta(all_fields: Dict[str, List[FieldDef]], source: str, out_path: Path) -> None:
+    db_catalog = _load_db_catalog_module()
+    source_path = Path(source)
+    with TIMINGS.phase("catalog_load", "tables") as stat:
+        try:
+            catalog = db_catalog.load_catalog(source)
+        except RuntimeError as e:
+            raise SystemExit(str(e))
+        stat.items += len(catalog)
+    # Never echo a connection string into the file; it may carry a password.
+    source_label = _repo_relative(source_path.resolve()) if source_path.is_file() else "live database (psql)"
+
+    with TIMINGS.phase("delta_render", "tables") as stat:
+        deltas = _plan_schema_delta(all_fields, catalog)
+        text = _generate_delta_sql(all_fields, deltas, source_label)
+        stat.items += len(deltas)
+
+    state = "Wrote" if _write_if_changed(out_path, text) else "Unchanged"
+    print(f"{state}: {out_path}")
+    changed = [d for d in deltas if d.actions]
+    print(
+        f"Delta: {sum(d.missing_columns for d in deltas)} missing column(s), "
+        f"{sum(d.changed_defaults for d in deltas)} changed default(s), "
+        f"{sum(d.changed_constraints for d in deltas)} changed constraint(s) "
+        f"across {len(changed)} table(s)"
+    )
+    for delta in deltas:
+        for warning in delta.warnings:
+            print(f"WARNING: {warning}")
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the build manifest and rebuild every entity from its CSV.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Build entities in a pool of N processes (default: 1 = serial, 0 = one per CPU).",
+    )
+    parser.add_argument(
+        "--diff-against",
+        metavar="SOURCE",
+        help=(
+            "Compare with the current database and write only the needed ALTERs. SOURCE is a "
+            "pg_dump file (plain SQL or custom format) or a psql connection string."
+        ),
+    )
+    parser.add_argument(
+        "--diff-out",
+        type=Path,
+        metavar="PATH",
+        help="Where --diff-against writes the delta migration (default: next to the full migration).",
+    )
+    parser.add_argument(
+        "--index-against",
+        metavar="SOURCE",
+        help=(
+            "Leave out indexes this database already has (SOURCE as for --diff-against; "
+            f"default: {_repo_relative(INDEX_BASELINE_DUMP)})."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=TYPE_CHANGE_BATCH_SIZE,
+        metavar="N",
+        help=f"Rows per backfill batch in type-change migrations (default: {TYPE_CHANGE_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--lock-timeout",
+        default=TYPE_CHANGE_LOCK_TIMEOUT,
+        metavar="DURATION",
+        help=f"lock_timeout for each type-change step (default: {TYPE_CHANGE_LOCK_TIMEOUT}).",
+    )
+    parser.add_argument(
+        "--list-values",
+        type=Path,
+        metavar="PATH",
+        help=(
+            "CSV of allowed status_list/list/color values (columns: entity, field, value) to "
+            f"append to {OUT_LIST_VALUES.name}; also writes the list encoding migration."
+        ),
+    )
+    parser.add_argument(
+        "--sample-values",
+        metavar="SOURCE",
+        help=(
+            "Append the distinct values found in the database instead (SOURCE as for "
+            "--diff-against); may be combined with --list-values."
+        ),
+    )
+    parser.add_argument(
+        "--list-encoding",
+        choices=LIST_ENCODINGS,
+        default="enum",
+        help="Store list columns as enum types (default) or as smallint ids into lookup tables.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=(
+            "Write nothing; exit 1 if the committed TS registry or schema snapshot differ from "
+            "a fresh build (run in CI after changing CSVs or the generator)."
+        ),
+    )
+    _add_timing_arguments(parser, GENERATE_PHASES)
+    args = parser.parse_args()
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be positive")
+    if not re.fullmatch(r"[0-9]+\s*(ms|s|min)?", args.lock_timeout):
+        parser.error("--lock-timeout must look like 500ms, 2s or 1min")
+    TIMINGS.configure(args, tool="generate")
+
     missing = [
         cfg["csv"] for cfg in ENTITIES.values() if not (CSV_DIR / cfg["csv"]).exists()
     ]
     if missing:
         raise SystemExit(f"Missing CSV files in {CSV_DIR}: {missing}")
 
-    all_fields: Dict[str, List[FieldDef]] = {}
-    for entity_key in ENTITIES.keys():
-        all_fields[entity_key] = _build_entity_fields(entity_key)
+    with TIMINGS.phase("manifest_load", "cached entities") as stat:
+        previous_manifest = _load_manifest(MANIFEST_PATH)
+        # --force rebuilds every entity, but still needs the module list for cleanup.
+        owned_modules: List[str] = previous_manifest.get("ts_entity_modules", [])
+        manifest = {} if args.force else previous_manifest
+        cached_entities: Dict[str, Any] = manifest.get("entities", {})
+        entity_inputs = _current_entity_inputs()
+
+        cached_fields: Dict[str, List[FieldDef]] = {}
+        rebuilt: List[str] = []
+        for entity_key, inputs in entity_inputs.items():
+            cached = cached_entities.get(entity_key)
+            if cached and cached.get("input_sha256") == inputs["input_sha256"]:
+                cached_fields[entity_key] = [_field_from_row(r) for r in cached["fields"]]
+            else:
+                rebuilt.append(entity_key)
+        stat.items += len(cached_fields)
+
+    reports: Dict[str, CsvReadReport] = {}
+    # csv_read is only broken out with --jobs 1; pool workers time into their own process.
+    with TIMINGS.phase("field_build", "entities") as stat:
+        built_fields = _build_fields_for(rebuilt, jobs=args.jobs, reports=reports)
+        stat.items += len(built_fields)
+    for entity_key, report in reports.items():
+        summary = report.summary()
+        if summary:
+            print(f"{ENTITIES[entity_key]['csv']}: {summary}")
 
-    OUT_SQL.parent.mkdir(parents=True, exist_ok=True)
-    OUT_TS.parent.mkdir(parents=True, exist_ok=True)
+    all_fields: Dict[str, List[FieldDef]] = {}
+    manifest_entities: Dict[str, Any] = {}
+    for entity_key, inputs in entity_inputs.items():
+        if entity_key in cached_fields:
+            all_fields[entity_key] = cached_fields[entity_key]
+        else:
+            all_fields[entity_key] = built_fields[entity_key]
+        manifest_entities[entity_key] = {
+            **inputs,
+            "fields": [_field_to_row(f) for f in all_fields[entity_key]],
+        }
 
-    OUT_SQL.write_text(_generate_sql(all_fields) + "\n", encoding="utf-8")
-    OUT_TS.write_text(_generate_ts(all_fields) + "\n", encoding="utf-8")
+    print(f"Rebuilt entities: {', '.join(rebuilt) if rebuilt else 'none'}")
+
+    if args.check:
+        stale = _stale_outputs(all_fields, entity_inputs)
+        for path in stale:
+            print(f"Stale: {_repo_relative(path)}")
+        if stale:
+            raise SystemExit("Generated schema files are out of date: run generate_from_csv.py and commit them.")
+        print("Generated schema files are up to date.")
+        TIMINGS.finish()
+        return
+
+    if args.diff_against:
+        _write_delta(all_fields, args.diff_against, args.diff_out or OUT_DELTA_SQL)
+    else:
+        # Compare with the snapshot from the previous run before it is overwritten.
+        previous = _load_snapshot(OUT_SNAPSHOT)
+        if previous is not None:
+            _write_type_changes(
+                all_fields,
+                _write_schema_diff(all_fields, previous, entity_inputs),
+                batch_size=args.batch_size,
+                lock_timeout=args.lock_timeout,
+            )
+        if args.list_values or args.sample_values:
+            _write_list_encoding(
+                all_fields,
+                values_csv=args.list_values,
+                sample_source=args.sample_values,
+                encoding=args.list_encoding,
+                batch_size=args.batch_size,
+                lock_timeout=args.lock_timeout,
+            )
+        _write_outputs(
+            all_fields,
+            entity_inputs,
+            owned_modules=owned_modules,
+            index_catalog=_load_index_catalog(args.index_against),
+        )
+        owned_modules = [
+            _ts_entity_module_name(k) + ".ts"
+            for k in list(all_fields) + list(_load_manual_entities(MANUAL_ENTITIES_PATH))
+        ]
 
-    print(f"Wrote: {OUT_SQL}")
-    print(f"Wrote: {OUT_TS}")
+    _write_if_changed(
+        MANIFEST_PATH,
+        json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "rules_sha256": _rules_hash(),
+                "mappings": _mapping_hashes(),
+                "entities": manifest_entities,
+                "ts_entity_modules": sorted(owned_modules),
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+    )
+    TIMINGS.finish()
 
 
 if __name__ == "__main__":
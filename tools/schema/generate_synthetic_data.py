@@ -0,0 +1,694 @@
+#!/usr/bin/env python3
+"""
+Generate production-scale synthetic rows for load testing (list pages, RLS, indexes).
+
+What this script does:
+- Builds the column list of every entity table from the generator's FieldDefs
+  (_build_entity_fields), plus the base-table columns that have no FieldDef (the
+  polymorphic entity_type/entity_id pair, NOT NULL code/name/...).
+- Lays out N rows per table across --projects projects with skewed (Zipf-like) project
+  sizes, and links rows the way production data is linked: shots -> sequences, tasks ->
+  shot/asset/sequence/project, versions -> task (+ the task's entity), notes -> version /
+  task / shot / ..., published files -> version (+ its task and entity). Every link is a
+  pure function of (seed, table, id), so chunks are generated independently and in
+  parallel without holding any table in memory.
+- Fills the remaining columns with plausible values for their pg_type; each column gets a
+  stable fill rate (most ShotGrid fields are sparse) and a skewed value distribution.
+  Columns with a known value set (a `col IN (...)` CHECK in --catalog, or
+  schema.values.json) only get those values; other status_list/list/color columns stay
+  NULL, so the rows satisfy the table's CHECK constraints. Summary counters keep their
+  default (see load.sql).
+- Writes COPY text-format chunk files plus a load.sql (psql) that loads them in
+  dependency order, resets the id sequences and ANALYZEs the tables.
+
+Usage:
+  python tools/schema/generate_synthetic_data.py --rows 1000000 --out /tmp/kong-synthetic \
+    --catalog supabase/supabase-kubernetes/charts/kong220.sql
+  psql "$DATABASE_URL" -f /tmp/kong-synthetic/load.sql
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import functools
+import importlib.util
+import os
+import random
+import sys
+import time
+import uuid
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+IMPORTER = REPO_ROOT / "tools" / "schema" / "import_shotgrid.py"
+
+DEFAULT_ROWS = 100_000
+DEFAULT_PROJECTS = 25
+DEFAULT_USERS = 500
+DEFAULT_SKEW = 1.1
+DEFAULT_SEED = 7
+DEFAULT_CHUNK_ROWS = 100_000
+
+# Tables are generated (and loaded) parents first.
+TABLE_ORDER = ["sequences", "shots", "assets", "tasks", "versions", "notes", "published_files"]
+
+# Parent tables default to a fraction of --rows; the rest get --rows each.
+PARENT_RATIOS: Dict[str, float] = {"sequences": 1 / 400, "shots": 1 / 20, "assets": 1 / 50}
+
+# Polymorphic link mix for rows that pick their own entity. versions and published_files
+# inherit the entity of their task / version instead.
+LINK_WEIGHTS: Dict[str, Dict[str, float]] = {
+    "tasks": {"shot": 0.62, "asset": 0.30, "sequence": 0.06, "project": 0.02},
+    "notes": {"version": 0.55, "task": 0.18, "shot": 0.14, "asset": 0.08, "sequence": 0.03, "project": 0.02},
+}
+
+STATUS_VALUES: Dict[str, List[str]] = {
+    "sequences": ["ip", "wtg", "fin", "hld", "omt"],
+    "shots": ["ip", "wtg", "rdy", "fin", "hld", "omt"],
+    "assets": ["ip", "wtg", "rdy", "fin", "hld", "omt"],
+    "tasks": ["wtg", "ip", "rdy", "rev", "apr", "fin", "hld", "omt"],
+    "versions": ["rev", "vwd", "apr", "rej", "na"],
+    "notes": ["open", "closed", "resolved"],
+    "published_files": ["cmpt", "ip", "wtg", "na"],
+}
+
+CODE_PREFIX: Dict[str, str] = {
+    "sequences": "SQ",
+    "shots": "SH",
+    "assets": "AS",
+    "tasks": "TK",
+    "versions": "V",
+    "notes": "N",
+    "published_files": "PF",
+}
+
+TASK_NAMES = ["comp", "lighting", "fx", "anim", "layout", "roto", "paint", "model", "rig", "lookdev", "matchmove"]
+
+WORDS = [
+    "plate", "comp", "edge", "matte", "grain", "flicker", "roto", "keying", "lens", "motion",
+    "blur", "light", "shadow", "spill", "render", "layer", "cache", "sim", "retime", "client",
+    "note", "fix", "frame", "camera", "track", "depth", "fog", "sky", "hair", "cloth",
+    "crowd", "water", "fire", "smoke", "debris", "glass", "metal", "skin", "eyes", "temp",
+]
+
+USER_COLUMNS = {"created_by", "updated_by", "author_id", "artist_id", "published_by", "assigned_to"}
+BODY_COLUMNS = {"content", "subject", "description"}
+# Columns of the base tables (NOT NULL, or the polymorphic link) that predate the CSV schema
+# and may have no FieldDef; every generated row fills them.
+BASE_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    "sequences": [("project_id", "integer"), ("code", "text"), ("name", "text")],
+    "shots": [("project_id", "integer"), ("code", "text"), ("name", "text")],
+    "assets": [("project_id", "integer"), ("code", "text"), ("name", "text")],
+    "tasks": [("project_id", "integer"), ("name", "text"), ("entity_type", "text"), ("entity_id", "integer")],
+    "versions": [
+        ("project_id", "integer"),
+        ("code", "text"),
+        ("version_number", "integer"),
+        ("entity_type", "text"),
+        ("entity_id", "integer"),
+    ],
+    "notes": [("project_id", "integer"), ("content", "text"), ("entity_type", "text"), ("entity_id", "integer")],
+    "published_files": [
+        ("project_id", "integer"),
+        ("code", "text"),
+        ("name", "text"),
+        ("file_path", "text"),
+        ("entity_type", "text"),
+        ("entity_id", "integer"),
+    ],
+}
+LINK_COLUMNS = {"project_id", "sequence_id", "shot_id", "task_id", "version_id", "entity_type", "entity_id"}
+
+# created_at spans the three years before this instant (UTC), increasing with id.
+TIME_END = 1_767_225_600  # 2026-01-01T00:00:00Z
+TIME_SPAN = 3 * 365 * 86400
+POOL_SIZE = 64
+BATCH_ROWS = 5000
+
+_MASK = (1 << 64) - 1
+
+
+@functools.lru_cache(maxsize=None)
+def load_importer_module():
+    spec = importlib.util.spec_from_file_location("shotgrid_importer", str(IMPORTER))
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {IMPORTER}")
+    module = importlib.util.module_from_spec(spec)
+    # Required for dataclasses to resolve module namespace correctly.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@functools.lru_cache(maxsize=None)
+def _salt(*parts: object) -> int:
+    return zlib.crc32(":".join(str(p) for p in parts).encode("utf-8"))
+
+
+def _unit(salt: int, n: int) -> float:
+    """splitmix64 of (salt, n) as a float in [0, 1): a stateless per-row random number."""
+    x = (n * 0x9E3779B97F4A7C15 + salt) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return ((x ^ (x >> 31)) >> 11) / 9007199254740992.0
+
+
+def user_id(n: int) -> str:
+    """Synthetic profile ids are stable, so RLS fixtures can create the matching profiles."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"kong-synthetic-user-{n}"))
+
+
+# ---------------------------------------------------------------------------
+# Layout: which project / parent every row belongs to
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Layout:
+    seed: int
+    skew: float
+    projects: int
+    counts: Dict[str, int]
+    starts: Dict[str, Tuple[int, ...]]  # first id of each project's block (+ end sentinel)
+    entity_tables: Dict[str, str]  # entity_type value -> table
+
+    def project_of(self, table: str, row_id: int) -> int:
+        return bisect.bisect_right(self.starts[table], row_id)
+
+    def pick(self, table: str, project: int, u: float) -> int:
+        """A row of `table` inside `project`; low ids are the busy ones (skewed by u**(1+skew))."""
+        start = self.starts[table][project - 1]
+        size = self.starts[table][project] - start
+        return start + int(size * u ** (1 + self.skew))
+
+    def pick_entity(self, entity_type: str, project: int, u: float) -> int:
+        if entity_type == "project":
+            return project
+        return self.pick(self.entity_tables[entity_type], project, u)
+
+    def _choose(self, table: str, row_id: int) -> Tuple[str, int]:
+        weights = LINK_WEIGHTS[table]
+        project = self.project_of(table, row_id)
+        u = _unit(_salt(self.seed, table, "entity_type"), row_id)
+        entity_type = list(weights)[-1]
+        for candidate, weight in weights.items():
+            if u < weight:
+                entity_type = candidate
+                break
+            u -= weight
+        return entity_type, self.pick_entity(entity_type, project, _unit(_salt(self.seed, table, "entity_id"), row_id))
+
+    def task_link(self, task_id: int) -> Tuple[str, int]:
+        return self._choose("tasks", task_id)
+
+    def version_task(self, version_id: int) -> int:
+        project = self.project_of("versions", version_id)
+        return self.pick("tasks", project, _unit(_salt(self.seed, "versions", "task_id"), version_id))
+
+    def version_link(self, version_id: int) -> Tuple[str, int]:
+        entity_type, entity_id = self.task_link(self.version_task(version_id))
+        if entity_type == "project":
+            # Project-level tasks have no shot/asset; versions.entity_type does not allow 'project'.
+            project = self.project_of("versions", version_id)
+            return "shot", self.pick("shots", project, _unit(_salt(self.seed, "versions", "entity_id"), version_id))
+        return entity_type, entity_id
+
+    def links(self, table: str, row_id: int) -> Dict[str, object]:
+        project = self.project_of(table, row_id)
+        links: Dict[str, object] = {"project_id": project}
+        if table == "shots":
+            links["sequence_id"] = self.pick("sequences", project, _unit(_salt(self.seed, table, "sequence_id"), row_id))
+        elif table == "assets":
+            # Most assets are project-level; a few are shot-specific.
+            if _unit(_salt(self.seed, table, "shot_link"), row_id) < 0.2:
+                shot_id = self.pick("shots", project, _unit(_salt(self.seed, table, "shot_id"), row_id))
+                links["shot_id"] = shot_id
+                links["sequence_id"] = self.links("shots", shot_id)["sequence_id"]
+        elif table == "tasks":
+            links["entity_type"], links["entity_id"] = self.task_link(row_id)
+        elif table == "versions":
+            links["task_id"] = self.version_task(row_id)
+            links["entity_type"], links["entity_id"] = self.version_link(row_id)
+        elif table == "notes":
+            entity_type, entity_id = self._choose("notes", row_id)
+            links["entity_type"], links["entity_id"] = entity_type, entity_id
+            if entity_type == "task":
+                links["task_id"] = entity_id
+            elif entity_type == "version":
+                links["task_id"] = self.version_task(entity_id)
+        elif table == "published_files":
+            version_id = self.pick("versions", project, _unit(_salt(self.seed, table, "version_id"), row_id))
+            links["version_id"] = version_id
+            links["task_id"] = self.version_task(version_id)
+            links["entity_type"], links["entity_id"] = self.version_link(version_id)
+        return links
+
+
+def build_layout(counts: Dict[str, int], projects: int, skew: float, seed: int, entity_tables: Dict[str, str]) -> Layout:
+    weights = [1 / (p ** skew) for p in range(1, projects + 1)]
+    total = sum(weights)
+    starts: Dict[str, Tuple[int, ...]] = {}
+    for table, count in counts.items():
+        # Every project gets at least one row of every table; the head project absorbs rounding.
+        sizes = [max(1, int(count * w / total)) for w in weights]
+        sizes[0] += count - sum(sizes)
+        if sizes[0] < 1:
+            raise SystemExit(f"{table}: {count} row(s) cannot cover {projects} project(s)")
+        bounds = [1]
+        for size in sizes:
+            bounds.append(bounds[-1] + size)
+        starts[table] = tuple(bounds)
+    return Layout(seed, skew, projects, dict(counts), starts, dict(entity_tables))
+
+
+# ---------------------------------------------------------------------------
+# Column values
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    column: str
+    pg_type: str
+    empty: str  # COPY value when the column is left unfilled
+    kind: str  # id | link | created_at | updated_at | user | status | name | code | body | version_number | file_path | choice | null | default | generic
+    # Allowed values of a "choice" column.
+    choices: Tuple[str, ...] = ()
+
+
+def _column_kind(column: str, pg_type: str) -> str:
+    if column == "id":
+        return "id"
+    if column in LINK_COLUMNS:
+        return "link"
+    if column in ("created_at", "updated_at"):
+        return column
+    if column in USER_COLUMNS and pg_type == "uuid":
+        return "user"
+    if column in ("status", "name", "code", "version_number", "file_path"):
+        return column
+    if column in BODY_COLUMNS:
+        return "body"
+    if column.endswith("_id") and pg_type == "integer":
+        # References outside the generated tables (step_id, client_note_id, ...).
+        return "null"
+    return "generic"
+
+
+def plan_table_columns(
+    table: str,
+    fields: list,
+    allowed: Optional[Dict[str, List[str]]] = None,
+    counters: Iterable[str] = (),
+) -> List[ColumnSpec]:
+    """
+    `allowed`: column -> the only values the table accepts (see load_allowed_values).
+    `counters`: trigger-maintained summary columns, left at their default.
+    """
+    importer = load_importer_module()
+    list_types = importer.load_generator_module().LIST_DATA_TYPES
+    allowed = allowed or {}
+    counters = set(counters)
+    specs: List[ColumnSpec] = []
+    seen = set()
+    for f in fields:
+        if not (f.column and f.pg_type) or f.column in seen:
+            continue
+        seen.add(f.column)
+        empty = importer._default_copy_value(f.default_sql)
+        kind = _column_kind(f.column, f.pg_type)
+        choices: Tuple[str, ...] = ()
+        if f.column in counters:
+            kind = "default"
+        elif kind != "link" and allowed.get(f.column):
+            kind, choices = "choice", tuple(allowed[f.column])
+        elif kind == "generic" and f.data_type.strip().lower() in list_types:
+            # Unknown value set: random words would trip a CHECK constraint.
+            kind = "null"
+        specs.append(ColumnSpec(f.column, f.pg_type, empty, kind, choices))
+    for column, pg_type in BASE_COLUMNS.get(table, []):
+        if column not in seen:
+            specs.append(ColumnSpec(column, pg_type, importer.COPY_NULL, _column_kind(column, pg_type)))
+    return specs
+
+
+def load_allowed_values(catalog_source: Optional[str]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    table -> column -> allowed values: schema.values.json (the generator's list value
+    catalog), overridden by single-column `col IN (...)` CHECK constraints of the
+    --catalog database or pg_dump, which are what the load has to satisfy.
+    """
+    generator = load_importer_module().load_generator_module()
+    out: Dict[str, Dict[str, List[str]]] = {}
+    for entity_key, columns in generator._load_list_values(generator.OUT_LIST_VALUES).items():
+        if entity_key in generator.ENTITIES:
+            out[generator.ENTITIES[entity_key]["table"]] = {c: list(v) for c, v in columns.items()}
+    if catalog_source:
+        db_catalog = generator._load_db_catalog_module()
+        try:
+            catalog = db_catalog.load_catalog(catalog_source)
+        except RuntimeError as e:
+            raise SystemExit(str(e))
+        for table in TABLE_ORDER:
+            if f"public.{table}" in catalog:
+                out.setdefault(table, {}).update(db_catalog.check_allowed_values(catalog[f"public.{table}"]))
+    return out
+
+
+def _timestamp(seconds: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S+00", time.gmtime(seconds))
+
+
+def _generic_value(pg_type: str, rng: random.Random, users: List[str]) -> str:
+    if pg_type == "boolean":
+        return "t" if rng.random() < 0.3 else "f"
+    if pg_type in ("integer", "bigint"):
+        return str(int(rng.paretovariate(1.2) * 10))
+    if pg_type in ("numeric", "double precision"):
+        return f"{rng.uniform(0, 100):.2f}"
+    if pg_type == "date":
+        return time.strftime("%Y-%m-%d", time.gmtime(TIME_END - rng.random() * TIME_SPAN))
+    if pg_type in ("timestamptz", "timestamp with time zone"):
+        return _timestamp(TIME_END - rng.random() * TIME_SPAN)
+    if pg_type == "text[]":
+        return "{" + ",".join(rng.sample(WORDS, rng.randint(1, 3))) + "}"
+    if pg_type == "jsonb":
+        return '{"' + rng.choice(WORDS) + '":' + str(rng.randint(0, 999)) + "}"
+    if pg_type == "uuid":
+        return rng.choice(users)
+    return " ".join(rng.sample(WORDS, rng.randint(1, 3)))
+
+
+@dataclass
+class Batch:
+    """One slice of a chunk, generated column by column."""
+
+    ids: range
+    links: List[Dict[str, object]]
+    created: List[float]  # created_at epoch seconds, shared by created_at / updated_at
+
+
+def _column_generator(
+    spec: ColumnSpec,
+    table: str,
+    layout: Layout,
+    rng: random.Random,
+    users: List[str],
+) -> Callable[[Batch], List[str]]:
+    """Returns values(batch) for one column: one COPY value per row of the batch."""
+    importer = load_importer_module()
+    null = importer.COPY_NULL
+    rnd = rng.random
+    skew = 1 + layout.skew
+    kind = spec.kind
+
+    def skewed(values: List[str]) -> Callable[[Batch], List[str]]:
+        n = len(values)
+        return lambda b: [values[int(n * rnd() ** skew)] for _ in b.ids]
+
+    if kind == "id":
+        return lambda b: [str(i) for i in b.ids]
+    if kind == "link":
+        column = spec.column
+        return lambda b: [str(row[column]) if column in row else null for row in b.links]
+    if kind == "null":
+        return lambda b: [null] * len(b.ids)
+    if kind == "default":
+        return lambda b: [spec.empty] * len(b.ids)
+    if kind == "choice":
+        return skewed(list(spec.choices))
+    if kind == "created_at":
+        return lambda b: [_timestamp(seconds) for seconds in b.created]
+    if kind == "updated_at":
+        expo = rng.expovariate
+        return lambda b: [_timestamp(seconds + expo(1 / (7 * 86400))) for seconds in b.created]
+    if kind == "user":
+        return skewed(users)
+    if kind == "status":
+        return skewed(STATUS_VALUES.get(table, ["ip"]))
+    if kind in ("name", "code"):
+        if table == "tasks":
+            return skewed(TASK_NAMES)
+        prefix = CODE_PREFIX.get(table, "X")
+        return lambda b: [f"{prefix}{i:07d}" for i in b.ids]
+    if kind == "body":
+        choices, lognorm = rng.choices, rng.lognormvariate
+        return lambda b: [" ".join(choices(WORDS, k=1 + int(lognorm(2, 0.8)))) for _ in b.ids]
+    if kind == "version_number":
+        pareto = rng.paretovariate
+        return lambda b: [str(int(pareto(1.5)) % 200 or 1) for _ in b.ids]
+    if kind == "file_path":
+        randint = rng.randint
+        return lambda b: [
+            f"/mnt/projects/p{row['project_id']:03d}/{table}/{i}/v{randint(1, 60):03d}.exr"
+            for i, row in zip(b.ids, b.links)
+        ]
+
+    # Generic: a stable per-column fill rate and a small pool of pre-rendered values, picked
+    # with the same skew as everything else.
+    column_rng = random.Random(_salt(layout.seed, table, spec.column))
+    fill = 0.05 + 0.85 * column_rng.random()
+    pool = [importer._copy_escape(_generic_value(spec.pg_type, column_rng, users)) for _ in range(POOL_SIZE)]
+    scale = POOL_SIZE / fill**skew  # pool[int(POOL_SIZE * (r / fill) ** skew)]
+    empty = spec.empty
+    return lambda b: [pool[int(scale * r**skew)] if r < fill else empty for r in [rnd() for _ in b.ids]]
+
+
+# ---------------------------------------------------------------------------
+# Chunked generation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ChunkResult:
+    table: str
+    index: int
+    rows: int
+    path: str
+
+
+def generate_chunk(
+    table: str,
+    index: int,
+    first_id: int,
+    last_id: int,
+    specs: List[ColumnSpec],
+    layout: Layout,
+    users: List[str],
+    out_dir: str,
+) -> ChunkResult:
+    """Runs in a worker process: write ids [first_id, last_id] of `table` as one COPY file."""
+    rng = random.Random(_salt(layout.seed, table, "chunk", index))
+    generators = [_column_generator(spec, table, layout, rng, users) for spec in specs]
+    count = layout.counts[table]
+    path = Path(out_dir) / f"{table}.{index:05d}.copy"
+    with path.open("w", encoding="utf-8") as f:
+        for start in range(first_id, last_id + 1, BATCH_ROWS):
+            ids = range(start, min(last_id, start + BATCH_ROWS - 1) + 1)
+            # created_at grows with id over TIME_SPAN, jittered within a day.
+            created = [TIME_END - TIME_SPAN * (1 - i / count) + rng.random() * 86400 for i in ids]
+            batch = Batch(ids, [layout.links(table, i) for i in ids], created)
+            columns = [values(batch) for values in generators]
+            f.write("\n".join(map("\t".join, zip(*columns))))
+            f.write("\n")
+    return ChunkResult(table, index, last_id - first_id + 1, path.name)
+
+
+def _load_sql(
+    results: List[ChunkResult],
+    specs: Dict[str, List[ColumnSpec]],
+    out_dir: Path,
+    header: str,
+) -> str:
+    lines = [
+        f"-- {header}",
+        "-- Load into an empty database: ids start at 1 in every table.",
+        "\\set ON_ERROR_STOP on",
+        "",
+        "-- Profiles are not generated (user ids are uuid5 'kong-synthetic-user-<n>'), so FK and",
+        "-- trigger checks are skipped while loading. Requires a superuser (local benchmark DB).",
+        "-- CHECK constraints still apply (see --catalog).",
+        "-- Replica mode also skips the summary counter triggers (migration_summary_counters.sql):",
+        "-- the *_count columns keep their defaults until its step 2 backfill is run.",
+        "SET session_replication_role = replica;",
+        "",
+        f"\\copy public.projects (id, code, name) FROM '{(out_dir / 'projects.copy').resolve()}'",
+    ]
+    for table in TABLE_ORDER:
+        columns = ", ".join(s.column for s in specs[table])
+        for r in sorted((r for r in results if r.table == table), key=lambda r: r.index):
+            lines.append(f"\\copy public.{table} ({columns}) FROM '{(out_dir / r.path).resolve()}'")
+    lines.append("")
+    lines.append("SET session_replication_role = DEFAULT;")
+    lines.append("")
+    for table in ["projects"] + TABLE_ORDER:
+        lines.append(
+            f"SELECT setval(pg_get_serial_sequence('public.{table}', 'id'), "
+            f"(SELECT max(id) FROM public.{table}));"
+        )
+    lines.append("")
+    for table in ["projects"] + TABLE_ORDER:
+        lines.append(f"ANALYZE public.{table};")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def run_generation(
+    *,
+    counts: Dict[str, int],
+    projects: int,
+    users: int,
+    skew: float,
+    seed: int,
+    out_dir: Path,
+    jobs: int,
+    chunk_rows: int,
+    catalog_source: Optional[str] = None,
+) -> List[ChunkResult]:
+    importer = load_importer_module()
+    generator = importer.load_generator_module()
+    table_entities = {cfg["table"]: key for key, cfg in generator.ENTITIES.items()}
+    entity_tables = {key: cfg["table"] for key, cfg in generator.ENTITIES.items()}
+    for table, weights in LINK_WEIGHTS.items():
+        unknown = set(weights) - set(generator.ENTITY_TYPE_CHECKS[table])
+        if unknown:
+            raise SystemExit(f"LINK_WEIGHTS[{table!r}] uses entity types outside its check: {sorted(unknown)}")
+
+    allowed = load_allowed_values(catalog_source)
+    specs: Dict[str, List[ColumnSpec]] = {}
+    for table in TABLE_ORDER:
+        fields = generator._build_entity_fields(table_entities[table])
+        counters = generator._summary_columns(table_entities[table], fields)
+        specs[table] = plan_table_columns(table, fields, allowed.get(table), counters)
+    layout = build_layout(counts, projects, skew, seed, entity_tables)
+    user_ids = [user_id(n) for n in range(1, users + 1)]
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "projects.copy").write_text(
+        "".join(f"{p}\tP{p:03d}\tSynthetic project {p}\n" for p in range(1, projects + 1)),
+        encoding="utf-8",
+    )
+
+    results: List[ChunkResult] = []
+    # Chunks are written by the workers, so only (2 * jobs) small futures are ever pending.
+    pending: List[Future] = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for table in TABLE_ORDER:
+            for index, first_id in enumerate(range(1, counts[table] + 1, chunk_rows)):
+                last_id = min(counts[table], first_id + chunk_rows - 1)
+                if len(pending) >= 2 * jobs:
+                    results.append(pending.pop(0).result())
+                pending.append(
+                    pool.submit(generate_chunk, table, index, first_id, last_id, specs[table], layout, user_ids, str(out_dir))
+                )
+        results.extend(p.result() for p in pending)
+
+    header = (
+        f"Synthetic data: seed={seed} projects={projects} users={users} skew={skew} "
+        + " ".join(f"{t}={counts[t]}" for t in TABLE_ORDER)
+    )
+    (out_dir / "load.sql").write_text(_load_sql(results, specs, out_dir, header), encoding="utf-8")
+    return results
+
+
+def _parse_count(value: str) -> Tuple[str, int]:
+    table, sep, number = value.partition("=")
+    if not sep or table not in TABLE_ORDER or not number.isdigit() or int(number) <= 0:
+        raise argparse.ArgumentTypeError(f"expected TABLE=N with TABLE in {', '.join(TABLE_ORDER)}")
+    return table, int(number)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", required=True, type=Path, help="Directory for the COPY chunks and load.sql.")
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=DEFAULT_ROWS,
+        metavar="N",
+        help=f"Rows per table for tasks, versions, notes and published_files (default: {DEFAULT_ROWS}); "
+        "sequences, shots and assets are scaled from it.",
+    )
+    parser.add_argument(
+        "--count",
+        type=_parse_count,
+        action="append",
+        default=[],
+        metavar="TABLE=N",
+        help="Override the row count of one table (repeatable).",
+    )
+    parser.add_argument("--projects", type=int, default=DEFAULT_PROJECTS, metavar="N")
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS, metavar="N", help="Size of the user id pool.")
+    parser.add_argument(
+        "--skew",
+        type=float,
+        default=DEFAULT_SKEW,
+        help=f"Distribution skew; 0 is uniform (default: {DEFAULT_SKEW}).",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--catalog",
+        metavar="SOURCE",
+        help="pg_dump file or psql connection string of the target schema; its `col IN (...)` "
+        "CHECK constraints limit the generated values.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Worker processes (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        metavar="N",
+        help=f"Rows per COPY file (default: {DEFAULT_CHUNK_ROWS}).",
+    )
+    args = parser.parse_args()
+
+    if min(args.rows, args.projects, args.users, args.jobs, args.chunk_rows) <= 0:
+        parser.error("--rows, --projects, --users, --jobs and --chunk-rows must be positive")
+    if args.skew < 0:
+        parser.error("--skew must be >= 0")
+
+    counts = {
+        table: max(args.projects, int(args.rows * PARENT_RATIOS.get(table, 1))) for table in TABLE_ORDER
+    }
+    counts.update(dict(args.count))
+    projects = min([args.projects] + list(counts.values()))
+    if projects < args.projects:
+        print(f"Using {projects} project(s): every project needs at least one row per table.")
+
+    started = time.perf_counter()
+    results = run_generation(
+        counts=counts,
+        projects=projects,
+        users=args.users,
+        skew=args.skew,
+        seed=args.seed,
+        out_dir=args.out,
+        jobs=args.jobs,
+        chunk_rows=args.chunk_rows,
+        catalog_source=args.catalog,
+    )
+    elapsed = time.perf_counter() - started
+
+    rows = sum(r.rows for r in results)
+    for table in TABLE_ORDER:
+        files = sum(1 for r in results if r.table == table)
+        print(f"- {table}: {counts[table]} row(s) in {files} file(s)")
+    print(f"Generated {rows} row(s) in {elapsed:.1f}s ({rows / elapsed if elapsed else 0:.0f} rows/s)")
+    print(f"Wrote: {args.out / 'load.sql'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
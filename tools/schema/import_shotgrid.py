@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+Bulk-load ShotGrid row exports into Postgres with COPY.
+
+What this script does:
+- Reads a ShotGrid export (CSV whose headers are the same Field Names as images/schema/*.csv).
+- Maps headers to columns with the generator's FieldDefs (_build_entity_fields); virtual
+  and unknown fields are reported and skipped.
+- Coerces every value for its column's pg_type (checkbox -> boolean, date_time ->
+  timestamptz, multi_entity -> text[], serializable -> jsonb, ...). Values that do not
+  parse are loaded as NULL and counted per column; --strict only turns them into a
+  non-zero exit status after the load (the rows are loaded either way).
+- Streams the rows in chunks to a process pool; each chunk becomes one COPY text-format
+  stream, either written to a file (--out) or piped straight into `psql \\copy` (--dsn),
+  so several chunks load in parallel. Each --dsn chunk commits on its own: if one fails,
+  the error lists the chunks already committed.
+- When the export carries ids, moves the table's id sequence past them afterwards (in
+  --dsn mode and at the end of <table>.load.sql), so later inserts do not collide.
+
+Usage:
+  python tools/schema/import_shotgrid.py --entity version --input versions.csv --out /tmp/kong-copy
+  python tools/schema/import_shotgrid.py --entity version --input versions.csv --dsn "$DATABASE_URL" --jobs 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime as dt
+import functools
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GENERATOR = REPO_ROOT / "tools" / "schema" / "generate_from_csv.py"
+
+DEFAULT_CHUNK_ROWS = 50_000
+COPY_NULL = "\\N"
+MAX_REJECT_SAMPLES = 5
+
+# Raise the csv module's field limit; serializable / notes bodies can be large.
+csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+
+
+@functools.lru_cache(maxsize=None)
+def load_generator_module():
+    spec = importlib.util.spec_from_file_location("schema_generator", str(GENERATOR))
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load schema generator at {GENERATOR}")
+    module = importlib.util.module_from_spec(spec)
+    # Required for dataclasses to resolve module namespace correctly.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ---------------------------------------------------------------------------
+# Value coercion (export string -> COPY text value)
+# ---------------------------------------------------------------------------
+
+_TRUE = {"true", "t", "yes", "y", "1", "on"}
+_FALSE = {"false", "f", "no", "n", "0", "off"}
+
+
+def _number_text(value: str) -> str:
+    return value.strip().replace(",", "").rstrip("%").strip()
+
+
+def _coerce_boolean(value: str) -> str:
+    v = value.strip().lower()
+    if v in _TRUE:
+        return "t"
+    if v in _FALSE:
+        return "f"
+    raise ValueError(value)
+
+
+def _coerce_integer(value: str) -> str:
+    try:
+        number = Decimal(_number_text(value))
+    except InvalidOperation:
+        raise ValueError(value)
+    if number != number.to_integral_value():
+        raise ValueError(value)
+    return str(int(number))
+
+
+def _coerce_numeric(value: str) -> str:
+    try:
+        number = Decimal(_number_text(value))
+    except InvalidOperation:
+        raise ValueError(value)
+    if not number.is_finite():
+        raise ValueError(value)
+    return str(number)
+
+
+def _coerce_date(value: str) -> str:
+    return dt.date.fromisoformat(value.strip()[:10]).isoformat()
+
+
+def _coerce_timestamptz(value: str) -> str:
+    v = value.strip()
+    if v.endswith(" UTC"):
+        v = v[:-4] + "+00:00"
+    elif v.endswith("Z"):
+        v = v[:-1] + "+00:00"
+    # Timestamps without an offset are left to the session TimeZone, as psql would.
+    return dt.datetime.fromisoformat(v).isoformat(sep=" ")
+
+
+def _array_element(item: str) -> str:
+    return '"' + item.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _coerce_text_array(value: str) -> str:
+    # multi_entity exports list the linked display names separated by commas.
+    items = [item.strip() for item in value.split(",")]
+    return "{" + ",".join(_array_element(item) for item in items if item) + "}"
+
+
+def _coerce_jsonb(value: str) -> str:
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        parsed = value
+    return json.dumps(parsed, separators=(",", ":"), ensure_ascii=False)
+
+
+def _coerce_uuid(value: str) -> str:
+    return str(uuid.UUID(value.strip()))
+
+
+def _coerce_text(value: str) -> str:
+    return value
+
+
+COERCERS: Dict[str, Callable[[str], str]] = {
+    "boolean": _coerce_boolean,
+    "integer": _coerce_integer,
+    "bigint": _coerce_integer,
+    "numeric": _coerce_numeric,
+    "double precision": _coerce_numeric,
+    "date": _coerce_date,
+    "timestamptz": _coerce_timestamptz,
+    "timestamp with time zone": _coerce_timestamptz,
+    "text[]": _coerce_text_array,
+    "jsonb": _coerce_jsonb,
+    "uuid": _coerce_uuid,
+    "text": _coerce_text,
+}
+
+
+def _copy_escape(value: str) -> str:
+    if "\\" in value:
+        value = value.replace("\\", "\\\\")
+    if "\t" in value or "\n" in value or "\r" in value:
+        value = value.replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    return value
+
+
+def _default_copy_value(default_sql: Optional[str]) -> str:
+    """
+    COPY with an explicit NULL bypasses column defaults, so empty cells are written as
+    the column default the generator declared ('{}'::text[] -> {}, false -> f, 0 -> 0).
+    """
+    if default_sql is None:
+        return COPY_NULL
+    d = default_sql.strip()
+    if d.startswith("'"):
+        return _copy_escape(d[1 : d.index("'::")] if "'::" in d else d.strip("'"))
+    if d in ("true", "false"):
+        return d[0]
+    return d
+
+
+# ---------------------------------------------------------------------------
+# Chunked COPY
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    index: int  # position in the export row
+    column: str
+    pg_type: str
+    empty: str  # COPY value for an empty cell
+
+
+@dataclass
+class ChunkResult:
+    index: int
+    rows: int = 0
+    rejects: Dict[str, int] = field(default_factory=dict)
+    samples: List[str] = field(default_factory=list)
+    path: Optional[str] = None
+
+
+def plan_columns(header: List[str], fields: list) -> Tuple[List[ColumnPlan], List[str], List[str]]:
+    """(plans, unknown headers, virtual headers). The first FieldDef with a given name wins."""
+    by_name: Dict[str, object] = {}
+    for f in fields:
+        by_name.setdefault(f.name, f)
+    plans: List[ColumnPlan] = []
+    unknown: List[str] = []
+    virtual: List[str] = []
+    seen_columns = set()
+    for i, name in enumerate(header):
+        f = by_name.get(name.strip())
+        if f is None:
+            unknown.append(name)
+            continue
+        if not (f.column and f.pg_type):
+            virtual.append(name)
+            continue
+        if f.column in seen_columns:
+            continue
+        if f.pg_type not in COERCERS:
+            raise SystemExit(f"No coercion for pg_type {f.pg_type!r} ({f.column})")
+        seen_columns.add(f.column)
+        plans.append(ColumnPlan(i, f.column, f.pg_type, _default_copy_value(f.default_sql)))
+    return plans, unknown, virtual
+
+
+def copy_command(table: str, plans: List[ColumnPlan], source: str) -> str:
+    columns = ", ".join(p.column for p in plans)
+    return f"\\copy public.{table} ({columns}) FROM {source}"
+
+
+def _encoder(pg_type: str) -> Callable[[str], str]:
+    """
+    Coerce + escape one value. Exports repeat values heavily (statuses, dates, links), so
+    typed columns are memoized; text is only escaped.
+    """
+    if pg_type == "text":
+        return _copy_escape
+    coerce = COERCERS[pg_type]
+
+    @functools.lru_cache(maxsize=16384)
+    def encode(raw: str) -> str:
+        return _copy_escape(coerce(raw))
+
+    return encode
+
+
+def _encode_chunk(rows: List[List[str]], plans: List[ColumnPlan], result: ChunkResult) -> str:
+    encoders = [(p.index, p.column, p.empty, _encoder(p.pg_type)) for p in plans]
+    width = max(p.index for p in plans) + 1
+    out: List[str] = []
+    for row in rows:
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        values: List[str] = []
+        for index, column, empty, encode in encoders:
+            raw = row[index]
+            if not raw or raw.isspace():
+                values.append(empty)
+                continue
+            try:
+                values.append(encode(raw))
+            except (ValueError, IndexError):
+                values.append(COPY_NULL)
+                result.rejects[column] = result.rejects.get(column, 0) + 1
+                if len(result.samples) < MAX_REJECT_SAMPLES:
+                    result.samples.append(f"{column}={raw[:60]!r}")
+        out.append("\t".join(values))
+    out.append("")
+    return "\n".join(out)
+
+
+def load_chunk(
+    index: int,
+    rows: List[List[str]],
+    plans: List[ColumnPlan],
+    table: str,
+    out_dir: Optional[str],
+    dsn: Optional[str],
+) -> ChunkResult:
+    """Runs in a worker process: coerce one chunk and write it to a file or psql."""
+    result = ChunkResult(index=index, rows=len(rows))
+    data = _encode_chunk(rows, plans, result)
+    if out_dir is not None:
+        path = Path(out_dir) / f"{table}.{index:05d}.copy"
+        path.write_text(data, encoding="utf-8")
+        result.path = path.name
+    if dsn is not None:
+        proc = subprocess.run(
+            ["psql", dsn, "-X", "-q", "-v", "ON_ERROR_STOP=1", "-c", copy_command(table, plans, "pstdin")],
+            input=data,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"chunk {index}: psql failed: {proc.stderr.strip()}")
+    return result
+
+
+def setval_sql(table: str) -> str:
+    return f"SELECT setval(pg_get_serial_sequence('public.{table}', 'id'), (SELECT max(id) FROM public.{table}));"
+
+
+def _run_psql(dsn: str, sql: str) -> None:
+    proc = subprocess.run(
+        ["psql", dsn, "-X", "-q", "-v", "ON_ERROR_STOP=1", "-c", sql],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"psql failed: {proc.stderr.strip()}")
+
+
+def iter_chunks(reader: Iterator[List[str]], chunk_rows: int) -> Iterator[List[List[str]]]:
+    chunk: List[List[str]] = []
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_import(
+    *,
+    entity_key: str,
+    input_path: Path,
+    out_dir: Optional[Path],
+    dsn: Optional[str],
+    jobs: int,
+    chunk_rows: int,
+) -> Tuple[List[ChunkResult], List[ColumnPlan]]:
+    generator = load_generator_module()
+    table = generator.ENTITIES[entity_key]["table"]
+    fields = generator._build_entity_fields(entity_key)
+
+    with input_path.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            raise SystemExit(f"{input_path} is empty")
+        plans, unknown, virtual = plan_columns(header, fields)
+        if unknown:
+            print(f"Skipping {len(unknown)} header(s) not in the {entity_key} schema: {', '.join(unknown)}")
+        if virtual:
+            print(f"Skipping {len(virtual)} virtual field(s): {', '.join(virtual)}")
+        if not plans:
+            raise SystemExit("No export column maps to a database column.")
+
+        if out_dir is not None:
+            out_dir.mkdir(parents=True, exist_ok=True)
+        results: List[ChunkResult] = []
+        errors: List[str] = []
+
+        def collect(future: Future) -> None:
+            try:
+                results.append(future.result())
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        # Bounded in-flight chunks keep memory at roughly (2 * jobs) chunks.
+        pending: List[Future] = []
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for index, chunk in enumerate(iter_chunks(reader, chunk_rows)):
+                if len(pending) >= 2 * jobs:
+                    collect(pending.pop(0))
+                if errors:
+                    break
+                pending.append(
+                    pool.submit(
+                        load_chunk,
+                        index,
+                        chunk,
+                        plans,
+                        table,
+                        str(out_dir) if out_dir is not None else None,
+                        dsn,
+                    )
+                )
+            for p in pending:
+                collect(p)
+
+    if errors:
+        message = "\n".join(errors)
+        if dsn is not None:
+            # Chunk i holds data rows [i * chunk_rows, (i + 1) * chunk_rows) of the export.
+            committed = sorted(r.index for r in results)
+            message += (
+                f"\nChunks already committed to public.{table} (of {chunk_rows} rows each): "
+                f"{', '.join(map(str, committed)) or 'none'}"
+            )
+        raise RuntimeError(message)
+
+    has_ids = any(p.column == "id" for p in plans)
+    if dsn is not None and has_ids:
+        _run_psql(dsn, setval_sql(table))
+    if out_dir is not None:
+        # psql script loading every chunk file in order (run from anywhere: paths are absolute).
+        lines = [copy_command(table, plans, f"'{(out_dir / r.path).resolve()}'") for r in results if r.path]
+        if has_ids:
+            lines.append(setval_sql(table))
+        (out_dir / f"{table}.load.sql").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return results, plans
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entity", required=True, help="Entity key (asset, shot, version, ...).")
+    parser.add_argument("--input", required=True, type=Path, help="ShotGrid export CSV for that entity.")
+    parser.add_argument("--out", type=Path, help="Write COPY chunk files and a <table>.load.sql here.")
+    parser.add_argument("--dsn", help="Load directly with psql into this database.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Worker processes (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        metavar="N",
+        help=f"Rows per COPY chunk (default: {DEFAULT_CHUNK_ROWS}).",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit non-zero if any value could not be coerced (they are loaded as NULL either way).",
+    )
+    args = parser.parse_args()
+
+    generator = load_generator_module()
+    if args.entity not in generator.ENTITIES:
+        parser.error(f"Unknown entity {args.entity!r}; expected one of: {', '.join(generator.ENTITIES)}")
+    if not (args.out or args.dsn):
+        parser.error("Pass --out DIR and/or --dsn DSN.")
+    if args.jobs <= 0 or args.chunk_rows <= 0:
+        parser.error("--jobs and --chunk-rows must be positive")
+
+    started = time.perf_counter()
+    try:
+        results, plans = run_import(
+            entity_key=args.entity,
+            input_path=args.input,
+            out_dir=args.out,
+            dsn=args.dsn,
+            jobs=args.jobs,
+            chunk_rows=args.chunk_rows,
+        )
+    except RuntimeError as e:
+        raise SystemExit(str(e))
+    elapsed = time.perf_counter() - started
+
+    rows = sum(r.rows for r in results)
+    rejects: Dict[str, int] = {}
+    samples: List[str] = []
+    for r in results:
+        for column, count in r.rejects.items():
+            rejects[column] = rejects.get(column, 0) + count
+        samples.extend(r.samples[: MAX_REJECT_SAMPLES - len(samples)])
+
+    table = generator.ENTITIES[args.entity]["table"]
+    print(
+        f"{table}: {rows} row(s), {len(plans)} column(s), {len(results)} chunk(s) "
+        f"in {elapsed:.1f}s ({rows / elapsed if elapsed else 0:.0f} rows/s)"
+    )
+    if args.out:
+        print(f"Wrote: {args.out / (table + '.load.sql')}")
+    if rejects:
+        print(f"Values loaded as NULL (could not be coerced): {sum(rejects.values())}")
+        for column, count in sorted(rejects.items()):
+            print(f"- {column}: {count}")
+        print(f"  samples: {'; '.join(samples)}")
+        if args.strict:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+"""
+Shared fixtures for the schema tool tests. The tools are standalone scripts, so they are
+loaded from their files the same way they load each other (importlib, fixed module names).
+
+The tests run without the ShotGrid CSVs: field data comes from the committed
+schema.snapshot.json and schema.manual.json, and the database from the kong220 pg_dump.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+REPO_ROOT = TOOLS_DIR.parents[1]
+KONG220_DUMP = REPO_ROOT / "supabase" / "supabase-kubernetes" / "charts" / "kong220.sql"
+
+
+def load_tool(name: str, filename: str):
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, str(TOOLS_DIR / filename))
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {filename}")
+    module = importlib.util.module_from_spec(spec)
+    # Required for dataclasses to resolve module namespace correctly.
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def generator():
+    return load_tool("schema_generator", "generate_from_csv.py")
+
+
+@pytest.fixture(scope="session")
+def db_catalog(generator):
+    return generator._load_db_catalog_module()
+
+
+@pytest.fixture(scope="session")
+def all_fields(generator):
+    snapshot = generator._load_snapshot(generator.OUT_SNAPSHOT)
+    assert snapshot is not None, f"{generator.OUT_SNAPSHOT} is missing or has an old version"
+    return generator._snapshot_fields(snapshot)
+
+
+@pytest.fixture(scope="session")
+def kong220(db_catalog):
+    return db_catalog.load_catalog(str(KONG220_DUMP))
+
+
+@pytest.fixture(scope="session")
+def audit():
+    return load_tool("audit_page_columns", "audit_page_columns.py")
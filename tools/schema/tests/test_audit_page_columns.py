@@ -0,0 +1,43 @@
+"""Column ids extracted from page TSX by audit_page_columns.extract_column_arrays."""
+
+from __future__ import annotations
+
+
+def test_jsx_closing_tags_are_not_regex_literals(audit):
+    tsx = """
+const columns = [
+  { id: 'code', cell: (r) => <span>{r.a}</span> },
+  { id: 'status', cell: (r) => <>{r.b && (<i>y</i>)}</> },
+  { accessorKey: 'due_date' },
+]
+"""
+    assert audit.extract_hardcoded_column_ids(tsx) == [("code", 3), ("status", 4), ("due_date", 5)]
+
+
+def test_regex_literals_still_skipped(audit):
+    tsx = """
+const columns = [
+  { id: 'code', cell: (r) => r.code.replace(/[)\\]]/g, '') },
+  { id: 'status' },
+]
+"""
+    assert [column_id for column_id, _ in audit.extract_hardcoded_column_ids(tsx)] == ["code", "status"]
+
+
+def test_use_memo_with_type_arguments(audit):
+    tsx = """
+const columns = useMemo<TableColumn<Row>[]>(() => [
+  { id: 'code' },
+  { accessorKey: 'status' },
+], [])
+"""
+    arrays = audit.extract_column_arrays(tsx)
+    assert [(a.name, a.ids) for a in arrays] == [("columns", [("code", 3), ("status", 4)])]
+
+
+def test_use_memo_with_annotated_binding(audit):
+    tsx = """
+const shotColumns: TableColumn[] = React.useMemo<TableColumn[]>(() => [{ id: 'code' }], [])
+"""
+    arrays = audit.extract_column_arrays(tsx)
+    assert [(a.name, a.ids) for a in arrays] == [("shotColumns", [("code", 2)])]
@@ -0,0 +1,41 @@
+"""bulk_upsert_<table> must convert values with the database column types, not the CSV ones."""
+
+from __future__ import annotations
+
+import re
+
+
+def _function_body(sql: str, table: str) -> str:
+    match = re.search(
+        rf"CREATE OR REPLACE FUNCTION public\.bulk_upsert_{table}\(p_rows jsonb\).*?\n\$\$;", sql, re.S
+    )
+    assert match, f"bulk_upsert_{table} not generated"
+    return match.group(0)
+
+
+def _csv_type(all_fields, entity_key, column):
+    return next(f.pg_type for f in all_fields[entity_key] if f.column == column)
+
+
+def test_csv_and_database_types_differ(all_fields, kong220, generator):
+    # The premise: the CSV says text where kong220 has boolean / text[].
+    tasks = kong220["public.tasks"].columns
+    shots = kong220["public.shots"].columns
+    assert _csv_type(all_fields, "task", "ayon_sync_status") == "text"
+    assert generator._normalize_pg_type(tasks["ayon_sync_status"].pg_type) == "boolean"
+    assert _csv_type(all_fields, "task", "ayon_assignees") == "text"
+    assert generator._normalize_pg_type(tasks["ayon_assignees"].pg_type) == "text[]"
+    assert _csv_type(all_fields, "shot", "shot_notes") == "text"
+    assert generator._normalize_pg_type(shots["shot_notes"].pg_type) == "text[]"
+
+
+def test_rows_are_read_through_the_table_row_type(generator, all_fields):
+    sql = generator._generate_bulk_upsert_sql(all_fields)
+    for table in ("tasks", "shots"):
+        body = _function_body(sql, table)
+        assert "jsonb_to_recordset" not in body
+        assert body.count(f"jsonb_populate_recordset(NULL::public.{table}, $1) AS r ") == 2
+    tasks = _function_body(sql, "tasks")
+    assert "'ayon_sync_status'" in tasks
+    # No column type list anywhere that could disagree with the table.
+    assert not re.search(r"ayon_sync_status\s+text", tasks)
@@ -0,0 +1,39 @@
+"""--diff-against must only ever widen CHECK constraints the database already has."""
+
+from __future__ import annotations
+
+
+def _notes_delta(generator, all_fields, kong220):
+    deltas = generator._plan_schema_delta(all_fields, kong220)
+    return next(d for d in deltas if d.table == "notes")
+
+
+def test_kong220_checks_are_left_alone(generator, all_fields, kong220):
+    for delta in generator._plan_schema_delta(all_fields, kong220):
+        assert not [a for a in delta.actions if "entity_type_check" in a], delta.table
+        assert delta.warnings == []
+
+
+def test_check_is_widened_not_narrowed(generator, all_fields, kong220, monkeypatch):
+    # A CSV schema without 'post' (posts.ts still inserts it) and with a new 'playlist' type.
+    notes = [v for v in generator.ENTITY_TYPE_CHECKS["notes"] if v != "post"] + ["playlist"]
+    monkeypatch.setitem(generator.ENTITY_TYPE_CHECKS, "notes", notes)
+
+    delta = _notes_delta(generator, all_fields, kong220)
+    added = [a for a in delta.actions if a.startswith("ADD CONSTRAINT notes_entity_type_check")]
+    assert len(added) == 1
+    values = generator._check_values(added[0])
+    assert {"post", "playlist"} <= values
+    assert values >= set(notes)
+    assert len(delta.warnings) == 1 and "'post'" in delta.warnings[0]
+
+
+def test_narrowing_alone_emits_nothing(generator, all_fields, kong220, monkeypatch):
+    notes = [v for v in generator.ENTITY_TYPE_CHECKS["notes"] if v != "post"]
+    monkeypatch.setitem(generator.ENTITY_TYPE_CHECKS, "notes", notes)
+
+    delta = _notes_delta(generator, all_fields, kong220)
+    assert not [a for a in delta.actions if "entity_type_check" in a]
+    assert "'post'" in delta.warnings[0]
+    sql = generator._generate_delta_sql(all_fields, [delta], "kong220.sql")
+    assert "-- WARNING: notes_entity_type_check" in sql
@@ -0,0 +1,48 @@
+"""Counter maintenance must not bump updated_at on the parent rows."""
+
+from __future__ import annotations
+
+import re
+
+from conftest import KONG220_DUMP
+
+
+def test_updated_at_triggers_are_guarded_before_counters_change(generator, all_fields):
+    sql = generator._generate_summary_sql(all_fields)
+    step0, _, rest = sql.partition("-- Step 1:")
+    assert "CREATE TRIGGER" not in step0 and "UPDATE public." not in step0
+    assert "$backfill$" in rest
+
+    by_table = {}
+    for entity_key, counter in generator._plan_summary_counters(all_fields):
+        by_table.setdefault(generator.ENTITIES[entity_key]["table"], []).append(counter.column)
+    assert by_table["tasks"] == ["open_notes_count", "workload_assignee_count"]
+    for table, columns in by_table.items():
+        assert f"tgrelid = 'public.{table}'::regclass" in step0
+        guard = generator._sql_literal(generator._counter_only_update_guard(columns))
+        assert f"BEFORE UPDATE ON public.{table} FOR EACH ROW WHEN (%s)" in step0
+        assert guard in step0
+
+
+def test_guard_ignores_only_counter_columns(generator):
+    guard = generator._counter_only_update_guard(["open_notes_count", "workload_assignee_count"])
+    assert guard == (
+        "(to_jsonb(OLD) - ARRAY['open_notes_count', 'workload_assignee_count']::text[])"
+        " IS DISTINCT FROM "
+        "(to_jsonb(NEW) - ARRAY['open_notes_count', 'workload_assignee_count']::text[])"
+        " OR ROW(OLD.open_notes_count, OLD.workload_assignee_count)"
+        " IS NOT DISTINCT FROM ROW(NEW.open_notes_count, NEW.workload_assignee_count)"
+    )
+
+
+def test_kong220_updated_at_triggers_match_the_guard_selection(generator, all_fields):
+    # Step 0 rewrites plain BEFORE UPDATE ... FOR EACH ROW triggers (no UPDATE OF, no WHEN).
+    dump = KONG220_DUMP.read_text(encoding="utf-8")
+    tables = {generator.ENTITIES[k]["table"] for k, _ in generator._plan_summary_counters(all_fields)}
+    for table in tables:
+        assert re.search(
+            rf"^CREATE TRIGGER update_{table}_updated_at BEFORE UPDATE ON public\.{table} "
+            r"FOR EACH ROW EXECUTE FUNCTION public\.update_updated_at\(\);$",
+            dump,
+            re.M,
+        ), table
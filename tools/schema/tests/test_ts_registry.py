@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+
+def _render(generator, all_fields):
+    return generator._generate_ts(
+        all_fields,
+        generator._load_list_values(generator.OUT_LIST_VALUES),
+        generator._load_manual_entities(generator.MANUAL_ENTITIES_PATH),
+    )
+
+
+def test_regenerating_reproduces_committed_registry(generator, all_fields):
+    files = _render(generator, all_fields)
+    changed = [
+        rel
+        for rel, text in files.items()
+        if (generator.OUT_TS.parent / rel).read_text(encoding="utf-8") != text
+    ]
+    assert changed == []
+
+
+def test_every_committed_entity_module_is_generated(generator, all_fields):
+    files = _render(generator, all_fields)
+    committed = {
+        f"entities/{p.name}" for p in (generator.OUT_TS.parent / "entities").glob("*.generated.ts")
+    }
+    assert committed - set(files) == set()
+
+
+def test_manual_entities_are_in_the_registry(generator, all_fields):
+    files = _render(generator, all_fields)
+    for entity_key in generator._load_manual_entities(generator.MANUAL_ENTITIES_PATH):
+        assert f"'{entity_key}'" in files["schema.types.generated.ts"]
+        assert f"  {entity_key}: {entity_key}_lookups," in files[generator.OUT_TS.name]
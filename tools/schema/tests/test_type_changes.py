@@ -0,0 +1,94 @@
+"""Type-change conversions must return NULL instead of raising, in the sync trigger and the backfill."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+
+def _change(generator, old_type, new_type, column="ayon_id"):
+    field = generator.FieldDef("Ayon Id", "text", "dynamic", column, column, new_type, None)
+    return generator.TypeChange("task", "tasks", column, old_type, field)
+
+
+@pytest.mark.parametrize(
+    "new_type, bounds",
+    [
+        ("smallint", "BETWEEN -32768 AND 32767"),
+        ("integer", "BETWEEN -2147483648 AND 2147483647"),
+        ("bigint", "BETWEEN -9223372036854775808 AND 9223372036854775807"),
+    ],
+)
+def test_text_to_integer_is_range_checked(generator, new_type, bounds):
+    expr = generator._conversion_expr("v", "text", new_type)
+    # The bounds are compared as numeric, and only after the regex matched (nested CASE).
+    assert expr == (
+        f"CASE WHEN v ~ {generator._INT_RE_SQL} THEN "
+        f"CASE WHEN btrim(v)::numeric {bounds} THEN btrim(v)::{new_type} END END"
+    )
+
+
+@pytest.mark.parametrize(
+    "old_type, new_type",
+    [("numeric", "integer"), ("double precision", "bigint"), ("bigint", "integer"), ("integer", "smallint")],
+)
+def test_narrowing_numbers_are_range_checked(generator, old_type, new_type):
+    expr = generator._conversion_expr("v", old_type, new_type)
+    low, high = generator._INT_RANGES[new_type]
+    assert expr.startswith("CASE WHEN ") and f"BETWEEN {low} AND {high} THEN" in expr
+    if old_type == "double precision":
+        assert "round(v)::numeric BETWEEN" in expr
+
+
+@pytest.mark.parametrize(
+    "old_type, new_type, helper",
+    [
+        ("text", "uuid", "try_cast_uuid(v)"),
+        ("text", "numeric", "try_cast_numeric(v)"),
+        ("text", "double precision", "try_cast_float8(v)"),
+        ("text", "date", "try_cast_date(v)"),
+        ("text", "timestamptz", "try_cast_timestamptz(v)"),
+        ("integer", "uuid", "try_cast_uuid(v::text)"),
+        ("jsonb", "integer[]", "try_cast_integer_array(v::text)"),
+    ],
+)
+def test_casts_that_can_fail_use_a_helper(generator, old_type, new_type, helper):
+    assert f"public.{helper}" in generator._conversion_expr("v", old_type, new_type)
+
+
+@pytest.mark.parametrize("old_type, new_type", [("integer", "bigint"), ("integer", "numeric"), ("date", "timestamptz")])
+def test_lossless_casts_stay_plain(generator, old_type, new_type):
+    assert generator._conversion_expr("v", old_type, new_type) == f"v::{generator._normalize_pg_type(new_type)}"
+
+
+def test_steps_define_every_helper_they_call(generator):
+    changes = [
+        _change(generator, "text", "uuid", "ayon_id"),
+        _change(generator, "text", "numeric", "bid"),
+        _change(generator, "text", "integer", "duration"),
+        _change(generator, "text", "date", "due_date"),
+    ]
+    sql = "\n".join(generator._type_change_steps(changes, batch_size=100, lock_timeout="2s"))
+    called = set(re.findall(r"public\.(try_cast_\w+)\(", sql))
+    assert called == {"try_cast_uuid", "try_cast_numeric", "try_cast_date"}
+    for fn in called:
+        definition = re.search(
+            rf"CREATE OR REPLACE FUNCTION public\.{fn}\(p_value text\).*?\$fn\$;", sql, re.S
+        )
+        assert definition, fn
+        assert "EXCEPTION WHEN data_exception THEN\n  RETURN NULL;" in definition.group(0)
+    # Helpers are created before the sync triggers (step 1) that call them.
+    assert sql.index("FUNCTION public.try_cast_uuid") < sql.index("Step 1:")
+
+
+def test_swap_releases_the_old_column(generator):
+    change = _change(generator, "text", "integer", "duration")
+    sql = "\n".join(generator._type_change_steps([change], batch_size=100, lock_timeout="2s"))
+    step3 = sql[sql.index("Step 3:") : sql.index("Step 4")]
+    swap = step3[step3.index("BEGIN;") : step3.index("COMMIT;")]
+    rename = swap.index("RENAME COLUMN duration TO duration__old;")
+    assert swap.index("ALTER COLUMN duration__old DROP NOT NULL;") > rename
+    checks = swap[swap.index("DO $checks$") : swap.index("$checks$;")]
+    assert "con.contype = 'c'" in checks and "a.attname = 'duration__old'" in checks
+    assert "DROP CONSTRAINT %I" in checks